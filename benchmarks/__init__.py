@@ -0,0 +1 @@
+"""Performance benchmarks for SystemdManager (run with ``python -m benchmarks.<name>``)."""
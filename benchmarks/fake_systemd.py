@@ -0,0 +1,767 @@
+"""Simulated ``systemctl`` and ``journalctl`` for tests and load benchmarks.
+
+Driving the controllers against a real systemd needs root, a real PID 1 and
+one real unit per simulated service. ``FakeSystemd`` simulates a whole fleet
+in memory instead:
+
+* thousands of units with their state (``ActiveState``, ``SubState``,
+  ``UnitFileState``, ``MainPID``, ``NRestarts``, memory...) and the usual
+  transitions (start, stop, restart, try-restart, reload, enable, disable,
+  daemon-reload, which loads the unit files of ``unit_dir``);
+* the verbs and output formats the manager relies on: ``show`` (batched
+  ``Key=Value`` blocks), ``status``, ``is-active``, ``is-enabled``, and
+  ``journalctl -u ... -n ...`` in short or JSON output;
+* an injectable latency per call and per unit, and failures (a random
+  fraction of the starts, or units that always fail);
+* ``journalctl -f`` streams of synthetic entries at a configurable rate.
+
+It can be used in two ways:
+
+**In process**, as a backend object: ``with fake.patch():`` replaces
+``subprocess.run`` (and ``subprocess.Popen`` for ``journalctl -f``,
+``asyncio.create_subprocess_exec`` for the runtime's ``run_process``), so the
+code under test runs unmodified and no process is spawned; other programs
+still run for real. ``fake.calls`` counts the simulated commands by class and
+``fake.busy`` sums the time they took.
+
+**As executables on PATH**, to include the process spawn cost::
+
+    python -m benchmarks.fake_systemd init --state /tmp/fleet.json --units 5000
+    python -m benchmarks.fake_systemd install /tmp/fakebin --state /tmp/fleet.json
+    PATH=/tmp/fakebin:$PATH systemctl show -p ActiveState -- svc00001.service
+
+The state file is locked and rewritten by each ``systemctl`` invocation.
+"""
+
+import argparse
+import asyncio
+import contextlib
+import fcntl
+import itertools
+import json
+import os
+import random
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from src.utils.proctrace import command_class
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Synthetic messages of the generated journals, one in ten is an error.
+JOURNAL_MESSAGES = [
+    "request served in {n} ms",
+    "accepted connection from 10.0.{m}.{n}",
+    "cache hit ratio {n}%",
+    "worker {m} heartbeat",
+    "flushed {n} records",
+    "scheduled job {m} completed",
+    "config reloaded",
+    "GET /api/items/{n} 200",
+    "slow query took {n} ms",
+    "ERROR: connection refused by upstream {m}",
+]
+
+_real_run = subprocess.run
+_real_popen = subprocess.Popen
+_real_create_subprocess_exec = asyncio.create_subprocess_exec
+
+
+@dataclass
+class FakeUnit:
+    """
+    State of one simulated unit.
+
+    Attributes:
+        name (str): Unit name, with its suffix
+        active_state (str): "active", "inactive" or "failed"
+        sub_state (str): "running", "dead" or "failed"
+        enabled (bool): True when the unit is enabled
+        main_pid (int): Fake main PID (0 when not running)
+        n_restarts (int): Restarts since the unit was loaded
+        memory (int): Memory usage, in bytes
+        fragment_path (str): Unit file the unit was loaded from
+    """
+
+    name: str
+    active_state: str = "inactive"
+    sub_state: str = "dead"
+    enabled: bool = False
+    main_pid: int = 0
+    n_restarts: int = 0
+    memory: int = 0
+    fragment_path: str = ""
+
+
+def _unit(name: str) -> str:
+    return name if "." in name else f"{name}.service"
+
+
+# systemctl options followed by a separate value.
+_VALUE_OPTIONS = {"-p", "--property", "-t", "--type", "--state", "-n", "--lines"}
+
+
+def _split_options(args: Sequence[str]) -> Tuple[List[str], List[str]]:
+    options: List[str] = []
+    positional: List[str] = []
+    only_positional = False
+    args = list(args)
+    while args:
+        arg = args.pop(0)
+        if only_positional or not arg.startswith("-"):
+            positional.append(arg)
+        elif arg == "--":
+            only_positional = True
+        elif arg in _VALUE_OPTIONS and args:
+            name = "--property" if arg == "-p" else arg
+            options.append(f"{name}={args.pop(0)}")
+        else:
+            options.append(arg)
+    return options, positional
+
+
+class FakeSystemd:
+    """
+    In-memory systemd: units, their state transitions and their journals.
+
+    Attributes:
+        units (Dict[str, FakeUnit]): Simulated units by name
+        latency (float): Seconds added to every simulated command
+        unit_latency (float): Seconds added per unit a command acts on
+        failure_rate (float): Probability for a start/restart to fail
+        failing (Set[str]): Units whose start always fails
+        journal_rate (float): Entries per second of ``journalctl -f`` streams
+        unit_dir (Optional[str]): Directory loaded by ``daemon-reload``
+        calls (Dict[str, int]): Simulated commands run, by command class
+        busy (float): Seconds spent simulating commands, injected latency
+            included (what systemd itself would have cost)
+    """
+
+    def __init__(
+        self,
+        units: int = 0,
+        latency: float = 0.0,
+        unit_latency: float = 0.0,
+        failure_rate: float = 0.0,
+        journal_rate: float = 100.0,
+        unit_dir: Optional[str] = None,
+        seed: int = 0,
+    ):
+        self.units: Dict[str, FakeUnit] = {}
+        self.latency = latency
+        self.unit_latency = unit_latency
+        self.failure_rate = failure_rate
+        self.failing: Set[str] = set()
+        self.journal_rate = journal_rate
+        self.unit_dir = unit_dir
+        self.calls: Dict[str, int] = {}
+        self.busy = 0.0
+        self._random = random.Random(seed)
+        self._pids = itertools.count(10000)
+        self._cursors = itertools.count(1)
+        self._lock = threading.RLock()
+        if units:
+            self.add_units(units)
+
+    # --- fleet --------------------------------------------------------------
+
+    def add_units(
+        self, count: int, prefix: str = "svc", active_ratio: float = 0.8
+    ) -> List[str]:
+        """Add ``count`` loaded units, ``active_ratio`` of them running."""
+        names = []
+        with self._lock:
+            start = len(self.units)
+            for i in range(start, start + count):
+                name = f"{prefix}{i:05d}.service"
+                unit = FakeUnit(name, enabled=True)
+                if self._random.random() < active_ratio:
+                    self._activate(unit)
+                self.units[name] = unit
+                names.append(name)
+        return names
+
+    def _activate(self, unit: FakeUnit):
+        unit.active_state, unit.sub_state = "active", "running"
+        unit.main_pid = next(self._pids)
+        unit.memory = self._random.randrange(1 << 20, 256 << 20)
+
+    def _deactivate(self, unit: FakeUnit, failed: bool = False):
+        unit.active_state = "failed" if failed else "inactive"
+        unit.sub_state = "failed" if failed else "dead"
+        unit.main_pid = 0
+        unit.memory = 0
+
+    def _start(self, unit: FakeUnit) -> bool:
+        if unit.name in self.failing or self._random.random() < self.failure_rate:
+            self._deactivate(unit, failed=True)
+            return False
+        if unit.active_state != "active":
+            self._activate(unit)
+        return True
+
+    def _reload_unit_files(self):
+        if not self.unit_dir:
+            return
+        try:
+            with os.scandir(self.unit_dir) as entries:
+                present = {
+                    entry.name: entry.path
+                    for entry in entries
+                    if entry.name.endswith(".service")
+                }
+        except OSError:
+            present = {}
+        for name, unit in list(self.units.items()):
+            if unit.fragment_path and name not in present:
+                del self.units[name]
+        for name, path in present.items():
+            unit = self.units.setdefault(name, FakeUnit(name))
+            unit.fragment_path = path
+
+    # --- systemctl ----------------------------------------------------------
+
+    def systemctl(self, args: Sequence[str]) -> Tuple[int, str, str]:
+        """Run ``systemctl args``; return ``(exit code, stdout, stderr)``."""
+        options, positional = _split_options(args)
+        if not positional:
+            return 1, "", "Too few arguments.\n"
+        verb, names = positional[0], [_unit(name) for name in positional[1:]]
+        self._sleep(len(names))
+
+        with self._lock:
+            if verb == "daemon-reload":
+                self._reload_unit_files()
+                return 0, "", ""
+            if verb == "show":
+                return 0, self._show(options, names), ""
+            if verb == "status":
+                return self._status(names)
+            if verb in ("is-active", "is-enabled"):
+                return self._is(verb, names, "--quiet" in options or "-q" in options)
+
+            missing = [name for name in names if name not in self.units]
+            if missing and verb not in ("stop", "disable", "try-restart"):
+                return 5, "", f"Failed to {verb} {missing[0]}: Unit not found.\n"
+
+            ok = True
+            for name in names:
+                unit = self.units.get(name)
+                if unit is None:
+                    continue
+                if verb == "start":
+                    ok &= self._start(unit)
+                elif verb == "stop":
+                    self._deactivate(unit)
+                elif verb in ("restart", "try-restart", "reload-or-restart"):
+                    if verb == "try-restart" and unit.active_state != "active":
+                        continue
+                    was_active = unit.active_state == "active"
+                    self._deactivate(unit)
+                    ok &= self._start(unit)
+                    unit.n_restarts += was_active
+                elif verb == "reload":
+                    if unit.active_state != "active":
+                        ok = False
+                elif verb == "enable":
+                    unit.enabled = True
+                elif verb == "disable":
+                    unit.enabled = False
+                else:
+                    return 1, "", f'Unknown command verb "{verb}".\n'
+            if not ok:
+                return 1, "", f"Job for {names[0]} failed.\n"
+            return 0, "", ""
+
+    def _properties(self, name: str) -> Dict[str, str]:
+        unit = self.units.get(name)
+        if unit is None:
+            return {
+                "Id": name,
+                "LoadState": "not-found",
+                "ActiveState": "inactive",
+                "SubState": "dead",
+                "Result": "success",
+                "NRestarts": "0",
+                "UnitFileState": "",
+                "MainPID": "0",
+                "MemoryCurrent": "[not set]",
+            }
+        return {
+            "Id": name,
+            "Description": f"Simulated {name}",
+            "LoadState": "loaded",
+            "ActiveState": unit.active_state,
+            "SubState": unit.sub_state,
+            "Result": "exit-code" if unit.active_state == "failed" else "success",
+            "NRestarts": str(unit.n_restarts),
+            "UnitFileState": "enabled" if unit.enabled else "disabled",
+            "MainPID": str(unit.main_pid),
+            "MemoryCurrent": str(unit.memory) if unit.memory else "[not set]",
+            "CPUUsageNSec": str(unit.memory // 7) if unit.memory else "[not set]",
+            "TasksCurrent": "3" if unit.main_pid else "[not set]",
+            "ControlGroup": f"/system.slice/{name}" if unit.main_pid else "",
+            "FragmentPath": unit.fragment_path,
+        }
+
+    def _show(self, options: List[str], names: List[str]) -> str:
+        wanted: List[str] = []
+        for option in options:
+            if option.startswith("--property="):
+                wanted += option.split("=", 1)[1].split(",")
+            elif option.startswith("-p") and len(option) > 2:
+                wanted += option[2:].split(",")
+        blocks = []
+        for name in names:
+            properties = self._properties(name)
+            keys = wanted or list(properties)
+            blocks.append("".join(f"{key}={properties.get(key, '')}\n" for key in keys))
+        return "\n".join(blocks)
+
+    def _status(self, names: List[str]) -> Tuple[int, str, str]:
+        out = []
+        code = 0
+        for name in names:
+            unit = self.units.get(name)
+            if unit is None:
+                return 4, "", f"Unit {name} could not be found.\n"
+            enabled = "enabled" if unit.enabled else "disabled"
+            path = unit.fragment_path or f"/etc/systemd/system/{name}"
+            out.append(f"● {name} - Simulated {name}")
+            out.append(f"     Loaded: loaded ({path}; {enabled}; preset: enabled)")
+            out.append(f"     Active: {unit.active_state} ({unit.sub_state})")
+            if unit.main_pid:
+                out.append(f"   Main PID: {unit.main_pid} ({name.split('.')[0]})")
+            out.append("")
+            if unit.active_state != "active":
+                code = 3
+        return code, "\n".join(out) + "\n", ""
+
+    def _is(self, verb: str, names: List[str], quiet: bool) -> Tuple[int, str, str]:
+        lines, code = [], 0
+        for name in names:
+            unit = self.units.get(name)
+            if verb == "is-active":
+                state = unit.active_state if unit else "inactive"
+                ok = state == "active"
+            else:
+                state = ("enabled" if unit.enabled else "disabled") if unit else ""
+                ok = state == "enabled"
+            lines.append(state)
+            if not ok:
+                code = 3 if verb == "is-active" else 1
+        return code, "" if quiet else "\n".join(lines) + "\n", ""
+
+    # --- journalctl ---------------------------------------------------------
+
+    def journal_entry(self, unit: str, usec: Optional[int] = None) -> dict:
+        """Return one synthetic ``journalctl --output=json`` record of ``unit``."""
+        cursor = next(self._cursors)
+        template = JOURNAL_MESSAGES[cursor % len(JOURNAL_MESSAGES)]
+        error = template.startswith("ERROR")
+        return {
+            "__CURSOR": f"s=fake;i={cursor:x}",
+            "__REALTIME_TIMESTAMP": str(usec or int(time.time() * 1_000_000)),
+            "_SYSTEMD_UNIT": unit,
+            "SYSLOG_IDENTIFIER": unit.split(".")[0],
+            "_PID": str(self.units[unit].main_pid if unit in self.units else 1),
+            "_HOSTNAME": "fakehost",
+            "PRIORITY": "3" if error else "6",
+            "MESSAGE": template.format(n=cursor % 997, m=cursor % 13),
+        }
+
+    def journal_entries(self, units: Sequence[str], count: int) -> List[dict]:
+        """Return the ``count`` last entries of ``units`` (all units if empty)."""
+        pool = list(units) or list(self.units) or ["fake.service"]
+        now = int(time.time() * 1_000_000)
+        return [
+            self.journal_entry(pool[i % len(pool)], now - (count - i) * 1000)
+            for i in range(count)
+        ]
+
+    @staticmethod
+    def format_entry(entry: dict, as_json: bool) -> str:
+        if as_json:
+            return json.dumps(entry)
+        stamp = time.strftime(
+            "%b %d %H:%M:%S",
+            time.localtime(int(entry["__REALTIME_TIMESTAMP"]) / 1_000_000),
+        )
+        return (
+            f"{stamp} {entry['_HOSTNAME']} "
+            f"{entry['SYSLOG_IDENTIFIER']}[{entry['_PID']}]: {entry['MESSAGE']}"
+        )
+
+    def _journal_args(self, args: Sequence[str]) -> Tuple[List[str], int, bool, bool]:
+        units, lines, as_json, follow = [], 10, False, False
+        args = list(args)
+        i = 0
+        while i < len(args):
+            arg = args[i]
+            if arg in ("-u", "--unit") and i + 1 < len(args):
+                units.append(_unit(args[i + 1].strip("*")))
+                i += 1
+            elif arg.startswith("--unit="):
+                units.append(_unit(arg.split("=", 1)[1]))
+            elif arg in ("-n", "--lines") and i + 1 < len(args):
+                lines = int(args[i + 1]) if args[i + 1].isdigit() else 10
+                i += 1
+            elif arg.startswith("--lines="):
+                lines = int(arg.split("=", 1)[1])
+            elif arg in ("-o", "--output") and i + 1 < len(args):
+                as_json = args[i + 1] == "json"
+                i += 1
+            elif arg.startswith("--output="):
+                as_json = arg.split("=", 1)[1] == "json"
+            elif arg in ("-f", "--follow"):
+                follow = True
+            elif arg in ("--since", "--until", "-p", "--priority"):
+                i += 1
+            i += 1
+        return units, lines, as_json, follow
+
+    def journalctl(self, args: Sequence[str]) -> Tuple[int, str, str]:
+        """Run a non-following ``journalctl args``."""
+        units, lines, as_json, _follow = self._journal_args(args)
+        self._sleep(0)
+        with self._lock:
+            entries = self.journal_entries(units, lines)
+        if not entries:
+            return 0, "-- No entries --\n", ""
+        return 0, "".join(self.format_entry(e, as_json) + "\n" for e in entries), ""
+
+    def follow(self, args: Sequence[str], stop: threading.Event) -> Iterator[str]:
+        """Yield ``journalctl -f`` lines at ``journal_rate`` until ``stop``."""
+        units, lines, as_json, _follow = self._journal_args(args)
+        with self._lock:
+            backlog = self.journal_entries(units, lines)
+        for entry in backlog:
+            yield self.format_entry(entry, as_json) + "\n"
+
+        pool = units or list(self.units) or ["fake.service"]
+        interval = 1.0 / self.journal_rate if self.journal_rate > 0 else None
+        # Lines are emitted in small bursts so that high rates stay accurate.
+        burst = max(1, int(self.journal_rate / 100)) if interval else 0
+        started, sent = time.monotonic(), 0
+        while not stop.is_set():
+            if interval is None:
+                stop.wait(0.1)
+                continue
+            due = int((time.monotonic() - started) / interval)
+            if due <= sent:
+                stop.wait(min(interval * burst, 0.05))
+                continue
+            chunk = []
+            with self._lock:
+                for _ in range(min(due - sent, burst * 10)):
+                    entry = self.journal_entry(pool[sent % len(pool)])
+                    chunk.append(self.format_entry(entry, as_json) + "\n")
+                    sent += 1
+            yield "".join(chunk)
+
+    # --- dispatch -----------------------------------------------------------
+
+    def _sleep(self, units: int):
+        delay = self.latency + self.unit_latency * units
+        if delay > 0:
+            time.sleep(delay)
+
+    def execute(self, argv: Sequence[str]) -> Optional[Tuple[int, str, str]]:
+        """Run a simulated command, or return None if it is not simulated."""
+        if not argv:
+            return None
+        program = os.path.basename(str(argv[0]))
+        if program not in ("systemctl", "journalctl"):
+            return None
+        with self._lock:
+            key = command_class(list(argv))
+            self.calls[key] = self.calls.get(key, 0) + 1
+        args = [str(arg) for arg in argv[1:]]
+        started = time.perf_counter()
+        try:
+            if program == "systemctl":
+                return self.systemctl(args)
+            return self.journalctl(args)
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._lock:
+                self.busy += elapsed
+
+    def run(self, *popenargs, **kwargs) -> subprocess.CompletedProcess:
+        """``subprocess.run`` replacement answering systemctl and journalctl."""
+        argv: Any = popenargs[0] if popenargs else kwargs.get("args")
+        if isinstance(argv, str):
+            argv = shlex.split(argv)
+        result = self.execute(argv or [])
+        if result is None:
+            return _real_run(*popenargs, **kwargs)
+
+        code, out, err = result
+        text = (
+            kwargs.get("text")
+            or kwargs.get("universal_newlines")
+            or (kwargs.get("encoding") is not None)
+        )
+        captured_out = kwargs.get("capture_output") or kwargs.get("stdout") not in (
+            None,
+            subprocess.DEVNULL,
+        )
+        captured_err = kwargs.get("capture_output") or kwargs.get("stderr") not in (
+            None,
+            subprocess.DEVNULL,
+        )
+        if kwargs.get("stderr") == subprocess.STDOUT:
+            out, err, captured_err = out + err, "", False
+        if not captured_out and kwargs.get("stdout") is None:
+            sys.stdout.write(out)
+        if not captured_err and kwargs.get("stderr") is None:
+            sys.stderr.write(err)
+
+        stdout: Any = (out if text else out.encode()) if captured_out else None
+        stderr: Any = (err if text else err.encode()) if captured_err else None
+        if kwargs.get("check") and code != 0:
+            raise subprocess.CalledProcessError(code, argv, stdout, stderr)
+        return subprocess.CompletedProcess(argv, code, stdout, stderr)
+
+    def popen(self, *popenargs, **kwargs):
+        """``subprocess.Popen`` replacement serving ``journalctl -f``."""
+        argv = popenargs[0] if popenargs else kwargs.get("args")
+        if (
+            isinstance(argv, (list, tuple))
+            and argv
+            and os.path.basename(str(argv[0])) == "journalctl"
+            and ("-f" in argv or "--follow" in argv)
+        ):
+            with self._lock:
+                key = command_class(list(argv))
+                self.calls[key] = self.calls.get(key, 0) + 1
+            return FakeFollowProcess(self, [str(arg) for arg in argv[1:]], kwargs)
+        return _real_popen(*popenargs, **kwargs)
+
+    async def create_subprocess_exec(self, *argv, **kwargs):
+        """``asyncio.create_subprocess_exec`` replacement (output captured)."""
+        if os.path.basename(str(argv[0])) in ("systemctl", "journalctl"):
+            return FakeAsyncProcess(self, [str(arg) for arg in argv])
+        return await _real_create_subprocess_exec(*argv, **kwargs)
+
+    @contextlib.contextmanager
+    def patch(self) -> Iterator["FakeSystemd"]:
+        """Answer ``subprocess.run``/``Popen`` calls with this fake."""
+        saved = subprocess.run, subprocess.Popen, asyncio.create_subprocess_exec
+        subprocess.run = self.run  # type: ignore[assignment]
+        subprocess.Popen = self.popen  # type: ignore[assignment, misc]
+        asyncio.create_subprocess_exec = self.create_subprocess_exec  # type: ignore[assignment]
+        try:
+            yield self
+        finally:
+            (
+                subprocess.run,
+                subprocess.Popen,  # type: ignore[misc]
+                asyncio.create_subprocess_exec,
+            ) = saved
+
+    # --- persistence (executables on PATH) ----------------------------------
+
+    def to_dict(self) -> dict:
+        return {
+            "latency": self.latency,
+            "unit_latency": self.unit_latency,
+            "failure_rate": self.failure_rate,
+            "failing": sorted(self.failing),
+            "journal_rate": self.journal_rate,
+            "unit_dir": self.unit_dir,
+            "units": [asdict(unit) for unit in self.units.values()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FakeSystemd":
+        fake = cls(
+            latency=data.get("latency", 0.0),
+            unit_latency=data.get("unit_latency", 0.0),
+            failure_rate=data.get("failure_rate", 0.0),
+            journal_rate=data.get("journal_rate", 100.0),
+            unit_dir=data.get("unit_dir"),
+            seed=int(time.time_ns()),
+        )
+        fake.failing = set(data.get("failing", []))
+        fake.units = {u["name"]: FakeUnit(**u) for u in data.get("units", [])}
+        fake._pids = itertools.count(
+            max([u.main_pid for u in fake.units.values()] + [10000]) + 1
+        )
+        fake._cursors = itertools.count(time.time_ns() // 1000)
+        return fake
+
+
+class FakeAsyncProcess:
+    """Simulated asyncio process of a ``systemctl``/``journalctl`` call."""
+
+    def __init__(self, fake: "FakeSystemd", argv: List[str]):
+        self.fake = fake
+        self.argv = argv
+        self.returncode: Optional[int] = None
+
+    async def communicate(self) -> Tuple[bytes, bytes]:
+        # The simulation (and its latency) runs off the event loop, like a
+        # real process would.
+        loop = asyncio.get_running_loop()
+        result = await loop.run_in_executor(None, self.fake.execute, self.argv)
+        code, out, err = result or (127, "", "command not simulated")
+        self.returncode = code
+        return out.encode(), err.encode()
+
+    async def wait(self) -> int:
+        return self.returncode if self.returncode is not None else -9
+
+    def kill(self):
+        self.returncode = -9
+
+
+class FakeFollowProcess:
+    """``Popen``-like ``journalctl -f`` whose stdout is fed by ``FakeSystemd``."""
+
+    def __init__(self, fake: FakeSystemd, args: List[str], kwargs: dict):
+        self.args = ["journalctl"] + args
+        self.pid = next(fake._pids)
+        self.returncode: Optional[int] = None
+        self._stop = threading.Event()
+        read_fd, self._write_fd = os.pipe()
+        text = kwargs.get("text") or kwargs.get("universal_newlines")
+        self.stdout = (
+            open(read_fd, "r", encoding="utf-8", errors=kwargs.get("errors"))
+            if text
+            else open(read_fd, "rb")
+        )
+        self.stderr = None
+        self._writer = threading.Thread(
+            target=self._write, args=(fake, args), daemon=True
+        )
+        self._writer.start()
+
+    def _write(self, fake: FakeSystemd, args: List[str]):
+        try:
+            with open(self._write_fd, "w", encoding="utf-8") as pipe:
+                for chunk in fake.follow(args, self._stop):
+                    pipe.write(chunk)
+                    pipe.flush()
+        except (BrokenPipeError, ValueError, OSError):
+            pass
+        finally:
+            self.returncode = 0 if self.returncode is None else self.returncode
+
+    def poll(self) -> Optional[int]:
+        return None if self._writer.is_alive() else self.returncode
+
+    def terminate(self):
+        self.returncode = -15
+        self._stop.set()
+
+    kill = terminate
+
+    def wait(self, timeout: Optional[float] = None) -> Optional[int]:
+        self._writer.join(timeout)
+        if self._writer.is_alive():
+            raise subprocess.TimeoutExpired(self.args, timeout or 0)
+        return self.returncode
+
+
+# --- command line (executables on PATH) -------------------------------------
+
+
+@contextlib.contextmanager
+def _locked_state(path: str, write: bool) -> Iterator[FakeSystemd]:
+    with open(path, "r+" if write else "r", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX if write else fcntl.LOCK_SH)
+        fake = FakeSystemd.from_dict(json.load(f))
+        yield fake
+        if write:
+            f.seek(0)
+            f.truncate()
+            json.dump(fake.to_dict(), f)
+
+
+def install(bin_dir: str, state: str, python: str = sys.executable) -> List[str]:
+    """Write ``systemctl`` and ``journalctl`` wrappers into ``bin_dir``."""
+    os.makedirs(bin_dir, exist_ok=True)
+    paths = []
+    for program in ("systemctl", "journalctl"):
+        path = os.path.join(bin_dir, program)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(
+                "#!/bin/sh\n"
+                f"PYTHONPATH={shlex.quote(ROOT)}${{PYTHONPATH:+:$PYTHONPATH}} exec "
+                f"{shlex.quote(python)} -m benchmarks.fake_systemd "
+                f'--state {shlex.quote(os.path.abspath(state))} {program} "$@"\n'
+            )
+        os.chmod(path, 0o755)
+        paths.append(path)
+    return paths
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--state", required=True, help="fleet state file (JSON)")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    init = subparsers.add_parser("init", help="create a fleet state file")
+    init.add_argument("--units", type=int, default=1000)
+    init.add_argument("--active-ratio", type=float, default=0.8)
+    init.add_argument("--latency", type=float, default=0.0)
+    init.add_argument("--unit-latency", type=float, default=0.0)
+    init.add_argument("--failure-rate", type=float, default=0.0)
+    init.add_argument("--journal-rate", type=float, default=100.0)
+    init.add_argument("--unit-dir")
+
+    setup = subparsers.add_parser("install", help="write systemctl/journalctl shims")
+    setup.add_argument("bin_dir")
+
+    for program in ("systemctl", "journalctl"):
+        sub = subparsers.add_parser(program, add_help=False)
+        sub.add_argument("args", nargs=argparse.REMAINDER)
+
+    args, extra = parser.parse_known_args(argv)
+
+    if args.command == "init":
+        fake = FakeSystemd(
+            latency=args.latency,
+            unit_latency=args.unit_latency,
+            failure_rate=args.failure_rate,
+            journal_rate=args.journal_rate,
+            unit_dir=args.unit_dir,
+        )
+        fake.add_units(args.units, active_ratio=args.active_ratio)
+        with open(args.state, "w", encoding="utf-8") as f:
+            json.dump(fake.to_dict(), f)
+        return 0
+    if args.command == "install":
+        for path in install(args.bin_dir, args.state):
+            print(path)
+        return 0
+
+    command = args.args + extra
+    if args.command == "journalctl" and ("-f" in command or "--follow" in command):
+        with _locked_state(args.state, write=False) as fake:
+            pass
+        stop = threading.Event()
+        try:
+            for chunk in fake.follow(command, stop):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+        except (KeyboardInterrupt, BrokenPipeError):
+            pass
+        return 0
+
+    with _locked_state(args.state, write=args.command == "systemctl") as fake:
+        result = fake.execute([args.command] + command)
+    code, out, err = result or (1, "", "")
+    sys.stdout.write(out)
+    sys.stderr.write(err)
+    return code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,348 @@
+"""Rendering benchmark of the GUI under a virtual X server.
+
+Runs ``SystemdManagerApp`` with N synthetic services (answered by
+``FakeSystemd``, privileged helper in process, no daemon) and measures what
+users perceive as slowness:
+
+* ``refresh_ms``: ``ServiceListFrame.refresh_services`` until the window is
+  redrawn (median of ``--repeat`` refreshes);
+* ``select_ms``: one row selection, redraw included (mean over up to 50 rows);
+* ``logs_dialog_open_ms``: ``LogsDialog`` construction until its journal
+  backlog is shown and drawn (median of ``--repeat`` openings; the backlog is
+  read in the background, so the event loop is pumped until ``show_logs``
+  has run);
+* ``ingest_us_per_line``: time ``SystemLogsFrame`` spends on the UI thread
+  per journal line while following a stream of ``--rate`` lines per second
+  for ``--duration`` seconds;
+* ``lag_p95_ms`` / ``lag_max_ms``: lateness of a 10 ms ``after`` probe during
+  that stream, i.e. how long the event loop could not answer the user.
+
+Every metric is "lower is better" and uses the layout of ``micro``, so the
+same ``--save-baseline`` / ``--compare`` workflow compares commits (on the
+same machine; record the baseline before the change)::
+
+    python -m benchmarks.gui_render --save-baseline
+    python -m benchmarks.gui_render --compare --tolerance 0.5
+    python -m benchmarks.gui_render --sizes 1000 --rate 2000 --json
+
+``DISPLAY`` is used when set; otherwise ``Xvfb`` is started on a free display
+for the duration of the run. Without either the benchmark is skipped (exit
+status 0, or 1 with ``--strict``), so it can stay in scripts run on headless
+machines.
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+from unittest import mock
+
+from benchmarks.micro import compare, load_baseline, make_service, save_baseline
+from benchmarks.orchestration import fleet_environment
+from src.utils.proctrace import percentile
+
+DEFAULT_SIZES = [100, 500]
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "gui_baseline.json"
+)
+
+# Interval of the event-loop lag probe, in milliseconds.
+PROBE_INTERVAL_MS = 10
+
+# Rows selected by the selection case.
+SELECTIONS = 50
+
+# Seconds a dialog may take to show its background-loaded content.
+LOAD_TIMEOUT = 30
+
+# Seconds the event loop is pumped after an action, for pending redraws.
+SETTLE = 0.05
+
+XVFB_TIMEOUT = 5.0
+
+
+class DisplayUnavailable(Exception):
+    """Raised when there is neither a display nor Xvfb to start one."""
+
+
+@contextlib.contextmanager
+def virtual_display() -> Iterator[str]:
+    """Yield the X display to use, starting Xvfb when none is set."""
+    display = os.environ.get("DISPLAY")
+    if display:
+        yield display
+        return
+
+    xvfb = shutil.which("Xvfb")
+    if xvfb is None:
+        raise DisplayUnavailable("DISPLAY non défini et Xvfb introuvable")
+
+    number = 99
+    while os.path.exists(f"/tmp/.X{number}-lock"):
+        number += 1
+    display = f":{number}"
+    process = subprocess.Popen(
+        [xvfb, display, "-screen", "0", "1280x1024x24", "-nolisten", "tcp"],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + XVFB_TIMEOUT
+        while not os.path.exists(f"/tmp/.X11-unix/X{number}"):
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise DisplayUnavailable(f"Xvfb n'a pas démarré sur {display}")
+            time.sleep(0.05)
+        os.environ["DISPLAY"] = display
+        try:
+            yield display
+        finally:
+            os.environ.pop("DISPLAY", None)
+    finally:
+        process.terminate()
+        process.wait(timeout=5)
+
+
+class LagProbe:
+    """
+    Measures how late ``after`` callbacks run on a Tk event loop.
+
+    Attributes:
+        interval_ms (int): Delay requested between two ticks
+        samples (List[float]): Lateness of each tick, in milliseconds
+    """
+
+    def __init__(self, widget, interval_ms: int = PROBE_INTERVAL_MS):
+        self.widget = widget
+        self.interval_ms = interval_ms
+        self.samples: List[float] = []
+        self._expected: Optional[float] = None
+        self._job = None
+
+    def start(self):
+        self.samples = []
+        self._expected = time.perf_counter() + self.interval_ms / 1000
+        self._job = self.widget.after(self.interval_ms, self._tick)
+
+    def _tick(self):
+        now = time.perf_counter()
+        if self._expected is not None:
+            self.samples.append(max(0.0, (now - self._expected) * 1000))
+        self._expected = now + self.interval_ms / 1000
+        self._job = self.widget.after(self.interval_ms, self._tick)
+
+    def stop(self) -> List[float]:
+        if self._job is not None:
+            self.widget.after_cancel(self._job)
+            self._job = None
+        return self.samples
+
+
+def lag_stats(samples: List[float]) -> Dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "lag_p95_ms": round(percentile(ordered, 95), 3),
+        "lag_max_ms": round(ordered[-1] if ordered else 0.0, 3),
+    }
+
+
+def pump(app, seconds: float):
+    """Run the event loop for ``seconds``, as ``mainloop`` would."""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        app.update()
+        time.sleep(0.001)
+
+
+def timed_ms(app, action: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    action()
+    app.update_idletasks()
+    return (time.perf_counter() - start) * 1000
+
+
+def measure_fleet(
+    count: int, repeat: int, rate: float, duration: float
+) -> Dict[str, float]:
+    """Open the application on ``count`` services and measure every case."""
+    from benchmarks.fake_systemd import FakeSystemd
+
+    with tempfile.TemporaryDirectory() as home:
+        unit_dir = os.path.join(home, "units")
+        services_dir = os.path.join(home, ".config", "systemd-manager", "services")
+        os.makedirs(unit_dir)
+        os.makedirs(services_dir)
+        for i in range(count):
+            service = make_service(i)
+            service.save_to_json(os.path.join(services_dir, f"{service.name}.json"))
+
+        fake = FakeSystemd(journal_rate=rate, seed=0)
+        fake.add_units(count)
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(mock.patch.dict(os.environ, {"HOME": home}))
+            stack.enter_context(fleet_environment(unit_dir))
+            stack.enter_context(fake.patch())
+            stack.enter_context(
+                mock.patch(
+                    "src.cli.cli_controller.CLIController.check_sudo",
+                    return_value=True,
+                )
+            )
+            return _measure_app(count, repeat, duration)
+
+
+def _measure_app(count: int, repeat: int, duration: float) -> Dict[str, float]:
+    from src.gui.app import SystemdManagerApp
+    from src.gui.dialogs.logs_dialog import LogsDialog
+    from src.gui.frames.system_logs import SystemLogsFrame
+    from src.utils.journal import journal_follower
+
+    app = SystemdManagerApp()
+    try:
+        pump(app, SETTLE)
+        frame = app.services_frame
+        results: Dict[str, float] = {}
+
+        refreshes = []
+        for _ in range(repeat):
+            refreshes.append(timed_ms(app, frame.refresh_services))
+            pump(app, SETTLE)
+        results["refresh_ms"] = statistics.median(refreshes)
+
+        rows = [
+            widget
+            for widget in frame.scrollable_frame.winfo_children()
+            if widget.grid_info().get("row", 0) != 0
+        ][:SELECTIONS]
+        selections = [
+            timed_ms(app, lambda s=service, f=row: frame.select_service(s, f))
+            for service, row in zip(frame.services, rows)
+        ]
+        results["select_ms"] = statistics.mean(selections) if selections else 0.0
+
+        openings = []
+        for _ in range(repeat):
+            dialogs: List = []
+
+            def open_logs():
+                dialog = LogsDialog(app, frame.services[0].name)
+                dialogs.append(dialog)
+                deadline = time.perf_counter() + LOAD_TIMEOUT
+                while dialog.loading and time.perf_counter() < deadline:
+                    app.update()
+                    time.sleep(0.001)
+
+            openings.append(timed_ms(app, open_logs))
+            dialogs[0].on_close()
+            pump(app, SETTLE)
+        results["logs_dialog_open_ms"] = statistics.median(openings)
+
+        logs = SystemLogsFrame(app.views_frame)
+        logs.grid(row=0, column=0, sticky="nsew")
+        spent = [0.0]
+        process_log_queue = logs.process_log_queue
+
+        def timed_process_log_queue():
+            start = time.perf_counter()
+            process_log_queue()
+            spent[0] += time.perf_counter() - start
+
+        logs.process_log_queue = timed_process_log_queue
+        logs.follow_var.set(True)
+        logs.start_log_updates()
+        probe = LagProbe(app)
+        probe.start()
+        pump(app, duration)
+        samples = probe.stop()
+        logs.stop_log_updates()
+        lines = int(logs.log_frame.index("end-1c").split(".")[0]) - 1
+        results["ingest_us_per_line"] = spent[0] / max(lines, 1) * 1e6
+        results.update(lag_stats(samples))
+        logs.destroy()
+        journal_follower.close()
+    finally:
+        app.destroy()
+    return {name: round(value, 3) for name, value in results.items()}
+
+
+def run_benchmark(
+    sizes: List[int], repeat: int, rate: float, duration: float
+) -> Dict[str, Dict[str, float]]:
+    """Return ``{metric: {size: value}}``, the layout of ``micro``."""
+    results: Dict[str, Dict[str, float]] = {}
+    for count in sorted(sizes):
+        for metric, value in measure_fleet(count, repeat, rate, duration).items():
+            results.setdefault(metric, {})[str(count)] = value
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--rate", type=float, default=500.0, help="journal lines per second"
+    )
+    parser.add_argument("--duration", type=float, default=3.0)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument(
+        "--strict", action="store_true", help="fail when no display is available"
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    try:
+        with virtual_display():
+            results = run_benchmark(
+                args.sizes, max(1, args.repeat), args.rate, args.duration
+            )
+    except DisplayUnavailable as e:
+        if args.json:
+            print(json.dumps({"skipped": str(e)}))
+        else:
+            print(f"Benchmark de l'interface ignoré : {e}")
+        return 1 if args.strict else 0
+
+    report: Dict = {"rate": args.rate, "results": results}
+    if args.compare:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Impossible de lire la référence {args.baseline} : {e}")
+            return 1
+        report["comparison"] = compare(results, baseline, args.tolerance)
+        report["ok"] = not any(row["regression"] for row in report["comparison"])
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif args.compare:
+        for row in report["comparison"]:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['case']:<20} {row['size']:>6}  {row['baseline_us']:10.3f} → "
+                f"{row['us']:10.3f}  x{row['ratio']:.2f}{flag}"
+            )
+    else:
+        for metric, points in results.items():
+            values = "  ".join(
+                f"{size:>6}: {value:10.3f}" for size, value in points.items()
+            )
+            print(f"{metric:<20} {values}")
+
+    return 0 if report.get("ok", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
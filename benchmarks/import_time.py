@@ -0,0 +1,156 @@
+"""Import-time benchmark of the headless command-line entry point.
+
+Runs ``python -X importtime`` on what ``systemd-manager status ...`` imports,
+several times in fresh interpreters, and checks the result against
+``import_budget.json``:
+
+* the total import time (best run) must stay under ``budget_ms``;
+* none of the ``forbidden`` modules (interactive interfaces, HTTP stack...) may
+  be imported at all.
+
+``measured_ms`` records the best runs seen on a fast and on a slow machine
+(56 and 94 ms); ``budget_ms`` leaves about 50 % above the slow one, so that
+noise does not fail CI while an interactive import (about 480 ms) still does.
+Most of the time goes to the standard library the commands need (argparse,
+dataclasses and inspect, subprocess): re-measure both ends before lowering it.
+
+Exits with status 1 on a regression, so it can run in CI::
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --repeat 10 --top 25 --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BUDGET_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "import_budget.json"
+)
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> List[ImportRecord]:
+    """Parse the ``import time: self | cumulative | module`` lines."""
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def measure(entry: str, python: str = sys.executable) -> List[ImportRecord]:
+    """Import ``entry`` in a fresh interpreter and return its import records."""
+    env = dict(os.environ)
+    # Measure what users get: cached bytecode, not compilation.
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    result = subprocess.run(
+        [python, "-X", "importtime", "-c", entry],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(result.stderr)
+
+
+def load_budget(path: str = BUDGET_FILE) -> Dict:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def run_benchmark(budget: Dict, repeat: int = 5) -> Dict:
+    """Measure ``repeat`` times and compare the best run with the budget."""
+    measure(budget["entry"])  # warm-up: writes the .pyc files
+
+    best: Optional[List[ImportRecord]] = None
+    totals = []
+    for _ in range(repeat):
+        records = measure(budget["entry"])
+        total = sum(record.self_us for record in records)
+        totals.append(total)
+        if best is None or total <= min(totals):
+            best = records
+    assert best is not None
+
+    imported = {record.module for record in best}
+    forbidden = sorted(
+        module
+        for module in imported
+        if any(
+            module == name or module.startswith(name + ".")
+            for name in budget.get("forbidden", [])
+        )
+    )
+    total_ms = min(totals) / 1000
+    return {
+        "entry": budget["entry"],
+        "total_ms": round(total_ms, 2),
+        "runs_ms": [round(t / 1000, 2) for t in totals],
+        "budget_ms": budget["budget_ms"],
+        "forbidden_imported": forbidden,
+        "modules": len(imported),
+        "top": [
+            {"module": r.module, "cumulative_ms": round(r.cumulative_us / 1000, 2)}
+            for r in sorted(best, key=lambda r: r.cumulative_us, reverse=True)
+        ],
+        "ok": total_ms <= budget["budget_ms"] and not forbidden,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--budget", default=BUDGET_FILE)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(load_budget(args.budget), max(1, args.repeat))
+    report["top"] = report["top"][: args.top]
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(f"entry: {report['entry']}")
+        print(
+            f"import time: {report['total_ms']} ms (budget {report['budget_ms']} ms, "
+            f"{report['modules']} modules, runs {report['runs_ms']})"
+        )
+        for item in report["top"]:
+            print(f"  {item['cumulative_ms']:8.2f} ms  {item['module']}")
+        if report["forbidden_imported"]:
+            print(
+                "forbidden modules imported: " + ", ".join(report["forbidden_imported"])
+            )
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
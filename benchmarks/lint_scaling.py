@@ -0,0 +1,114 @@
+"""Scaling benchmark of ``systemd-manager lint``.
+
+Generates N synthetic service configurations in a temporary directory (a few
+dozen distinct executables, working directories and users, as in a real
+fleet), lints them and reports the time per configuration for each N. The run
+fails when the per-configuration cost at the largest N exceeds the one at the
+smallest N by more than ``--max-ratio``, i.e. when linting stops scaling
+linearly::
+
+    python -m benchmarks.lint_scaling
+    python -m benchmarks.lint_scaling --sizes 100 1000 10000 --workers 8 --json
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+from src.models.service_model import ServiceModel
+from src.utils.lint import lint_services
+
+DEFAULT_SIZES = [100, 1000, 10000]
+
+# Distinct paths referenced by the generated configurations.
+DISTINCT_PATHS = 50
+
+
+def generate_configs(directory: str, count: int):
+    """Write ``count`` configurations, some of them with errors or warnings."""
+    executables = [shutil.which(name) or "/bin/sh" for name in ("sh", "true", "env")]
+    workdirs = []
+    for i in range(DISTINCT_PATHS):
+        workdir = os.path.join(directory, "work", str(i))
+        os.makedirs(workdir, exist_ok=True)
+        workdirs.append(workdir)
+
+    services_dir = os.path.join(directory, "services")
+    os.makedirs(services_dir, exist_ok=True)
+    for i in range(count):
+        service = ServiceModel(f"svc{i:05d}")
+        executable = executables[i % len(executables)]
+        if i % 97 == 0:
+            executable = f"/opt/missing/bin{i % DISTINCT_PATHS}"
+        service.service.exec_start = f"{executable} --id {i}"
+        service.service.working_directory = workdirs[i % DISTINCT_PATHS]
+        service.service.user = "root" if i % 89 else "missing-user"
+        service.service.restart = "on-failure"
+        service.service.restart_sec = 600 if i % 53 == 0 else 5
+        service.save_to_json(os.path.join(services_dir, f"{service.name}.json"))
+    return services_dir
+
+
+def measure(count: int, workers: Optional[int], repeat: int) -> Dict:
+    with tempfile.TemporaryDirectory() as directory:
+        services_dir = generate_configs(directory, count)
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            results = lint_services(services_dir, workers=workers)
+            timings.append(time.perf_counter() - start)
+        best = min(timings)
+        return {
+            "configs": count,
+            "seconds": round(best, 4),
+            "us_per_config": round(best / count * 1e6, 1),
+            "errors": sum(1 for r in results if r.errors),
+        }
+
+
+def run_benchmark(
+    sizes: List[int], workers: Optional[int], repeat: int, max_ratio: float
+) -> Dict:
+    points = [measure(count, workers, repeat) for count in sorted(sizes)]
+    ratio = points[-1]["us_per_config"] / max(points[0]["us_per_config"], 1e-9)
+    return {
+        "workers": workers,
+        "points": points,
+        "scaling_ratio": round(ratio, 2),
+        "max_ratio": max_ratio,
+        "ok": ratio <= max_ratio,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--workers", type=int)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--max-ratio", type=float, default=2.0)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(
+        args.sizes, args.workers, max(1, args.repeat), args.max_ratio
+    )
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for point in report["points"]:
+            print(
+                f"{point['configs']:>7} configs  {point['seconds']:8.3f} s  "
+                f"{point['us_per_config']:8.1f} µs/config  "
+                f"({point['errors']} with errors)"
+            )
+        print(f"scaling ratio {report['scaling_ratio']} (max {report['max_ratio']})")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
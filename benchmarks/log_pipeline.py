@@ -0,0 +1,205 @@
+"""Throughput benchmark of the log ingest pipeline.
+
+A journal line goes through these stages before it is visible in a log view:
+
+* ``parse``: ``JournalEntry.from_json`` on the ``journalctl --output=json``
+  line (on the journal follower's reader thread);
+* ``format``: ``JournalEntry.format``, on the UI thread;
+* ``render``: ``render_lines``, the tagged chunks of one ``Text.insert``, on
+  the UI thread (``render_legacy`` is the former per-line split, kept as a
+  reference);
+* ``classify``: ``LogClassifier.classify_lines``, the error patterns of the
+  health report, measured on the same lines.
+
+``ui_thread`` combines ``format`` and ``render``, ``pipeline`` adds
+``parse``. These stages need no display and are always measured. With a display (or
+``Xvfb``, see ``gui_render``) the Tk side is measured too, on a
+``CTkTextbox`` tagged like ``SystemLogsFrame``:
+
+* ``view_legacy``: three ``insert`` calls and one ``see`` per line, as
+  ``SystemLogsFrame.add_log_line`` used to do;
+* ``view``: ``SystemLogsFrame.add_log_lines``, ``INGEST_BATCH`` lines per
+  call;
+
+with the slowest batch (``max_batch_ms``), to be compared with a 60 Hz frame
+(16.7 ms). Results are lines per second; the run fails (exit status 1) when
+``ui_thread`` (or ``view`` when it was measured) is below ``--target``, or
+when a batch took longer than a frame::
+
+    python -m benchmarks.log_pipeline
+    python -m benchmarks.log_pipeline --lines 200000 --target 50000 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.fake_systemd import FakeSystemd
+from src.utils.journal import JournalEntry
+from src.utils.log_classifier import LogClassifier
+from src.utils.log_render import INGEST_BATCH, render_lines
+
+DEFAULT_LINES = 100000
+DEFAULT_TARGET = 50000
+LEGACY_LINES = 20000
+
+# One frame at 60 Hz, in milliseconds.
+FRAME_BUDGET_MS = 1000 / 60
+
+
+def journal_lines(count: int) -> List[str]:
+    """Return ``count`` synthetic ``journalctl --output=json`` lines."""
+    fake = FakeSystemd(units=50, seed=0)
+    return [
+        fake.format_entry(entry, as_json=True)
+        for entry in fake.journal_entries([], count)
+    ]
+
+
+def render_legacy(lines: List[str]) -> List[tuple]:
+    """Former ``add_log_line`` logic, without Tk: one tuple per insert."""
+    inserts = []
+    for line in lines:
+        parts = line.split(" ", 3)
+        timestamp = parts[0]
+        service = parts[2]
+        message = parts[3] if len(parts) > 3 else ""
+        level = "info"
+        if "error" in message.lower():
+            level = "error"
+        elif "warning" in message.lower():
+            level = "warning"
+        inserts.append((f"{timestamp} ", "timestamp"))
+        inserts.append((f"{service} ", "service"))
+        inserts.append((f"{message}\n", level))
+    return inserts
+
+
+def rate(action: Callable[[], object], count: int) -> float:
+    start = time.perf_counter()
+    action()
+    return count / max(time.perf_counter() - start, 1e-9)
+
+
+def measure_stages(raw: List[str]) -> Dict[str, float]:
+    count = len(raw)
+    entries: List[JournalEntry] = []
+    formatted: List[str] = []
+
+    def parse():
+        for line in raw:
+            entry = JournalEntry.from_json(line)
+            if entry is not None:
+                entries.append(entry)
+
+    def format_entries():
+        formatted.extend(entry.format() for entry in entries)
+
+    results = {"parse": rate(parse, count), "format": rate(format_entries, count)}
+    results["render_legacy"] = rate(lambda: render_legacy(formatted), count)
+    results["render"] = rate(lambda: render_lines(formatted), count)
+    classifier = LogClassifier()
+    results["classify"] = rate(lambda: classifier.classify_lines(formatted), count)
+    results["ui_thread"] = 1 / (1 / results["format"] + 1 / results["render"])
+    results["pipeline"] = 1 / (1 / results["parse"] + 1 / results["ui_thread"])
+    return results
+
+
+def measure_view(lines: List[str]) -> Dict[str, float]:
+    """Insert ``lines`` into a log view, the former way and the batched one."""
+    import customtkinter as ctk
+
+    from src.gui.frames.system_logs import SystemLogsFrame
+
+    root = ctk.CTk()
+    try:
+        view = SystemLogsFrame(root)
+        view.pack(fill="both", expand=True)
+        view.follow_var.set(True)
+        root.update()
+        textbox = view.log_frame
+
+        # The per-line path is slow enough to be measured on fewer lines.
+        legacy_lines = lines[:LEGACY_LINES]
+        inserts = render_legacy(legacy_lines)
+        start = time.perf_counter()
+        for i in range(0, len(inserts), 3):
+            for text, tag in inserts[i : i + 3]:
+                textbox.insert("end", text, tag)
+            textbox.see("end")
+        root.update_idletasks()
+        results: Dict[str, float] = {
+            "view_legacy": len(legacy_lines) / (time.perf_counter() - start)
+        }
+        textbox.delete("1.0", "end")
+        root.update()
+
+        slowest = 0.0
+        start = time.perf_counter()
+        for first in range(0, len(lines), INGEST_BATCH):
+            batch_start = time.perf_counter()
+            view.add_log_lines(lines[first : first + INGEST_BATCH])
+            root.update_idletasks()
+            slowest = max(slowest, time.perf_counter() - batch_start)
+        results["view"] = len(lines) / (time.perf_counter() - start)
+        results["max_batch_ms"] = slowest * 1000
+        return results
+    finally:
+        root.destroy()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--lines", type=int, default=DEFAULT_LINES)
+    parser.add_argument("--target", type=float, default=DEFAULT_TARGET)
+    parser.add_argument(
+        "--no-view", action="store_true", help="skip the Tk measurements"
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    raw = journal_lines(max(1, args.lines))
+    results = measure_stages(raw)
+    report: Dict = {"lines": len(raw), "target": args.target}
+
+    checked = "ui_thread"
+    if not args.no_view:
+        from benchmarks.gui_render import DisplayUnavailable, virtual_display
+
+        formatted = [
+            entry.format()
+            for entry in map(JournalEntry.from_json, raw)
+            if entry is not None
+        ]
+        try:
+            with virtual_display():
+                results.update(measure_view(formatted))
+            checked = "view"
+        except DisplayUnavailable as e:
+            report["view_skipped"] = str(e)
+
+    report["results"] = {name: round(value, 1) for name, value in results.items()}
+    report["ok"] = (
+        results[checked] >= args.target
+        and results.get("max_batch_ms", 0.0) <= FRAME_BUDGET_MS
+    )
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        for name, value in results.items():
+            unit = "ms" if name.endswith("_ms") else "lignes/s"
+            print(f"{name:<14} {value:12.1f} {unit}")
+        if "view_skipped" in report:
+            print(f"Vue Tk non mesurée : {report['view_skipped']}")
+        if results[checked] < args.target:
+            print(f"{checked} sous l'objectif de {args.target:.0f} lignes/s")
+        if results.get("max_batch_ms", 0.0) > FRAME_BUDGET_MS:
+            print(f"Un lot a dépassé la durée d'une image ({FRAME_BUDGET_MS:.1f} ms)")
+    return 0 if report["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
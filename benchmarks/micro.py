@@ -0,0 +1,305 @@
+"""Micro-benchmarks of the model, serialization and parsing hot paths.
+
+Each case processes N items (services, status blocks, log lines) and is timed
+for N in 10, 1,000 and 10,000; the result is the best time per item over
+``--repeat`` rounds (small N are looped until a round lasts ``MIN_ROUND``
+seconds, so that they are not dominated by timer resolution):
+
+* ``load_from_json`` / ``save_to_json``: N configuration files;
+* ``to_systemd_file``: N unit files rendered;
+* ``screen_helpers``: N commands wrapped, detected and normalized;
+* ``parse_show_output``: one batched ``systemctl show`` output of N units,
+  converted to records;
+* ``log_classifier``: N journal lines, one in ten matching a pattern;
+* ``cgroup_sample``: one ``CgroupSampler`` tick over N services whose cgroup
+  files are faked in the temporary directory (the daemon refresh budget is
+  10 ms for 500 services). The sampler keeps one directory descriptor per
+  service: N = 10,000 needs ``ulimit -n`` above that.
+
+``--save-baseline`` stores the results in ``micro_baseline.json``;
+``--compare`` fails (exit status 1) when a case got slower than the baseline
+by more than ``--tolerance``::
+
+    python -m benchmarks.micro --save-baseline
+    python -m benchmarks.micro --compare --tolerance 0.5
+    python -m benchmarks.micro --cases to_systemd_file --sizes 10000 --json
+
+Baselines are only comparable on the same machine: record one before a change
+and compare after it. The JSON cases also measure the file system; set
+``TMPDIR=/dev/shm`` to keep disk noise out of them.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.models.screen import (
+    build_screen_command,
+    is_screen_command,
+    normalize_screen_command,
+    screen_session_from_command,
+    screen_session_name,
+)
+from src.models.service_model import ServiceModel
+from src.utils.cgroup import CgroupSampler
+from src.utils.log_classifier import LogClassifier
+from src.utils.systemctl import parse_show_output, unit_record
+
+DEFAULT_SIZES = [10, 1000, 10000]
+BASELINE_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "micro_baseline.json"
+)
+
+# Minimum duration of one timed round, in seconds.
+MIN_ROUND = 0.05
+
+Case = Callable[[str, int], Callable[[], object]]
+
+
+def make_service(i: int) -> ServiceModel:
+    service = ServiceModel(f"svc{i:05d}")
+    service.unit.description = f"Synthetic service {i}"
+    service.service.exec_start = f"/usr/bin/python3 /opt/app{i % 50}/main.py --id {i}"
+    service.service.working_directory = f"/opt/app{i % 50}"
+    service.service.user = "www-data"
+    service.service.environment = {"PORT": str(8000 + i % 1000), "MODE": "prod"}
+    if i % 3 == 0:
+        service.service.exec_start = build_screen_command(
+            screen_session_name(service.name), service.service.exec_start
+        )
+    return service
+
+
+def _json_files(directory: str, count: int) -> List[str]:
+    paths = []
+    for i in range(count):
+        path = os.path.join(directory, f"svc{i:05d}.json")
+        make_service(i).save_to_json(path)
+        paths.append(path)
+    return paths
+
+
+def case_load_from_json(directory: str, count: int) -> Callable[[], object]:
+    paths = _json_files(directory, count)
+    return lambda: [ServiceModel.load_from_json(path) for path in paths]
+
+
+def case_save_to_json(directory: str, count: int) -> Callable[[], object]:
+    services = [make_service(i) for i in range(count)]
+    paths = [os.path.join(directory, f"{s.name}.json") for s in services]
+
+    def run():
+        for service, path in zip(services, paths):
+            service.save_to_json(path)
+
+    return run
+
+
+def case_to_systemd_file(directory: str, count: int) -> Callable[[], object]:
+    services = [make_service(i) for i in range(count)]
+    return lambda: [service.to_systemd_file() for service in services]
+
+
+def case_screen_helpers(directory: str, count: int) -> Callable[[], object]:
+    commands = [f"/usr/bin/node /srv/app{i}/index.js" for i in range(count)]
+    names = [f"app{i}" for i in range(count)]
+
+    def run():
+        for name, command in zip(names, commands):
+            wrapped = build_screen_command(screen_session_name(name), command)
+            is_screen_command(wrapped)
+            screen_session_from_command(wrapped)
+            normalize_screen_command(f"screen -dmS {name} {command}")
+
+    return run
+
+
+def case_parse_show_output(directory: str, count: int) -> Callable[[], object]:
+    output = "\n\n".join(
+        f"Id=svc{i:05d}.service\nLoadState=loaded\nActiveState=active\n"
+        f"SubState=running\nMainPID={1000 + i}\nNRestarts={i % 4}\n"
+        f"MemoryCurrent={i * 4096}\nCPUUsageNSec={i * 1000}\nTasksCurrent=3"
+        for i in range(count)
+    )
+
+    def run():
+        return [
+            unit_record(properties["Id"], properties)
+            for properties in parse_show_output(output)
+        ]
+
+    return run
+
+
+def case_log_classifier(directory: str, count: int) -> Callable[[], object]:
+    classifier = LogClassifier()
+    lines = [
+        f"Oct 19 10:00:{i % 60:02d} host app[{i}]: "
+        + (
+            "ERROR: connection refused by upstream"
+            if i % 10 == 0
+            else f"request {i} served in {i % 97} ms"
+        )
+        for i in range(count)
+    ]
+    return lambda: classifier.classify_lines(lines)
+
+
+def case_cgroup_sample(directory: str, count: int) -> Callable[[], object]:
+    names = [f"svc{i:05d}" for i in range(count)]
+    for name in names:
+        unit = os.path.join(directory, f"{name}.service")
+        os.mkdir(unit)
+        for filename, content in [
+            ("cpu.stat", "usage_usec 1000\nuser_usec 0\nsystem_usec 0\n"),
+            ("memory.current", "1048576\n"),
+            ("pids.current", "3\n"),
+        ]:
+            with open(os.path.join(unit, filename), "w") as f:
+                f.write(content)
+    sampler = CgroupSampler(root=directory)
+    sampler.sample(names)  # opens and caches the directory descriptors
+
+    def run():
+        return sampler.sample(names)
+
+    run.close = sampler.close  # type: ignore[attr-defined]
+    return run
+
+
+CASES: Dict[str, Case] = {
+    "load_from_json": case_load_from_json,
+    "save_to_json": case_save_to_json,
+    "to_systemd_file": case_to_systemd_file,
+    "screen_helpers": case_screen_helpers,
+    "parse_show_output": case_parse_show_output,
+    "log_classifier": case_log_classifier,
+    "cgroup_sample": case_cgroup_sample,
+}
+
+
+def time_per_item(run: Callable[[], object], count: int, repeat: int) -> float:
+    """Return the best time per item, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        loops = 0
+        start = time.perf_counter()
+        while True:
+            run()
+            loops += 1
+            elapsed = time.perf_counter() - start
+            if elapsed >= MIN_ROUND:
+                break
+        best = min(best, elapsed / loops)
+    return best / count * 1e6
+
+
+def run_benchmark(
+    cases: List[str], sizes: List[int], repeat: int
+) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    for name in cases:
+        results[name] = {}
+        for count in sorted(sizes):
+            with tempfile.TemporaryDirectory() as directory:
+                run = CASES[name](directory, count)
+                try:
+                    per_item = time_per_item(run, count, repeat)
+                finally:
+                    close = getattr(run, "close", None)
+                    if close is not None:
+                        close()
+                results[name][str(count)] = round(per_item, 3)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float,
+) -> List[dict]:
+    """Return one row per case and size measured in both runs."""
+    rows = []
+    for name, points in results.items():
+        for size, value in points.items():
+            reference = baseline.get(name, {}).get(size)
+            if reference is None:
+                continue
+            ratio = value / max(reference, 1e-9)
+            rows.append(
+                {
+                    "case": name,
+                    "size": int(size),
+                    "baseline_us": reference,
+                    "us": value,
+                    "ratio": round(ratio, 2),
+                    "regression": ratio > 1 + tolerance,
+                }
+            )
+    return rows
+
+
+def load_baseline(path: str) -> Dict[str, Dict[str, float]]:
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(path: str, results: Dict[str, Dict[str, float]]):
+    data = {"python": sys.version.split()[0], "results": results}
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES))
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--compare", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5)
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.cases, args.sizes, max(1, args.repeat))
+    report: Dict = {"results": results}
+
+    if args.compare:
+        try:
+            baseline = load_baseline(args.baseline)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Impossible de lire la référence {args.baseline} : {e}")
+            return 1
+        report["comparison"] = compare(results, baseline, args.tolerance)
+        report["ok"] = not any(row["regression"] for row in report["comparison"])
+
+    if args.save_baseline:
+        save_baseline(args.baseline, results)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    elif args.compare:
+        for row in report["comparison"]:
+            flag = "  REGRESSION" if row["regression"] else ""
+            print(
+                f"{row['case']:<18} {row['size']:>6}  {row['baseline_us']:10.2f} → "
+                f"{row['us']:10.2f} µs/item  x{row['ratio']:.2f}{flag}"
+            )
+    else:
+        for name, points in results.items():
+            timings = "  ".join(
+                f"{size:>6}: {value:9.2f} µs" for size, value in points.items()
+            )
+            print(f"{name:<18} {timings}")
+
+    return 0 if report.get("ok", True) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
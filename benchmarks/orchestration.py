@@ -0,0 +1,199 @@
+"""End-to-end orchestration benchmark against the simulated systemd.
+
+The micro-benchmarks time the model and the parsers; this one drives the
+controllers the way a user does, for fleets of N managed services, with
+``FakeSystemd`` answering every ``systemctl`` call in process. Each phase
+acts on the whole fleet:
+
+* ``create``: N configurations written (``ServiceModel.save_to_json``);
+* ``install``: unit files generated by the headless CLI (``apply --all``);
+* ``start``: N ``run_operation`` calls, the job each Start button queues;
+* ``list_gui`` / ``list_cli``: the GUI service list
+  (``GUIController.get_services``) and the CLI one (``list --json``);
+* ``restart``: the CLI (``restart --all``);
+* ``save``: N ``GUIController.save_service`` calls, the edit dialog path
+  (unit file rewritten and daemon reloaded for each service);
+* ``delete``: N ``GUIController.delete_service`` calls.
+
+For every phase the report gives the wall-clock time, the throughput (services
+per second), the ``systemctl`` commands run and the time the simulated systemd
+took to answer them; ``overhead`` is what remains, i.e. the cost of the
+manager itself. The command counts are exact and machine-independent, which
+makes them the first thing to look at when comparing commits::
+
+    python -m benchmarks.orchestration
+    python -m benchmarks.orchestration --sizes 10 100 1000 5000 --latency 0.002
+    python -m benchmarks.orchestration --sizes 1000 --json
+
+N = 5000 takes a few minutes: ``save`` and ``delete`` reload the daemon once
+per service, and each simulated reload scans the whole unit directory.
+
+The privileged helper runs in process against a temporary unit directory, and
+no daemon is queried. The interactive menus of ``CLIController`` (questionary
+prompts, ``/etc/systemd/system``) are not driven: the CLI phases use the
+headless commands, which run the same ``systemctl`` calls.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, Iterator, List, Optional
+
+from benchmarks.fake_systemd import FakeSystemd
+from benchmarks.micro import make_service
+from src.cli import commands
+from src.daemon.client import SOCKET_ENV
+from src.gui.gui_controller import GUIController
+from src.utils.operations import run_operation
+from src.utils.privileged import privileged_helper
+
+DEFAULT_SIZES = [10, 100, 1000]
+
+PHASES = [
+    "create",
+    "install",
+    "start",
+    "list_gui",
+    "list_cli",
+    "restart",
+    "save",
+    "delete",
+]
+
+
+@contextlib.contextmanager
+def fleet_environment(unit_dir: str) -> Iterator[None]:
+    """Run the privileged helper in process on ``unit_dir``, without daemon."""
+    saved = (privileged_helper.unit_dir, privileged_helper.in_process)
+    saved_socket = os.environ.get(SOCKET_ENV)
+    privileged_helper.unit_dir = unit_dir
+    privileged_helper.in_process = True
+    os.environ[SOCKET_ENV] = os.path.join(unit_dir, "absent.sock")
+    try:
+        yield
+    finally:
+        privileged_helper.unit_dir, privileged_helper.in_process = saved
+        if saved_socket is None:
+            os.environ.pop(SOCKET_ENV, None)
+        else:
+            os.environ[SOCKET_ENV] = saved_socket
+
+
+def run_fleet(count: int, latency: float = 0.0) -> Dict[str, dict]:
+    """Run every phase on ``count`` services; return the results by phase."""
+    results: Dict[str, dict] = {}
+    with tempfile.TemporaryDirectory() as root:
+        services_dir = os.path.join(root, "services")
+        unit_dir = os.path.join(root, "units")
+        os.makedirs(services_dir)
+        os.makedirs(unit_dir)
+
+        fake = FakeSystemd(latency=latency, unit_dir=unit_dir)
+        controller = GUIController()
+        controller.services_dir = services_dir
+        services = [make_service(i) for i in range(count)]
+        names = [service.name for service in services]
+        cli = ["--services-dir", services_dir, "--no-daemon"]
+
+        def create():
+            for service in services:
+                service.save_to_json(os.path.join(services_dir, f"{service.name}.json"))
+
+        def install():
+            commands.run(cli + ["apply", "--all", "--unit-dir", unit_dir])
+
+        def start():
+            for name in names:
+                run_operation("start", name)
+
+        def list_gui():
+            controller.get_services()
+
+        def list_cli():
+            commands.run(cli + ["list", "--json"])
+
+        def restart():
+            commands.run(cli + ["restart", "--all"])
+
+        def save():
+            for service in services:
+                service.unit.description += " (modifié)"
+                controller.save_service(service)
+
+        def delete():
+            for name in names:
+                controller.delete_service(name)
+
+        phases: Dict[str, Callable[[], None]] = {
+            "create": create,
+            "install": install,
+            "start": start,
+            "list_gui": list_gui,
+            "list_cli": list_cli,
+            "restart": restart,
+            "save": save,
+            "delete": delete,
+        }
+        with fleet_environment(unit_dir), fake.patch():
+            for name in PHASES:
+                results[name] = time_phase(fake, phases[name], count)
+    return results
+
+
+def time_phase(fake: FakeSystemd, phase: Callable[[], None], count: int) -> dict:
+    calls_before = sum(fake.calls.values())
+    busy_before = fake.busy
+    output = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(output):
+        phase()
+    elapsed = time.perf_counter() - start
+    systemd = fake.busy - busy_before
+    return {
+        "seconds": round(elapsed, 4),
+        "per_second": round(count / max(elapsed, 1e-9), 1),
+        "commands": sum(fake.calls.values()) - calls_before,
+        "systemd_seconds": round(systemd, 4),
+        "overhead_seconds": round(max(elapsed - systemd, 0.0), 4),
+    }
+
+
+def run_benchmark(sizes: List[int], latency: float) -> Dict[str, Dict[str, dict]]:
+    return {str(count): run_fleet(count, latency) for count in sorted(sizes)}
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="seconds added to every simulated systemctl call",
+    )
+    parser.add_argument("--json", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.sizes, args.latency)
+    if args.json:
+        print(json.dumps({"latency": args.latency, "results": results}, indent=2))
+        return 0
+
+    for count, phases in results.items():
+        print(f"N = {count}")
+        for name, row in phases.items():
+            print(
+                f"  {name:<9} {row['seconds']:9.3f} s  {row['per_second']:10.1f} /s"
+                f"  {row['commands']:6d} cmd  systemd {row['systemd_seconds']:8.3f} s"
+                f"  overhead {row['overhead_seconds']:8.3f} s"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,8 +10,27 @@ import questionary
 from src.cli.cli_translations import TranslationKeys, cli_translations
 from src.models.screen import build_screen_command, screen_session_name
 from src.models.service_model import (
+    DEFAULT_SERVICES_DIR,
     ServiceModel,
+    list_service_names,
 )
+from src.utils.dirlist import (
+    PAGE_SIZE,
+    filter_names,
+    list_subdirectories,
+    paginate,
+)
+from src.utils.health import (
+    ERRORING,
+    FAILED,
+    FLAPPING,
+    HealthReport,
+    HealthScanner,
+)
+from src.utils.identity import identity_cache
+from src.utils.metrics import operation_metrics
+from src.utils.proctrace import run_command
+from src.utils.unit_index import unit_index
 
 """
 CLI Controller for SystemD Service Manager
@@ -58,7 +77,7 @@ class CLIController:
         signal.signal(signal.SIGINT, self.signal_handler)
         signal.signal(signal.SIGTERM, self.signal_handler)
 
-        self.services_dir = os.path.expanduser("~/.config/systemd-manager/services")
+        self.services_dir = DEFAULT_SERVICES_DIR
         self.logs_dir = os.path.expanduser("~/.config/systemd-manager/logs")
         self.setup_directories()
 
@@ -115,6 +134,7 @@ class CLIController:
                 choices=[
                     cli_translations.get_text(TranslationKeys.CREATE_NEW_SERVICE),
                     cli_translations.get_text(TranslationKeys.MANAGE_EXISTING_SERVICES),
+                    cli_translations.get_text(TranslationKeys.HEALTH_SCAN),
                     cli_translations.get_text(TranslationKeys.LANGUAGE),
                     cli_translations.get_text(TranslationKeys.QUIT),
                 ],
@@ -126,6 +146,8 @@ class CLIController:
                 TranslationKeys.MANAGE_EXISTING_SERVICES
             ):
                 self.manage_services()
+            elif action == cli_translations.get_text(TranslationKeys.HEALTH_SCAN):
+                self.health_scan()
             elif action == cli_translations.get_text(TranslationKeys.LANGUAGE):
                 self.change_language()
             else:
@@ -442,11 +464,11 @@ class CLIController:
                 f.write(service.to_systemd_file())
             print(cli_translations.get_text("✅ Fichier service créé"))
 
-            subprocess.run(["systemctl", "daemon-reload"], check=True)
+            run_command(["systemctl", "daemon-reload"], check=True)
             print(cli_translations.get_text("✅ Configuration systemd rechargée"))
 
             if service.install.wanted_by:
-                subprocess.run(["systemctl", "enable", service.name], check=True)
+                run_command(["systemctl", "enable", service.name], check=True)
                 print(cli_translations.get_text("✅ Service activé au démarrage"))
 
             if questionary.confirm(
@@ -454,10 +476,10 @@ class CLIController:
                     "Voulez-vous démarrer le service maintenant ?"
                 )
             ).ask():
-                subprocess.run(["systemctl", "start", service.name], check=True)
+                run_command(["systemctl", "start", service.name], check=True)
                 print(cli_translations.get_text("✅ Service démarré"))
 
-                status = subprocess.run(
+                status = run_command(
                     ["systemctl", "is-active", service.name],
                     capture_output=True,
                     text=True,
@@ -475,7 +497,7 @@ class CLIController:
                         )
                     )
                     print("📜 " + cli_translations.get_text("Consultation des logs :"))
-                    subprocess.run(
+                    run_command(
                         ["journalctl", "-u", service.name, "-n", "50", "--no-pager"]
                     )
 
@@ -554,9 +576,9 @@ class CLIController:
             elif action == cli_translations.get_text(TranslationKeys.RESTART_SERVICE):
                 self.restart_service(service_name)
             elif action == cli_translations.get_text(TranslationKeys.VIEW_STATUS):
-                subprocess.run(["systemctl", "status", service_name, "--no-pager"])
+                run_command(["systemctl", "status", service_name, "--no-pager"])
             elif action == cli_translations.get_text(TranslationKeys.VIEW_LOGS):
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "50", "--no-pager"]
                 )
             elif action == cli_translations.get_text(
@@ -568,6 +590,70 @@ class CLIController:
             ):
                 self.delete_service(service_name)
 
+    def health_scan(self) -> Optional[HealthReport]:
+        """
+        Scan every managed service concurrently and print a health report.
+        Failed units come first, then flapping ones, then units whose recent
+        logs contain errors.
+
+        Returns:
+            Optional[HealthReport]: The report, or None if no service is managed
+        """
+        names = list_service_names(self.services_dir)
+        if not names:
+            print(cli_translations.get_text(TranslationKeys.MSG_NO_SERVICES))
+            return None
+
+        print(
+            cli_translations.get_text(TranslationKeys.HEALTH_SCAN_RUNNING).format(
+                count=len(names)
+            )
+        )
+        report = HealthScanner().scan(names)
+        self.print_health_report(report)
+        return report
+
+    def print_health_report(self, report: HealthReport):
+        """
+        Print a health report grouped by category, worst first.
+
+        Args:
+            report (HealthReport): Report returned by HealthScanner.scan
+        """
+        print(
+            "\n"
+            + cli_translations.get_text(TranslationKeys.HEALTH_SCAN_SUMMARY).format(
+                count=len(report.units), duration=report.duration
+            )
+        )
+
+        if not report.problems:
+            print(cli_translations.get_text(TranslationKeys.HEALTH_ALL_OK))
+            return
+
+        titles = {
+            FAILED: TranslationKeys.HEALTH_FAILED,
+            FLAPPING: TranslationKeys.HEALTH_FLAPPING,
+            ERRORING: TranslationKeys.HEALTH_ERRORING,
+        }
+        restarts_label = cli_translations.get_text(TranslationKeys.HEALTH_RESTARTS)
+        for category, title_key in titles.items():
+            units = [unit for unit in report.problems if unit.category == category]
+            if not units:
+                continue
+            print(f"\n{cli_translations.get_text(title_key)} ({len(units)})")
+            for unit in units:
+                print(
+                    f"  • {unit.name} — {unit.active_state} ({unit.sub_state}), "
+                    f"{unit.restarts} {restarts_label}"
+                )
+                for stats in unit.errors:
+                    seen = f" [{stats.first_seen} → {stats.last_seen}]"
+                    print(
+                        f"      - {stats.message} ×{stats.count}"
+                        + (seen if stats.first_seen else "")
+                    )
+
     def edit_service(self, service_name: str):
         """
         Edit an existing service configuration.
@@ -623,24 +709,18 @@ class CLIController:
             service (ServiceModel): The modified service model to save
         """
         try:
-            print(
-                "📥 "
-                + cli_translations.get_text("Arrêt du service {name}...").format(
-                    name=service.name
-                )
-            )
+            with operation_metrics.timed("save"):
+                service_path = f"/etc/systemd/system/{service.name}.service"
+                with open(service_path, "w") as f:
+                    f.write(service.to_systemd_file())
 
-            subprocess.run(["systemctl", "stop", service.name])
+                json_path = os.path.join(self.services_dir, f"{service.name}.json")
+                service.save_to_json(json_path)
 
-            service_path = f"/etc/systemd/system/{service.name}.service"
-            with open(service_path, "w") as f:
-                f.write(service.to_systemd_file())
-
-            json_path = os.path.join(self.services_dir, f"{service.name}.json")
-            service.save_to_json(json_path)
-
-            subprocess.run(["systemctl", "daemon-reload"])
-            subprocess.run(["systemctl", "restart", service.name])
+                # No stop beforehand: the new unit file only applies after
+                # the reload, and restart stops the unit itself.
+                run_command(["systemctl", "daemon-reload"])
+                run_command(["systemctl", "restart", service.name])
 
             print(
                 cli_translations.get_text(
@@ -670,14 +750,14 @@ class CLIController:
                 )
             )
 
-            subprocess.run(["systemctl", "stop", service_name])
+            run_command(["systemctl", "stop", service_name])
 
             print(
                 cli_translations.get_text(TranslationKeys.DISABLING_SERVICE).format(
                     name=service_name
                 )
             )
-            subprocess.run(["systemctl", "disable", service_name])
+            run_command(["systemctl", "disable", service_name])
 
             service_path = f"/etc/systemd/system/{service_name}.service"
             if os.path.exists(service_path):
@@ -697,7 +777,7 @@ class CLIController:
                     ).format(path=json_path)
                 )
 
-            subprocess.run(["systemctl", "daemon-reload"])
+            run_command(["systemctl", "daemon-reload"])
             print(
                 cli_translations.get_text(TranslationKeys.SERVICE_DELETED).format(
                     name=service_name
@@ -712,19 +792,8 @@ class CLIController:
         Returns:
             List[str]: List of valid system usernames
         """
-        users = []
         try:
-            with open("/etc/passwd", "r") as f:
-                for line in f:
-                    user_info = line.strip().split(":")
-                    if (
-                        len(user_info) >= 3
-                        and user_info[2].isdigit()
-                        and int(user_info[2]) >= 1000
-                        and user_info[0] != "nobody"
-                    ):
-                        users.append(user_info[0])
-            return sorted(users)
+            return identity_cache.regular_users()
         except Exception as e:
             print(
                 "⚠️  "
@@ -774,21 +843,43 @@ class CLIController:
             Optional[str]: Selected directory path or None if cancelled
         """
         current_path = start_path
+        listed_path = None
+        subdirectories: List[str] = []
+        query = ""
+        page = 0
 
         while True:
             try:
-                items = [".."] + sorted(
-                    [
-                        f"📁 {d}"
-                        for d in os.listdir(current_path)
-                        if os.path.isdir(os.path.join(current_path, d))
-                        and not d.startswith(".")
-                    ]
+                if listed_path != current_path:
+                    subdirectories = list_subdirectories(current_path)
+                    listed_path = current_path
+                    query = ""
+                    page = 0
+                names = filter_names(subdirectories, query)
+                visible, page, pages = paginate(names, page)
+
+                next_page = cli_translations.get_text(TranslationKeys.NEXT_PAGE)
+                previous_page = cli_translations.get_text(TranslationKeys.PREVIOUS_PAGE)
+                filter_choice = cli_translations.get_text(
+                    TranslationKeys.FILTER_DIRECTORIES
                 )
+                items = [".."] + [f"📁 {d}" for d in visible]
+                if page > 0:
+                    items.append(previous_page)
+                if page < pages - 1:
+                    items.append(next_page)
+                if len(subdirectories) > PAGE_SIZE or query:
+                    items.append(filter_choice)
 
                 print(
                     f"\n{cli_translations.get_text(TranslationKeys.CURRENT_DIRECTORY)} {current_path}"
                 )
+                if pages > 1 or query:
+                    print(
+                        cli_translations.get_text(
+                            TranslationKeys.DIRECTORY_PAGE
+                        ).format(page=page + 1, pages=pages, count=len(names))
+                    )
                 choice = questionary.select(
                     cli_translations.get_text(TranslationKeys.SELECT_DIRECTORY),
                     choices=items
@@ -809,6 +900,18 @@ class CLIController:
                     TranslationKeys.SELECT_THIS_DIRECTORY
                 ):
                     return current_path
+                elif choice == next_page:
+                    page += 1
+                elif choice == previous_page:
+                    page -= 1
+                elif choice == filter_choice:
+                    query = (
+                        questionary.text(
+                            cli_translations.get_text(TranslationKeys.FILTER_PROMPT)
+                        ).ask()
+                        or ""
+                    )
+                    page = 0
                 elif choice == "..":
                     if current_path != "/":
                         current_path = os.path.dirname(current_path)
@@ -828,7 +931,7 @@ class CLIController:
             bool: True if screen is installed, False otherwise
         """
         try:
-            result = subprocess.run(
+            result = run_command(
                 ["which", "screen"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
             return result.returncode == 0
@@ -1015,7 +1118,7 @@ class CLIController:
         passed as a list element so it can never be interpreted as shell syntax.
         stderr is merged into stdout to match getoutput()'s behaviour.
         """
-        result = subprocess.run(
+        result = run_command(
             args, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
         )
         return result.stdout.strip()
@@ -1121,6 +1224,14 @@ class CLIController:
             elif name.lower() == "b":
                 return None
             elif self.validate_service_name(name):
+                if unit_index.exists(name):
+                    print(
+                        "⚠️  "
+                        + cli_translations.get_text(
+                            TranslationKeys.SERVICE_ALREADY_EXISTS
+                        )
+                        + f" : {unit_index.path(name)}"
+                    )
                 return name
             else:
                 print(cli_translations.get_text(TranslationKeys.INVALID_NAME))
@@ -1294,7 +1405,7 @@ class CLIController:
             service_name (str): Name of the service to stop
         """
         try:
-            status = subprocess.run(
+            status = run_command(
                 ["systemctl", "is-active", "--quiet", service_name]
             ).returncode
 
@@ -1314,7 +1425,12 @@ class CLIController:
                 )
             )
 
-            if subprocess.run(["systemctl", "stop", service_name]).returncode == 0:
+            with operation_metrics.timed("stop") as operation:
+                operation.success = (
+                    run_command(["systemctl", "stop", service_name]).returncode == 0
+                )
+
+            if operation.success:
                 print(
                     cli_translations.get_text(
                         TranslationKeys.SERVICE_STOPPED_SUCCESSFULLY
@@ -1322,7 +1438,7 @@ class CLIController:
                 )
 
                 print("\n📊 " + cli_translations.get_text("Statut actuel du service :"))
-                subprocess.run(["systemctl", "status", service_name, "--no-pager"])
+                run_command(["systemctl", "status", service_name, "--no-pager"])
             else:
                 print(
                     cli_translations.get_text(TranslationKeys.ERROR_STOPPING_SERVICE)
@@ -1330,7 +1446,7 @@ class CLIController:
                 )
 
                 print("\n📜 " + cli_translations.get_text("Derniers logs du service :"))
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "20", "--no-pager"]
                 )
 
@@ -1346,7 +1462,7 @@ class CLIController:
             service_name (str): Name of the service to start
         """
         try:
-            status = subprocess.run(
+            status = run_command(
                 ["systemctl", "is-active", "--quiet", service_name]
             ).returncode
 
@@ -1366,7 +1482,12 @@ class CLIController:
                 )
             )
 
-            if subprocess.run(["systemctl", "start", service_name]).returncode == 0:
+            with operation_metrics.timed("start") as operation:
+                operation.success = (
+                    run_command(["systemctl", "start", service_name]).returncode == 0
+                )
+
+            if operation.success:
                 print(
                     cli_translations.get_text(
                         TranslationKeys.SERVICE_STARTED_SUCCESSFULLY
@@ -1374,10 +1495,10 @@ class CLIController:
                 )
 
                 print("\n📊 " + cli_translations.get_text("Statut actuel du service :"))
-                subprocess.run(["systemctl", "status", service_name, "--no-pager"])
+                run_command(["systemctl", "status", service_name, "--no-pager"])
 
                 print("\n📜 " + cli_translations.get_text("Logs de démarrage :"))
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "20", "--no-pager"]
                 )
             else:
@@ -1387,7 +1508,7 @@ class CLIController:
                 )
 
                 print("\n📜 " + cli_translations.get_text("Logs d'erreur :"))
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "50", "--no-pager"]
                 )
 
@@ -1410,7 +1531,12 @@ class CLIController:
                 )
             )
 
-            if subprocess.run(["systemctl", "restart", service_name]).returncode == 0:
+            with operation_metrics.timed("restart") as operation:
+                operation.success = (
+                    run_command(["systemctl", "restart", service_name]).returncode == 0
+                )
+
+            if operation.success:
                 print(
                     cli_translations.get_text(
                         TranslationKeys.SERVICE_RESTARTED_SUCCESSFULLY
@@ -1418,10 +1544,10 @@ class CLIController:
                 )
 
                 print("\n📊 " + cli_translations.get_text("Statut actuel du service :"))
-                subprocess.run(["systemctl", "status", service_name, "--no-pager"])
+                run_command(["systemctl", "status", service_name, "--no-pager"])
 
                 print("\n📜 " + cli_translations.get_text("Logs de redémarrage :"))
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "20", "--no-pager"]
                 )
             else:
@@ -1431,12 +1557,12 @@ class CLIController:
                 )
 
                 print("\n📜 " + cli_translations.get_text("Logs d'erreur détaillés :"))
-                subprocess.run(
+                run_command(
                     ["journalctl", "-u", service_name, "-n", "50", "--no-pager"]
                 )
 
                 print("\n🔍 " + cli_translations.get_text("État détaillé du service :"))
-                subprocess.run(["systemctl", "status", service_name, "--no-pager"])
+                run_command(["systemctl", "status", service_name, "--no-pager"])
 
         except Exception as e:
             print(cli_translations.get_text(TranslationKeys.UNEXPECTED_ERROR) + f" {e}")
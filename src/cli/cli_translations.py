@@ -4,6 +4,7 @@ Module de traductions pour l'interface CLI dans SystemdManager
 
 import json
 import os
+from typing import Callable, Dict
 
 
 # Clés de traduction
@@ -127,6 +128,11 @@ class TranslationKeys:
     CURRENT_DIRECTORY = "CURRENT_DIRECTORY"
     SELECT_DIRECTORY = "SELECT_DIRECTORY"
     SELECT_THIS_DIRECTORY = "SELECT_THIS_DIRECTORY"
+    NEXT_PAGE = "NEXT_PAGE"
+    PREVIOUS_PAGE = "PREVIOUS_PAGE"
+    FILTER_DIRECTORIES = "FILTER_DIRECTORIES"
+    FILTER_PROMPT = "FILTER_PROMPT"
+    DIRECTORY_PAGE = "DIRECTORY_PAGE"
 
     # Messages pour la commande d'exécution
     SPECIFY_COMMAND_METHOD = "SPECIFY_COMMAND_METHOD"
@@ -353,403 +359,465 @@ class TranslationKeys:
     CONFIG_FILE_DELETED = "CONFIG_FILE_DELETED"
     SERVICE_DELETED = "SERVICE_DELETED"
 
+    # Bilan de santé
+    HEALTH_SCAN = "HEALTH_SCAN"
+    HEALTH_SCAN_RUNNING = "HEALTH_SCAN_RUNNING"
+    HEALTH_SCAN_SUMMARY = "HEALTH_SCAN_SUMMARY"
+    HEALTH_FAILED = "HEALTH_FAILED"
+    HEALTH_FLAPPING = "HEALTH_FLAPPING"
+    HEALTH_ERRORING = "HEALTH_ERRORING"
+    HEALTH_ALL_OK = "HEALTH_ALL_OK"
+    HEALTH_RESTARTS = "HEALTH_RESTARTS"
+
 
 # Dictionnaire de traduction français
-cli_translations_fr = {
-    # Configuration des redémarrages
-    TranslationKeys.RESTART_POLICY_TITLE: "🔄 Configuration de la politique de redémarrage",
-    TranslationKeys.RESTART_POLICY_DESCRIPTION: "Choisissez comment le service doit redémarrer",
-    TranslationKeys.RESTART_LIMITS_TITLE: "🔄 Configuration des limites de redémarrage",
-    TranslationKeys.RESTART_LIMITS_MAX_RESTARTS: "Nombre maximum de redémarrages en 5 minutes :",
-    TranslationKeys.RESTART_LIMITS_DELAY: "Délai entre les tentatives de redémarrage (en secondes) :",
-    TranslationKeys.RESTART_LIMITS_DEFAULT: "Entrez un nombre (défaut: {default})",
-    TranslationKeys.RESTART_POLICY_NO: "Ne pas redémarrer",
-    TranslationKeys.RESTART_POLICY_ALWAYS: "Toujours redémarrer",
-    TranslationKeys.RESTART_POLICY_ON_FAILURE: "Redémarrer en cas d'échec",
-    TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Redémarrer en cas d'anomalie",
-    TranslationKeys.WELCOME: "Bienvenue dans SystemdManager",
-    TranslationKeys.MAIN_MENU: "Menu principal",
-    TranslationKeys.CREATE_SERVICE: "📝 Créer un nouveau service",
-    TranslationKeys.EDIT_SERVICE: "Modifier le service",
-    TranslationKeys.DELETE_SERVICE: "Supprimer le service",
-    TranslationKeys.VIEW_SERVICE: "Voir le service",
-    TranslationKeys.EXIT: "Quitter",
-    TranslationKeys.SELECT_ACTION: "Sélectionnez une action",
-    TranslationKeys.GOODBYE: "Au revoir ! 👋",
-    TranslationKeys.CREATE_NEW_SERVICE_SYSTEMD: "📝 Création d'un nouveau service systemd",
-    TranslationKeys.EXEC_COMMAND_CONFIGURED: "✅ Commande d'exécution configurée",
-    TranslationKeys.START_DELAY: "⏰ Délai de démarrage (en secondes)",
-    TranslationKeys.START_DELAY_SET: "✅ Délai de démarrage défini à {delay} secondes",
-    TranslationKeys.MAX_RESTARTS: "🔄 Nombre maximum de redémarrages",
-    TranslationKeys.CONFIGURE_FINAL_SERVICE: "🔧 Configuration finale du service",
-    TranslationKeys.MAX_RESTARTS_SET: "✅ Nombre maximum de redémarrages défini à {restarts}",
-    # Messages d'erreur et d'administration
-    TranslationKeys.ADMIN_RIGHTS_REQUIRED: "⚠️  Droits administrateur requis pour",
-    TranslationKeys.RELAUNCH_WITH_SUDO: "📌 Relancez avec sudo",
-    TranslationKeys.INSTALLATION_ERROR: "❌ Erreur lors de l'installation :",
-    TranslationKeys.UNEXPECTED_ERROR: " Erreur inattendue :",
-    TranslationKeys.ERROR_READING_USERS: "Erreur lors de la lecture des utilisateurs :",
-    TranslationKeys.ERROR_USER_CONFIGURATION: "Erreur lors de la configuration utilisateur :",
-    TranslationKeys.ERROR_DURING_STEP: "❌ Erreur lors de l'étape",
-    TranslationKeys.ERROR_SAVING: "❌ Erreur lors de la sauvegarde :",
-    TranslationKeys.ERROR_STARTING_SERVICE: "❌ Erreur lors du démarrage du service",
-    TranslationKeys.ERROR_STOPPING_SERVICE: "❌ Erreur lors de l'arrêt du service",
-    TranslationKeys.ERROR_RESTARTING_SERVICE: "❌ Erreur lors du redémarrage du service",
-    TranslationKeys.SERVICE_FILE_CREATED: "✅ Fichier service créé",
-    TranslationKeys.SYSTEMD_RELOADED: "✅ Configuration systemd rechargée",
-    TranslationKeys.SERVICE_ENABLED_ON_BOOT: "✅ Service activé au démarrage",
-    TranslationKeys.WANT_TO_START_SERVICE_NOW: "Voulez-vous démarrer le service maintenant ?",
-    TranslationKeys.SERVICE_RUNNING: "Service en cours d'exécution",
-    TranslationKeys.SERVICE_INSTALLED_BUT_NOT_ACTIVE: "Le service est installé mais n'est pas actif",
-    TranslationKeys.INSTALL_SERVICE_ACTION: "installer le service",
-    TranslationKeys.SERVICE_NAME_REQUIRED: "❌ Le nom du service est requis.",
-    # Messages de validation
-    TranslationKeys.SERVICE_NAME_VALIDATION: "Le nom du service ne peut contenir que des lettres, chiffres, tirets et underscores",
-    TranslationKeys.SERVICE_NAME_MIN_LENGTH: "Le nom du service doit faire au moins 1 caractère",
-    TranslationKeys.SERVICE_NAME_NO_NUMBER_START: "Le nom du service ne doit pas commencer par un chiffre",
-    TranslationKeys.SERVICE_ALREADY_EXISTS: "Un service avec ce nom existe déjà",
-    # Interface principale
-    TranslationKeys.MAIN_TITLE: "🚀 Gestionnaire de services systemd",
-    TranslationKeys.WHAT_DO_YOU_WANT_TO_DO: "Que souhaitez-vous faire ?",
-    TranslationKeys.CREATE_NEW_SERVICE: "📝 Créer un nouveau service",
-    TranslationKeys.MANAGE_EXISTING_SERVICES: "⚙️  Gérer les services existants",
-    TranslationKeys.LANGUAGE: "🌍 Langue",
-    TranslationKeys.QUIT: "❌ Quitter",
-    TranslationKeys.CHOOSE_LANGUAGE: "🌍 Choisissez votre langue",
-    TranslationKeys.FRENCH: "🇫🇷 Français",
-    TranslationKeys.ENGLISH: "🇬🇧 Anglais",
-    # Configuration du service
-    TranslationKeys.SERVICE_NAME: "Nom du service",
-    TranslationKeys.DESCRIPTION: "Description",
-    TranslationKeys.SERVICE_TYPE: "Type de service",
-    TranslationKeys.USER_CONFIGURATION: "Configuration utilisateur",
-    TranslationKeys.WORKING_DIRECTORY: "Dossier de travail",
-    TranslationKeys.EXECUTION_COMMAND: "Commande d'exécution",
-    TranslationKeys.CONFIGURE_SERVICE_TYPE: "⚡ Configuration du type de service",
-    TranslationKeys.SIMPLE_TYPE: "simple - Le processus reste au premier plan (recommandé, y compris pour screen via -DmS)",
-    TranslationKeys.FORKING_TYPE: "forking - Le processus se détache en arrière-plan",
-    TranslationKeys.ONESHOT_TYPE: "oneshot - S'exécute une fois et s'arrête",
-    TranslationKeys.NOTIFY_TYPE: "notify - Comme simple mais notifie quand il est prêt",
-    # Messages de progression
-    TranslationKeys.PROGRESS_STEP: "🔄 Étape {step}/{total}: {name}",
-    TranslationKeys.USE_BACK_TO_GO_BACK: "Utilisez ↩️  pour revenir en arrière à tout moment",
-    TranslationKeys.BACK_TO_PREVIOUS_STEP: "↩️  Retour à l'étape précédente",
-    TranslationKeys.MSG_NO_SERVICES: "Aucun service disponible",
-    TranslationKeys.MSG_CHOOSE_SERVICE: "Choisissez un service",
-    TranslationKeys.MSG_CHOOSE_ACTION: "Choisissez une action",
-    TranslationKeys.BACK: "↩️  Retour",
-    # Actions sur les services
-    TranslationKeys.START_SERVICE: "🚀 Démarrer",
-    TranslationKeys.STOP_SERVICE: "🛑 Arrêter",
-    TranslationKeys.RESTART_SERVICE: "🔄 Redémarrer",
-    TranslationKeys.VIEW_STATUS: "📊 Voir le statut",
-    TranslationKeys.VIEW_LOGS: "📜 Voir les logs",
-    TranslationKeys.EDIT_SERVICE_ACTION: "📝 Modifier",
-    TranslationKeys.DELETE_SERVICE_ACTION: "🗑️  Supprimer",
-    # Messages de succès
-    TranslationKeys.SERVICE_INITIALIZED: "✅ Service '{name}' initialisé",
-    TranslationKeys.DESCRIPTION_ADDED: "✅ Description ajoutée",
-    TranslationKeys.SERVICE_TYPE_SET: "✅ Type de service défini : {result}",
-    TranslationKeys.USER_CONFIGURED: "✅ Utilisateur configuré : {user}",
-    TranslationKeys.WORKING_DIRECTORY_SET: "✅ Dossier de travail défini : {directory}",
-    TranslationKeys.FINAL_CONFIGURATION_COMPLETED: "✅ Configuration finale terminée",
-    TranslationKeys.SERVICE_UPDATED_AND_RESTARTED: "✅ Service {name} mis à jour et redémarré",
-    TranslationKeys.SERVICE_DELETED: "✅ Service {name} complètement supprimé",
-    TranslationKeys.SERVICE_STARTED_SUCCESSFULLY: "✅ Service {name} démarré avec succès",
-    TranslationKeys.SERVICE_STOPPED_SUCCESSFULLY: "✅ Service {name} arrêté avec succès",
-    TranslationKeys.SERVICE_RESTARTED_SUCCESSFULLY: "✅ Service {name} redémarré avec succès",
-    # Instructions et messages pour le nom du service
-    TranslationKeys.ENTER_SERVICE_NAME_INSTRUCTION: "Entrez un nom (lettres, chiffres, - et _ uniquement)\n'b' pour revenir en arrière, 'q' pour quitter",
-    TranslationKeys.ENTER_SERVICE_DESCRIPTION_INSTRUCTION: "Décrivez brièvement le service\n'b' pour revenir, 'q' pour quitter",
-    TranslationKeys.CONFIRM_QUIT: "Êtes-vous sûr de vouloir quitter ?",
-    TranslationKeys.INVALID_NAME: "❌ Nom invalide. Utilisez uniquement des lettres, des chiffres, - et _",
-    TranslationKeys.SELECT_USER_TO_RUN_SERVICE: "Sélectionnez l'utilisateur qui exécutera le service :",
-    # Messages pour le dossier de travail
-    TranslationKeys.BROWSE_DIRECTORIES: "📂 Parcourir les dossiers",
-    TranslationKeys.ENTER_PATH_MANUALLY: "📝 Saisir le chemin manuellement",
-    TranslationKeys.DEFINE_WORKING_DIRECTORY: "Comment souhaitez-vous définir le dossier de travail ?",
-    TranslationKeys.ENTER_FULL_DIRECTORY_PATH: "Entrez le chemin complet du dossier de travail :",
-    TranslationKeys.DIRECTORY_DOES_NOT_EXIST: "Le dossier {directory} n'existe pas",
-    TranslationKeys.NOT_A_DIRECTORY: "{directory} n'est pas un dossier",
-    # Messages pour la navigation des dossiers
-    TranslationKeys.CURRENT_DIRECTORY: "Dossier actuel :",
-    TranslationKeys.SELECT_DIRECTORY: "Sélectionnez un dossier :",
-    TranslationKeys.SELECT_THIS_DIRECTORY: "✅ Sélectionner ce dossier",
-    # Messages pour la commande d'exécution
-    TranslationKeys.SPECIFY_COMMAND_METHOD: "Comment souhaitez-vous spécifier la commande ?",
-    TranslationKeys.SELECT_EXECUTABLE_FILE: "📂 Sélectionner un fichier exécutable",
-    TranslationKeys.ENTER_COMMAND_MANUALLY: "📝 Saisir la commande manuellement",
-    TranslationKeys.SEARCH_EXECUTABLE_FILES: "🔍 Recherche des fichiers exécutables dans :",
-    TranslationKeys.ERROR_READING_DIRECTORY: "Erreur lors de la lecture du dossier",
-    TranslationKeys.NO_EXECUTABLE_FILES_FOUND: "Aucun fichier exécutable trouvé dans",
-    TranslationKeys.ENTER_EXECUTION_COMMAND: "Entrez la commande d'exécution :",
-    TranslationKeys.EXAMPLE_COMMAND: "Exemple : python3 script.py ou ./executable",
-    TranslationKeys.RUN_SERVICE_IN_SCREEN: "Voulez-vous exécuter ce service dans screen ?",
-    # Autres messages
-    TranslationKeys.QUIT_WITHOUT_SAVING: "Quitter sans sauvegarder",
-    TranslationKeys.WANT_TO_RETRY: "Voulez-vous réessayer ?",
-    TranslationKeys.SAVE_CONFIGURATION: "Sauvegarde de la configuration",
-    TranslationKeys.CONFIGURATION_SAVED: "✅ Configuration sauvegardée",
-    TranslationKeys.WANT_TO_INSTALL_SERVICE_NOW: "Voulez-vous installer le service maintenant ?",
-    TranslationKeys.SERVICE_INSTALLED_SUCCESSFULLY: "✅ Service installé avec succès",
-    TranslationKeys.SERVICE_ALREADY_ACTIVE: "⚠️  Le service {name} est déjà actif",
-    TranslationKeys.SERVICE_NOT_ACTIVE: "⚠️  Le service est installé mais n'est pas actif",
-    TranslationKeys.CHECKING_LOGS: "📜 Consultation des logs :",
-    TranslationKeys.LAST_SERVICE_LOGS: "📜 Derniers logs du service :",
-    TranslationKeys.INVALID_INPUT_FOR_START_DELAY: "Entrée invalide pour le délai de démarrage.",
-    TranslationKeys.INVALID_INPUT_FOR_MAX_RESTARTS: "Entrée invalide pour le nombre maximum de redémarrages.",
-    TranslationKeys.WANT_TO_QUIT: "Voulez-vous vraiment quitter ?",
-    TranslationKeys.YES: "Oui",
-    TranslationKeys.NO: "Non",
-    TranslationKeys.ARE_YOU_SURE_YOU_WANT_TO_DELETE: "Êtes-vous sûr de vouloir supprimer {name} ?",
-    TranslationKeys.SERVICE_STOPPED: "📥 Arrêt du service {name}...",
-    TranslationKeys.SERVICE_DISABLED: "🔌 Désactivation du service {name}...",
-    TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Fichier service supprimé : {path}",
-    TranslationKeys.CONFIGURATION_DELETED: "🗑️  Configuration supprimée : {path}",
-    TranslationKeys.SERVICE_FULLY_DELETED: "✅ Service {name} complètement supprimé",
-    # Édition des sections
-    TranslationKeys.WHICH_SECTION_TO_EDIT: "Quelle section voulez-vous modifier ?",
-    TranslationKeys.SECTION_UNIT: "📋 Section [Unit] - Description et dépendances",
-    TranslationKeys.SECTION_SERVICE: "⚙️  Section [Service] - Configuration du service",
-    TranslationKeys.SECTION_INSTALL: "🔌 Section [Install] - Installation et démarrage",
-    TranslationKeys.SAVE_AND_APPLY_CHANGES: "💾 Sauvegarder et appliquer les modifications",
-    # Modifications des sections
-    TranslationKeys.WHAT_DO_YOU_WANT_TO_MODIFY: "Que souhaitez-vous modifier ?",
-    TranslationKeys.DESCRIPTION: "📝 Description",
-    TranslationKeys.DOCUMENTATION: "📚 Documentation",
-    TranslationKeys.START_LIMIT_INTERVAL: "⏰ Délai avant redémarrage",
-    TranslationKeys.START_LIMIT_BURST: "🔄 Nombre de redémarrages",
-    TranslationKeys.USER: "👤 Utilisateur",
-    TranslationKeys.GROUP: "👥 Groupe",
-    TranslationKeys.WORKING_DIRECTORY: "📂 Dossier de travail",
-    TranslationKeys.SERVICE_TYPE: "⚡ Type de service",
-    TranslationKeys.EXEC_START: "🚀 Commande de démarrage",
-    TranslationKeys.EXEC_STOP: "🛑 Commande d'arrêt",
-    TranslationKeys.RESTART_POLICY: "🔄 Politique de redémarrage",
-    TranslationKeys.RESTART_SEC: "⏱️  Délai de redémarrage",
-    TranslationKeys.MAX_RESTARTS_ALLOWED: "🔄 Nombre maximum de redémarrages",
-    # Politique de redémarrage
-    TranslationKeys.CHOOSE_RESTART_POLICY: "Choisissez la politique de redémarrage :",
-    # Entrées invalides
-    TranslationKeys.INVALID_INPUT: "Entrée invalide.",
-    # Autres
-    TranslationKeys.RETRY: "Réessayer",
-    TranslationKeys.RETOUR: "Retour",
-    TranslationKeys.EXITING: "Au revoir ! 👋",
-    # Instructions pour quitter ou revenir
-    TranslationKeys.ENTER_B_TO_GO_BACK: "'b' pour revenir",
-    TranslationKeys.ENTER_Q_TO_QUIT: "'q' pour quitter",
-    # Messages pour le timer (si nécessaire)
-    TranslationKeys.CONFIGURE_TIMER: "Voulez-vous configurer un timer ?",
-    TranslationKeys.TIMER_TYPE: "Type de timer :",
-    TranslationKeys.DELAY_AFTER_BOOT: "Délai après le démarrage",
-    TranslationKeys.REGULAR_INTERVAL: "Intervalle régulier",
-    TranslationKeys.SPECIFIC_TIME: "Heure spécifique",
-    TranslationKeys.DELAY_IN_SECONDS: "Délai en secondes :",
-    TranslationKeys.INTERVAL_IN_SECONDS: "Intervalle en secondes :",
-    TranslationKeys.TIME_IN_HH_MM: "Heure (format HH:MM) :",
-    TranslationKeys.INVALID_TIME_FORMAT: "Format de temps invalide.",
-    TranslationKeys.ON_BOOT_SEC: "OnBootSec={seconds}s",
-    TranslationKeys.ON_UNIT_ACTIVE_SEC: "OnUnitActiveSec={seconds}s",
-    TranslationKeys.ON_CALENDAR: "OnCalendar=*-*-* {time}:00",
-    # Confirmation
-    TranslationKeys.CONFIRMATION: "Confirmation",
-    TranslationKeys.ARE_YOU_SURE: "Êtes-vous sûr ?",
-    TranslationKeys.YES: "Oui",
-    TranslationKeys.NO: "Non",
-    # Clés pour les options de redémarrage
-    TranslationKeys.RESTART_NO_KEY: "non",
-    TranslationKeys.RESTART_ALWAYS_KEY: "toujours",
-    TranslationKeys.RESTART_ON_FAILURE_KEY: "en cas d'échec",
-    TranslationKeys.RESTART_ON_ABNORMAL_KEY: "en cas d'anomalie",
-    # Messages supplémentaires
-    TranslationKeys.RESTART_LIMIT_CONFIGURATION: "🔄 Configuration des limites de redémarrage",
-    TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Nombre maximum de redémarrages en 5 minutes :",
-    TranslationKeys.ENTER_NUMBER_DEFAULT: "Entrez un nombre (défaut: {default})",
-    TranslationKeys.RESTART_DELAY_BETWEEN_ATTEMPTS: "Délai entre les tentatives de redémarrage (en secondes) :",
-    TranslationKeys.ENTER_SECONDS_DEFAULT: "Entrez un nombre de secondes (défaut: {default})",
-    # Options de redémarrage
-    TranslationKeys.RESTART_NO: "Ne pas redémarrer",
-    TranslationKeys.RESTART_NO_DESCRIPTION: "Le service ne redémarre jamais automatiquement",
-    TranslationKeys.RESTART_ALWAYS: "Toujours redémarrer",
-    TranslationKeys.RESTART_ALWAYS_DESCRIPTION: "Le service redémarre toujours automatiquement",
-    TranslationKeys.RESTART_ON_FAILURE: "Redémarrer sur échec",
-    TranslationKeys.RESTART_ON_FAILURE_DESCRIPTION: "Le service redémarre uniquement en cas d'échec",
-    TranslationKeys.RESTART_ON_ABNORMAL: "Redémarrer sur anomalie",
-    TranslationKeys.RESTART_ON_ABNORMAL_DESCRIPTION: "Le service redémarre en cas d'arrêt anormal",
-    # Détails des options de redémarrage
-    TranslationKeys.RESTART_NO_DETAIL: "Le service ne redémarre jamais automatiquement.",
-    TranslationKeys.RESTART_ALWAYS_DETAIL: "Le service redémarre toujours automatiquement.",
-    TranslationKeys.RESTART_ON_FAILURE_DETAIL: "Le service redémarre uniquement en cas d'échec.",
-    TranslationKeys.RESTART_ON_ABNORMAL_DETAIL: "Le service redémarre en cas d'arrêt anormal.",
-    # Configuration du redémarrage
-    TranslationKeys.RESTART_CONFIGURATION: "Configuration du redémarrage",
-    TranslationKeys.RESTART_CONFIGURATION_TITLE: "🔄 Restart Options Configuration",
-    TranslationKeys.RESTART_CONFIGURATION_DESCRIPTION: "Configurez comment le service doit se comporter en cas d'arrêt",
-    # Configuration des redémarrages
-    TranslationKeys.RESTART_POLICY_ABNORMAL: "en cas d'anomalie - Redémarrer sur arrêt anormal",
-    TranslationKeys.RESTART_LIMITS_CONFIG: "🔄 Configuration des limites de redémarrage",
-    TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Nombre maximum de redémarrages en 5 minutes :",
-    TranslationKeys.ENTER_NUMBER_DEFAULT: "Entrez un nombre (défaut: {default})",
-    # Politiques de redémarrage
-    TranslationKeys.RESTART_POLICY_NO: "Ne pas redémarrer",
-    TranslationKeys.RESTART_POLICY_ALWAYS: "Toujours redémarrer",
-    TranslationKeys.RESTART_POLICY_ON_FAILURE: "Redémarrer en cas d'échec",
-    TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Redémarrer en cas d'anomalie",
-    TranslationKeys.RESTART_POLICY_ON_ABORT: "Redémarrer en cas d'arrêt",
-    TranslationKeys.RESTART_POLICY_ON_WATCHDOG: "Redémarrer sur watchdog",
-    # Options d'édition
-    TranslationKeys.EDIT_USER: "👤 Utilisateur",
-    TranslationKeys.EDIT_GROUP: "👥 Groupe",
-    TranslationKeys.EDIT_WORKING_DIR: "📂 Dossier de travail",
-    TranslationKeys.EDIT_SERVICE_TYPE: "⚡ Type de service",
-    TranslationKeys.EDIT_START_COMMAND: "🚀 Commande de démarrage",
-    TranslationKeys.EDIT_STOP_COMMAND: "🛑 Commande d'arrêt",
-    TranslationKeys.EDIT_RESTART_POLICY: "🔄 Politique de redémarrage",
-    TranslationKeys.EDIT_RESTART_DELAY: "⏱️  Délai de redémarrage",
-    TranslationKeys.EDIT_MAX_RESTARTS: "🔄 Nombre maximum de redémarrages",
-    # Ajouter ces traductions françaises
-    TranslationKeys.EDIT_SECTION_TITLE: "Quelle section voulez-vous modifier ?",
-    TranslationKeys.EDIT_SECTION_UNIT: "📋 Section [Unit] - Description et dépendances",
-    TranslationKeys.EDIT_SECTION_SERVICE: "⚙️  Section [Service] - Configuration du service",
-    TranslationKeys.EDIT_SECTION_INSTALL: "🔌 Section [Install] - Installation et démarrage",
-    TranslationKeys.EDIT_SAVE_CHANGES: "💾 Sauvegarder et appliquer les modifications",
-    TranslationKeys.EDIT_DESCRIPTION: "📝 Description",
-    TranslationKeys.EDIT_DOCUMENTATION: "📚 Documentation",
-    TranslationKeys.EDIT_START_LIMIT_INTERVAL: "⏰ Délai avant redémarrage",
-    TranslationKeys.EDIT_START_LIMIT_BURST: "🔄 Nombre de redémarrages",
-    TranslationKeys.EDIT_CURRENT_VALUE: "Valeur actuelle : {value}",
-    TranslationKeys.EDIT_ENTER_NEW_VALUE: "Nouvelle valeur :",
-    TranslationKeys.EDIT_URLS_SPACE_SEPARATED: "Documentation (URLs, séparées par des espaces) :",
-    TranslationKeys.EDIT_RESTART_INTERVAL: "Délai avant redémarrage (en secondes) :",
-    TranslationKeys.EDIT_RESTART_ATTEMPTS: "Nombre de redémarrages autorisés :",
-    TranslationKeys.EDIT_WANTED_BY: "🎯 WantedBy (Démarrage automatique)",
-    TranslationKeys.EDIT_REQUIRED_BY: "⚡ RequiredBy (Dépendances)",
-    TranslationKeys.EDIT_ALSO: "➕ Also (Services additionnels)",
-    TranslationKeys.EDIT_WANTED_BY_PROMPT: "Cibles qui démarrent ce service (ex: multi-user.target) :",
-    TranslationKeys.EDIT_REQUIRED_BY_PROMPT: "Services qui requièrent ce service :",
-    TranslationKeys.EDIT_ALSO_PROMPT: "Services à installer en même temps :",
-    # Suppression de service
-    TranslationKeys.CONFIRM_DELETE_SERVICE: "⚠️  Êtes-vous sûr de vouloir supprimer {name} ?",
-    TranslationKeys.STOPPING_SERVICE: "🛑 Arrêt du service {name}...",
-    TranslationKeys.DISABLING_SERVICE: "🔌 Désactivation du service {name}...",
-    TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Fichier service supprimé : {path}",
-    TranslationKeys.CONFIG_FILE_DELETED: "🗑️  Fichier de configuration supprimé : {path}",
-    TranslationKeys.SERVICE_DELETED: "✅ Service {name} complètement supprimé",
-}
+def _catalog_fr() -> Dict[str, str]:
+    return {
+        # Configuration des redémarrages
+        TranslationKeys.RESTART_POLICY_TITLE: "🔄 Configuration de la politique de redémarrage",
+        TranslationKeys.RESTART_POLICY_DESCRIPTION: "Choisissez comment le service doit redémarrer",
+        TranslationKeys.RESTART_LIMITS_TITLE: "🔄 Configuration des limites de redémarrage",
+        TranslationKeys.RESTART_LIMITS_MAX_RESTARTS: "Nombre maximum de redémarrages en 5 minutes :",
+        TranslationKeys.RESTART_LIMITS_DELAY: "Délai entre les tentatives de redémarrage (en secondes) :",
+        TranslationKeys.RESTART_LIMITS_DEFAULT: "Entrez un nombre (défaut: {default})",
+        TranslationKeys.RESTART_POLICY_NO: "Ne pas redémarrer",
+        TranslationKeys.RESTART_POLICY_ALWAYS: "Toujours redémarrer",
+        TranslationKeys.RESTART_POLICY_ON_FAILURE: "Redémarrer en cas d'échec",
+        TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Redémarrer en cas d'anomalie",
+        TranslationKeys.WELCOME: "Bienvenue dans SystemdManager",
+        TranslationKeys.MAIN_MENU: "Menu principal",
+        TranslationKeys.CREATE_SERVICE: "📝 Créer un nouveau service",
+        TranslationKeys.EDIT_SERVICE: "Modifier le service",
+        TranslationKeys.DELETE_SERVICE: "Supprimer le service",
+        TranslationKeys.VIEW_SERVICE: "Voir le service",
+        TranslationKeys.EXIT: "Quitter",
+        TranslationKeys.SELECT_ACTION: "Sélectionnez une action",
+        TranslationKeys.GOODBYE: "Au revoir ! 👋",
+        TranslationKeys.CREATE_NEW_SERVICE_SYSTEMD: "📝 Création d'un nouveau service systemd",
+        TranslationKeys.EXEC_COMMAND_CONFIGURED: "✅ Commande d'exécution configurée",
+        TranslationKeys.START_DELAY: "⏰ Délai de démarrage (en secondes)",
+        TranslationKeys.START_DELAY_SET: "✅ Délai de démarrage défini à {delay} secondes",
+        TranslationKeys.MAX_RESTARTS: "🔄 Nombre maximum de redémarrages",
+        TranslationKeys.CONFIGURE_FINAL_SERVICE: "🔧 Configuration finale du service",
+        TranslationKeys.MAX_RESTARTS_SET: "✅ Nombre maximum de redémarrages défini à {restarts}",
+        # Messages d'erreur et d'administration
+        TranslationKeys.ADMIN_RIGHTS_REQUIRED: "⚠️  Droits administrateur requis pour",
+        TranslationKeys.RELAUNCH_WITH_SUDO: "📌 Relancez avec sudo",
+        TranslationKeys.INSTALLATION_ERROR: "❌ Erreur lors de l'installation :",
+        TranslationKeys.UNEXPECTED_ERROR: " Erreur inattendue :",
+        TranslationKeys.ERROR_READING_USERS: "Erreur lors de la lecture des utilisateurs :",
+        TranslationKeys.ERROR_USER_CONFIGURATION: "Erreur lors de la configuration utilisateur :",
+        TranslationKeys.ERROR_DURING_STEP: "❌ Erreur lors de l'étape",
+        TranslationKeys.ERROR_SAVING: "❌ Erreur lors de la sauvegarde :",
+        TranslationKeys.ERROR_STARTING_SERVICE: "❌ Erreur lors du démarrage du service",
+        TranslationKeys.ERROR_STOPPING_SERVICE: "❌ Erreur lors de l'arrêt du service",
+        TranslationKeys.ERROR_RESTARTING_SERVICE: "❌ Erreur lors du redémarrage du service",
+        TranslationKeys.SERVICE_FILE_CREATED: "✅ Fichier service créé",
+        TranslationKeys.SYSTEMD_RELOADED: "✅ Configuration systemd rechargée",
+        TranslationKeys.SERVICE_ENABLED_ON_BOOT: "✅ Service activé au démarrage",
+        TranslationKeys.WANT_TO_START_SERVICE_NOW: "Voulez-vous démarrer le service maintenant ?",
+        TranslationKeys.SERVICE_RUNNING: "Service en cours d'exécution",
+        TranslationKeys.SERVICE_INSTALLED_BUT_NOT_ACTIVE: "Le service est installé mais n'est pas actif",
+        TranslationKeys.INSTALL_SERVICE_ACTION: "installer le service",
+        TranslationKeys.SERVICE_NAME_REQUIRED: "❌ Le nom du service est requis.",
+        # Messages de validation
+        TranslationKeys.SERVICE_NAME_VALIDATION: "Le nom du service ne peut contenir que des lettres, chiffres, tirets et underscores",
+        TranslationKeys.SERVICE_NAME_MIN_LENGTH: "Le nom du service doit faire au moins 1 caractère",
+        TranslationKeys.SERVICE_NAME_NO_NUMBER_START: "Le nom du service ne doit pas commencer par un chiffre",
+        TranslationKeys.SERVICE_ALREADY_EXISTS: "Un service avec ce nom existe déjà",
+        # Interface principale
+        TranslationKeys.MAIN_TITLE: "🚀 Gestionnaire de services systemd",
+        TranslationKeys.WHAT_DO_YOU_WANT_TO_DO: "Que souhaitez-vous faire ?",
+        TranslationKeys.CREATE_NEW_SERVICE: "📝 Créer un nouveau service",
+        TranslationKeys.MANAGE_EXISTING_SERVICES: "⚙️  Gérer les services existants",
+        TranslationKeys.LANGUAGE: "🌍 Langue",
+        TranslationKeys.QUIT: "❌ Quitter",
+        TranslationKeys.CHOOSE_LANGUAGE: "🌍 Choisissez votre langue",
+        TranslationKeys.FRENCH: "🇫🇷 Français",
+        TranslationKeys.ENGLISH: "🇬🇧 Anglais",
+        # Configuration du service
+        TranslationKeys.SERVICE_NAME: "Nom du service",
+        TranslationKeys.DESCRIPTION: "Description",
+        TranslationKeys.SERVICE_TYPE: "Type de service",
+        TranslationKeys.USER_CONFIGURATION: "Configuration utilisateur",
+        TranslationKeys.WORKING_DIRECTORY: "Dossier de travail",
+        TranslationKeys.EXECUTION_COMMAND: "Commande d'exécution",
+        TranslationKeys.CONFIGURE_SERVICE_TYPE: "⚡ Configuration du type de service",
+        TranslationKeys.SIMPLE_TYPE: "simple - Le processus reste au premier plan (recommandé, y compris pour screen via -DmS)",
+        TranslationKeys.FORKING_TYPE: "forking - Le processus se détache en arrière-plan",
+        TranslationKeys.ONESHOT_TYPE: "oneshot - S'exécute une fois et s'arrête",
+        TranslationKeys.NOTIFY_TYPE: "notify - Comme simple mais notifie quand il est prêt",
+        # Messages de progression
+        TranslationKeys.PROGRESS_STEP: "🔄 Étape {step}/{total}: {name}",
+        TranslationKeys.USE_BACK_TO_GO_BACK: "Utilisez ↩️  pour revenir en arrière à tout moment",
+        TranslationKeys.BACK_TO_PREVIOUS_STEP: "↩️  Retour à l'étape précédente",
+        TranslationKeys.MSG_NO_SERVICES: "Aucun service disponible",
+        TranslationKeys.MSG_CHOOSE_SERVICE: "Choisissez un service",
+        TranslationKeys.MSG_CHOOSE_ACTION: "Choisissez une action",
+        TranslationKeys.BACK: "↩️  Retour",
+        # Actions sur les services
+        TranslationKeys.START_SERVICE: "🚀 Démarrer",
+        TranslationKeys.STOP_SERVICE: "🛑 Arrêter",
+        TranslationKeys.RESTART_SERVICE: "🔄 Redémarrer",
+        TranslationKeys.VIEW_STATUS: "📊 Voir le statut",
+        TranslationKeys.VIEW_LOGS: "📜 Voir les logs",
+        TranslationKeys.EDIT_SERVICE_ACTION: "📝 Modifier",
+        TranslationKeys.DELETE_SERVICE_ACTION: "🗑️  Supprimer",
+        # Messages de succès
+        TranslationKeys.SERVICE_INITIALIZED: "✅ Service '{name}' initialisé",
+        TranslationKeys.DESCRIPTION_ADDED: "✅ Description ajoutée",
+        TranslationKeys.SERVICE_TYPE_SET: "✅ Type de service défini : {result}",
+        TranslationKeys.USER_CONFIGURED: "✅ Utilisateur configuré : {user}",
+        TranslationKeys.WORKING_DIRECTORY_SET: "✅ Dossier de travail défini : {directory}",
+        TranslationKeys.FINAL_CONFIGURATION_COMPLETED: "✅ Configuration finale terminée",
+        TranslationKeys.SERVICE_UPDATED_AND_RESTARTED: "✅ Service {name} mis à jour et redémarré",
+        TranslationKeys.SERVICE_DELETED: "✅ Service {name} complètement supprimé",
+        TranslationKeys.SERVICE_STARTED_SUCCESSFULLY: "✅ Service {name} démarré avec succès",
+        TranslationKeys.SERVICE_STOPPED_SUCCESSFULLY: "✅ Service {name} arrêté avec succès",
+        TranslationKeys.SERVICE_RESTARTED_SUCCESSFULLY: "✅ Service {name} redémarré avec succès",
+        # Instructions et messages pour le nom du service
+        TranslationKeys.ENTER_SERVICE_NAME_INSTRUCTION: "Entrez un nom (lettres, chiffres, - et _ uniquement)\n'b' pour revenir en arrière, 'q' pour quitter",
+        TranslationKeys.ENTER_SERVICE_DESCRIPTION_INSTRUCTION: "Décrivez brièvement le service\n'b' pour revenir, 'q' pour quitter",
+        TranslationKeys.CONFIRM_QUIT: "Êtes-vous sûr de vouloir quitter ?",
+        TranslationKeys.INVALID_NAME: "❌ Nom invalide. Utilisez uniquement des lettres, des chiffres, - et _",
+        TranslationKeys.SELECT_USER_TO_RUN_SERVICE: "Sélectionnez l'utilisateur qui exécutera le service :",
+        # Messages pour le dossier de travail
+        TranslationKeys.BROWSE_DIRECTORIES: "📂 Parcourir les dossiers",
+        TranslationKeys.ENTER_PATH_MANUALLY: "📝 Saisir le chemin manuellement",
+        TranslationKeys.DEFINE_WORKING_DIRECTORY: "Comment souhaitez-vous définir le dossier de travail ?",
+        TranslationKeys.ENTER_FULL_DIRECTORY_PATH: "Entrez le chemin complet du dossier de travail :",
+        TranslationKeys.DIRECTORY_DOES_NOT_EXIST: "Le dossier {directory} n'existe pas",
+        TranslationKeys.NOT_A_DIRECTORY: "{directory} n'est pas un dossier",
+        # Messages pour la navigation des dossiers
+        TranslationKeys.CURRENT_DIRECTORY: "Dossier actuel :",
+        TranslationKeys.SELECT_DIRECTORY: "Sélectionnez un dossier :",
+        TranslationKeys.SELECT_THIS_DIRECTORY: "✅ Sélectionner ce dossier",
+        TranslationKeys.NEXT_PAGE: "➡️  Page suivante",
+        TranslationKeys.PREVIOUS_PAGE: "⬅️  Page précédente",
+        TranslationKeys.FILTER_DIRECTORIES: "🔍 Filtrer les dossiers",
+        TranslationKeys.FILTER_PROMPT: "Texte à rechercher (vide pour tout afficher) :",
+        TranslationKeys.DIRECTORY_PAGE: "Page {page}/{pages} — {count} dossiers",
+        # Messages pour la commande d'exécution
+        TranslationKeys.SPECIFY_COMMAND_METHOD: "Comment souhaitez-vous spécifier la commande ?",
+        TranslationKeys.SELECT_EXECUTABLE_FILE: "📂 Sélectionner un fichier exécutable",
+        TranslationKeys.ENTER_COMMAND_MANUALLY: "📝 Saisir la commande manuellement",
+        TranslationKeys.SEARCH_EXECUTABLE_FILES: "🔍 Recherche des fichiers exécutables dans :",
+        TranslationKeys.ERROR_READING_DIRECTORY: "Erreur lors de la lecture du dossier",
+        TranslationKeys.NO_EXECUTABLE_FILES_FOUND: "Aucun fichier exécutable trouvé dans",
+        TranslationKeys.ENTER_EXECUTION_COMMAND: "Entrez la commande d'exécution :",
+        TranslationKeys.EXAMPLE_COMMAND: "Exemple : python3 script.py ou ./executable",
+        TranslationKeys.RUN_SERVICE_IN_SCREEN: "Voulez-vous exécuter ce service dans screen ?",
+        # Autres messages
+        TranslationKeys.QUIT_WITHOUT_SAVING: "Quitter sans sauvegarder",
+        TranslationKeys.WANT_TO_RETRY: "Voulez-vous réessayer ?",
+        TranslationKeys.SAVE_CONFIGURATION: "Sauvegarde de la configuration",
+        TranslationKeys.CONFIGURATION_SAVED: "✅ Configuration sauvegardée",
+        TranslationKeys.WANT_TO_INSTALL_SERVICE_NOW: "Voulez-vous installer le service maintenant ?",
+        TranslationKeys.SERVICE_INSTALLED_SUCCESSFULLY: "✅ Service installé avec succès",
+        TranslationKeys.SERVICE_ALREADY_ACTIVE: "⚠️  Le service {name} est déjà actif",
+        TranslationKeys.SERVICE_NOT_ACTIVE: "⚠️  Le service est installé mais n'est pas actif",
+        TranslationKeys.CHECKING_LOGS: "📜 Consultation des logs :",
+        TranslationKeys.LAST_SERVICE_LOGS: "📜 Derniers logs du service :",
+        TranslationKeys.INVALID_INPUT_FOR_START_DELAY: "Entrée invalide pour le délai de démarrage.",
+        TranslationKeys.INVALID_INPUT_FOR_MAX_RESTARTS: "Entrée invalide pour le nombre maximum de redémarrages.",
+        TranslationKeys.WANT_TO_QUIT: "Voulez-vous vraiment quitter ?",
+        TranslationKeys.YES: "Oui",
+        TranslationKeys.NO: "Non",
+        TranslationKeys.ARE_YOU_SURE_YOU_WANT_TO_DELETE: "Êtes-vous sûr de vouloir supprimer {name} ?",
+        TranslationKeys.SERVICE_STOPPED: "📥 Arrêt du service {name}...",
+        TranslationKeys.SERVICE_DISABLED: "🔌 Désactivation du service {name}...",
+        TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Fichier service supprimé : {path}",
+        TranslationKeys.CONFIGURATION_DELETED: "🗑️  Configuration supprimée : {path}",
+        TranslationKeys.SERVICE_FULLY_DELETED: "✅ Service {name} complètement supprimé",
+        # Édition des sections
+        TranslationKeys.WHICH_SECTION_TO_EDIT: "Quelle section voulez-vous modifier ?",
+        TranslationKeys.SECTION_UNIT: "📋 Section [Unit] - Description et dépendances",
+        TranslationKeys.SECTION_SERVICE: "⚙️  Section [Service] - Configuration du service",
+        TranslationKeys.SECTION_INSTALL: "🔌 Section [Install] - Installation et démarrage",
+        TranslationKeys.SAVE_AND_APPLY_CHANGES: "💾 Sauvegarder et appliquer les modifications",
+        # Modifications des sections
+        TranslationKeys.WHAT_DO_YOU_WANT_TO_MODIFY: "Que souhaitez-vous modifier ?",
+        TranslationKeys.DESCRIPTION: "📝 Description",
+        TranslationKeys.DOCUMENTATION: "📚 Documentation",
+        TranslationKeys.START_LIMIT_INTERVAL: "⏰ Délai avant redémarrage",
+        TranslationKeys.START_LIMIT_BURST: "🔄 Nombre de redémarrages",
+        TranslationKeys.USER: "👤 Utilisateur",
+        TranslationKeys.GROUP: "👥 Groupe",
+        TranslationKeys.WORKING_DIRECTORY: "📂 Dossier de travail",
+        TranslationKeys.SERVICE_TYPE: "⚡ Type de service",
+        TranslationKeys.EXEC_START: "🚀 Commande de démarrage",
+        TranslationKeys.EXEC_STOP: "🛑 Commande d'arrêt",
+        TranslationKeys.RESTART_POLICY: "🔄 Politique de redémarrage",
+        TranslationKeys.RESTART_SEC: "⏱️  Délai de redémarrage",
+        TranslationKeys.MAX_RESTARTS_ALLOWED: "🔄 Nombre maximum de redémarrages",
+        # Politique de redémarrage
+        TranslationKeys.CHOOSE_RESTART_POLICY: "Choisissez la politique de redémarrage :",
+        # Entrées invalides
+        TranslationKeys.INVALID_INPUT: "Entrée invalide.",
+        # Autres
+        TranslationKeys.RETRY: "Réessayer",
+        TranslationKeys.RETOUR: "Retour",
+        TranslationKeys.EXITING: "Au revoir ! 👋",
+        # Instructions pour quitter ou revenir
+        TranslationKeys.ENTER_B_TO_GO_BACK: "'b' pour revenir",
+        TranslationKeys.ENTER_Q_TO_QUIT: "'q' pour quitter",
+        # Messages pour le timer (si nécessaire)
+        TranslationKeys.CONFIGURE_TIMER: "Voulez-vous configurer un timer ?",
+        TranslationKeys.TIMER_TYPE: "Type de timer :",
+        TranslationKeys.DELAY_AFTER_BOOT: "Délai après le démarrage",
+        TranslationKeys.REGULAR_INTERVAL: "Intervalle régulier",
+        TranslationKeys.SPECIFIC_TIME: "Heure spécifique",
+        TranslationKeys.DELAY_IN_SECONDS: "Délai en secondes :",
+        TranslationKeys.INTERVAL_IN_SECONDS: "Intervalle en secondes :",
+        TranslationKeys.TIME_IN_HH_MM: "Heure (format HH:MM) :",
+        TranslationKeys.INVALID_TIME_FORMAT: "Format de temps invalide.",
+        TranslationKeys.ON_BOOT_SEC: "OnBootSec={seconds}s",
+        TranslationKeys.ON_UNIT_ACTIVE_SEC: "OnUnitActiveSec={seconds}s",
+        TranslationKeys.ON_CALENDAR: "OnCalendar=*-*-* {time}:00",
+        # Confirmation
+        TranslationKeys.CONFIRMATION: "Confirmation",
+        TranslationKeys.ARE_YOU_SURE: "Êtes-vous sûr ?",
+        TranslationKeys.YES: "Oui",
+        TranslationKeys.NO: "Non",
+        # Clés pour les options de redémarrage
+        TranslationKeys.RESTART_NO_KEY: "non",
+        TranslationKeys.RESTART_ALWAYS_KEY: "toujours",
+        TranslationKeys.RESTART_ON_FAILURE_KEY: "en cas d'échec",
+        TranslationKeys.RESTART_ON_ABNORMAL_KEY: "en cas d'anomalie",
+        # Messages supplémentaires
+        TranslationKeys.RESTART_LIMIT_CONFIGURATION: "🔄 Configuration des limites de redémarrage",
+        TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Nombre maximum de redémarrages en 5 minutes :",
+        TranslationKeys.ENTER_NUMBER_DEFAULT: "Entrez un nombre (défaut: {default})",
+        TranslationKeys.RESTART_DELAY_BETWEEN_ATTEMPTS: "Délai entre les tentatives de redémarrage (en secondes) :",
+        TranslationKeys.ENTER_SECONDS_DEFAULT: "Entrez un nombre de secondes (défaut: {default})",
+        # Options de redémarrage
+        TranslationKeys.RESTART_NO: "Ne pas redémarrer",
+        TranslationKeys.RESTART_NO_DESCRIPTION: "Le service ne redémarre jamais automatiquement",
+        TranslationKeys.RESTART_ALWAYS: "Toujours redémarrer",
+        TranslationKeys.RESTART_ALWAYS_DESCRIPTION: "Le service redémarre toujours automatiquement",
+        TranslationKeys.RESTART_ON_FAILURE: "Redémarrer sur échec",
+        TranslationKeys.RESTART_ON_FAILURE_DESCRIPTION: "Le service redémarre uniquement en cas d'échec",
+        TranslationKeys.RESTART_ON_ABNORMAL: "Redémarrer sur anomalie",
+        TranslationKeys.RESTART_ON_ABNORMAL_DESCRIPTION: "Le service redémarre en cas d'arrêt anormal",
+        # Détails des options de redémarrage
+        TranslationKeys.RESTART_NO_DETAIL: "Le service ne redémarre jamais automatiquement.",
+        TranslationKeys.RESTART_ALWAYS_DETAIL: "Le service redémarre toujours automatiquement.",
+        TranslationKeys.RESTART_ON_FAILURE_DETAIL: "Le service redémarre uniquement en cas d'échec.",
+        TranslationKeys.RESTART_ON_ABNORMAL_DETAIL: "Le service redémarre en cas d'arrêt anormal.",
+        # Configuration du redémarrage
+        TranslationKeys.RESTART_CONFIGURATION: "Configuration du redémarrage",
+        TranslationKeys.RESTART_CONFIGURATION_TITLE: "🔄 Restart Options Configuration",
+        TranslationKeys.RESTART_CONFIGURATION_DESCRIPTION: "Configurez comment le service doit se comporter en cas d'arrêt",
+        # Configuration des redémarrages
+        TranslationKeys.RESTART_POLICY_ABNORMAL: "en cas d'anomalie - Redémarrer sur arrêt anormal",
+        TranslationKeys.RESTART_LIMITS_CONFIG: "🔄 Configuration des limites de redémarrage",
+        TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Nombre maximum de redémarrages en 5 minutes :",
+        TranslationKeys.ENTER_NUMBER_DEFAULT: "Entrez un nombre (défaut: {default})",
+        # Politiques de redémarrage
+        TranslationKeys.RESTART_POLICY_NO: "Ne pas redémarrer",
+        TranslationKeys.RESTART_POLICY_ALWAYS: "Toujours redémarrer",
+        TranslationKeys.RESTART_POLICY_ON_FAILURE: "Redémarrer en cas d'échec",
+        TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Redémarrer en cas d'anomalie",
+        TranslationKeys.RESTART_POLICY_ON_ABORT: "Redémarrer en cas d'arrêt",
+        TranslationKeys.RESTART_POLICY_ON_WATCHDOG: "Redémarrer sur watchdog",
+        # Options d'édition
+        TranslationKeys.EDIT_USER: "👤 Utilisateur",
+        TranslationKeys.EDIT_GROUP: "👥 Groupe",
+        TranslationKeys.EDIT_WORKING_DIR: "📂 Dossier de travail",
+        TranslationKeys.EDIT_SERVICE_TYPE: "⚡ Type de service",
+        TranslationKeys.EDIT_START_COMMAND: "🚀 Commande de démarrage",
+        TranslationKeys.EDIT_STOP_COMMAND: "🛑 Commande d'arrêt",
+        TranslationKeys.EDIT_RESTART_POLICY: "🔄 Politique de redémarrage",
+        TranslationKeys.EDIT_RESTART_DELAY: "⏱️  Délai de redémarrage",
+        TranslationKeys.EDIT_MAX_RESTARTS: "🔄 Nombre maximum de redémarrages",
+        # Ajouter ces traductions françaises
+        TranslationKeys.EDIT_SECTION_TITLE: "Quelle section voulez-vous modifier ?",
+        TranslationKeys.EDIT_SECTION_UNIT: "📋 Section [Unit] - Description et dépendances",
+        TranslationKeys.EDIT_SECTION_SERVICE: "⚙️  Section [Service] - Configuration du service",
+        TranslationKeys.EDIT_SECTION_INSTALL: "🔌 Section [Install] - Installation et démarrage",
+        TranslationKeys.EDIT_SAVE_CHANGES: "💾 Sauvegarder et appliquer les modifications",
+        TranslationKeys.EDIT_DESCRIPTION: "📝 Description",
+        TranslationKeys.EDIT_DOCUMENTATION: "📚 Documentation",
+        TranslationKeys.EDIT_START_LIMIT_INTERVAL: "⏰ Délai avant redémarrage",
+        TranslationKeys.EDIT_START_LIMIT_BURST: "🔄 Nombre de redémarrages",
+        TranslationKeys.EDIT_CURRENT_VALUE: "Valeur actuelle : {value}",
+        TranslationKeys.EDIT_ENTER_NEW_VALUE: "Nouvelle valeur :",
+        TranslationKeys.EDIT_URLS_SPACE_SEPARATED: "Documentation (URLs, séparées par des espaces) :",
+        TranslationKeys.EDIT_RESTART_INTERVAL: "Délai avant redémarrage (en secondes) :",
+        TranslationKeys.EDIT_RESTART_ATTEMPTS: "Nombre de redémarrages autorisés :",
+        TranslationKeys.EDIT_WANTED_BY: "🎯 WantedBy (Démarrage automatique)",
+        TranslationKeys.EDIT_REQUIRED_BY: "⚡ RequiredBy (Dépendances)",
+        TranslationKeys.EDIT_ALSO: "➕ Also (Services additionnels)",
+        TranslationKeys.EDIT_WANTED_BY_PROMPT: "Cibles qui démarrent ce service (ex: multi-user.target) :",
+        TranslationKeys.EDIT_REQUIRED_BY_PROMPT: "Services qui requièrent ce service :",
+        TranslationKeys.EDIT_ALSO_PROMPT: "Services à installer en même temps :",
+        # Suppression de service
+        TranslationKeys.CONFIRM_DELETE_SERVICE: "⚠️  Êtes-vous sûr de vouloir supprimer {name} ?",
+        TranslationKeys.STOPPING_SERVICE: "🛑 Arrêt du service {name}...",
+        TranslationKeys.DISABLING_SERVICE: "🔌 Désactivation du service {name}...",
+        TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Fichier service supprimé : {path}",
+        TranslationKeys.CONFIG_FILE_DELETED: "🗑️  Fichier de configuration supprimé : {path}",
+        TranslationKeys.SERVICE_DELETED: "✅ Service {name} complètement supprimé",
+        # Bilan de santé
+        TranslationKeys.HEALTH_SCAN: "🩺 Bilan de santé des services",
+        TranslationKeys.HEALTH_SCAN_RUNNING: "🔍 Analyse de {count} services...",
+        TranslationKeys.HEALTH_SCAN_SUMMARY: "🩺 {count} services analysés en {duration:.1f} s",
+        TranslationKeys.HEALTH_FAILED: "❌ En échec",
+        TranslationKeys.HEALTH_FLAPPING: "🔁 Instables",
+        TranslationKeys.HEALTH_ERRORING: "⚠️  Erreurs dans les logs",
+        TranslationKeys.HEALTH_ALL_OK: "✅ Tous les services sont en bonne santé",
+        TranslationKeys.HEALTH_RESTARTS: "redémarrages",
+    }
+
 
 # Dictionnaire de traduction anglais
-cli_translations_en = {
-    # Restart configuration
-    TranslationKeys.RESTART_POLICY_TITLE: "🔄 Restart Policy Configuration",
-    TranslationKeys.RESTART_POLICY_DESCRIPTION: "Choose how the service should restart",
-    TranslationKeys.RESTART_LIMITS_TITLE: "🔄 Restart Limits Configuration",
-    TranslationKeys.RESTART_LIMITS_MAX_RESTARTS: "Maximum number of restarts in 5 minutes:",
-    TranslationKeys.RESTART_LIMITS_DELAY: "Delay between restart attempts (in seconds):",
-    TranslationKeys.RESTART_LIMITS_DEFAULT: "Enter a number (default: {default})",
-    TranslationKeys.RESTART_POLICY_NO: "No restart",
-    TranslationKeys.RESTART_POLICY_ALWAYS: "Always restart",
-    TranslationKeys.RESTART_POLICY_ON_FAILURE: "Restart on failure",
-    TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Restart on abnormal",
-    # Messages de base en anglais
-    TranslationKeys.WELCOME: "Welcome to SystemdManager",
-    TranslationKeys.MAIN_MENU: "Main menu",
-    TranslationKeys.CREATE_SERVICE: "📝 Create new service",
-    TranslationKeys.EDIT_SERVICE: "Edit service",
-    TranslationKeys.DELETE_SERVICE: "Delete service",
-    TranslationKeys.VIEW_SERVICE: "View service",
-    TranslationKeys.EXIT: "Exit",
-    TranslationKeys.SELECT_ACTION: "Select an action",
-    TranslationKeys.GOODBYE: "Goodbye! 👋",
-    TranslationKeys.CREATE_NEW_SERVICE_SYSTEMD: "📝 Creating new systemd service",
-    TranslationKeys.EXEC_COMMAND_CONFIGURED: "✅ Execution command configured",
-    TranslationKeys.START_DELAY: "⏰ Start delay (in seconds)",
-    TranslationKeys.START_DELAY_SET: "✅ Start delay set to {delay} seconds",
-    TranslationKeys.MAX_RESTARTS: "🔄 Maximum number of restarts",
-    TranslationKeys.CONFIGURE_FINAL_SERVICE: "🔧 Final service configuration",
-    TranslationKeys.MAX_RESTARTS_SET: "✅ Maximum number of restarts set to {restarts}",
-    # Configuration des redémarrages en anglais
-    TranslationKeys.RESTART_POLICY_ABNORMAL: "on abnormal - Restart on abnormal exit",
-    TranslationKeys.RESTART_LIMITS_CONFIG: "🔄 Restart Limits Configuration",
-    TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Maximum number of restarts in 5 minutes:",
-    TranslationKeys.ENTER_NUMBER_DEFAULT: "Enter a number (default: {default})",
-    # Politiques de redémarrage en anglais
-    TranslationKeys.RESTART_POLICY_NO: "No restart",
-    TranslationKeys.RESTART_POLICY_ALWAYS: "Always restart",
-    TranslationKeys.RESTART_POLICY_ON_FAILURE: "Restart on failure",
-    TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Restart on abnormal",
-    TranslationKeys.RESTART_POLICY_ON_ABORT: "Restart on abort",
-    TranslationKeys.RESTART_POLICY_ON_WATCHDOG: "Restart on watchdog",
-    # Options d'édition en anglais
-    TranslationKeys.EDIT_USER: "👤 User",
-    TranslationKeys.EDIT_GROUP: "👥 Group",
-    TranslationKeys.EDIT_WORKING_DIR: "📂 Working directory",
-    TranslationKeys.EDIT_SERVICE_TYPE: "⚡ Service type",
-    TranslationKeys.EDIT_START_COMMAND: "🚀 Start command",
-    TranslationKeys.EDIT_STOP_COMMAND: "🛑 Stop command",
-    TranslationKeys.EDIT_RESTART_POLICY: "🔄 Restart policy",
-    TranslationKeys.EDIT_RESTART_DELAY: "⏱️  Restart delay",
-    TranslationKeys.EDIT_MAX_RESTARTS: "🔄 Maximum number of restarts",
-    # Configuration du redémarrage en anglais
-    TranslationKeys.RESTART_CONFIGURATION: "Restart Configuration",
-    TranslationKeys.RESTART_CONFIGURATION_TITLE: "🔄 Restart Options Configuration",
-    TranslationKeys.RESTART_CONFIGURATION_DESCRIPTION: "Configure how the service should behave when it stops",
-    # Détails des options de redémarrage en anglais
-    TranslationKeys.RESTART_NO_DETAIL: "The service never restarts automatically.",
-    TranslationKeys.RESTART_ALWAYS_DETAIL: "The service always restarts automatically.",
-    TranslationKeys.RESTART_ON_FAILURE_DETAIL: "The service restarts only on failure.",
-    TranslationKeys.RESTART_ON_ABNORMAL_DETAIL: "The service restarts on abnormal exit.",
-    # Ajouter ces traductions anglaises
-    TranslationKeys.EDIT_SECTION_TITLE: "Which section do you want to modify?",
-    TranslationKeys.EDIT_SECTION_UNIT: "📋 [Unit] Section - Description and dependencies",
-    TranslationKeys.EDIT_SECTION_SERVICE: "⚙️  [Service] Section - Service configuration",
-    TranslationKeys.EDIT_SECTION_INSTALL: "🔌 [Install] Section - Installation and startup",
-    TranslationKeys.EDIT_SAVE_CHANGES: "💾 Save and apply changes",
-    TranslationKeys.EDIT_DESCRIPTION: "📝 Description",
-    TranslationKeys.EDIT_DOCUMENTATION: "📚 Documentation",
-    TranslationKeys.EDIT_START_LIMIT_INTERVAL: "⏰ Restart delay",
-    TranslationKeys.EDIT_START_LIMIT_BURST: "🔄 Number of restarts",
-    TranslationKeys.EDIT_CURRENT_VALUE: "Current value: {value}",
-    TranslationKeys.EDIT_ENTER_NEW_VALUE: "New value:",
-    TranslationKeys.EDIT_URLS_SPACE_SEPARATED: "Documentation (URLs, space separated):",
-    TranslationKeys.EDIT_RESTART_INTERVAL: "Restart delay (in seconds):",
-    TranslationKeys.EDIT_RESTART_ATTEMPTS: "Number of allowed restarts:",
-    TranslationKeys.EDIT_WANTED_BY: "🎯 WantedBy (Auto-start)",
-    TranslationKeys.EDIT_REQUIRED_BY: "⚡ RequiredBy (Dependencies)",
-    TranslationKeys.EDIT_ALSO: "➕ Also (Additional services)",
-    TranslationKeys.EDIT_WANTED_BY_PROMPT: "Targets that start this service (e.g., multi-user.target):",
-    TranslationKeys.EDIT_REQUIRED_BY_PROMPT: "Services that require this service:",
-    TranslationKeys.EDIT_ALSO_PROMPT: "Services to install alongside:",
-    # Service deletion
-    TranslationKeys.CONFIRM_DELETE_SERVICE: "⚠️  Are you sure you want to delete {name}?",
-    TranslationKeys.STOPPING_SERVICE: "🛑 Stopping service {name}...",
-    TranslationKeys.DISABLING_SERVICE: "🔌 Disabling service {name}...",
-    TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Service file deleted: {path}",
-    TranslationKeys.CONFIG_FILE_DELETED: "🗑️  Configuration file deleted: {path}",
-    TranslationKeys.SERVICE_DELETED: "✅ Service {name} completely deleted",
+def _catalog_en() -> Dict[str, str]:
+    return {
+        # Restart configuration
+        TranslationKeys.RESTART_POLICY_TITLE: "🔄 Restart Policy Configuration",
+        TranslationKeys.RESTART_POLICY_DESCRIPTION: "Choose how the service should restart",
+        TranslationKeys.RESTART_LIMITS_TITLE: "🔄 Restart Limits Configuration",
+        TranslationKeys.RESTART_LIMITS_MAX_RESTARTS: "Maximum number of restarts in 5 minutes:",
+        TranslationKeys.RESTART_LIMITS_DELAY: "Delay between restart attempts (in seconds):",
+        TranslationKeys.RESTART_LIMITS_DEFAULT: "Enter a number (default: {default})",
+        TranslationKeys.RESTART_POLICY_NO: "No restart",
+        TranslationKeys.RESTART_POLICY_ALWAYS: "Always restart",
+        TranslationKeys.RESTART_POLICY_ON_FAILURE: "Restart on failure",
+        TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Restart on abnormal",
+        # Messages de base en anglais
+        TranslationKeys.WELCOME: "Welcome to SystemdManager",
+        TranslationKeys.MAIN_MENU: "Main menu",
+        TranslationKeys.CREATE_SERVICE: "📝 Create new service",
+        TranslationKeys.EDIT_SERVICE: "Edit service",
+        TranslationKeys.DELETE_SERVICE: "Delete service",
+        TranslationKeys.VIEW_SERVICE: "View service",
+        TranslationKeys.EXIT: "Exit",
+        TranslationKeys.SELECT_ACTION: "Select an action",
+        TranslationKeys.GOODBYE: "Goodbye! 👋",
+        TranslationKeys.CREATE_NEW_SERVICE_SYSTEMD: "📝 Creating new systemd service",
+        TranslationKeys.EXEC_COMMAND_CONFIGURED: "✅ Execution command configured",
+        TranslationKeys.START_DELAY: "⏰ Start delay (in seconds)",
+        TranslationKeys.START_DELAY_SET: "✅ Start delay set to {delay} seconds",
+        TranslationKeys.MAX_RESTARTS: "🔄 Maximum number of restarts",
+        TranslationKeys.CONFIGURE_FINAL_SERVICE: "🔧 Final service configuration",
+        TranslationKeys.MAX_RESTARTS_SET: "✅ Maximum number of restarts set to {restarts}",
+        # Configuration des redémarrages en anglais
+        TranslationKeys.RESTART_POLICY_ABNORMAL: "on abnormal - Restart on abnormal exit",
+        TranslationKeys.RESTART_LIMITS_CONFIG: "🔄 Restart Limits Configuration",
+        TranslationKeys.MAX_RESTARTS_IN_INTERVAL: "Maximum number of restarts in 5 minutes:",
+        TranslationKeys.ENTER_NUMBER_DEFAULT: "Enter a number (default: {default})",
+        # Politiques de redémarrage en anglais
+        TranslationKeys.RESTART_POLICY_NO: "No restart",
+        TranslationKeys.RESTART_POLICY_ALWAYS: "Always restart",
+        TranslationKeys.RESTART_POLICY_ON_FAILURE: "Restart on failure",
+        TranslationKeys.RESTART_POLICY_ON_ABNORMAL: "Restart on abnormal",
+        TranslationKeys.RESTART_POLICY_ON_ABORT: "Restart on abort",
+        TranslationKeys.RESTART_POLICY_ON_WATCHDOG: "Restart on watchdog",
+        # Options d'édition en anglais
+        TranslationKeys.EDIT_USER: "👤 User",
+        TranslationKeys.EDIT_GROUP: "👥 Group",
+        TranslationKeys.EDIT_WORKING_DIR: "📂 Working directory",
+        TranslationKeys.EDIT_SERVICE_TYPE: "⚡ Service type",
+        TranslationKeys.EDIT_START_COMMAND: "🚀 Start command",
+        TranslationKeys.EDIT_STOP_COMMAND: "🛑 Stop command",
+        TranslationKeys.EDIT_RESTART_POLICY: "🔄 Restart policy",
+        TranslationKeys.EDIT_RESTART_DELAY: "⏱️  Restart delay",
+        TranslationKeys.EDIT_MAX_RESTARTS: "🔄 Maximum number of restarts",
+        # Configuration du redémarrage en anglais
+        TranslationKeys.RESTART_CONFIGURATION: "Restart Configuration",
+        TranslationKeys.RESTART_CONFIGURATION_TITLE: "🔄 Restart Options Configuration",
+        TranslationKeys.RESTART_CONFIGURATION_DESCRIPTION: "Configure how the service should behave when it stops",
+        # Détails des options de redémarrage en anglais
+        TranslationKeys.RESTART_NO_DETAIL: "The service never restarts automatically.",
+        TranslationKeys.RESTART_ALWAYS_DETAIL: "The service always restarts automatically.",
+        TranslationKeys.RESTART_ON_FAILURE_DETAIL: "The service restarts only on failure.",
+        TranslationKeys.RESTART_ON_ABNORMAL_DETAIL: "The service restarts on abnormal exit.",
+        # Ajouter ces traductions anglaises
+        TranslationKeys.EDIT_SECTION_TITLE: "Which section do you want to modify?",
+        TranslationKeys.EDIT_SECTION_UNIT: "📋 [Unit] Section - Description and dependencies",
+        TranslationKeys.EDIT_SECTION_SERVICE: "⚙️  [Service] Section - Service configuration",
+        TranslationKeys.EDIT_SECTION_INSTALL: "🔌 [Install] Section - Installation and startup",
+        TranslationKeys.EDIT_SAVE_CHANGES: "💾 Save and apply changes",
+        TranslationKeys.EDIT_DESCRIPTION: "📝 Description",
+        TranslationKeys.EDIT_DOCUMENTATION: "📚 Documentation",
+        TranslationKeys.EDIT_START_LIMIT_INTERVAL: "⏰ Restart delay",
+        TranslationKeys.EDIT_START_LIMIT_BURST: "🔄 Number of restarts",
+        TranslationKeys.EDIT_CURRENT_VALUE: "Current value: {value}",
+        TranslationKeys.EDIT_ENTER_NEW_VALUE: "New value:",
+        TranslationKeys.EDIT_URLS_SPACE_SEPARATED: "Documentation (URLs, space separated):",
+        TranslationKeys.EDIT_RESTART_INTERVAL: "Restart delay (in seconds):",
+        TranslationKeys.EDIT_RESTART_ATTEMPTS: "Number of allowed restarts:",
+        TranslationKeys.EDIT_WANTED_BY: "🎯 WantedBy (Auto-start)",
+        TranslationKeys.EDIT_REQUIRED_BY: "⚡ RequiredBy (Dependencies)",
+        TranslationKeys.EDIT_ALSO: "➕ Also (Additional services)",
+        TranslationKeys.EDIT_WANTED_BY_PROMPT: "Targets that start this service (e.g., multi-user.target):",
+        TranslationKeys.EDIT_REQUIRED_BY_PROMPT: "Services that require this service:",
+        TranslationKeys.EDIT_ALSO_PROMPT: "Services to install alongside:",
+        # Service deletion
+        TranslationKeys.CONFIRM_DELETE_SERVICE: "⚠️  Are you sure you want to delete {name}?",
+        TranslationKeys.STOPPING_SERVICE: "🛑 Stopping service {name}...",
+        TranslationKeys.DISABLING_SERVICE: "🔌 Disabling service {name}...",
+        TranslationKeys.SERVICE_FILE_DELETED: "🗑️  Service file deleted: {path}",
+        TranslationKeys.CONFIG_FILE_DELETED: "🗑️  Configuration file deleted: {path}",
+        TranslationKeys.SERVICE_DELETED: "✅ Service {name} completely deleted",
+        # Health scan
+        TranslationKeys.HEALTH_SCAN: "🩺 Service health scan",
+        TranslationKeys.HEALTH_SCAN_RUNNING: "🔍 Scanning {count} services...",
+        TranslationKeys.HEALTH_SCAN_SUMMARY: "🩺 {count} services scanned in {duration:.1f} s",
+        TranslationKeys.HEALTH_FAILED: "❌ Failed",
+        TranslationKeys.HEALTH_FLAPPING: "🔁 Flapping",
+        TranslationKeys.HEALTH_ERRORING: "⚠️  Errors in logs",
+        TranslationKeys.HEALTH_ALL_OK: "✅ All services are healthy",
+        TranslationKeys.HEALTH_RESTARTS: "restarts",
+        TranslationKeys.SERVICE_ALREADY_EXISTS: "A service with this name already exists",
+        TranslationKeys.NEXT_PAGE: "➡️  Next page",
+        TranslationKeys.PREVIOUS_PAGE: "⬅️  Previous page",
+        TranslationKeys.FILTER_DIRECTORIES: "🔍 Filter folders",
+        TranslationKeys.FILTER_PROMPT: "Text to search for (empty to show everything):",
+        TranslationKeys.DIRECTORY_PAGE: "Page {page}/{pages} — {count} folders",
+    }
+
+
+CATALOGS: Dict[str, Callable[[], Dict[str, str]]] = {
+    "fr": _catalog_fr,
+    "en": _catalog_en,
 }
 
+_loaded_catalogs: Dict[str, Dict[str, str]] = {}
+
+
+def load_catalog(locale: str) -> Dict[str, str]:
+    """Return the catalog of ``locale``, building it on first use."""
+    catalog = _loaded_catalogs.get(locale)
+    if catalog is None:
+        catalog = _loaded_catalogs[locale] = CATALOGS[locale]()
+    return catalog
+
 
 class CLITranslations:
     def __init__(self):
         self.current_locale = "fr"
         self.config_dir = os.path.expanduser("~/.config/systemd-manager")
         self.config_file = os.path.join(self.config_dir, "cli_config.json")
-        self.translations = cli_translations_fr
+        self._translations: Dict[str, str] = {}
         self.load_config()
 
+    @property
+    def translations(self) -> Dict[str, str]:
+        # Only the catalog of the language actually used is ever built.
+        if not self._translations:
+            self._translations = load_catalog(self.current_locale)
+        return self._translations
+
     def load_config(self):
         """Charge la configuration de langue"""
         if os.path.exists(self.config_file):
             try:
                 with open(self.config_file, "r") as f:
                     config = json.load(f)
-                    self.current_locale = config.get("language", "fr")
-                    self.translations = (
-                        cli_translations_en
-                        if self.current_locale == "en"
-                        else cli_translations_fr
-                    )
+                    locale = config.get("language", "fr")
+                    self.current_locale = locale if locale in CATALOGS else "fr"
+                    self._translations = {}
             except (OSError, json.JSONDecodeError):
                 self.current_locale = "fr"
 
@@ -764,9 +832,7 @@ class CLITranslations:
         """Définit la langue courante"""
         if locale in ["fr", "en"]:
             self.current_locale = locale
-            self.translations = (
-                cli_translations_en if locale == "en" else cli_translations_fr
-            )
+            self._translations = {}
             self.save_config()
 
     def get_text(self, key):
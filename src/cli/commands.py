@@ -0,0 +1,429 @@
+"""Headless command-line interface for scripts, CI jobs and other tools.
+
+``systemd-manager <command> ...`` skips the banner and the interactive
+questionary menus entirely. Every command accepts several services at once
+and is answered with as few processes as possible: one batched
+``systemctl show`` for ``list``/``status``, one ``systemctl <verb>`` for all
+the units of ``start``/``stop``/``restart``, one ``daemon-reload`` for
+``apply``, one ``journalctl`` for ``logs``; ``lint`` validates every stored
+configuration without any process at all. When the daemon (``systemd-manager daemon``)
+is running, ``list``, ``status`` and ``logs`` are answered from its caches
+without spawning any process.
+
+This module must stay importable without questionary or customtkinter, so
+that a status check does not pay for loading the interactive interfaces.
+
+Exit codes:
+    0 success, 1 operation failure (``lint``: at least one configuration has
+    errors, or warnings with ``--strict``), 2 usage error (argparse),
+    3 ``status``: at least one unit is not active.
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import List, Optional
+
+from src.models.service_model import (
+    DEFAULT_SERVICES_DIR,
+    ServiceModel,
+    is_valid_service_name,
+    list_service_names,
+)
+from src.utils.cgroup import format_bytes
+from src.utils.metrics import operation_metrics
+from src.utils.proctrace import run_command
+from src.utils.systemctl import (
+    DETAIL_PROPERTIES,
+    UNIT_DIR,
+    show_units,
+    unit_name,
+    unit_record,
+)
+
+EXIT_OK = 0
+EXIT_FAILURE = 1
+EXIT_NOT_ACTIVE = 3
+
+
+def _error(message: str):
+    print(message, file=sys.stderr)
+
+
+def _print_table(rows: List[List[str]]):
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    for row in rows:
+        print("  ".join(cell.ljust(width) for cell, width in zip(row, widths)).rstrip())
+
+
+def _print_records(records: List[dict], as_json: bool):
+    if as_json:
+        json.dump(records, sys.stdout, indent=2)
+        print()
+        return
+    if not records:
+        return
+    rows = [["UNIT", "LOAD", "ACTIVE", "SUB", "ENABLED", "RESTARTS", "PID", "MEMORY"]]
+    for record in records:
+        rows.append(
+            [
+                record["name"],
+                record["load"],
+                record["active"],
+                record["sub"],
+                record["enabled"] or "-",
+                str(record["restarts"]),
+                str(record["main_pid"] or "-"),
+                format_bytes(record["memory_bytes"]),
+            ]
+        )
+    _print_table(rows)
+
+
+def _check_names(names: List[str]) -> bool:
+    invalid = [name for name in names if not is_valid_service_name(name)]
+    for name in invalid:
+        _error(f"Nom de service invalide : {name!r}")
+    return not invalid
+
+
+def _resolve_names(args) -> Optional[List[str]]:
+    names = list(args.services)
+    if getattr(args, "all", False):
+        names += list_service_names(args.services_dir)
+    # Deduplicate while keeping the command-line order.
+    names = list(dict.fromkeys(names))
+    if not names:
+        _error("Aucun service indiqué (nommez des services ou utilisez --all)")
+        return None
+    if not _check_names(names):
+        return None
+    return names
+
+
+def _ask_daemon(args, method: str, **params):
+    """Return the daemon's answer, or ``None`` when no daemon can answer."""
+    if args.no_daemon:
+        return None
+    from src.daemon.client import DaemonError, connect_daemon
+
+    client = connect_daemon(args.socket)
+    if client is None:
+        return None
+    try:
+        with client:
+            return client.call(method, **params)
+    except (DaemonError, OSError, ValueError) as e:
+        _error(f"Démon indisponible, interrogation directe de systemd : {e}")
+        return None
+
+
+def cmd_list(args) -> int:
+    records = _ask_daemon(args, "list")
+    if records is None:
+        names = list_service_names(args.services_dir)
+        states = show_units(names, DETAIL_PROPERTIES)
+        records = [unit_record(n, states.get(n, {})) for n in names]
+    _print_records(records, args.json)
+    return EXIT_OK
+
+
+def cmd_status(args) -> int:
+    names = _resolve_names(args)
+    if names is None:
+        return EXIT_FAILURE
+    records = _ask_daemon(args, "status", services=names)
+    if records is None:
+        states = show_units(names, DETAIL_PROPERTIES)
+        records = [unit_record(n, states.get(n, {})) for n in names]
+    _print_records(records, args.json)
+    if all(record["active"] == "active" for record in records):
+        return EXIT_OK
+    return EXIT_NOT_ACTIVE
+
+
+def cmd_operation(args) -> int:
+    names = _resolve_names(args)
+    if names is None:
+        return EXIT_FAILURE
+
+    command = ["systemctl", args.command]
+    if args.no_block:
+        command.append("--no-block")
+    command += ["--"] + [unit_name(name) for name in names]
+
+    with operation_metrics.timed(args.command) as operation:
+        try:
+            returncode = run_command(command).returncode
+        except OSError as e:
+            _error(f"Erreur lors de l'exécution de systemctl : {e}")
+            returncode = EXIT_FAILURE
+        operation.success = returncode == 0
+    if not args.no_daemon:
+        from src.daemon.client import refresh_daemon
+
+        refresh_daemon(names, args.socket)
+
+    if args.json:
+        json.dump(
+            {
+                "operation": args.command,
+                "services": names,
+                "success": operation.success,
+            },
+            sys.stdout,
+        )
+        print()
+    return EXIT_OK if operation.success else EXIT_FAILURE
+
+
+def cmd_apply(args) -> int:
+    names = _resolve_names(args)
+    if names is None:
+        return EXIT_FAILURE
+
+    changed: List[str] = []
+    failed: List[str] = []
+    # Reported by requested name; restarted by the unit actually written.
+    units: List[str] = []
+    for name in names:
+        try:
+            service = ServiceModel.load_from_json(
+                os.path.join(args.services_dir, f"{name}.json")
+            )
+            content = service.to_systemd_file()
+            unit_path = os.path.join(args.unit_dir, f"{service.name}.service")
+            try:
+                with open(unit_path, "r") as f:
+                    if f.read() == content:
+                        continue
+            except OSError:
+                pass
+            if not args.dry_run:
+                with open(unit_path, "w") as f:
+                    f.write(content)
+            changed.append(name)
+            units.append(service.name)
+        except (OSError, ValueError) as e:
+            _error(f"Erreur lors de l'application de {name} : {e}")
+            failed.append(name)
+
+    success = not failed
+    if changed and not args.dry_run:
+        with operation_metrics.timed("apply") as operation:
+            try:
+                operation.success = (
+                    run_command(["systemctl", "daemon-reload"]).returncode == 0
+                )
+                if operation.success and args.restart:
+                    # try-restart leaves stopped units stopped.
+                    operation.success = (
+                        run_command(
+                            ["systemctl", "try-restart", "--"]
+                            + [unit_name(unit) for unit in units]
+                        ).returncode
+                        == 0
+                    )
+            except OSError as e:
+                _error(f"Erreur lors de l'exécution de systemctl : {e}")
+                operation.success = False
+        success = success and operation.success
+
+    if args.json:
+        json.dump(
+            {
+                "changed": changed,
+                "unchanged": [n for n in names if n not in changed + failed],
+                "failed": failed,
+                "dry_run": args.dry_run,
+            },
+            sys.stdout,
+        )
+        print()
+    else:
+        for name in changed:
+            print(f"{'~' if args.dry_run else '✓'} {name}")
+    return EXIT_OK if success else EXIT_FAILURE
+
+
+def cmd_logs(args) -> int:
+    names = _resolve_names(args)
+    if names is None:
+        return EXIT_FAILURE
+
+    if not (args.follow or args.since or args.json):
+        # The daemon keeps recent lines in memory: no journalctl needed.
+        entries = _ask_daemon(args, "logs", services=names, lines=args.lines)
+        if entries is not None:
+            for entry in entries:
+                print(entry["line"])
+            return EXIT_OK
+
+    command = ["journalctl", "--no-pager", "-n", str(args.lines)]
+    for name in names:
+        command += ["-u", unit_name(name)]
+    if args.since:
+        command += ["--since", args.since]
+    if args.follow:
+        command.append("-f")
+    if args.json:
+        command.append("--output=json")
+
+    try:
+        return run_command(command).returncode
+    except OSError as e:
+        _error(f"Erreur lors de l'exécution de journalctl : {e}")
+        return EXIT_FAILURE
+    except KeyboardInterrupt:
+        return EXIT_OK
+
+
+def cmd_lint(args) -> int:
+    from src.utils.lint import lint_report, lint_services
+
+    results = lint_services(args.services_dir, workers=args.workers)
+    report = lint_report(results)
+
+    if args.json:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        for result in results:
+            for error in result.errors:
+                print(f"✗ {result.name}: {error}")
+            for warning in result.warnings:
+                print(f"! {result.name}: {warning}")
+        print(
+            f"{report['checked']} configuration(s) vérifiée(s) : "
+            f"{report['errors']} en erreur, {report['warnings']} avec avertissements"
+        )
+
+    if report["errors"] or (args.strict and report["warnings"]):
+        return EXIT_FAILURE
+    return EXIT_OK
+
+
+def cmd_trace(args) -> int:
+    from src.utils.proctrace import load_records, summarize
+
+    try:
+        rows = summarize(load_records(args.file))
+    except OSError as e:
+        _error(f"Erreur lors de la lecture de la trace : {e}")
+        return EXIT_FAILURE
+
+    if args.json:
+        json.dump(rows, sys.stdout, indent=2)
+        print()
+    elif rows:
+        table = [["COMMAND", "COUNT", "FAILED", "TOTAL", "P50", "P95", "P99", "MAX"]]
+        for row in rows:
+            table.append(
+                [row["command"], str(row["count"]), str(row["failures"])]
+                + [
+                    f"{row[key] * 1000:.1f}ms"
+                    for key in ("total", "p50", "p95", "p99", "max")
+                ]
+            )
+        _print_table(table)
+    return EXIT_OK
+
+
+def cmd_daemon(args) -> int:
+    from src.daemon.server import ManagerDaemon
+
+    daemon = ManagerDaemon(
+        args.services_dir, socket_path=args.socket, refresh_interval=args.interval
+    )
+    try:
+        print(f"Démon SystemdManager à l'écoute sur {daemon.socket_path}")
+        daemon.serve_forever()
+    except (OSError, RuntimeError) as e:
+        _error(f"Erreur lors du démarrage du démon : {e}")
+        return EXIT_FAILURE
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="systemd-manager",
+        description="Manage SystemdManager services without the interactive menus.",
+    )
+    parser.add_argument(
+        "--services-dir",
+        default=DEFAULT_SERVICES_DIR,
+        help="directory holding the service configurations",
+    )
+    parser.add_argument("--socket", help="daemon socket path")
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="query systemd directly even if the daemon is running",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add(name: str, help: str, many: bool = True) -> argparse.ArgumentParser:
+        sub = subparsers.add_parser(name, help=help)
+        # Also accepted after the command name; SUPPRESS keeps the global value.
+        sub.add_argument(
+            "--services-dir", default=argparse.SUPPRESS, help=argparse.SUPPRESS
+        )
+        sub.add_argument("--json", action="store_true", help="machine-readable output")
+        if many:
+            sub.add_argument("services", nargs="*", metavar="SERVICE")
+            sub.add_argument("--all", action="store_true", help="every managed service")
+        return sub
+
+    add("list", "list the managed services and their state", many=False).set_defaults(
+        func=cmd_list
+    )
+    add("status", "show the state of services").set_defaults(func=cmd_status)
+
+    for verb in ("start", "stop", "restart"):
+        sub = add(verb, f"{verb} services")
+        sub.add_argument(
+            "--no-block", action="store_true", help="do not wait for the jobs"
+        )
+        sub.set_defaults(func=cmd_operation)
+
+    sub = add("apply", "regenerate unit files from the stored configurations")
+    sub.add_argument("--unit-dir", default=UNIT_DIR)
+    sub.add_argument(
+        "--restart", action="store_true", help="restart running changed services"
+    )
+    sub.add_argument(
+        "--dry-run", action="store_true", help="only report what would change"
+    )
+    sub.set_defaults(func=cmd_apply)
+
+    sub = add("logs", "show the journal of services")
+    sub.add_argument("-n", "--lines", type=int, default=50)
+    sub.add_argument("-f", "--follow", action="store_true")
+    sub.add_argument("--since")
+    sub.set_defaults(func=cmd_logs)
+
+    sub = add("lint", "validate every stored configuration", many=False)
+    sub.add_argument(
+        "--workers", type=int, help="validation threads (default: CPU-based)"
+    )
+    sub.add_argument("--strict", action="store_true", help="also fail on warnings")
+    sub.set_defaults(func=cmd_lint)
+
+    sub = add("trace", "summarize a SYSTEMD_MANAGER_TRACE command trace", many=False)
+    sub.add_argument("file", metavar="FILE")
+    sub.set_defaults(func=cmd_trace)
+
+    sub = subparsers.add_parser(
+        "daemon", help="serve cached status, logs and metrics over a local socket"
+    )
+    sub.add_argument("--interval", type=float, default=2.0)
+    sub.set_defaults(func=cmd_daemon)
+
+    return parser
+
+
+def run(argv: List[str]) -> int:
+    """Run a headless command and return its exit code."""
+    args = build_parser().parse_args(argv)
+    return args.func(args)
@@ -0,0 +1,23 @@
+"""Optional resident daemon for SystemdManager.
+
+``systemd-manager daemon`` keeps the service configuration index, the status
+cache, the journal followers and the cgroup samplers warm in one process and
+serves them over a local Unix socket. The headless CLI and the GUI use it when
+it is running and fall back to querying systemd themselves otherwise.
+"""
+
+from .client import (
+    DaemonClient,
+    DaemonError,
+    connect_daemon,
+    default_socket_path,
+    refresh_daemon,
+)
+
+__all__ = [
+    "DaemonClient",
+    "DaemonError",
+    "connect_daemon",
+    "default_socket_path",
+    "refresh_daemon",
+]
@@ -0,0 +1,101 @@
+"""Client side of the SystemdManager daemon protocol.
+
+Requests and responses are single-line JSON objects over a Unix stream socket::
+
+    {"method": "status", "params": {"services": ["web"]}}
+    {"result": [...]}            or            {"error": "message"}
+
+The client only depends on the standard library so that the headless CLI can
+try the daemon first without slowing down its own start-up.
+"""
+
+import json
+import os
+import socket
+from typing import Any, List, Optional
+
+SOCKET_ENV = "SYSTEMD_MANAGER_SOCKET"
+
+
+def default_socket_path() -> str:
+    """Return the daemon socket path (``$SYSTEMD_MANAGER_SOCKET`` wins)."""
+    path = os.environ.get(SOCKET_ENV)
+    if path:
+        return path
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "systemd-manager.sock")
+    return os.path.expanduser("~/.config/systemd-manager/daemon.sock")
+
+
+class DaemonError(Exception):
+    """Raised when the daemon answers a request with an error."""
+
+
+class DaemonClient:
+    """
+    Connection to a running SystemdManager daemon.
+
+    Attributes:
+        socket_path (str): Path of the daemon Unix socket
+    """
+
+    def __init__(self, socket_path: Optional[str] = None, timeout: float = 10.0):
+        self.socket_path = socket_path or default_socket_path()
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.settimeout(timeout)
+        try:
+            self._socket.connect(self.socket_path)
+        except OSError:
+            self._socket.close()
+            raise
+        self._reader = self._socket.makefile("r", encoding="utf-8")
+
+    def call(self, method: str, **params) -> Any:
+        """Send one request and return its result."""
+        request = json.dumps({"method": method, "params": params}) + "\n"
+        self._socket.sendall(request.encode())
+        line = self._reader.readline()
+        if not line:
+            raise DaemonError("connexion fermée par le démon")
+        response = json.loads(line)
+        if "error" in response:
+            raise DaemonError(response["error"])
+        return response.get("result")
+
+    def close(self):
+        self._reader.close()
+        self._socket.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def refresh_daemon(services: List[str], socket_path: Optional[str] = None):
+    """Have a running daemon refetch ``services`` after a client changed them.
+
+    Operations do not go through the daemon: without this, its cache would
+    report the previous state until the next periodic refresh.
+    """
+    client = connect_daemon(socket_path)
+    if client is None:
+        return
+    try:
+        with client:
+            client.call("refresh", services=services)
+    except (DaemonError, OSError, ValueError) as e:
+        print(f"Erreur lors du rafraîchissement du démon : {e}")
+
+
+def connect_daemon(socket_path: Optional[str] = None) -> Optional[DaemonClient]:
+    """Return a client if a daemon is listening, otherwise ``None``."""
+    path = socket_path or default_socket_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        return DaemonClient(path)
+    except OSError:
+        return None
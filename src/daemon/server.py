@@ -0,0 +1,400 @@
+"""Resident SystemdManager daemon.
+
+The daemon owns, for as long as it runs:
+
+* the **configuration index**: stored service configurations, reloaded only
+  when a JSON file's mtime changes;
+* the **status cache**: one batched ``systemctl show`` for every watched unit
+  every ``refresh_interval`` seconds;
+* the **cgroup samplers** (CPU, memory, tasks of the managed services);
+* the **log buffers**: per unit set, the last lines seeded once from
+  ``journalctl`` and then kept up to date by the shared ``JournalFollower``.
+
+Clients (``src/daemon/client.py``) therefore get answers from memory: a
+``status`` or ``logs`` request never spawns a process once the unit is watched.
+"""
+
+import json
+import os
+import queue
+import socket
+import socketserver
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, FrozenSet, List, Optional, Set, Tuple
+
+from src.daemon.client import default_socket_path
+from src.models.service_model import (
+    DEFAULT_SERVICES_DIR,
+    is_valid_service_name,
+    list_service_names,
+)
+from src.utils.cgroup import CgroupSampler
+from src.utils.journal import JournalEntry, JournalFollower, journal_follower
+from src.utils.proctrace import run_command
+from src.utils.systemctl import DETAIL_PROPERTIES, show_units, unit_name, unit_record
+
+# Lines kept per log buffer.
+LOG_BUFFER_LINES = 1000
+
+# Log buffers and extra units nobody asked for during this long are dropped.
+IDLE_SECONDS = 600
+
+
+@dataclass
+class _LogBuffer:
+    units: FrozenSet[str]
+    entries: "queue.Queue[JournalEntry]" = field(default_factory=queue.Queue)
+    lines: Deque[JournalEntry] = field(
+        default_factory=lambda: deque(maxlen=LOG_BUFFER_LINES)
+    )
+    seeded_cursors: Set[str] = field(default_factory=set)
+    token: int = 0
+    last_access: float = field(default_factory=time.monotonic)
+
+    def drain(self):
+        while True:
+            try:
+                entry = self.entries.get_nowait()
+            except queue.Empty:
+                return
+            if entry.cursor in self.seeded_cursors:
+                continue  # already read by the initial journalctl
+            self.lines.append(entry)
+
+
+class ManagerDaemon:
+    """
+    Long-running owner of the caches shared by the CLI and GUI clients.
+
+    Attributes:
+        services_dir (str): Directory holding the managed service configurations
+        socket_path (str): Path of the Unix socket served to clients
+        refresh_interval (float): Seconds between two status/cgroup refreshes
+        configs (Dict[str, Tuple[float, str]]): (mtime, JSON text) by service
+        states (Dict[str, Dict[str, str]]): Cached systemctl properties by unit
+    """
+
+    def __init__(
+        self,
+        services_dir: str = DEFAULT_SERVICES_DIR,
+        socket_path: Optional[str] = None,
+        refresh_interval: float = 2.0,
+        sampler: Optional[CgroupSampler] = None,
+        follower: Optional[JournalFollower] = None,
+    ):
+        self.services_dir = services_dir
+        self.socket_path = socket_path or default_socket_path()
+        self.refresh_interval = refresh_interval
+        self.sampler = sampler or CgroupSampler()
+        self.follower = follower or journal_follower
+
+        self.configs: Dict[str, Tuple[float, str]] = {}
+        self.states: Dict[str, Dict[str, str]] = {}
+        self.refreshed_at: Optional[float] = None
+        # Units asked about by clients that are not managed services, with
+        # the time of the last request.
+        self._extra_units: Dict[str, float] = {}
+        self._log_buffers: Dict[FrozenSet[str], _LogBuffer] = {}
+
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+
+        self._methods: Dict[str, Callable[..., Any]] = {
+            "ping": self.do_ping,
+            "list": self.do_list,
+            "status": self.do_status,
+            "config": self.do_config,
+            "logs": self.do_logs,
+            "refresh": self.do_refresh,
+            "start": lambda **p: self.do_operation("start", **p),
+            "stop": lambda **p: self.do_operation("stop", **p),
+            "restart": lambda **p: self.do_operation("restart", **p),
+        }
+
+    # -- caches ---------------------------------------------------------------
+
+    @property
+    def managed(self) -> List[str]:
+        with self._lock:
+            return sorted(self.configs)
+
+    def _scan_configs(self):
+        names = list_service_names(self.services_dir)
+        configs = {}
+        for name in names:
+            path = os.path.join(self.services_dir, f"{name}.json")
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            cached = self.configs.get(name)
+            if cached is not None and cached[0] == mtime:
+                configs[name] = cached
+                continue
+            try:
+                with open(path, "r") as f:
+                    configs[name] = (mtime, f.read())
+            except OSError as e:
+                print(f"Erreur lors de la lecture de {path} : {e}")
+        with self._lock:
+            self.configs = configs
+
+    def refresh(self):
+        """Rescan the configurations and refresh status and cgroup caches."""
+        self._scan_configs()
+        managed = self.managed
+        with self._lock:
+            watched = sorted(set(managed) | set(self._extra_units))
+
+        states = show_units(watched, DETAIL_PROPERTIES)
+        with self._lock:
+            self.states = states
+            self.refreshed_at = time.time()
+            self.sampler.sample(managed)
+            self._expire_idle()
+
+    def _expire_idle(self):
+        now = time.monotonic()
+        for key, buffer in list(self._log_buffers.items()):
+            if now - buffer.last_access > IDLE_SECONDS:
+                self.follower.unsubscribe(buffer.token)
+                del self._log_buffers[key]
+        for name, last_access in list(self._extra_units.items()):
+            if now - last_access > IDLE_SECONDS:
+                del self._extra_units[name]
+                if name not in self.configs:
+                    self.states.pop(name, None)
+
+    def _record(self, name: str) -> dict:
+        record = unit_record(name, self.states.get(name, {}))
+        usage = self.sampler.usage.get(name)
+        record["cpu_percent"] = usage.cpu_percent if usage else None
+        if usage is not None and usage.memory_bytes is not None:
+            record["memory_bytes"] = usage.memory_bytes
+        return record
+
+    # -- methods --------------------------------------------------------------
+
+    def do_ping(self) -> dict:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "services": len(self.configs),
+                "refreshed_at": self.refreshed_at,
+            }
+
+    def do_list(self) -> List[dict]:
+        with self._lock:
+            return [self._record(name) for name in sorted(self.configs)]
+
+    def do_status(self, services: List[str]) -> List[dict]:
+        _check_names(services)
+        with self._lock:
+            now = time.monotonic()
+            for name in services:
+                if name in self._extra_units:
+                    self._extra_units[name] = now
+            missing = [name for name in services if name not in self.states]
+        if missing:
+            # First request for these units: fetch them now and keep them
+            # in the periodic refresh until nobody asks for them any more.
+            fetched = show_units(missing, DETAIL_PROPERTIES)
+            with self._lock:
+                now = time.monotonic()
+                self._extra_units.update((name, now) for name in missing)
+                self.states.update(fetched)
+        with self._lock:
+            return [self._record(name) for name in services]
+
+    def do_config(self, service: str) -> Optional[str]:
+        _check_names([service])
+        with self._lock:
+            cached = self.configs.get(service)
+        return cached[1] if cached else None
+
+    def do_refresh(self, services: Optional[List[str]] = None) -> dict:
+        if services is None:
+            self.refresh()
+        else:
+            # Units changed by a client (start, stop, save...): refetch only them.
+            _check_names(services)
+            fetched = show_units(services, DETAIL_PROPERTIES)
+            with self._lock:
+                self.states.update(fetched)
+        return self.do_ping()
+
+    def do_logs(self, services: List[str], lines: int = 50) -> List[dict]:
+        _check_names(services)
+        key = frozenset(unit_name(name) for name in services)
+        with self._lock:
+            buffer = self._log_buffers.get(key)
+        if buffer is None:
+            # Seeded outside the lock: journalctl and the follower restart
+            # must not hold up the other clients.
+            seeded = _LogBuffer(key)
+            # Subscribe before reading the backlog so nothing is missed in
+            # between; duplicates are dropped by cursor.
+            seeded.token = self.follower.subscribe(key, seeded.entries)
+            for entry in _read_backlog(sorted(key), LOG_BUFFER_LINES):
+                seeded.lines.append(entry)
+                seeded.seeded_cursors.add(entry.cursor)
+            with self._lock:
+                buffer = self._log_buffers.setdefault(key, seeded)
+            if buffer is not seeded:
+                # Another client seeded the same units meanwhile.
+                self.follower.unsubscribe(seeded.token)
+        with self._lock:
+            buffer.last_access = time.monotonic()
+            buffer.drain()
+            selected = list(buffer.lines)[-lines:] if lines > 0 else []
+        return [
+            {
+                "cursor": entry.cursor,
+                "usec": entry.usec,
+                "unit": entry.unit,
+                "priority": entry.priority,
+                "message": entry.message,
+                "line": entry.format(),
+            }
+            for entry in selected
+        ]
+
+    def do_operation(self, verb: str, services: List[str], no_block: bool = False):
+        _check_names(services)
+        command = ["systemctl", verb]
+        if no_block:
+            command.append("--no-block")
+        command += ["--"] + [unit_name(name) for name in services]
+        returncode = run_command(command).returncode
+        fetched = show_units(services, DETAIL_PROPERTIES)
+        with self._lock:
+            self.states.update(fetched)
+            return {
+                "success": returncode == 0,
+                "services": [self._record(name) for name in services],
+            }
+
+    def handle(self, request: Any) -> dict:
+        """Answer one decoded request."""
+        if not isinstance(request, dict):
+            return {"error": "requête invalide"}
+        method = self._methods.get(request.get("method", ""))
+        if method is None:
+            return {"error": f"méthode inconnue : {request.get('method')!r}"}
+        params = request.get("params") or {}
+        if not isinstance(params, dict):
+            return {"error": "paramètres invalides"}
+        try:
+            return {"result": method(**params)}
+        except (TypeError, ValueError) as e:
+            return {"error": str(e)}
+        except Exception as e:
+            print(f"Erreur lors du traitement de la requête {request!r} : {e}")
+            return {"error": str(e)}
+
+    # -- serving ----------------------------------------------------------------
+
+    def _prepare_socket(self):
+        directory = os.path.dirname(self.socket_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.socket_path):
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(self.socket_path)
+            except OSError:
+                os.remove(self.socket_path)  # stale socket of a dead daemon
+            else:
+                raise RuntimeError(f"Un démon écoute déjà sur {self.socket_path}")
+            finally:
+                probe.close()
+
+    def start(self):
+        """Bind the socket and serve clients and refreshes in the background."""
+        self._prepare_socket()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                for line in self.rfile:
+                    try:
+                        request = json.loads(line)
+                    except ValueError:
+                        response = {"error": "JSON invalide"}
+                    else:
+                        response = daemon.handle(request)
+                    self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        old_umask = os.umask(0o177)  # socket readable by its owner only
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(
+                self.socket_path, Handler
+            )
+        finally:
+            os.umask(old_umask)
+        self._server.daemon_threads = True
+
+        self.refresh()
+        threading.Thread(target=self._refresh_loop, daemon=True).start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def _refresh_loop(self):
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Erreur lors du rafraîchissement du démon : {e}")
+
+    def serve_forever(self):
+        self.start()
+        try:
+            self._stop.wait()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            self.shutdown()
+
+    def shutdown(self):
+        self._stop.set()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            try:
+                os.remove(self.socket_path)
+            except OSError:
+                pass
+        with self._lock:
+            for buffer in self._log_buffers.values():
+                self.follower.unsubscribe(buffer.token)
+            self._log_buffers.clear()
+        self.sampler.close()
+
+
+def _check_names(names: List[str]):
+    if not isinstance(names, list) or not names:
+        raise ValueError("liste de services attendue")
+    for name in names:
+        if not isinstance(name, str) or not is_valid_service_name(name):
+            raise ValueError(f"Nom de service invalide : {name!r}")
+
+
+def _read_backlog(units: List[str], lines: int) -> List[JournalEntry]:
+    command = ["journalctl", "--no-pager", "--output=json", "-n", str(lines)]
+    for unit in units:
+        command += ["-u", unit]
+    try:
+        output = run_command(command, capture_output=True, text=True).stdout
+    except OSError as e:
+        print(f"Erreur lors de la lecture du journal : {e}")
+        return []
+    entries = []
+    for line in output.splitlines():
+        entry = JournalEntry.from_json(line)
+        if entry is not None:
+            entries.append(entry)
+    return entries
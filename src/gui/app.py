@@ -1,11 +1,17 @@
 import customtkinter as ctk
 
 from src.cli.cli_controller import CLIController
+from src.gui.dialogs.command_trace_dialog import CommandTraceDialog
+from src.gui.dialogs.health_report_dialog import HealthReportDialog
 from src.gui.frames.service_creation import ServiceCreationFrame
 from src.gui.frames.service_list import ServiceListFrame
 from src.gui.gui_controller import GUIController
+from src.gui.utils.lag_indicator import LagIndicator
 from src.gui.utils.notification import NotificationManager
 from src.i18n.translations import _, i18n
+from src.utils.profiling import profiled
+from src.utils.runtime import runtime
+from src.utils.ui_watchdog import ui_watchdog
 
 
 class SystemdManagerApp(ctk.CTk):
@@ -28,6 +34,9 @@ class SystemdManagerApp(ctk.CTk):
 
         self.notification_manager = NotificationManager()
 
+        # Background tasks deliver their results on this window's event loop.
+        runtime.attach(self)
+
         self.gui_controller = GUIController()
         self.cli_controller = CLIController()
 
@@ -48,6 +57,11 @@ class SystemdManagerApp(ctk.CTk):
         self.create_sidebar()
         self.create_main_view()
 
+        self.bind("<F12>", lambda event: self.show_command_trace())
+
+        if ui_watchdog.enabled:
+            ui_watchdog.attach(self)
+
     def create_sidebar(self):
 
         sidebar = ctk.CTkFrame(
@@ -73,6 +87,13 @@ class SystemdManagerApp(ctk.CTk):
         creation_btn.grid(row=1, column=0, padx=20, pady=10)
         self.nav_buttons.append(creation_btn)
 
+        self.health_btn = ctk.CTkButton(
+            sidebar,
+            text=_("🩺 Health scan"),
+            command=self.show_health_report,
+        )
+        self.health_btn.grid(row=2, column=0, padx=20, pady=10)
+
         spacer = ctk.CTkFrame(sidebar, fg_color="transparent", height=50)
         spacer.grid(row=4, column=0, sticky="ew")
 
@@ -102,6 +123,10 @@ class SystemdManagerApp(ctk.CTk):
         )
         dev_label.grid(row=8, column=0, padx=20, pady=(5, 10))
 
+        if ui_watchdog.enabled:
+            self.lag_indicator = LagIndicator(sidebar)
+            self.lag_indicator.grid(row=9, column=0, padx=20, pady=(0, 10))
+
     def create_main_view(self):
 
         self.main_container = ctk.CTkFrame(
@@ -221,6 +246,7 @@ class SystemdManagerApp(ctk.CTk):
 
         self.title_label.configure(text=_("Services systemd"))
         self.nav_buttons[0].configure(text=_("➕ New Service"))
+        self.health_btn.configure(text=_("🩺 Health scan"))
 
         for widget in self.winfo_children():
             if isinstance(widget, ctk.CTkFrame):
@@ -242,6 +268,15 @@ class SystemdManagerApp(ctk.CTk):
         if hasattr(self, "creation_frame"):
             self.creation_frame.update_translations()
 
+    @profiled("health_scan")
+    def show_health_report(self):
+
+        HealthReportDialog(self, self.gui_controller.services_dir)
+
+    def show_command_trace(self):
+
+        CommandTraceDialog(self)
+
     def show_service_creation_dialog(self):
 
         dialog = ctk.CTkToplevel(self)
@@ -1,5 +1,6 @@
 from .confirm_dialog import ConfirmDialog
 from .edit_service_dialog import EditServiceDialog
+from .health_report_dialog import HealthReportDialog
 from .logs_dialog import LogsDialog
 
-__all__ = ["EditServiceDialog", "LogsDialog", "ConfirmDialog"]
+__all__ = ["EditServiceDialog", "LogsDialog", "ConfirmDialog", "HealthReportDialog"]
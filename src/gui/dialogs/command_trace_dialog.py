@@ -0,0 +1,148 @@
+import os
+from tkinter import filedialog
+
+import customtkinter as ctk
+
+from src.i18n.translations import _
+from src.utils.proctrace import command_tracer
+
+
+class CommandTraceDialog(ctk.CTkToplevel):
+    """
+    Debug window listing the external commands run by the application.
+
+    The table (one row per command class, slowest total time first, with the
+    p50/p95/p99 latencies) is rebuilt from ``command_tracer`` every second; the
+    last commands are listed below it with their caller.
+
+    Attributes:
+        paused (bool): True while the table is not refreshed
+    """
+
+    REFRESH_INTERVAL_MS = 1000
+    RECENT_COMMANDS = 30
+
+    def __init__(self, parent):
+        super().__init__(parent)
+
+        self.paused = False
+        self._refresh_job = None
+
+        self.title(_("External commands"))
+        self.geometry("1000x600")
+        self.minsize(700, 400)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.summary_label = ctk.CTkLabel(
+            self, text="", font=ctk.CTkFont(size=16, weight="bold"), anchor="w"
+        )
+        self.summary_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
+
+        self.trace_text = ctk.CTkTextbox(self, wrap="none", font=("Courier", 12))
+        self.trace_text.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="nsew")
+        self.trace_text.tag_config("header", foreground="gray")
+        self.trace_text.tag_config("failed", foreground="red")
+
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="e")
+
+        self.pause_button = ctk.CTkButton(
+            button_frame, text=_("Pause"), command=self.toggle_pause, width=100
+        )
+        self.pause_button.grid(row=0, column=0, padx=5)
+
+        ctk.CTkButton(
+            button_frame, text=_("Clear"), command=self.clear, width=100
+        ).grid(row=0, column=1, padx=5)
+
+        ctk.CTkButton(
+            button_frame, text=_("Export JSONL"), command=self.export, width=100
+        ).grid(row=0, column=2, padx=5)
+
+        ctk.CTkButton(
+            button_frame, text=_("Close"), command=self.destroy, width=100
+        ).grid(row=0, column=3, padx=5)
+
+        self.transient(parent)
+        self.refresh()
+
+    def refresh(self):
+
+        self._refresh_job = None
+        if not self.paused:
+            self.render()
+        self._refresh_job = self.after(self.REFRESH_INTERVAL_MS, self.refresh)
+
+    def render(self):
+
+        records = command_tracer.records()
+        rows = command_tracer.summary()
+        self.summary_label.configure(
+            text=_("%d commands, %.2f s in total")
+            % (len(records), sum(row["total"] for row in rows))
+        )
+
+        self.trace_text.configure(state="normal")
+        self.trace_text.delete("1.0", "end")
+        self.trace_text.insert(
+            "end",
+            f"{'COMMAND':<28}{'COUNT':>7}{'FAILED':>8}{'TOTAL':>11}"
+            f"{'P50':>10}{'P95':>10}{'P99':>10}{'MAX':>10}\n",
+            "header",
+        )
+        for row in rows:
+            self.trace_text.insert(
+                "end",
+                f"{row['command'][:27]:<28}{row['count']:>7}{row['failures']:>8}"
+                + "".join(
+                    f"{row[key] * 1000:>{11 if key == 'total' else 10}.1f}"
+                    for key in ("total", "p50", "p95", "p99", "max")
+                )
+                + "\n",
+            )
+
+        self.trace_text.insert("end", "\n" + _("Last commands") + "\n", "header")
+        for record in reversed(records[-self.RECENT_COMMANDS :]):
+            line = (
+                f"{record.duration * 1000:>9.1f} ms  "
+                f"{'-' if record.returncode is None else record.returncode:>4}  "
+                f"{' '.join(record.argv)[:60]:<60}  {record.caller}\n"
+            )
+            self.trace_text.insert(
+                "end", line, "failed" if record.returncode != 0 else ()
+            )
+        self.trace_text.configure(state="disabled")
+
+    def toggle_pause(self):
+
+        self.paused = not self.paused
+        self.pause_button.configure(text=_("Resume") if self.paused else _("Pause"))
+
+    def clear(self):
+
+        command_tracer.clear()
+        self.render()
+
+    def export(self):
+
+        path = filedialog.asksaveasfilename(
+            parent=self,
+            defaultextension=".jsonl",
+            initialfile="commands.jsonl",
+            initialdir=os.path.expanduser("~"),
+        )
+        if not path:
+            return
+        try:
+            command_tracer.dump(path)
+        except OSError as e:
+            print(f"Erreur lors de l'export de la trace : {e}")
+
+    def destroy(self):
+
+        if self._refresh_job is not None:
+            self.after_cancel(self._refresh_job)
+            self._refresh_job = None
+        super().destroy()
@@ -5,6 +5,8 @@ import customtkinter as ctk
 
 from src.i18n.translations import _
 from src.models.service_model import ServiceModel
+from src.utils.identity import identity_cache
+from src.utils.profiling import profiled
 
 
 class EditServiceDialog(ctk.CTkToplevel):
@@ -350,11 +352,7 @@ class EditServiceDialog(ctk.CTkToplevel):
             if not user:
                 errors.append(_("User is required"))
             else:
-                try:
-                    import pwd
-
-                    pwd.getpwnam(user)
-                except KeyError:
+                if not identity_cache.user_exists(user):
                     errors.append(_("User '%s' does not exist") % user)
 
             working_dir = self.working_dir_entry.get().strip()
@@ -419,6 +417,7 @@ class EditServiceDialog(ctk.CTkToplevel):
             )
             return False
 
+    @profiled("save")
     def save(self):
         if self.validate_fields():
             try:
@@ -0,0 +1,140 @@
+from typing import Optional
+
+import customtkinter as ctk
+
+from src.i18n.translations import _
+from src.models.service_model import list_service_names
+from src.utils.health import ERRORING, FAILED, FLAPPING, HealthReport, HealthScanner
+from src.utils.runtime import runtime
+
+
+class HealthReportDialog(ctk.CTkToplevel):
+    """
+    Dialog running a health scan of every managed service.
+
+    The scan runs on the background runtime (status is fetched with one batched
+    systemctl query and journals are read by a bounded pool); the report is
+    rendered once it is ready, failed units first.
+
+    Attributes:
+        services_dir (str): Directory holding the managed service configurations
+        report (Optional[HealthReport]): Result of the last completed scan
+    """
+
+    def __init__(self, parent, services_dir: str):
+        super().__init__(parent)
+
+        self.services_dir = services_dir
+        self.report: Optional[HealthReport] = None
+
+        self.title(_("🩺 Health scan"))
+        self.geometry("900x600")
+        self.minsize(600, 400)
+
+        self.grid_columnconfigure(0, weight=1)
+        self.grid_rowconfigure(1, weight=1)
+
+        self.summary_label = ctk.CTkLabel(
+            self, text="", font=ctk.CTkFont(size=16, weight="bold"), anchor="w"
+        )
+        self.summary_label.grid(row=0, column=0, padx=20, pady=(20, 10), sticky="ew")
+
+        self.report_text = ctk.CTkTextbox(self, wrap="word", font=("Courier", 12))
+        self.report_text.grid(row=1, column=0, padx=20, pady=(0, 10), sticky="nsew")
+        self.report_text.tag_config(FAILED, foreground="red")
+        self.report_text.tag_config(FLAPPING, foreground="orange")
+        self.report_text.tag_config(ERRORING, foreground="yellow")
+        self.report_text.tag_config("detail", foreground="gray")
+
+        button_frame = ctk.CTkFrame(self, fg_color="transparent")
+        button_frame.grid(row=2, column=0, padx=20, pady=(0, 20), sticky="e")
+
+        self.rescan_button = ctk.CTkButton(
+            button_frame, text=_("Rescan"), command=self.start_scan, width=100
+        )
+        self.rescan_button.grid(row=0, column=0, padx=5)
+
+        ctk.CTkButton(
+            button_frame, text=_("Close"), command=self.destroy, width=100
+        ).grid(row=0, column=1, padx=5)
+
+        self.transient(parent)
+        self.start_scan()
+
+    def start_scan(self):
+
+        names = list_service_names(self.services_dir)
+        self.rescan_button.configure(state="disabled")
+        self.summary_label.configure(text=_("Scanning %d services...") % len(names))
+
+        runtime.submit(
+            HealthScanner().scan,
+            names,
+            owner=self,
+            on_done=self.scan_done,
+            on_error=self.scan_failed,
+        )
+
+    def scan_done(self, report: HealthReport):
+
+        self.rescan_button.configure(state="normal")
+        self.report = report
+        self.show_report(report)
+
+    def scan_failed(self, error: BaseException):
+
+        self.rescan_button.configure(state="normal")
+        self.summary_label.configure(text=_("Error during health scan: ") + str(error))
+
+    def show_report(self, report: HealthReport):
+
+        self.summary_label.configure(
+            text=_(
+                "%d services scanned in %.1f s — %d failed, %d flapping, %d erroring"
+            )
+            % (
+                len(report.units),
+                report.duration,
+                report.count(FAILED),
+                report.count(FLAPPING),
+                report.count(ERRORING),
+            )
+        )
+
+        self.report_text.configure(state="normal")
+        self.report_text.delete("1.0", "end")
+
+        if not report.problems:
+            self.report_text.insert("end", _("All services are healthy") + "\n")
+
+        labels = {
+            FAILED: _("FAILED"),
+            FLAPPING: _("FLAPPING"),
+            ERRORING: _("ERRORS"),
+        }
+        for unit in report.problems:
+            self.report_text.insert(
+                "end", f"{labels[unit.category]:<10} {unit.name}", unit.category
+            )
+            self.report_text.insert(
+                "end",
+                f"  {unit.active_state} ({unit.sub_state}), "
+                f"{unit.restarts} {_('restarts')}\n",
+                "detail",
+            )
+            for stats in unit.errors:
+                seen = (
+                    f" [{stats.first_seen} → {stats.last_seen}]"
+                    if stats.first_seen
+                    else ""
+                )
+                self.report_text.insert(
+                    "end", f"           • {stats.message} ×{stats.count}{seen}\n"
+                )
+
+        self.report_text.configure(state="disabled")
+
+    def destroy(self):
+
+        runtime.cancel_owner(self)
+        super().destroy()
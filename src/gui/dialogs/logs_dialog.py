@@ -1,10 +1,13 @@
+import queue
 import subprocess
-import threading
 from datetime import datetime, timedelta
 
 import customtkinter as ctk
 
 from src.i18n.translations import _
+from src.utils.journal import BacklogFence, journal_follower, parse_entries
+from src.utils.profiling import profiled
+from src.utils.runtime import run_process, runtime
 
 
 class LogsDialog(ctk.CTkToplevel):
@@ -12,19 +15,29 @@ class LogsDialog(ctk.CTkToplevel):
     Dialog class for displaying and monitoring service logs.
 
     This class provides a real-time view of systemd service logs with features
-    for filtering, auto-updating, and time-based log retrieval.
+    for filtering, auto-updating, and time-based log retrieval. New entries are
+    received from the shared journal follower instead of re-reading the journal.
 
     Attributes:
         service_name (str): Name of the service to monitor
-        stop_update (bool): Flag to control automatic log updates
-        update_thread (threading.Thread): Thread for automatic log updates
+        entries (queue.Queue): Entries delivered by the shared journal follower
+        subscription (int): Token of the journal follower subscription
+        loading (bool): True while the backlog is read in the background
+        load_task (Optional[Task]): Backlog read in progress, if any
+        fence (BacklogFence): Live entries already shown by the backlog
     """
 
+    POLL_INTERVAL_MS = 250
+
     def __init__(self, parent, service_name: str):
         super().__init__(parent)
 
         self.service_name = service_name
-        self.stop_update = False
+        self.entries: queue.Queue = queue.Queue()
+        self.has_logs = False
+        self.loading = False
+        self.load_task = None
+        self.fence = BacklogFence()
 
         self.title(_("Logs") + f" - {service_name}")
         self.geometry("1200x800")
@@ -43,9 +56,8 @@ class LogsDialog(ctk.CTkToplevel):
 
         self.update_logs()
 
-        self.update_thread = threading.Thread(target=self.auto_update_logs)
-        self.update_thread.daemon = True
-        self.update_thread.start()
+        self.subscription = journal_follower.subscribe([service_name], self.entries)
+        self.after(self.POLL_INTERVAL_MS, self.process_entries)
 
         self.protocol("WM_DELETE_WINDOW", self.on_close)
 
@@ -156,42 +168,93 @@ class LogsDialog(ctk.CTkToplevel):
         )
         lines = self.lines_var.get()
 
-        try:
-            result = subprocess.run(
-                [
-                    "journalctl",
-                    "-u",
-                    f"{self.service_name}",
-                    "--since",
-                    since,
-                    "-n",
-                    lines,
-                    "--no-pager",
-                    "--output=short-precise",
-                ],
-                capture_output=True,
-                text=True,
-            )
-
-            self.log_text.delete("1.0", "end")
+        command = [
+            "journalctl",
+            "-u",
+            f"{self.service_name}",
+            "--since",
+            since,
+            "-n",
+            lines,
+            "--no-pager",
+            "--output=json",
+        ]
+        # Live entries stay queued until the backlog is shown. A newer period
+        # or line count replaces the read in progress.
+        if self.load_task is not None:
+            self.load_task.cancel()
+        self.loading = True
+        self.load_task = runtime.submit(
+            run_process,
+            command,
+            name="logs_dialog_journal",
+            owner=self,
+            on_done=self.show_logs,
+            on_error=self.show_logs_error,
+        )
 
-            if result.stdout:
-                self.log_text.insert("1.0", result.stdout)
-            else:
-                self.log_text.insert("1.0", _("No logs available for this period"))
+    @profiled("logs_refresh", snapshot=True)
+    def show_logs(self, result: subprocess.CompletedProcess):
+
+        self.loading = False
+        self.load_task = None
+        self.log_text.delete("1.0", "end")
+
+        # Decoded with their cursors so that the live entries delivered
+        # during the read are not shown twice.
+        entries = parse_entries(result.stdout)
+        self.fence = BacklogFence.after(entries)
+        self.has_logs = bool(entries)
+        if entries:
+            self.log_text.insert(
+                "1.0", "".join(entry.format() + "\n" for entry in entries)
+            )
+        else:
+            self.log_text.insert("1.0", _("No logs available for this period"))
+
+        self.log_text.see("end")
+
+    def show_logs_error(self, error: BaseException):
+
+        self.loading = False
+        self.load_task = None
+        self.log_text.delete("1.0", "end")
+        self.log_text.insert("1.0", _("Error retrieving logs: ") + str(error))
+
+    def process_entries(self):
+
+        if not self.winfo_exists():
+            return
+        if self.loading:
+            self.after(self.POLL_INTERVAL_MS, self.process_entries)
+            return
+
+        lines = []
+        while True:
+            try:
+                entry = self.entries.get_nowait()
+            except queue.Empty:
+                break
+            if self.fence.keeps(entry):
+                lines.append(entry.format())
+
+        # While auto-update is off the view is frozen; "Refresh" reloads it.
+        if lines and self.auto_update_var.get():
+            if not self.has_logs:
+                self.log_text.delete("1.0", "end")
+                self.has_logs = True
+            self.log_text.insert("end", "\n".join(lines) + "\n")
+
+            max_lines = int(self.lines_var.get())
+            line_count = int(self.log_text.index("end-1c").split(".")[0])
+            if line_count > max_lines:
+                self.log_text.delete("1.0", f"{line_count - max_lines + 1}.0")
 
             self.log_text.see("end")
 
-        except subprocess.CalledProcessError as e:
-            self.log_text.delete("1.0", "end")
-            self.log_text.insert("1.0", _("Error retrieving logs: ") + str(e))
-
-    def auto_update_logs(self):
-        while not self.stop_update:
-            if self.auto_update_var.get():
-                self.update_logs()
-            threading.Event().wait(5)
+        self.after(self.POLL_INTERVAL_MS, self.process_entries)
 
     def on_close(self):
-        self.stop_update = True
+        runtime.cancel_owner(self)
+        journal_follower.unsubscribe(self.subscription)
         self.destroy()
@@ -1,6 +1,7 @@
+import functools
 import os
 import subprocess
-from typing import List
+from typing import List, Optional
 
 import customtkinter as ctk
 
@@ -8,6 +9,12 @@ from src.gui.utils.service_validator import ServiceValidator
 from src.i18n.translations import _
 from src.models.screen import build_screen_command, screen_session_name
 from src.models.service_model import ServiceModel
+from src.utils.dirlist import PAGE_SIZE, DirectoryListing, paginate
+from src.utils.executables import executable_finder
+from src.utils.identity import identity_cache
+from src.utils.proctrace import run_command
+from src.utils.profiling import profiled
+from src.utils.runtime import Task, runtime
 
 
 class ServiceCreationFrame(ctk.CTkFrame):
@@ -32,6 +39,13 @@ class ServiceCreationFrame(ctk.CTkFrame):
         user_var (StringVar): Variable for service user configuration
     """
 
+    # Executable menu entries that are messages, not executables.
+    EXECUTABLE_PLACEHOLDERS = (
+        "Sélectionnez d'abord un dossier de travail",
+        "Aucun exécutable trouvé",
+        "Erreur de lecture",
+    )
+
     def __init__(self, parent):
         super().__init__(parent)
         self.parent = parent
@@ -76,6 +90,9 @@ class ServiceCreationFrame(ctk.CTkFrame):
         self.args_var = ctk.StringVar()
         self.use_screen_var = ctk.BooleanVar(value=False)
         self.executables_var = ctk.StringVar()
+        self.executable_search_var = ctk.StringVar()
+        self.include_bin_var = ctk.BooleanVar(value=False)
+        self._executables_task: Optional[Task] = None
         self.start_delay_var = ctk.StringVar(value="0")
         self.max_restarts_var = ctk.StringVar(value="3")
         self.start_after_save_var = ctk.BooleanVar(value=True)
@@ -282,9 +299,32 @@ class ServiceCreationFrame(ctk.CTkFrame):
         self.executable_menu.grid(row=0, column=0, sticky="ew", padx=(0, 5))
 
         ctk.CTkButton(
-            executable_container, text="🔄", width=30, command=self.refresh_executables
+            executable_container,
+            text="🔄",
+            width=30,
+            command=lambda: self.refresh_executables(force=True),
         ).grid(row=0, column=1)
 
+        search_entry = ctk.CTkEntry(
+            executable_container,
+            textvariable=self.executable_search_var,
+            placeholder_text=_("Search executables..."),
+        )
+        search_entry.grid(row=1, column=0, sticky="ew", padx=(0, 5), pady=(5, 0))
+        search_entry.bind("<KeyRelease>", lambda e: self.refresh_executables())
+
+        ctk.CTkCheckBox(
+            executable_container,
+            text=_("Include bin/ subfolders"),
+            variable=self.include_bin_var,
+            command=self.refresh_executables,
+        ).grid(row=2, column=0, sticky="w", pady=(5, 0))
+
+        self.executables_status = ctk.CTkLabel(
+            executable_container, text="", **self.help_text_style
+        )
+        self.executables_status.grid(row=3, column=0, columnspan=2, sticky="w")
+
         self.args_entry = ctk.CTkEntry(
             self.browse_frame,
             textvariable=self.args_var,
@@ -458,6 +498,7 @@ class ServiceCreationFrame(ctk.CTkFrame):
 
         self.winfo_toplevel().destroy()
 
+    @profiled("save")
     def create_service(self):
         try:
             config = self.get_service_config()
@@ -511,7 +552,7 @@ class ServiceCreationFrame(ctk.CTkFrame):
 
             if self.start_after_save_var.get():
                 try:
-                    subprocess.run(
+                    run_command(
                         ["systemctl", "start", f"{service.name}.service"], check=True
                     )
                 except subprocess.CalledProcessError as e:
@@ -604,17 +645,8 @@ class ServiceCreationFrame(ctk.CTkFrame):
         if selected_user == "root":
             current_path = "/"
         else:
-            try:
-                with open("/etc/passwd", "r") as f:
-                    for line in f:
-                        user_info = line.strip().split(":")
-                        if user_info[0] == selected_user:
-                            current_path = user_info[5]
-                            break
-                    else:
-                        current_path = os.path.expanduser("~")
-            except Exception:
-                current_path = os.path.expanduser("~")
+            home = identity_cache.home_directory(selected_user)
+            current_path = home if home else os.path.expanduser("~")
 
         try:
             dialog = ctk.CTkToplevel(self)
@@ -641,64 +673,132 @@ class ServiceCreationFrame(ctk.CTkFrame):
                 command=lambda: validate_manual_entry(),
             ).grid(row=0, column=2, padx=5, pady=5)
 
+            filter_var = ctk.StringVar()
+            ctk.CTkEntry(
+                top_frame,
+                textvariable=filter_var,
+                placeholder_text=_("Filter folders..."),
+            ).grid(row=1, column=0, columnspan=3, padx=5, pady=(0, 5), sticky="ew")
+
             scrollable_frame = ctk.CTkScrollableFrame(dialog)
             scrollable_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
 
-            def update_directory_list(path):
+            page_frame = ctk.CTkFrame(dialog, fg_color="transparent")
+            page_frame.grid(row=2, column=0, padx=10, sticky="ew")
+            page_frame.grid_columnconfigure(1, weight=1)
 
-                for widget in scrollable_frame.winfo_children():
-                    widget.destroy()
+            previous_button = ctk.CTkButton(
+                page_frame, text="◀", width=40, command=lambda: change_page(-1)
+            )
+            previous_button.grid(row=0, column=0, padx=5)
+            status_label = ctk.CTkLabel(page_frame, text="")
+            status_label.grid(row=0, column=1, padx=5)
+            next_button = ctk.CTkButton(
+                page_frame, text="▶", width=40, command=lambda: change_page(1)
+            )
+            next_button.grid(row=0, column=2, padx=5)
+
+            row_style = {
+                "anchor": "w",
+                "fg_color": "transparent",
+                "text_color": ("gray10", "gray90"),
+                "hover_color": ("gray70", "gray30"),
+            }
+            parent_button = ctk.CTkButton(
+                scrollable_frame,
+                text="📁 ..",
+                command=lambda: navigate_to(os.path.dirname(current_path)),
+                **row_style,
+            )
+            error_label = ctk.CTkLabel(scrollable_frame, text="", text_color="red")
+            # Buttons are reused from page to page: at most PAGE_SIZE exist.
+            row_buttons: List[ctk.CTkButton] = []
+            state = {"listing": None, "page": 0, "version": -1, "shown": 0}
+
+            def update_status(names, pages):
+                listing = state["listing"]
+                status = _("%d folders") % len(names)
+                if pages > 1:
+                    status = (
+                        _("Page %d/%d") % (state["page"] + 1, pages) + " — " + status
+                    )
+                if not listing.done:
+                    status += " — " + _("loading...")
+                status_label.configure(text=status)
+                previous_button.configure(
+                    state="normal" if state["page"] > 0 else "disabled"
+                )
+                next_button.configure(
+                    state="normal" if state["page"] < pages - 1 else "disabled"
+                )
 
-                try:
-                    if path != "/":
-                        parent_btn = ctk.CTkButton(
-                            scrollable_frame,
-                            text="📁 ..",
-                            anchor="w",
-                            command=lambda: navigate_to(os.path.dirname(path)),
-                            fg_color="transparent",
-                            text_color=("gray10", "gray90"),
-                            hover_color=("gray70", "gray30"),
-                        )
-                        parent_btn.pack(fill="x", padx=5, pady=2)
-
-                    items = []
-                    for item in sorted(os.listdir(path)):
-                        if item.startswith("."):
-                            continue
-                        full_path = os.path.join(path, item)
-                        if os.path.isdir(full_path):
-                            items.append((item, full_path))
-
-                    for name, full_path in items:
-                        btn = ctk.CTkButton(
-                            scrollable_frame,
-                            text=f"📁 {name}",
-                            anchor="w",
-                            command=lambda p=full_path: navigate_to(p),
-                            fg_color="transparent",
-                            text_color=("gray10", "gray90"),
-                            hover_color=("gray70", "gray30"),
-                        )
-                        btn.pack(fill="x", padx=5, pady=2)
-
-                except PermissionError:
-                    error_label = ctk.CTkLabel(
-                        scrollable_frame,
-                        text=_("⚠️ Accès refusé à ce dossier"),
-                        text_color="red",
+            def render():
+                listing = state["listing"]
+                names = listing.matching(filter_var.get())
+                visible, state["page"], pages = paginate(names, state["page"])
+
+                for widget in scrollable_frame.winfo_children():
+                    widget.pack_forget()
+                if current_path != "/":
+                    parent_button.pack(fill="x", padx=5, pady=2)
+                if isinstance(listing.error, PermissionError):
+                    error_label.configure(text=_("⚠️ Accès refusé à ce dossier"))
+                    error_label.pack(pady=10)
+                elif listing.error is not None:
+                    error_label.configure(
+                        text=_("Error accessing directory: ") + str(listing.error)
                     )
                     error_label.pack(pady=10)
-                    if path != "/":
-                        navigate_to(os.path.dirname(path))
 
-                path_entry.delete(0, "end")
-                path_entry.insert(0, path)
+                for i, name in enumerate(visible):
+                    if i == len(row_buttons):
+                        row_buttons.append(ctk.CTkButton(scrollable_frame, **row_style))
+                    path = os.path.join(listing.path, name)
+                    row_buttons[i].configure(
+                        text=f"📁 {name}", command=lambda p=path: navigate_to(p)
+                    )
+                    row_buttons[i].pack(fill="x", padx=5, pady=2)
+                state["shown"] = len(visible)
+                update_status(names, pages)
+
+            def poll_listing(listing):
+                if listing is not state["listing"]:
+                    return  # navigated elsewhere meanwhile
+                if not dialog.winfo_exists():
+                    listing.cancel()
+                    return
+                if listing.version != state["version"]:
+                    state["version"] = listing.version
+                    if listing.done or state["shown"] < PAGE_SIZE:
+                        render()
+                    else:
+                        names = listing.matching(filter_var.get())
+                        update_status(names, paginate(names, state["page"])[2])
+                if not listing.done:
+                    dialog.after(100, poll_listing, listing)
 
             def navigate_to(path):
                 nonlocal current_path
                 current_path = path
-                update_directory_list(path)
+                if state["listing"] is not None:
+                    state["listing"].cancel()
+                state.update(listing=DirectoryListing(path).start(), page=0, version=-1)
+                path_entry.delete(0, "end")
+                path_entry.insert(0, path)
+                filter_var.set("")
+                poll_listing(state["listing"])
+
+            def change_page(delta):
+                state["page"] += delta
+                render()
+                scrollable_frame._parent_canvas.yview_moveto(0)
+
+            def on_filter_change(*args):
+                if state["listing"] is not None:
+                    state["page"] = 0
+                    render()
+
+            filter_var.trace_add("write", on_filter_change)
 
             def validate_manual_entry():
                 path = path_entry.get().strip()
@@ -722,7 +822,7 @@ class ServiceCreationFrame(ctk.CTkFrame):
                 navigate_to(path)
 
             button_frame = ctk.CTkFrame(dialog)
-            button_frame.grid(row=2, column=0, padx=10, pady=5, sticky="ew")
+            button_frame.grid(row=3, column=0, padx=10, pady=5, sticky="ew")
             button_frame.grid_columnconfigure((0, 1), weight=1)
 
             ctk.CTkButton(
@@ -745,7 +845,7 @@ class ServiceCreationFrame(ctk.CTkFrame):
                 if self.validate_working_directory():
                     dialog.destroy()
 
-            update_directory_list(current_path)
+            navigate_to(current_path)
 
             path_entry.bind("<Return>", lambda e: validate_manual_entry())
 
@@ -846,16 +946,12 @@ class ServiceCreationFrame(ctk.CTkFrame):
 
     def on_executable_selected(self, value):
 
-        if value not in [
-            "Sélectionnez d'abord un dossier de travail",
-            "Aucun exécutable trouvé",
-            "Erreur de lecture",
-        ]:
+        if value not in self.EXECUTABLE_PLACEHOLDERS:
             working_dir = self.working_dir_var.get()
             self.executable_var.set(os.path.join(working_dir, value))
             self.update_command()
 
-    def refresh_executables(self):
+    def refresh_executables(self, force=False):
 
         working_dir = self.working_dir_var.get()
         if not working_dir:
@@ -864,38 +960,57 @@ class ServiceCreationFrame(ctk.CTkFrame):
             )
             return
 
-        try:
-            executables = []
-            for item in os.listdir(working_dir):
-                full_path = os.path.join(working_dir, item)
-                if os.path.isfile(full_path):
-                    if os.access(full_path, os.X_OK):
-                        executables.append(item)
-                    elif item.endswith((".sh", ".py", ".bash", ".js")):
-                        executables.append(item)
-
-            if executables:
-                self.executable_menu.configure(values=executables)
-
-                first_executable = executables[0]
-                self.executable_menu.set(first_executable)
-                self.on_executable_selected(first_executable)
-            else:
-                self.executable_menu.configure(values=["Aucun exécutable trouvé"])
+        query = self.executable_search_var.get()
+        include_bin = self.include_bin_var.get()
+
+        # A newer search supersedes the pending one.
+        if self._executables_task is not None:
+            self._executables_task.cancel()
+        self.executables_status.configure(text=_("Searching..."))
+        self._executables_task = runtime.submit(
+            functools.partial(
+                executable_finder.find,
+                working_dir,
+                query,
+                recursive_bin=include_bin,
+                force=force,
+            ),
+            name="executable_search",
+            owner=self,
+            on_done=self.show_executables,
+            on_error=self.executables_failed,
+        )
 
-        except Exception as e:
-            self.show_error(_("Erreur lors de la lecture du dossier : ") + str(e))
-            self.executable_menu.configure(values=["Erreur de lecture"])
+    def executables_failed(self, error: BaseException):
+
+        self.executables_status.configure(text="")
+        self.show_error(_("Erreur lors de la lecture du dossier : ") + str(error))
+        self.executable_menu.configure(values=["Erreur de lecture"])
+
+    def show_executables(self, search):
+
+        if search.truncated:
+            self.executables_status.configure(
+                text=_("%d of %d executables shown, refine the search")
+                % (len(search.names), search.total)
+            )
+        else:
+            self.executables_status.configure(text="")
+
+        if search.names:
+            self.executable_menu.configure(values=search.names)
+
+            first_executable = search.names[0]
+            self.executable_menu.set(first_executable)
+            self.on_executable_selected(first_executable)
+        else:
+            self.executable_menu.configure(values=["Aucun exécutable trouvé"])
 
     def update_command(self):
 
         if self.command_method_var.get() == "browse":
             executable = self.executable_var.get()
-            if executable and executable not in [
-                "Sélectionnez d'abord un dossier de travail",
-                "Aucun exécutable trouvé",
-                "Erreur de lecture",
-            ]:
+            if executable and executable not in self.EXECUTABLE_PLACEHOLDERS:
                 base_cmd = executable
 
                 if self.args_var.get().strip():
@@ -916,7 +1031,7 @@ class ServiceCreationFrame(ctk.CTkFrame):
     def check_screen_installed(self):
 
         try:
-            result = subprocess.run(
+            result = run_command(
                 ["which", "screen"], stdout=subprocess.PIPE, stderr=subprocess.PIPE
             )
             return result.returncode == 0
@@ -1055,3 +1170,8 @@ class ServiceCreationFrame(ctk.CTkFrame):
 
     def set_language(self, language):
         self.update_translations()
+
+    def destroy(self):
+
+        runtime.cancel_owner(self)
+        super().destroy()
@@ -1,5 +1,5 @@
 from tkinter import messagebox
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import customtkinter as ctk
 
@@ -7,6 +7,10 @@ from src.gui.gui_controller import GUIController
 from src.gui.utils.service_validator import ServiceValidator
 from src.i18n.translations import _
 from src.models.service_model import ServiceModel
+from src.utils.cgroup import CgroupSampler, format_bytes, sparkline
+from src.utils.operations import operation_queue
+from src.utils.profiling import profiled
+from src.utils.runtime import runtime
 
 
 class ServiceListFrame(ctk.CTkFrame):
@@ -20,8 +24,37 @@ class ServiceListFrame(ctk.CTkFrame):
         controller (GUIController): Controller for GUI operations
         selected_service (Optional[ServiceModel]): Currently selected service
         services (List[ServiceModel]): List of all available services
+        sampler (CgroupSampler): cgroup v2 CPU/memory sampler of the listed services
+        usage_labels (Dict[str, tuple]): CPU, memory and sparkline labels by service
+        status_labels (Dict[str, CTkLabel]): Status label of each service row
     """
 
+    SAMPLE_INTERVAL_MS = 2000
+    STATUS_COLORS = {
+        "active": "green",
+        "inactive": "gray",
+        "failed": "red",
+        "unknown": "orange",
+    }
+    OPERATION_MESSAGES = {
+        "start": (
+            "Service started successfully",
+            "%d services started",
+            "Error starting service",
+        ),
+        "stop": (
+            "Service stopped successfully",
+            "%d services stopped",
+            "Error stopping service",
+        ),
+        "restart": (
+            "Service restarted successfully",
+            "%d services restarted",
+            "Error restarting service",
+        ),
+    }
+    SPARKLINE_WIDTH = 15
+
     def __init__(self, master):
         super().__init__(master)
 
@@ -35,6 +68,11 @@ class ServiceListFrame(ctk.CTkFrame):
         self.normal_color = ("gray75", "gray15")
         self.selected_color = ("gray85", "gray35")
 
+        self.sampler = CgroupSampler()
+        self.usage_labels: Dict[str, tuple] = {}
+        self.status_labels: Dict[str, ctk.CTkLabel] = {}
+        self.sample_job = None
+
         self.grid_columnconfigure(0, weight=1)
         self.grid_rowconfigure(1, weight=1)
 
@@ -44,6 +82,10 @@ class ServiceListFrame(ctk.CTkFrame):
 
         self.refresh_services()
 
+        self.sample_usage()
+
+        operation_queue.subscribe(self.show_operation)
+
     def create_control_buttons(self):
 
         button_frame = ctk.CTkFrame(
@@ -130,7 +172,14 @@ class ServiceListFrame(ctk.CTkFrame):
         self.header_frame.grid(row=0, column=0, sticky="ew")
         self.header_frame.grid_columnconfigure(1, weight=1)
 
-        headers = [(_("Nom"), 200), (_("Description"), 300), (_("Statut"), 100)]
+        headers = [
+            (_("Nom"), 200),
+            (_("Description"), 300),
+            (_("Statut"), 100),
+            (_("CPU"), 60),
+            (_("Mémoire"), 80),
+            (_("Activité"), 130),
+        ]
 
         for col, (text, width) in enumerate(headers):
             label = ctk.CTkLabel(
@@ -141,6 +190,7 @@ class ServiceListFrame(ctk.CTkFrame):
             )
             label.grid(row=0, column=col, padx=5, pady=5)
 
+    @profiled("refresh", snapshot=True)
     def refresh_services(self):
 
         selected_service_name = (
@@ -150,6 +200,8 @@ class ServiceListFrame(ctk.CTkFrame):
         self.selected_frame = None
 
         self.services = self.controller.get_services()
+        self.usage_labels = {}
+        self.status_labels = {}
 
         for widget in self.scrollable_frame.winfo_children():
             if widget.grid_info()["row"] != 0:
@@ -176,22 +228,38 @@ class ServiceListFrame(ctk.CTkFrame):
             desc_label.grid(row=0, column=1, padx=5, pady=2)
 
             status = service.status.get("active", _("unknown"))
-            status_colors = {
-                "active": "green",
-                "inactive": "gray",
-                "failed": "red",
-                "unknown": "orange",
-            }
-
             status_label = ctk.CTkLabel(
                 service_frame,
                 text=status,
-                text_color=status_colors.get(status, "white"),
+                text_color=self.STATUS_COLORS.get(status, "white"),
                 width=100,
             )
             status_label.grid(row=0, column=2, padx=5, pady=2)
+            self.status_labels[service.name] = status_label
+            self.show_operation(service.name)
+
+            cpu_label = ctk.CTkLabel(service_frame, text="—", width=60, anchor="e")
+            cpu_label.grid(row=0, column=3, padx=5, pady=2)
+
+            memory_label = ctk.CTkLabel(service_frame, text="—", width=80, anchor="e")
+            memory_label.grid(row=0, column=4, padx=5, pady=2)
 
-            for widget in [service_frame, name_label, desc_label, status_label]:
+            spark_label = ctk.CTkLabel(
+                service_frame, text="", width=130, anchor="w", font=("Courier", 12)
+            )
+            spark_label.grid(row=0, column=5, padx=5, pady=2)
+
+            self.usage_labels[service.name] = (cpu_label, memory_label, spark_label)
+
+            for widget in [
+                service_frame,
+                name_label,
+                desc_label,
+                status_label,
+                cpu_label,
+                memory_label,
+                spark_label,
+            ]:
                 widget.bind(
                     "<Button-1>",
                     lambda e, s=service, f=service_frame: self.select_service(s, f),
@@ -207,6 +275,42 @@ class ServiceListFrame(ctk.CTkFrame):
             if selected_service_name and service.name == selected_service_name:
                 self.select_service(service, service_frame)
 
+        self.update_usage_labels()
+
+    def sample_usage(self):
+
+        self.sample_job = None
+        if not self.winfo_exists():
+            return
+        # Plain file reads from cgroupfs: cheap enough to run on the UI thread.
+        self.sampler.sample(self.usage_labels)
+        self.update_usage_labels()
+        self.sample_job = self.after(self.SAMPLE_INTERVAL_MS, self.sample_usage)
+
+    def update_usage_labels(self):
+
+        for name, (cpu_label, memory_label, spark_label) in self.usage_labels.items():
+            usage = self.sampler.usage.get(name)
+            if usage is None:
+                continue
+            cpu_label.configure(
+                text="—" if usage.cpu_percent is None else f"{usage.cpu_percent:.1f}%"
+            )
+            memory_label.configure(text=format_bytes(usage.memory_bytes))
+            spark_label.configure(
+                text=sparkline(usage.cpu_history, self.SPARKLINE_WIDTH)
+            )
+
+    def destroy(self):
+
+        if self.sample_job is not None:
+            self.after_cancel(self.sample_job)
+            self.sample_job = None
+        self.sampler.close()
+        runtime.cancel_owner(self)
+        operation_queue.unsubscribe(self.show_operation)
+        super().destroy()
+
     def create_service_frame(self, service: ServiceModel, row: int) -> ctk.CTkFrame:
 
         frame = ctk.CTkFrame(self.scrollable_frame)
@@ -252,6 +356,7 @@ class ServiceListFrame(ctk.CTkFrame):
         ]:
             button.configure(state="normal")
 
+    @profiled("edit")
     def edit_service(self):
 
         if not self.selected_service:
@@ -285,10 +390,17 @@ class ServiceListFrame(ctk.CTkFrame):
 
         messagebox.showerror(_("Erreur"), message)
 
-    def show_success(self, message):
+    def show_success(self, message, plural=None):
 
-        messagebox.showinfo(_("Succès"), message)
+        manager = getattr(self.winfo_toplevel(), "notification_manager", None)
+        if manager is None:
+            messagebox.showinfo(_("Succès"), message)
+            return
+        manager.show_notification(
+            self, message, "success", group=message, plural=plural
+        )
 
+    @profiled("open_logs")
     def show_logs(self):
 
         if self.selected_service:
@@ -296,6 +408,7 @@ class ServiceListFrame(ctk.CTkFrame):
 
             LogsDialog(self.master.master, self.selected_service.name)
 
+    @profiled("delete")
     def delete_service(self):
 
         if not self.selected_service:
@@ -308,7 +421,9 @@ class ServiceListFrame(ctk.CTkFrame):
         ):
             try:
                 self.controller.delete_service(self.selected_service.name)
-                self.show_success(_("Service deleted successfully"))
+                self.show_success(
+                    _("Service deleted successfully"), _("%d services deleted")
+                )
 
                 self.refresh_services()
 
@@ -336,6 +451,10 @@ class ServiceListFrame(ctk.CTkFrame):
                     widget.configure(text=_("Description"))
                 elif widget.cget("text") == "Statut":
                     widget.configure(text=_("Status"))
+                elif widget.cget("text") == "Mémoire":
+                    widget.configure(text=_("Memory"))
+                elif widget.cget("text") == "Activité":
+                    widget.configure(text=_("Activity"))
 
         for widget in self.scrollable_frame.winfo_children():
             if isinstance(widget, ctk.CTkFrame):
@@ -360,56 +479,71 @@ class ServiceListFrame(ctk.CTkFrame):
 
     def refresh_service_status(self, service_name: str):
 
-        try:
-            status, errors = self.validator.analyze_service_status(service_name)
-
-            if service_name in self.service_frames:
-                frame = self.service_frames[service_name]
-                frame.update_status(status)
+        runtime.submit(
+            self.controller.get_statuses,
+            [service_name],
+            name="service_status",
+            owner=self,
+            on_done=self.show_statuses,
+        )
 
-                if errors:
-                    frame.show_error_indicator()
-                    frame.set_error_tooltip("\n".join(errors))
-                else:
-                    frame.hide_error_indicator()
+    def show_statuses(self, statuses: Dict[str, dict]):
 
-        except Exception as e:
-            print(
-                f"Erreur lors du rafraîchissement du statut de {service_name}: {str(e)}"
+        for name, status in statuses.items():
+            label = self.status_labels.get(name)
+            if label is None or not label.winfo_exists():
+                continue
+            active = status.get("active", "unknown")
+            label.configure(
+                text=active, text_color=self.STATUS_COLORS.get(active, "white")
             )
 
-    def start_service(self):
+    def show_operation(self, service_name: str):
 
-        if not self.selected_service:
+        label = self.status_labels.get(service_name)
+        if label is None or not label.winfo_exists():
             return
+        running, pending = operation_queue.state(service_name)
+        if running is None:
+            # The status refresh requested by the operation's callback
+            # replaces the text.
+            return
+        text = f"⟳ {running}" + (f" · {pending}" if pending else "")
+        label.configure(text=text, text_color="orange")
 
-        try:
-            self.controller.start_service(self.selected_service.name)
-            self.show_success(_("Service started successfully"))
-            self.refresh_service_status(self.selected_service.name)
-        except Exception as e:
-            self.show_error(f"{_('Error starting service')}: {str(e)}")
-
-    def stop_service(self):
+    def run_operation(self, verb: str):
 
         if not self.selected_service:
             return
 
-        try:
-            self.controller.stop_service(self.selected_service.name)
-            self.show_success(_("Service stopped successfully"))
-            self.refresh_service_status(self.selected_service.name)
-        except Exception as e:
-            self.show_error(f"{_('Error stopping service')}: {str(e)}")
+        # Queued per unit: a double click or a start/stop/start sequence
+        # costs one systemctl job, and jobs on a unit never overlap.
+        service_name = self.selected_service.name
 
-    def restart_service(self):
+        def done(ran: str):
+            if not self.winfo_exists():
+                return
+            success, plural, _failure = self.OPERATION_MESSAGES[ran]
+            self.show_success(_(success), _(plural))
+            self.refresh_service_status(service_name)
 
-        if not self.selected_service:
-            return
+        def failed(ran: str, error: BaseException):
+            if not self.winfo_exists():
+                return
+            failure = self.OPERATION_MESSAGES[ran][2]
+            self.show_error(f"{_(failure)}: {str(error)}")
+            self.refresh_service_status(service_name)
 
-        try:
-            self.controller.restart_service(self.selected_service.name)
-            self.show_success(_("Service restarted successfully"))
-            self.refresh_service_status(self.selected_service.name)
-        except Exception as e:
-            self.show_error(f"{_('Error restarting service')}: {str(e)}")
+        operation_queue.request(service_name, verb, on_done=done, on_error=failed)
+
+    def start_service(self):
+
+        self.run_operation("start")
+
+    def stop_service(self):
+
+        self.run_operation("stop")
+
+    def restart_service(self):
+
+        self.run_operation("restart")
@@ -1,10 +1,41 @@
 import queue
-import subprocess
-import threading
+from collections import deque
 from datetime import datetime
+from typing import Deque, List
 
 import customtkinter as ctk
 
+from src.utils.journal import (
+    PRIORITY_DEBUG,
+    PRIORITY_ERROR,
+    PRIORITY_INFO,
+    PRIORITY_WARNING,
+    BacklogFence,
+    journal_follower,
+    parse_entries,
+)
+from src.utils.log_render import INGEST_BATCH, MAX_LINES, render_lines
+from src.utils.runtime import run_process, runtime
+
+LEVEL_PRIORITIES = {
+    "Tous": PRIORITY_DEBUG,
+    "Info": PRIORITY_INFO,
+    "Warning": PRIORITY_WARNING,
+    "Error": PRIORITY_ERROR,
+}
+
+
+def insert_chunks(textbox: ctk.CTkTextbox, chunks: List[str]):
+    """Insert the ``[text, tag, ...]`` chunks of ``render_lines`` at the end."""
+    # CTkTextbox.insert only forwards one text/tags pair; the Tk text widget
+    # it wraps (a private attribute) takes the whole batch in a single call.
+    widget = getattr(textbox, "_textbox", None)
+    if widget is not None:
+        widget.insert("end", *chunks)
+        return
+    for i in range(0, len(chunks), 2):
+        textbox.insert("end", chunks[i], chunks[i + 1])
+
 
 class SystemLogsFrame(ctk.CTkFrame):
     """
@@ -14,17 +45,27 @@ class SystemLogsFrame(ctk.CTkFrame):
     - Real-time log monitoring with auto-scroll capability
     - Log filtering by time period and severity level
     - Search functionality within logs
-    - Log following (auto-scroll) option
-    - Multi-threaded log updates to maintain UI responsiveness
+    - Log following (auto-scroll) option, fed by the shared journal follower
 
     Attributes:
         parent: The parent widget containing this frame
-        log_queue (Queue): Thread-safe queue for handling log updates
+        log_queue (Queue): Entries delivered by the shared journal follower
         follow_logs (bool): Flag to control automatic log following
         current_filter (str): Current active log filter
-        update_thread (Thread): Background thread for log updates
+        subscription (Optional[int]): Journal follower token while following
+        poll_job (Optional[str]): Pending ``after`` job draining the queue
+        filter_job (Optional[str]): Pending refresh after a filter keystroke
+        pending_lines (Deque[str]): Lines waiting to be rendered, oldest first
+        render_job (Optional[str]): Pending ``after`` job rendering them
+        trimmed (int): Lines dropped from the view since the last refresh
+        notice_shown (bool): True when line 1 is the notice of these drops
+        refresh_task (Optional[Task]): Journal read in progress, if any
+        fence (BacklogFence): Live entries already shown by the backlog
     """
 
+    POLL_INTERVAL_MS = 100
+    FILTER_DELAY_MS = 300
+
     def __init__(self, parent):
         super().__init__(parent)
 
@@ -35,12 +76,19 @@ class SystemLogsFrame(ctk.CTkFrame):
         self.follow_logs = False
         self.current_filter = None
 
+        self.subscription = None
+        self.poll_job = None
+        self.filter_job = None
+        self.pending_lines: Deque[str] = deque()
+        self.render_job = None
+        self.trimmed = 0
+        self.notice_shown = False
+        self.refresh_task = None
+        self.fence = BacklogFence()
+
         self.create_toolbar()
         self.create_log_view()
 
-        self.update_thread = None
-        self.start_log_updates()
-
     def create_toolbar(self):
 
         toolbar = ctk.CTkFrame(self)
@@ -108,78 +156,148 @@ class SystemLogsFrame(ctk.CTkFrame):
 
     def start_log_updates(self):
 
-        if self.update_thread is None or not self.update_thread.is_alive():
-            self.update_thread = threading.Thread(target=self.update_logs, daemon=True)
-            self.update_thread.start()
+        self.stop_log_updates()
 
-    def update_logs(self):
+        service_filter = self.filter_var.get()
+        units = [f"*{service_filter}*"] if service_filter else None
+        max_priority = LEVEL_PRIORITIES.get(self.level_var.get(), PRIORITY_DEBUG)
 
-        while True:
-            if self.follow_var.get():
-                try:
-                    cmd = ["journalctl", "-f", "-n", "0", "--no-pager"]
-
-                    level = self.level_var.get()
-                    if level != "Tous":
-                        cmd.extend(["-p", level.lower()])
-
-                    service_filter = self.filter_var.get()
-                    if service_filter:
-                        cmd.extend(["-u", f"*{service_filter}*"])
-
-                    process = subprocess.Popen(
-                        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
-                    )
+        self.subscription = journal_follower.subscribe(
+            units, self.log_queue, max_priority
+        )
+        self.poll_job = self.after(self.POLL_INTERVAL_MS, self.process_log_queue)
 
-                    for line in process.stdout:
-                        if not self.follow_var.get():
-                            process.terminate()
-                            break
+    def stop_log_updates(self):
 
-                        self.log_queue.put(line)
+        # One polling loop per view: re-subscribing must not start another.
+        if self.poll_job is not None:
+            self.after_cancel(self.poll_job)
+            self.poll_job = None
 
-                        self.after(100, self.process_log_queue)
+        if self.subscription is not None:
+            journal_follower.unsubscribe(self.subscription)
+            self.subscription = None
 
-                except Exception as e:
-                    print(f"Erreur lors de la mise à jour des logs : {e}")
-                    break
+        # Drop entries delivered for the previous filter.
+        while not self.log_queue.empty():
+            self.log_queue.get_nowait()
 
     def process_log_queue(self):
 
-        while not self.log_queue.empty():
-            line = self.log_queue.get()
-            self.add_log_line(line)
+        self.poll_job = None
+        if self.subscription is None or not self.winfo_exists():
+            return
+        if self.refresh_task is not None:
+            # Live entries wait for the backlog: they are newer.
+            self.poll_job = self.after(self.POLL_INTERVAL_MS, self.process_log_queue)
+            return
+
+        lines = []
+        read = 0
+        while read < INGEST_BATCH:
+            try:
+                entry = self.log_queue.get_nowait()
+            except queue.Empty:
+                break
+            read += 1
+            if self.fence.keeps(entry):
+                lines.append(entry.format())
+        self.queue_lines(lines)
+
+        # A full batch means a backlog: continue on the next event-loop turn
+        # instead of blocking this one.
+        delay = 1 if read == INGEST_BATCH else self.POLL_INTERVAL_MS
+        self.poll_job = self.after(delay, self.process_log_queue)
 
     def add_log_line(self, line: str):
 
-        try:
-            parts = line.split(" ", 3)
-            timestamp = parts[0]
-            service = parts[2]
-            message = parts[3] if len(parts) > 3 else ""
-
-            level = "info"
-            if "error" in message.lower():
-                level = "error"
-            elif "warning" in message.lower():
-                level = "warning"
-
-            self.log_frame.insert("end", f"{timestamp} ", "timestamp")
-            self.log_frame.insert("end", f"{service} ", "service")
-            self.log_frame.insert("end", f"{message}\n", level)
+        self.add_log_lines([line])
+
+    def queue_lines(self, lines: List[str]):
+
+        # Rendered INGEST_BATCH lines per event-loop turn, whatever the size
+        # of the backlog; lines that would be trimmed anyway are not rendered.
+        self.pending_lines.extend(lines)
+        excess = len(self.pending_lines) - MAX_LINES
+        if excess > 0:
+            for _ in range(excess):
+                self.pending_lines.popleft()
+            # Everything shown is older than the lines kept.
+            self.trimmed += excess + self.shown_line_count()
+            self.log_frame.delete("1.0", "end")
+            self.notice_shown = False
+        if self.render_job is None and self.pending_lines:
+            self.render_job = self.after(1, self.render_pending)
+
+    def render_pending(self):
+
+        self.render_job = None
+        if not self.winfo_exists():
+            return
+        count = min(INGEST_BATCH, len(self.pending_lines))
+        self.add_log_lines([self.pending_lines.popleft() for _ in range(count)])
+        if self.pending_lines:
+            self.render_job = self.after(1, self.render_pending)
+
+    def clear_pending(self):
+
+        if self.render_job is not None:
+            self.after_cancel(self.render_job)
+            self.render_job = None
+        self.pending_lines.clear()
+
+    def shown_line_count(self) -> int:
+
+        # The text always ends with an empty line after the last "\n".
+        count = int(self.log_frame.index("end-1c").split(".")[0]) - 1
+        return count - 1 if self.notice_shown else count
+
+    def add_log_lines(self, lines: List[str]):
+
+        if not lines:
+            return
+        for start in range(0, len(lines), INGEST_BATCH):
+            insert_chunks(
+                self.log_frame, render_lines(lines[start : start + INGEST_BATCH])
+            )
 
-            if self.follow_var.get():
-                self.log_frame.see("end")
+        if self.notice_shown:
+            self.log_frame.delete("1.0", "2.0")
+            self.notice_shown = False
+        excess = self.shown_line_count() - MAX_LINES
+        if excess > 0:
+            self.log_frame.delete("1.0", f"{excess + 1}.0")
+            self.trimmed += excess
+        if self.trimmed:
+            # The user is told that the view does not hold everything.
+            self.notice_shown = True
+            self.log_frame.insert(
+                "1.0",
+                f"… {self.trimmed} lignes plus anciennes non affichées "
+                f"(limite de {MAX_LINES} lignes)\n",
+                "warning",
+            )
 
-        except Exception:
-            self.log_frame.insert("end", f"{line}\n", "info")
+        if self.follow_var.get():
+            self.log_frame.see("end")
 
     def refresh_logs(self, *args):
 
+        if self.filter_job is not None:
+            self.after_cancel(self.filter_job)
+            self.filter_job = None
+        self.clear_pending()
+        self.trimmed = 0
+        self.notice_shown = False
         self.log_frame.delete("1.0", "end")
 
+        # Re-subscribe so the follower picks up the new level/service filter.
+        if self.subscription is not None:
+            self.start_log_updates()
+
         try:
-            cmd = ["journalctl", "--no-pager"]
+            # JSON for the cursors: see BacklogFence.
+            cmd = ["journalctl", "--no-pager", "--output=json"]
 
             period = self.period_var.get()
             if period.endswith("m"):
@@ -200,27 +318,63 @@ class SystemLogsFrame(ctk.CTkFrame):
             if service_filter:
                 cmd.extend(["-u", f"*{service_filter}*"])
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
-
-            for line in result.stdout.splitlines():
-                self.add_log_line(line)
+            # Only the last request is shown; cancelling kills the previous
+            # journalctl.
+            if self.refresh_task is not None:
+                self.refresh_task.cancel()
+            self.refresh_task = runtime.submit(
+                run_process,
+                cmd,
+                name="system_logs_journal",
+                owner=self,
+                on_done=self.show_logs,
+                on_error=self.show_logs_error,
+            )
 
         except Exception as e:
-            self.log_frame.insert(
-                "end", f"Erreur lors de la récupération des logs : {e}\n", "error"
-            )
+            self.show_logs_error(e)
+
+    def show_logs(self, result):
+
+        self.refresh_task = None
+        entries = parse_entries(result.stdout)
+        self.fence = BacklogFence.after(entries)
+        self.queue_lines([entry.format() for entry in entries])
+
+    def show_logs_error(self, error: BaseException):
+
+        self.refresh_task = None
+
+        self.log_frame.insert(
+            "end", f"Erreur lors de la récupération des logs : {error}\n", "error"
+        )
 
     def apply_filter(self, *args):
 
-        self.refresh_logs()
+        # Wait for the user to stop typing instead of reading the journal on
+        # every key.
+        if self.filter_job is not None:
+            self.after_cancel(self.filter_job)
+        self.filter_job = self.after(self.FILTER_DELAY_MS, self.refresh_logs)
 
     def toggle_follow(self):
 
         if self.follow_var.get():
             self.start_log_updates()
         else:
+            self.stop_log_updates()
             self.refresh_logs()
 
+    def destroy(self):
+
+        runtime.cancel_owner(self)
+        self.clear_pending()
+        if self.filter_job is not None:
+            self.after_cancel(self.filter_job)
+            self.filter_job = None
+        self.stop_log_updates()
+        super().destroy()
+
     def export_logs(self):
 
         try:
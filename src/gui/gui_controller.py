@@ -1,11 +1,20 @@
 import json
 import os
 import subprocess
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 import customtkinter
 
-from src.models.service_model import ServiceModel
+from src.daemon import DaemonError, connect_daemon, refresh_daemon
+from src.models.service_model import (
+    DEFAULT_SERVICES_DIR,
+    ServiceModel,
+    list_service_names,
+)
+from src.utils.metrics import operation_metrics
+from src.utils.privileged import PrivilegedError, privileged_helper
+from src.utils.proctrace import run_command
+from src.utils.systemctl import show_units, unit_record
 
 
 class GUIController:
@@ -22,7 +31,7 @@ class GUIController:
 
     def __init__(self):
 
-        self.services_dir = os.path.expanduser("~/.config/systemd-manager/services")
+        self.services_dir = DEFAULT_SERVICES_DIR
         self.setup_directories()
         self.current_theme = "dark"
 
@@ -36,6 +45,7 @@ class GUIController:
         services = []
 
         try:
+            statuses = self.get_statuses(list_service_names(self.services_dir))
             for filename in os.listdir(self.services_dir):
                 if filename.endswith(".json"):
                     service_path = os.path.join(self.services_dir, filename)
@@ -54,8 +64,10 @@ class GUIController:
                             if "install" in service_data:
                                 service.install.__dict__.update(service_data["install"])
 
-                        status = self.get_service_status(service_name)
-                        service.status = status
+                        service.status = statuses.get(
+                            service_name,
+                            {"active": "unknown", "sub": "unknown", "load": "unknown"},
+                        )
 
                         services.append(service)
                     except Exception as e:
@@ -66,10 +78,35 @@ class GUIController:
             print(f"Erreur lors de la lecture du dossier services : {e}")
             return []
 
+    def get_statuses(self, names: List[str]) -> Dict[str, dict]:
+        """Status of every service, from the daemon's cache when it runs,
+        otherwise from one batched ``systemctl show``."""
+        records = None
+        client = connect_daemon()
+        if client is not None:
+            try:
+                with client:
+                    records = client.call("status", services=names) if names else []
+            except (DaemonError, OSError, ValueError) as e:
+                print(f"Erreur lors de l'interrogation du démon : {e}")
+
+        if records is None:
+            states = show_units(names)
+            records = [unit_record(name, states.get(name, {})) for name in names]
+
+        return {
+            record["name"]: {
+                "active": record["active"],
+                "sub": record["sub"],
+                "load": record["load"],
+            }
+            for record in records
+        }
+
     def get_service_status(self, service_name: str) -> dict:
 
         try:
-            result = subprocess.run(
+            result = run_command(
                 ["systemctl", "status", f"{service_name}.service"],
                 capture_output=True,
                 text=True,
@@ -84,7 +121,7 @@ class GUIController:
             else:
                 active_state = "unknown"
 
-            props_result = subprocess.run(
+            props_result = run_command(
                 [
                     "systemctl",
                     "show",
@@ -110,39 +147,11 @@ class GUIController:
         except subprocess.CalledProcessError:
             return {"active": "unknown", "sub": "unknown", "load": "unknown"}
 
-    def start_service(self, service_name: str) -> bool:
-
-        try:
-            subprocess.run(
-                ["systemctl", "start", f"{service_name}.service"], check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
-
-    def stop_service(self, service_name: str) -> bool:
-
-        try:
-            subprocess.run(["systemctl", "stop", f"{service_name}.service"], check=True)
-            return True
-        except subprocess.CalledProcessError:
-            return False
-
-    def restart_service(self, service_name: str) -> bool:
-
-        try:
-            subprocess.run(
-                ["systemctl", "restart", f"{service_name}.service"], check=True
-            )
-            return True
-        except subprocess.CalledProcessError:
-            return False
-
     def check_sudo(self) -> bool:
 
-        return (
-            subprocess.run(["sudo", "-n", "true"], capture_output=True).returncode == 0
-        )
+        # Starts the session's privileged helper once (or nothing when root)
+        # instead of probing with a ``sudo -n true`` process each time.
+        return privileged_helper.start()
 
     def save_service(self, service: ServiceModel) -> bool:
 
@@ -152,12 +161,18 @@ class GUIController:
 
             # Single source of truth for unit-file generation (CLI and GUI both
             # render through ServiceModel.to_systemd_file).
-            systemd_path = f"/etc/systemd/system/{service.name}.service"
-            with open("/tmp/service.tmp", "w") as f:
-                f.write(service.to_systemd_file())
-
-            subprocess.run(["sudo", "mv", "/tmp/service.tmp", systemd_path], check=True)
-            subprocess.run(["sudo", "systemctl", "daemon-reload"], check=True)
+            with operation_metrics.timed("save"):
+                privileged_helper.batch(
+                    [
+                        {
+                            "op": "write_unit",
+                            "name": service.name,
+                            "content": service.to_systemd_file(),
+                        },
+                        {"op": "daemon_reload"},
+                    ]
+                )
+            refresh_daemon([service.name])
 
             return True
         except Exception as e:
@@ -241,21 +256,21 @@ class GUIController:
             Exception: If any step of the deletion process fails
         """
         try:
-            subprocess.run(["systemctl", "stop", service_name], check=True)
-
-            subprocess.run(["systemctl", "disable", service_name], check=True)
-
-            service_path = f"/etc/systemd/system/{service_name}.service"
-            if os.path.exists(service_path):
-                os.remove(service_path)
-
-            json_path = os.path.join(self.services_dir, f"{service_name}.json")
-            if os.path.exists(json_path):
-                os.remove(json_path)
-
-            subprocess.run(["systemctl", "daemon-reload"], check=True)
-
-        except subprocess.CalledProcessError as e:
+            with operation_metrics.timed("delete"):
+                privileged_helper.batch(
+                    [
+                        {"op": "stop", "names": [service_name]},
+                        {"op": "disable", "names": [service_name]},
+                        {"op": "remove_unit", "name": service_name},
+                        {"op": "daemon_reload"},
+                    ]
+                )
+
+                json_path = os.path.join(self.services_dir, f"{service_name}.json")
+                if os.path.exists(json_path):
+                    os.remove(json_path)
+
+        except PrivilegedError as e:
             raise Exception(f"Failed to delete service: {str(e)}")
         except OSError as e:
             raise Exception(f"Failed to remove service files: {str(e)}")
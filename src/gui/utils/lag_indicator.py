@@ -0,0 +1,82 @@
+import tkinter
+
+import customtkinter as ctk
+
+from src.gui.dialogs.error_details_dialog import ErrorDetailsDialog
+from src.i18n.translations import _
+from src.utils.ui_watchdog import UIWatchdog, callback_name, ui_watchdog
+
+_installed = False
+
+
+def install_callback_timer(watchdog: UIWatchdog = ui_watchdog):
+    """Time every Tk callback (event handlers, ``after`` jobs) with ``watchdog``.
+
+    Must run before the first widget is created: tkinter binds the wrapper's
+    ``__call__`` when a callback is registered, so the commands registered
+    earlier would keep the untimed one.
+    """
+    global _installed
+    if _installed:
+        return
+    _installed = True
+    call = tkinter.CallWrapper.__call__
+
+    def timed_call(self, *args):
+        if not watchdog.enabled:
+            return call(self, *args)
+        with watchdog.callback(callback_name(self.func)):
+            return call(self, *args)
+
+    tkinter.CallWrapper.__call__ = timed_call  # type: ignore[method-assign]
+
+
+class LagIndicator(ctk.CTkLabel):
+    """
+    Status-bar label showing the event-loop lag of the GUI.
+
+    Attributes:
+        watchdog (UIWatchdog): Source of the lag statistics
+    """
+
+    UPDATE_INTERVAL_MS = 1000
+
+    def __init__(self, master, watchdog: UIWatchdog = ui_watchdog):
+        super().__init__(master, text="", font=ctk.CTkFont(size=11), cursor="hand2")
+
+        self.watchdog = watchdog
+        self.bind("<Button-1>", lambda event: self.show_events())
+        self.update_job = None
+        self.update_indicator()
+
+    def update_indicator(self):
+
+        stats = self.watchdog.stats()
+        if stats["max_ms"] >= self.watchdog.threshold * 1000:
+            color = "red"
+        elif stats["p95_ms"] >= 50:
+            color = "orange"
+        else:
+            color = ("gray40", "gray70")
+        self.configure(
+            text=_("UI lag p95 %d ms · max %d ms · %d blocks")
+            % (stats["p95_ms"], stats["max_ms"], stats["slow"]),
+            text_color=color,
+        )
+        self.update_job = self.after(self.UPDATE_INTERVAL_MS, self.update_indicator)
+
+    def show_events(self):
+
+        events = [event.format() for event in reversed(self.watchdog.events)]
+        ErrorDetailsDialog(
+            self.winfo_toplevel(),
+            _("Blocked user interface"),
+            events or [_("No callback exceeded the threshold")],
+        )
+
+    def destroy(self):
+
+        if self.update_job is not None:
+            self.after_cancel(self.update_job)
+            self.update_job = None
+        super().destroy()
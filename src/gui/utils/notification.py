@@ -1,8 +1,10 @@
-import threading
-from gettext import gettext as _
+from typing import Any, Dict, Optional
 
 import customtkinter as ctk
 
+from src.i18n.translations import _
+from src.utils.notifications import Notification, NotificationQueue
+
 
 class NotificationManager:
     """
@@ -10,67 +12,84 @@ class NotificationManager:
 
     This class manages the display and lifecycle of notifications in the application,
     including creation, display duration, and cleanup of notification windows.
+    Notifications go through a ``NotificationQueue`` drained by a single ``after``
+    callback on the Tk thread: notifications of the same group are merged, and the
+    number of visible toasts and the rate at which they appear are limited.
 
     Attributes:
-        _notifications (list): List of active notifications
-        _lock (threading.Lock): Thread lock for synchronizing notification operations
+        queue (NotificationQueue): Pending and visible notifications
+        _widgets (dict): Toast frame, label and close job of each visible notification
+        _root: Window the toasts are placed in
+        _pump_job: Pending ``after`` job draining the queue, if any
     """
 
-    def __init__(self):
-        self._notifications = []
-        self._lock = threading.Lock()
+    COLORS = {
+        "info": ("#3498db", "#2980b9"),
+        "success": ("#2ecc71", "#27ae60"),
+        "error": ("#e74c3c", "#c0392b"),
+    }
+
+    def __init__(self, queue: Optional[NotificationQueue] = None):
+        self.queue = queue if queue is not None else NotificationQueue()
+        self._widgets: Dict[Notification, tuple] = {}
+        self._root: Any = None
+        self._pump_job = None
 
     def show_notification(
-        self, parent: ctk.CTk, message: str, type: str = "info", duration: int = 3000
+        self,
+        parent: ctk.CTk,
+        message: str,
+        type: str = "info",
+        duration: int = 3000,
+        group: Optional[str] = None,
+        plural: Optional[str] = None,
     ):
 
-        thread = threading.Thread(
-            target=self._create_notification, args=(parent, message, type, duration)
-        )
-        thread.daemon = True
-        thread.start()
+        self.queue.push(message, type, duration, group, plural)
+        if self._root is None:
+            self._root = parent.winfo_toplevel()
+        self._schedule(0)
 
-    def _create_notification(self, parent, message, type, duration):
+    def _schedule(self, delay_ms: int):
 
+        if self._pump_job is not None or self._root is None:
+            return
         try:
-            colors = {
-                "info": ("#3498db", "#2980b9"),
-                "success": ("#2ecc71", "#27ae60"),
-                "error": ("#e74c3c", "#c0392b"),
-            }
-            bg_color, hover_color = colors.get(type, colors["info"])
-
-            parent.after(
-                0,
-                lambda: self._show_notification_widget(
-                    parent, message, bg_color, hover_color, duration
-                ),
-            )
-
+            self._pump_job = self._root.after(delay_ms, self._pump)
         except Exception as e:
             print(_("Error creating notification: ") + str(e))
 
-    def _show_notification_widget(
-        self, parent, message, bg_color, hover_color, duration
-    ):
+    def _pump(self):
 
-        try:
-            print(_("Creating notification widget..."))
+        self._pump_job = None
+        for notification in self.queue.changed():
+            self._update_notification(notification)
+        for notification in self.queue.due():
+            self._show_notification_widget(notification)
+        self._update_positions()
 
-            root = parent.winfo_toplevel()
+        delay = self.queue.next_delay()
+        if delay is not None:
+            self._schedule(int(delay * 1000) + 1)
 
-            notification = ctk.CTkFrame(root, fg_color=bg_color, corner_radius=10)
+    def _show_notification_widget(self, notification: Notification):
+
+        try:
+            bg_color, hover_color = self.COLORS.get(
+                notification.type, self.COLORS["info"]
+            )
+            frame = ctk.CTkFrame(self._root, fg_color=bg_color, corner_radius=10)
 
             label = ctk.CTkLabel(
-                notification,
-                text=message,
+                frame,
+                text=notification.text,
                 text_color="white",
                 font=ctk.CTkFont(size=12),
             )
             label.pack(padx=20, pady=10)
 
             close_button = ctk.CTkButton(
-                notification,
+                frame,
                 text="✕",
                 width=20,
                 height=20,
@@ -80,68 +99,67 @@ class NotificationManager:
             )
             close_button.place(relx=1.0, rely=0.0, anchor="ne", x=-5, y=5)
 
-            notification.update_idletasks()
-            width = label.winfo_reqwidth() + 40
-            height = label.winfo_reqheight() + 20
-
-            root.update_idletasks()
-            window_width = root.winfo_width()
-            window_height = root.winfo_height()
-
-            with self._lock:
-                self._notifications.append(notification)
+            self._widgets[notification] = (frame, label, None)
+            self._restart_timer(notification)
 
-                total_height = sum(
-                    n.winfo_reqheight() + 10 for n in self._notifications[:-1]
-                )
-                y = window_height - 60 - total_height - height
+        except Exception as e:
+            print(_("Error displaying notification: ") + str(e))
+            self.queue.dismiss(notification)
 
-                x = window_width - width - 20
-                notification.place(x=x, y=y)
-                notification.lift()
+    def _update_notification(self, notification: Notification):
 
-            if duration > 0:
-                root.after(duration, lambda: self._close_notification(notification))
+        widgets = self._widgets.get(notification)
+        if widgets is None:
+            return
+        try:
+            widgets[1].configure(text=notification.text)
+            self._restart_timer(notification)
+        except Exception:
+            self._close_notification(notification)
 
-            print(_("Notification created and positioned"))
+    def _restart_timer(self, notification: Notification):
 
-        except Exception as e:
-            print(_("Error displaying notification: ") + str(e))
-            import traceback
-
-            print(traceback.format_exc())
+        frame, label, job = self._widgets[notification]
+        if job is not None:
+            self._root.after_cancel(job)
+            job = None
+        if notification.duration > 0:
+            job = self._root.after(
+                notification.duration, lambda: self._close_notification(notification)
+            )
+        self._widgets[notification] = (frame, label, job)
 
-    def _close_notification(self, notification: ctk.CTkFrame) -> None:
+    def _close_notification(self, notification: Notification) -> None:
 
+        self.queue.dismiss(notification)
+        frame, _label, job = self._widgets.pop(notification, (None, None, None))
         try:
-            if notification.winfo_exists():
-                notification.destroy()
-            if notification in self._notifications:
-                self._notifications.remove(notification)
-                self._update_positions()
+            if job is not None:
+                self._root.after_cancel(job)
+            if frame is not None and frame.winfo_exists():
+                frame.destroy()
         except Exception:
-            if notification in self._notifications:
-                self._notifications.remove(notification)
+            pass
+        self._update_positions()
+        self._schedule(0)
 
     def _update_positions(self) -> None:
 
-        with self._lock:
-            if not self._notifications:
-                return
-
-            root = self._notifications[0].winfo_toplevel()
-            window_width = root.winfo_width()
-            window_height = root.winfo_height()
-
-            x = window_width - 20
-            y = window_height - 60
-
-            for notification in reversed(self._notifications):
-                try:
-                    if notification.winfo_exists():
-                        new_x = x - notification.winfo_reqwidth()
-                        notification.place(x=new_x, y=y)
-                        y -= notification.winfo_reqheight() + 10
-                except Exception:
-                    if notification in self._notifications:
-                        self._notifications.remove(notification)
+        if not self._widgets:
+            return
+        try:
+            self._root.update_idletasks()
+            x = self._root.winfo_width() - 20
+            y = self._root.winfo_height() - 60
+
+            for notification in reversed(self.queue.visible()):
+                widgets = self._widgets.get(notification)
+                if widgets is None:
+                    continue
+                frame = widgets[0]
+                y -= frame.winfo_reqheight()
+                frame.place(x=x - frame.winfo_reqwidth(), y=y)
+                frame.lift()
+                y -= 10
+        except Exception as e:
+            print(_("Error displaying notification: ") + str(e))
@@ -16,39 +16,84 @@ Features:
     - Internationalization support
 """
 
+import os
 import signal
 import sys
 
-import questionary
-
-from src.cli.cli_controller import CLIController
-from src.gui.app import SystemdManagerApp
-from src.i18n.translations import i18n
-from src.utils.banner import print_banner
+# The interfaces are imported lazily: questionary/prompt_toolkit and
+# customtkinter/Tk take hundreds of milliseconds to load, and a headless command
+# (``systemd-manager status web``) must not pay for them.
 
 
 def signal_handler(sig, frame):
 
+    from src.i18n.translations import i18n
+
     print("\n\n" + i18n.get_text("Au revoir ! 👋"))
     sys.exit(0)
 
 
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+def setup_interactive():
+
+    import questionary
+
+    signal.signal(signal.SIGINT, signal_handler)
+    signal.signal(signal.SIGTERM, signal_handler)
+
+    questionary.prompts.confirm.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
+    questionary.prompts.select.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
+    questionary.prompts.text.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
+
+    questionary.prompts.confirm.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
+    questionary.prompts.select.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
+    questionary.prompts.text.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
+
+
+def main(argv=None):
+
+    argv = sys.argv[1:] if argv is None else argv
+    # The variables are parsed by enable_from_env(); they are only looked at
+    # here to skip importing the modules when unset.
+    profile = "--profile" in argv
+    if profile or os.environ.get("SYSTEMD_MANAGER_PROFILE"):
+        from src.utils.profiling import action_profiler, enable_from_env
+
+        argv = [arg for arg in argv if arg != "--profile"]
+        if enable_from_env():
+            profile = True
+        elif profile:
+            action_profiler.enable()
 
-questionary.prompts.confirm.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
-questionary.prompts.select.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
-questionary.prompts.text.KEYBOARD_INTERRUPT_MSG = None  # type: ignore[attr-defined]
+    watchdog = "--watchdog" in argv
+    if watchdog or os.environ.get("SYSTEMD_MANAGER_WATCHDOG"):
+        from src.utils.ui_watchdog import enable_from_env as enable_watchdog
+        from src.utils.ui_watchdog import ui_watchdog
 
-questionary.prompts.confirm.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
-questionary.prompts.select.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
-questionary.prompts.text.DEFAULT_KBI_MESSAGE = None  # type: ignore[attr-defined]
+        argv = [arg for arg in argv if arg != "--watchdog"]
+        if not enable_watchdog() and watchdog:
+            ui_watchdog.enable()
 
+    if argv:
+        from src.cli.commands import run
 
-def main():
+        if profile:
+            with action_profiler.action(argv[0]):
+                code = run(argv)
+            sys.exit(code)
+        sys.exit(run(argv))
+
+    setup_interactive()
+
+    import questionary
+
+    from src.i18n.translations import i18n
+    from src.utils.banner import print_banner
+    from src.utils.metrics import start_exporter_from_env
 
     print_banner()
 
+    start_exporter_from_env()
+
     interface = questionary.select(
         i18n.get_text("Choisissez votre interface :"),
         choices=[
@@ -62,9 +107,20 @@ def main():
         print("\n" + i18n.get_text("Au revoir ! 👋"))
         sys.exit(0)
     elif interface == i18n.get_text("🖥️  Interface graphique (GUI)"):
+        from src.utils.ui_watchdog import ui_watchdog
+
+        if ui_watchdog.enabled:
+            from src.gui.utils.lag_indicator import install_callback_timer
+
+            install_callback_timer()
+
+        from src.gui.app import SystemdManagerApp
+
         app = SystemdManagerApp()
         app.mainloop()
     else:
+        from src.cli.cli_controller import CLIController
+
         cli = CLIController()
         if not cli.check_sudo():
             cli.request_sudo(i18n.get_text("⚠️  Droits administrateur requis pour"))
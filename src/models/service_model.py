@@ -18,6 +18,9 @@ from src.models.screen import (
 # whitespace or shell metacharacters).
 _VALID_NAME_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._@-]*$")
 
+# Where the GUI, the CLI, the daemon and the exporter keep the configurations.
+DEFAULT_SERVICES_DIR = os.path.expanduser("~/.config/systemd-manager/services")
+
 
 def _assert_single_line(value: str) -> str:
     """Return ``value`` unchanged, or raise ``ValueError`` on a line break.
@@ -35,6 +38,29 @@ def _assert_single_line(value: str) -> str:
     return value
 
 
+def is_valid_service_name(name: str) -> bool:
+    """Return True if ``name`` is safe to use in unit paths and systemctl calls."""
+    return bool(_VALID_NAME_RE.match(name))
+
+
+def list_service_names(services_dir: str) -> List[str]:
+    """Return the names of the services stored as JSON in ``services_dir``.
+
+    Names come from the file names (the loader's trusted fallback); files whose
+    name is not a valid service name are skipped.
+    """
+    try:
+        filenames = os.listdir(services_dir)
+    except OSError:
+        return []
+    names = []
+    for filename in filenames:
+        name, ext = os.path.splitext(filename)
+        if ext == ".json" and _VALID_NAME_RE.match(name):
+            names.append(name)
+    return sorted(names)
+
+
 @dataclass
 class UnitSection:
     """[Unit] Section - General service information"""
@@ -0,0 +1,218 @@
+"""Per-service CPU and memory sampling from cgroup v2 files.
+
+systemd places every service in its own cgroup under
+``/sys/fs/cgroup/system.slice/``; the kernel exposes the accounting counters as
+small text files, so sampling a whole fleet costs a few ``open``/``read`` system
+calls per unit and never forks ``systemctl``:
+
+* ``cpu.stat`` — ``usage_usec``: cumulative CPU time, turned into a CPU% by
+  diffing two samples against the elapsed wall-clock time;
+* ``memory.current`` — bytes charged to the cgroup (page cache included);
+* ``pids.current`` — number of tasks.
+
+Each service keeps its recent CPU% and memory values in fixed-size ring buffers
+(``collections.deque``) for sparklines.
+
+References:
+    * Linux kernel documentation, "Control Group v2" (cpu.stat,
+      memory.current, pids.current).
+    * systemd.unit(5): template instances live in ``system-<prefix>.slice``,
+      the prefix escaped as by ``systemd-escape`` (systemd.unit(5), "String
+      Escaping for Inclusion in Unit Names").
+"""
+
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Iterable, Optional, Sequence, Tuple
+
+CGROUP_ROOT = "/sys/fs/cgroup/system.slice"
+
+SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+_UNESCAPED = frozenset(
+    b"0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ:_."
+)
+
+
+def unit_name_escape(text: str) -> str:
+    """Escape ``text`` for a unit name the way ``systemd-escape`` does."""
+    escaped = []
+    for i, byte in enumerate(text.encode()):
+        if byte == ord("/"):
+            escaped.append("-")
+        elif byte in _UNESCAPED and not (i == 0 and byte == ord(".")):
+            escaped.append(chr(byte))
+        else:
+            escaped.append(f"\\x{byte:02x}")
+    return "".join(escaped)
+
+
+def cgroup_path(name: str, root: str = CGROUP_ROOT) -> str:
+    """Return the cgroup directory of service ``name`` under ``root``."""
+    unit = name if name.endswith(".service") else f"{name}.service"
+    if "@" in unit:
+        prefix = unit_name_escape(unit.split("@", 1)[0])
+        return os.path.join(root, f"system-{prefix}.slice", unit)
+    return os.path.join(root, unit)
+
+
+def _read_small(name: str, dir_fd: int) -> Optional[bytes]:
+    # os.open/os.read avoid the buffered file object set-up of open(), and
+    # opening relative to the cgroup directory fd skips the path walk.
+    try:
+        fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 4096)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _read_int(name: str, dir_fd: int) -> Optional[int]:
+    data = _read_small(name, dir_fd)
+    if not data:
+        return None
+    try:
+        return int(data)
+    except ValueError:
+        return None  # e.g. "max"
+
+
+def format_bytes(value: Optional[int]) -> str:
+    """Format a byte count for display ("12.3 MiB")."""
+    if value is None:
+        return "—"
+    size = float(value)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if size < 1024 or unit == "GiB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GiB"
+
+
+def sparkline(values: Sequence[float], width: int = 20) -> str:
+    """Render the last ``width`` values as a unicode sparkline."""
+    values = list(values)[-width:]
+    if not values:
+        return ""
+    peak = max(max(values), 1.0)
+    last = len(SPARK_CHARS) - 1
+    return "".join(
+        SPARK_CHARS[min(last, int(round(value / peak * last)))] for value in values
+    )
+
+
+@dataclass
+class ServiceUsage:
+    """Latest resource usage of one service and its recent history."""
+
+    cpu_percent: Optional[float] = None
+    memory_bytes: Optional[int] = None
+    pids: Optional[int] = None
+    cpu_history: Deque[float] = field(default_factory=deque)
+    memory_history: Deque[int] = field(default_factory=deque)
+    # Previous (monotonic time, usage_usec) reading, for the CPU delta.
+    last_reading: Optional[Tuple[float, int]] = None
+
+
+class CgroupSampler:
+    """
+    Lightweight sampler of cgroup v2 accounting files for a set of services.
+
+    Attributes:
+        root (str): cgroup directory holding the service cgroups
+        history (int): Number of samples kept per service for sparklines
+        usage (Dict[str, ServiceUsage]): Latest usage by service name
+    """
+
+    def __init__(self, root: str = CGROUP_ROOT, history: int = 60):
+        self.root = root
+        self.history = history
+        self.usage: Dict[str, ServiceUsage] = {}
+        self._dir_fds: Dict[str, int] = {}
+
+    def _open_dir(self, name: str) -> Optional[int]:
+        try:
+            fd = os.open(cgroup_path(name, self.root), os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            return None
+        self._dir_fds[name] = fd
+        return fd
+
+    def _forget_dir(self, name: str):
+        fd = self._dir_fds.pop(name, None)
+        if fd is not None:
+            os.close(fd)
+
+    def _read_cpu_usec(self, name: str) -> Tuple[Optional[int], Optional[int]]:
+        """Return (usage_usec, directory fd), reopening the cgroup if needed."""
+        dir_fd = self._dir_fds.get(name)
+        for _ in range(2):
+            if dir_fd is None:
+                dir_fd = self._open_dir(name)
+                if dir_fd is None:
+                    return None, None
+            cpu_stat = _read_small("cpu.stat", dir_fd)
+            if cpu_stat and cpu_stat.startswith(b"usage_usec "):
+                return int(cpu_stat[11 : cpu_stat.index(b"\n")]), dir_fd
+            # The cgroup was removed (service stopped or restarted): the
+            # cached directory fd is stale, retry once with a fresh one.
+            self._forget_dir(name)
+            dir_fd = None
+        return None, None
+
+    def close(self):
+        """Release the cached cgroup directory descriptors."""
+        for name in list(self._dir_fds):
+            self._forget_dir(name)
+
+    def sample(self, names: Iterable[str]) -> Dict[str, ServiceUsage]:
+        """Take one sample for every service in ``names``.
+
+        Services that are not running (no cgroup) report ``None`` values.
+        Services no longer in ``names`` are forgotten.
+        """
+        names = list(names)
+        now = time.monotonic()
+        for name in names:
+            usage = self.usage.get(name)
+            if usage is None:
+                usage = self.usage[name] = ServiceUsage(
+                    cpu_history=deque(maxlen=self.history),
+                    memory_history=deque(maxlen=self.history),
+                )
+            cpu_usec, dir_fd = self._read_cpu_usec(name)
+            if cpu_usec is None or dir_fd is None:
+                usage.cpu_percent = usage.memory_bytes = usage.pids = None
+                usage.last_reading = None
+                continue
+
+            usage.memory_bytes = _read_int("memory.current", dir_fd)
+            usage.pids = _read_int("pids.current", dir_fd)
+
+            previous = usage.last_reading
+            usage.last_reading = (now, cpu_usec)
+            if previous is None or cpu_usec < previous[1] or now <= previous[0]:
+                # First sample, or the service restarted in a fresh cgroup.
+                usage.cpu_percent = None
+                continue
+
+            usage.cpu_percent = (
+                (cpu_usec - previous[1]) / ((now - previous[0]) * 1_000_000) * 100
+            )
+            usage.cpu_history.append(usage.cpu_percent)
+            if usage.memory_bytes is not None:
+                usage.memory_history.append(usage.memory_bytes)
+
+        if len(self.usage) != len(names):
+            wanted = set(names)
+            for name in [n for n in self.usage if n not in wanted]:
+                del self.usage[name]
+                self._forget_dir(name)
+
+        return self.usage
@@ -0,0 +1,144 @@
+"""Fast listing of the subdirectories of large directories.
+
+The directory browsers used to call ``os.listdir`` and then ``os.path.isdir``
+on every entry: one ``stat`` per entry, on the GUI thread, so opening
+``/usr/lib`` or a large NFS mount froze the interface. Here:
+
+* entries come from ``os.scandir``, whose ``DirEntry.is_dir()`` uses the file
+  type returned by ``readdir`` (``d_type``) and only falls back to ``stat``
+  for symbolic links and file systems that do not report it;
+* ``DirectoryListing`` runs the scan on a worker thread and exposes the names
+  found so far, so a browser can show the first entries immediately and be
+  closed or moved elsewhere without waiting for the scan to finish;
+* ``filter_names`` and ``paginate`` let the browsers show one page of a
+  filtered list instead of one widget or choice per entry.
+
+References:
+    * Python documentation, ``os.scandir`` and ``os.DirEntry``.
+    * readdir(3), ``d_type``.
+"""
+
+import os
+import threading
+from typing import Callable, List, Optional, Tuple
+
+# Entries shown by a browser at once.
+PAGE_SIZE = 200
+
+# Names handed from the scanning thread at once.
+BATCH_SIZE = 512
+
+
+def _scan(
+    path: str,
+    show_hidden: bool,
+    cancelled: threading.Event,
+    on_batch: Callable[[List[str]], None],
+):
+    batch: List[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if cancelled.is_set():
+                return
+            if not show_hidden and entry.name.startswith("."):
+                continue
+            try:
+                if not entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            batch.append(entry.name)
+            if len(batch) >= BATCH_SIZE:
+                on_batch(batch)
+                batch = []
+    if batch:
+        on_batch(batch)
+
+
+def list_subdirectories(path: str, show_hidden: bool = False) -> List[str]:
+    """Return the sorted subdirectory names of ``path`` (raises OSError)."""
+    names: List[str] = []
+    _scan(path, show_hidden, threading.Event(), names.extend)
+    return sorted(names)
+
+
+def filter_names(names: List[str], query: str) -> List[str]:
+    """Return the names containing ``query``, case-insensitively."""
+    query = query.strip().lower()
+    if not query:
+        return names
+    return [name for name in names if query in name.lower()]
+
+
+def paginate(
+    names: List[str], page: int, size: int = PAGE_SIZE
+) -> Tuple[List[str], int, int]:
+    """Return ``(entries of the page, clamped page index, page count)``."""
+    pages = max(1, (len(names) + size - 1) // size)
+    page = min(max(page, 0), pages - 1)
+    return names[page * size : (page + 1) * size], page, pages
+
+
+class DirectoryListing:
+    """
+    Subdirectories of one directory, scanned on a worker thread.
+
+    Attributes:
+        path (str): Directory being listed
+        done (bool): True once the scan has finished (or failed)
+        error (Optional[OSError]): Error that stopped the scan, if any
+        version (int): Incremented each time new names arrive or the scan ends
+    """
+
+    def __init__(self, path: str, show_hidden: bool = False):
+        self.path = path
+        self.show_hidden = show_hidden
+        self.done = False
+        self.error: Optional[OSError] = None
+        self.version = 0
+        self._names: List[str] = []
+        self._sorted = True
+        self._lock = threading.Lock()
+        self._cancelled = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> "DirectoryListing":
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            _scan(self.path, self.show_hidden, self._cancelled, self._add)
+        except OSError as e:
+            self.error = e
+        finally:
+            with self._lock:
+                self.done = True
+                self.version += 1
+
+    def _add(self, batch: List[str]):
+        with self._lock:
+            self._names.extend(batch)
+            self._sorted = False
+            self.version += 1
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return self.done
+
+    def count(self) -> int:
+        with self._lock:
+            return len(self._names)
+
+    def matching(self, query: str = "") -> List[str]:
+        """Return the sorted names found so far that contain ``query``."""
+        with self._lock:
+            if not self._sorted:
+                self._names.sort()
+                self._sorted = True
+            return list(filter_names(self._names, query))
@@ -0,0 +1,182 @@
+"""Discovery of the executables of a service's working directory.
+
+The creation form used to call ``os.path.isfile`` and ``os.access`` on every
+entry of the working directory, on the GUI thread, each time the list was
+refreshed. ``ExecutableFinder``:
+
+* lists directories with ``os.scandir`` (file type from ``d_type``) and only
+  calls ``os.access`` on regular files without a script suffix;
+* caches the result per directory, keyed by the directory mtime, so that
+  refreshing or searching the list of an unchanged directory costs one
+  ``stat``. A file made executable in place does not change the directory
+  mtime: ``force=True`` rescans;
+* returns at most ``limit`` matches of an optional search string, with the
+  total count, so a directory with 50,000 files yields a short menu;
+* optionally looks for nested ``bin/`` directories (``venv/bin``,
+  ``build/bin``...), down to ``BIN_SEARCH_DEPTH`` levels and at most
+  ``BIN_SEARCH_MAX_DIRS`` directories.
+
+The finder is thread-safe; the GUI calls it from a worker thread.
+"""
+
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+SCRIPT_SUFFIXES = (".sh", ".py", ".bash", ".js")
+
+# Matches returned by one search.
+MAX_RESULTS = 200
+
+# Depth and breadth limits of the nested bin/ search.
+BIN_SEARCH_DEPTH = 3
+BIN_SEARCH_MAX_DIRS = 2000
+
+# Directory listings kept in the cache (oldest dropped first).
+CACHE_MAX_DIRS = 4096
+
+# Directories never searched for a bin/ subdirectory.
+SKIPPED_DIRS = {"node_modules", "__pycache__", "site-packages", "proc", "sys"}
+
+
+@dataclass
+class _Listing:
+    mtime_ns: int
+    executables: List[str]
+    subdirectories: List[str]
+
+
+@dataclass
+class ExecutableSearch:
+    """Result of ``ExecutableFinder.find``: relative paths, sorted."""
+
+    directory: str
+    names: List[str] = field(default_factory=list)
+    total: int = 0
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > len(self.names)
+
+
+def _is_executable(entry: os.DirEntry) -> bool:
+    try:
+        if not entry.is_file():
+            return False
+    except OSError:
+        return False
+    if entry.name.endswith(SCRIPT_SUFFIXES):
+        return True
+    return os.access(entry.path, os.X_OK)
+
+
+class ExecutableFinder:
+    """
+    Cached executable search, shared by the service forms.
+
+    Attributes:
+        scans (int): Number of directories actually listed so far
+    """
+
+    def __init__(self):
+        self.scans = 0
+        self._cache: Dict[str, _Listing] = {}
+        self._lock = threading.Lock()
+
+    def _listing(self, directory: str) -> _Listing:
+        mtime_ns = os.stat(directory).st_mtime_ns
+        with self._lock:
+            cached = self._cache.get(directory)
+        if cached is not None and cached.mtime_ns == mtime_ns:
+            return cached
+
+        executables = []
+        subdirectories = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                if is_dir:
+                    subdirectories.append(entry.name)
+                elif _is_executable(entry):
+                    executables.append(entry.name)
+        listing = _Listing(mtime_ns, sorted(executables), sorted(subdirectories))
+        with self._lock:
+            self._cache.pop(directory, None)
+            self._cache[directory] = listing
+            while len(self._cache) > CACHE_MAX_DIRS:
+                del self._cache[next(iter(self._cache))]
+            self.scans += 1
+        return listing
+
+    def _bin_directories(self, directory: str) -> List[str]:
+        """Return the nested ``bin`` directories, relative to ``directory``."""
+        found = []
+        level = [""]
+        visited = 0
+        for _ in range(BIN_SEARCH_DEPTH):
+            next_level = []
+            for relative in level:
+                path = os.path.join(directory, relative) if relative else directory
+                try:
+                    listing = self._listing(path)
+                except OSError:
+                    continue
+                for name in listing.subdirectories:
+                    if name.startswith(".") or name in SKIPPED_DIRS:
+                        continue
+                    child = os.path.join(relative, name)
+                    if name == "bin":
+                        found.append(child)
+                    else:
+                        next_level.append(child)
+                visited += 1
+                if visited >= BIN_SEARCH_MAX_DIRS:
+                    return found
+            level = next_level
+        return found
+
+    def find(
+        self,
+        directory: str,
+        query: str = "",
+        recursive_bin: bool = False,
+        limit: int = MAX_RESULTS,
+        force: bool = False,
+    ) -> ExecutableSearch:
+        """Return the executables of ``directory`` matching ``query``.
+
+        Raises OSError when ``directory`` itself cannot be listed.
+        """
+        if force:
+            self.forget(directory)
+        names = list(self._listing(directory).executables)
+        if recursive_bin:
+            for relative in self._bin_directories(directory):
+                try:
+                    listing = self._listing(os.path.join(directory, relative))
+                except OSError:
+                    continue
+                names += [os.path.join(relative, name) for name in listing.executables]
+
+        query = query.strip().lower()
+        if query:
+            names = [name for name in names if query in name.lower()]
+        return ExecutableSearch(directory, names[:limit], len(names))
+
+    def forget(self, directory: Optional[str] = None):
+        """Drop the cached listings of ``directory`` and below (all if None)."""
+        with self._lock:
+            if directory is None:
+                self._cache.clear()
+                return
+            prefix = os.path.join(directory, "")
+            for cached in list(self._cache):
+                if cached == directory or cached.startswith(prefix):
+                    del self._cache[cached]
+
+
+executable_finder = ExecutableFinder()
@@ -0,0 +1,194 @@
+"""Fleet health scan for the services managed by SystemdManager.
+
+A scan gathers, for every managed service:
+
+* its state, from **one** batched ``systemctl show`` (see ``src/utils/systemctl``);
+* the errors found in its recent journal, read with a bounded pool of workers
+  and classified by the shared ``LogClassifier``.
+
+Units are then sorted into a report: failed first, then flapping (restarting
+repeatedly), then erroring (healthy state but errors in the journal).
+"""
+
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional
+
+from src.utils.log_classifier import LogClassifier, PatternStats, get_log_classifier
+from src.utils.proctrace import record_command
+from src.utils.systemctl import show_units, unit_name
+
+FAILED = "failed"
+FLAPPING = "flapping"
+ERRORING = "erroring"
+HEALTHY = "ok"
+
+_SEVERITY = {FAILED: 0, FLAPPING: 1, ERRORING: 2, HEALTHY: 3}
+
+
+@dataclass
+class UnitHealth:
+    """Health of a single managed unit."""
+
+    name: str
+    load_state: str = "unknown"
+    active_state: str = "unknown"
+    sub_state: str = "unknown"
+    result: str = ""
+    restarts: int = 0
+    errors: List[PatternStats] = field(default_factory=list)
+    category: str = HEALTHY
+
+    @property
+    def error_count(self) -> int:
+        return sum(stats.count for stats in self.errors)
+
+    def to_json(self) -> dict:
+        return {
+            "name": self.name,
+            "category": self.category,
+            "load": self.load_state,
+            "active": self.active_state,
+            "sub": self.sub_state,
+            "result": self.result,
+            "restarts": self.restarts,
+            "errors": [
+                {
+                    "message": stats.message,
+                    "count": stats.count,
+                    "first_seen": stats.first_seen,
+                    "last_seen": stats.last_seen,
+                }
+                for stats in self.errors
+            ],
+        }
+
+
+@dataclass
+class HealthReport:
+    """Result of a fleet scan, sorted worst first."""
+
+    units: List[UnitHealth]
+    duration: float
+
+    @property
+    def problems(self) -> List[UnitHealth]:
+        return [unit for unit in self.units if unit.category != HEALTHY]
+
+    def count(self, category: str) -> int:
+        return sum(1 for unit in self.units if unit.category == category)
+
+
+class HealthScanner:
+    """
+    Concurrent health scanner for a set of services.
+
+    Attributes:
+        max_workers (int): Upper bound on concurrent journal readers
+        journal_since (str): ``journalctl --since`` window for error analysis
+        journal_lines (int): Maximum journal lines read per unit
+        flapping_restarts (int): ``NRestarts`` from which a unit is flapping
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 8,
+        journal_since: str = "1 hour ago",
+        journal_lines: int = 200,
+        flapping_restarts: int = 3,
+        classifier: Optional[LogClassifier] = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.journal_since = journal_since
+        self.journal_lines = journal_lines
+        self.flapping_restarts = flapping_restarts
+        self.classifier = classifier
+
+    def scan(self, names: Iterable[str]) -> HealthReport:
+        started = time.monotonic()
+        names = sorted(set(names))
+        classifier = self.classifier or get_log_classifier()
+
+        states = show_units(names)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            errors = dict(
+                zip(
+                    names,
+                    pool.map(lambda n: self._journal_errors(n, classifier), names),
+                )
+            )
+
+        units = [
+            self._unit_health(name, states.get(name, {}), errors[name])
+            for name in names
+        ]
+        units.sort(key=lambda u: (_SEVERITY[u.category], -u.error_count, u.name))
+        return HealthReport(units, time.monotonic() - started)
+
+    def _journal_errors(
+        self, name: str, classifier: LogClassifier
+    ) -> List[PatternStats]:
+        command = [
+            "journalctl",
+            "-u",
+            unit_name(name),
+            "--since",
+            self.journal_since,
+            "-n",
+            str(self.journal_lines),
+            "--no-pager",
+            "--output=short-iso",
+        ]
+        # Read as a stream, so not through run_command: recorded by hand.
+        started = time.time()
+        begin = time.perf_counter()
+        try:
+            process = subprocess.Popen(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors="replace",
+            )
+        except OSError as e:
+            record_command(command, started, time.perf_counter() - begin, None)
+            print(f"Erreur lors de la lecture du journal de {name} : {e}")
+            return []
+
+        with process:
+            errors = []
+            if process.stdout is not None:
+                errors = classifier.classify_stream(process.stdout)
+        record_command(
+            command, started, time.perf_counter() - begin, process.returncode
+        )
+        return errors
+
+    def _unit_health(
+        self, name: str, state: Dict[str, str], errors: List[PatternStats]
+    ) -> UnitHealth:
+        try:
+            restarts = int(state.get("NRestarts", "0") or 0)
+        except ValueError:
+            restarts = 0
+
+        unit = UnitHealth(
+            name=name,
+            load_state=state.get("LoadState", "unknown"),
+            active_state=state.get("ActiveState", "unknown"),
+            sub_state=state.get("SubState", "unknown"),
+            result=state.get("Result", ""),
+            restarts=restarts,
+            errors=errors,
+        )
+
+        if unit.active_state == "failed" or unit.load_state in ("error", "bad-setting"):
+            unit.category = FAILED
+        elif unit.sub_state == "auto-restart" or restarts >= self.flapping_restarts:
+            unit.category = FLAPPING
+        elif errors:
+            unit.category = ERRORING
+        return unit
@@ -0,0 +1,350 @@
+"""Shared ``journalctl -f`` follower for every open log view.
+
+Each log view (``LogsDialog``, ``SystemLogsFrame``) used to run its own poller
+or ``journalctl -f`` process, so the journal was read once per open window.
+``JournalFollower`` keeps a *single* follower process whose match set is the
+union of the units currently watched, and fans every entry out to the queue of
+each view that asked for it. Journal read I/O is therefore constant in the
+number of open views.
+
+The follower is restarted whenever the match set changes (a view watching a new
+unit opens, or the last view on a unit closes). To avoid losing entries written
+while the process is being swapped, the new process resumes from the timestamp
+of the last entry seen (bounded by ``RESUME_WINDOW_USEC``) and entries that were
+already dispatched are skipped.
+
+A view also reads a backlog (``journalctl --output=json -n N``) when it opens
+or refreshes, while its subscription already delivers new entries. Entries
+written during that read can come from both, and a live entry can arrive
+before the backlog is shown: ``BacklogFence`` drops the live entries the
+backlog already holds or that are older than its last entry.
+
+References:
+    * journalctl(1): ``--follow``, ``--output=json``, ``--since``, ``--unit``.
+    * systemd.journal-fields(7): ``__CURSOR``, ``__REALTIME_TIMESTAMP``,
+      ``_SYSTEMD_UNIT``, ``UNIT``, ``PRIORITY``.
+"""
+
+import atexit
+import fnmatch
+import json
+import queue
+import subprocess
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set
+
+# Entries written while the follower is restarted are replayed from the last
+# timestamp seen, but never further back than this window.
+RESUME_WINDOW_USEC = 30 * 1_000_000
+
+# journald priorities (syslog levels): 0 = emerg ... 7 = debug.
+PRIORITY_DEBUG = 7
+PRIORITY_INFO = 6
+PRIORITY_WARNING = 4
+PRIORITY_ERROR = 3
+
+_GLOB_CHARS = set("*?[")
+
+# Last second rendered by ``JournalEntry.format``: a burst of entries shares
+# it, and ``strftime`` is the most expensive part of formatting an entry.
+_last_stamp = (-1, "")
+
+
+def normalize_unit(unit: str) -> str:
+    """Return ``unit`` with a ``.service`` suffix, as ``journalctl -u`` does.
+
+    Glob patterns and names that already carry a unit type suffix are returned
+    unchanged.
+    """
+    if _GLOB_CHARS & set(unit) or "." in unit:
+        return unit
+    return f"{unit}.service"
+
+
+@dataclass
+class JournalEntry:
+    """A single journal record decoded from ``journalctl --output=json``."""
+
+    cursor: str
+    usec: int
+    unit: str
+    identifier: str
+    message: str
+    priority: int = PRIORITY_INFO
+    hostname: str = ""
+    pid: str = ""
+    # Unit named by PID 1 messages about a unit ("Started foo.service").
+    object_unit: str = ""
+
+    @classmethod
+    def from_json(cls, line: str) -> Optional["JournalEntry"]:
+        """Decode one JSON line, or return ``None`` if it is not an entry."""
+        try:
+            data = json.loads(line)
+        except ValueError:
+            return None
+        if not isinstance(data, dict) or "__CURSOR" not in data:
+            return None
+
+        message = data.get("MESSAGE", "")
+        if isinstance(message, list):
+            # Non-UTF-8 messages are exported as a byte array.
+            message = bytes(message).decode("utf-8", errors="replace")
+
+        try:
+            priority = int(data.get("PRIORITY", PRIORITY_INFO))
+        except (TypeError, ValueError):
+            priority = PRIORITY_INFO
+
+        try:
+            usec = int(data.get("__REALTIME_TIMESTAMP", 0))
+        except (TypeError, ValueError):
+            usec = 0
+
+        unit = data.get("_SYSTEMD_UNIT", "") or ""
+        return cls(
+            cursor=data["__CURSOR"],
+            usec=usec,
+            unit=unit,
+            identifier=data.get("SYSLOG_IDENTIFIER") or unit or "kernel",
+            message=str(message),
+            priority=priority,
+            hostname=data.get("_HOSTNAME", ""),
+            pid=str(data.get("_PID", "") or ""),
+            object_unit=data.get("UNIT", "") or "",
+        )
+
+    def format(self) -> str:
+        """Render the entry like ``journalctl --output=short-precise``."""
+        global _last_stamp
+        seconds, micros = divmod(self.usec, 1_000_000)
+        cached_seconds, prefix = _last_stamp
+        if seconds != cached_seconds:
+            prefix = datetime.fromtimestamp(seconds).strftime("%b %d %H:%M:%S")
+            _last_stamp = (seconds, prefix)
+        stamp = f"{prefix}.{micros:06d}"
+        source = f"{self.identifier}[{self.pid}]" if self.pid else self.identifier
+        return f"{stamp} {self.hostname} {source}: {self.message}"
+
+
+def parse_entries(output: str) -> List[JournalEntry]:
+    """Decode the entries of a ``journalctl --output=json`` output."""
+    entries = []
+    for line in output.splitlines():
+        entry = JournalEntry.from_json(line)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+@dataclass
+class BacklogFence:
+    """Live entries to drop once a backlog read is shown."""
+
+    cursors: Set[str] = field(default_factory=set)
+    last_usec: int = 0
+
+    @classmethod
+    def after(cls, backlog: List[JournalEntry]) -> "BacklogFence":
+        return cls(
+            cursors={entry.cursor for entry in backlog},
+            last_usec=max((entry.usec for entry in backlog), default=0),
+        )
+
+    def keeps(self, entry: JournalEntry) -> bool:
+        return entry.cursor not in self.cursors and entry.usec >= self.last_usec
+
+
+@dataclass
+class _Subscription:
+    """One view's interest in the journal."""
+
+    units: Optional[FrozenSet[str]]  # None means every unit
+    queue: "queue.Queue[JournalEntry]"
+    max_priority: int = PRIORITY_DEBUG
+    since_usec: int = field(default_factory=lambda: int(time.time() * 1_000_000))
+
+    def wants(self, entry: JournalEntry) -> bool:
+        if entry.priority > self.max_priority or entry.usec < self.since_usec:
+            return False
+        if self.units is None:
+            return True
+        for pattern in self.units:
+            for unit in (entry.unit, entry.object_unit):
+                if unit and fnmatch.fnmatchcase(unit, pattern):
+                    return True
+        return False
+
+
+class JournalFollower:
+    """
+    Single multiplexed ``journalctl -f`` process shared by all log views.
+
+    Views register a queue with ``subscribe`` and receive the matching
+    ``JournalEntry`` objects on it; they drain their queue from the Tk main
+    loop. The follower process is started with the first subscription, is
+    restarted when the union of watched units changes and is stopped with the
+    last ``unsubscribe``.
+
+    Attributes:
+        _subscriptions (Dict[int, _Subscription]): Active subscriptions by token
+        _process (Optional[subprocess.Popen]): Current follower process
+        _match_args (Optional[List[str]]): Unit arguments of the running process
+        _generation (int): Incremented on every restart to retire stale readers
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._next_token = 1
+        self._process: Optional[subprocess.Popen] = None
+        self._match_args: Optional[List[str]] = None
+        self._generation = 0
+        self._last_usec = 0
+        self._edge_cursors: Set[str] = set()
+
+    def subscribe(
+        self,
+        units: Optional[Iterable[str]],
+        entries: "queue.Queue[JournalEntry]",
+        max_priority: int = PRIORITY_DEBUG,
+    ) -> int:
+        """Start delivering entries for ``units`` (``None`` for all) to ``entries``.
+
+        Returns a token to pass to ``unsubscribe``.
+        """
+        unit_set = (
+            None if units is None else frozenset(normalize_unit(u) for u in units)
+        )
+        with self._lock:
+            token = self._next_token
+            self._next_token += 1
+            self._subscriptions[token] = _Subscription(unit_set, entries, max_priority)
+            self._sync_process()
+        return token
+
+    def unsubscribe(self, token: int) -> None:
+        """Stop delivering entries for ``token``; unknown tokens are ignored."""
+        with self._lock:
+            if self._subscriptions.pop(token, None) is not None:
+                self._sync_process()
+
+    def close(self) -> None:
+        """Drop every subscription and stop the follower process."""
+        with self._lock:
+            self._subscriptions.clear()
+            self._sync_process()
+
+    @property
+    def match_args(self) -> Optional[List[str]]:
+        """Unit arguments of the running follower, or ``None`` when stopped."""
+        with self._lock:
+            return None if self._match_args is None else list(self._match_args)
+
+    def _wanted_match_args(self) -> Optional[List[str]]:
+        if not self._subscriptions:
+            return None
+        units: Set[str] = set()
+        for subscription in self._subscriptions.values():
+            if subscription.units is None:
+                # One view follows everything: no unit match at all.
+                return []
+            units.update(subscription.units)
+        args: List[str] = []
+        for unit in sorted(units):
+            args.extend(["-u", unit])
+        return args
+
+    def _sync_process(self) -> None:
+        """(Re)start or stop the follower to match the subscriptions.
+
+        Must be called with ``_lock`` held.
+        """
+        wanted = self._wanted_match_args()
+        if wanted == self._match_args:
+            return
+
+        self._stop_process()
+        self._match_args = wanted
+        if wanted is None:
+            return
+
+        cmd = ["journalctl", "-f", "--no-pager", "--output=json"]
+        now_usec = int(time.time() * 1_000_000)
+        if self._last_usec:
+            resume = max(self._last_usec, now_usec - RESUME_WINDOW_USEC)
+            cmd.append(f"--since=@{resume / 1_000_000:.6f}")
+        else:
+            cmd.extend(["-n", "0"])
+        cmd.extend(wanted)
+
+        try:
+            self._process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                errors="replace",
+            )
+        except OSError as e:
+            print(f"Erreur lors du lancement de journalctl : {e}")
+            self._process = None
+            return
+
+        reader = threading.Thread(
+            target=self._read_loop,
+            args=(self._process, self._generation),
+            daemon=True,
+        )
+        reader.start()
+
+    def _stop_process(self) -> None:
+        self._generation += 1
+        process, self._process = self._process, None
+        if process is not None:
+            try:
+                process.terminate()
+            except OSError:
+                pass
+
+    def _read_loop(self, process: subprocess.Popen, generation: int) -> None:
+        stdout = process.stdout
+        if stdout is None:
+            return
+        for line in stdout:
+            entry = JournalEntry.from_json(line)
+            if entry is None:
+                continue
+            with self._lock:
+                if generation != self._generation:
+                    break
+                self._dispatch(entry)
+        try:
+            process.wait(timeout=1)
+        except (subprocess.TimeoutExpired, OSError):
+            pass
+
+    def _dispatch(self, entry: JournalEntry) -> None:
+        """Fan ``entry`` out to every interested subscription.
+
+        Must be called with ``_lock`` held.
+        """
+        # Skip what the previous process already delivered when resuming.
+        if entry.usec < self._last_usec or entry.cursor in self._edge_cursors:
+            return
+        if entry.usec > self._last_usec:
+            self._last_usec = entry.usec
+            self._edge_cursors = set()
+        self._edge_cursors.add(entry.cursor)
+
+        for subscription in self._subscriptions.values():
+            if subscription.wants(entry):
+                subscription.queue.put_nowait(entry)
+
+
+# Instance globale partagée par toutes les vues de logs
+journal_follower = JournalFollower()
+atexit.register(journal_follower.close)
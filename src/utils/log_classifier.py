@@ -0,0 +1,259 @@
+"""Single-pass error classifier for systemd journal output.
+
+The error pattern table is compiled **once** into a single alternation regex
+instead of running one case-insensitive ``re.search`` per pattern over the whole
+log blob. Input is consumed as a stream of line-aligned chunks, so memory stays
+bounded and the cost is linear in the size of the journal output, whatever its
+size.
+
+Two details keep the scan fast with CPython's ``re`` engine:
+
+* the alternation has no capturing groups (they disable the engine's literal
+  fast paths) and only finds the candidate lines; each pattern is then
+  searched on those rare lines alone, so overlapping patterns ("error" and
+  "configuration error") are all counted, as with one search per pattern;
+* chunks are lowercased once and matched case-sensitively, which is an order of
+  magnitude faster than ``re.IGNORECASE``. Patterns containing uppercase
+  letters fall back to ``re.IGNORECASE`` so they keep matching.
+
+Patterns are compiled with ``re.MULTILINE``, so ``^`` and ``$`` anchor at line
+boundaries as they would on a single line. Patterns referring to a group
+(``\\1``, ``(?P=name)``, ``(?(1)...)``) are rejected: once combined, the
+group numbers no longer belong to the pattern.
+
+For every pattern the classifier reports how many lines matched and the
+timestamps of the first and last matching line (when the line starts with a
+``journalctl`` short, short-precise or short-iso timestamp).
+
+Users can extend (or replace) the built-in table with
+``~/.config/systemd-manager/log_patterns.json``::
+
+    {
+        "replace_defaults": false,
+        "patterns": [
+            {"pattern": "out of memory", "message": "OOM détecté"}
+        ]
+    }
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass
+from typing import IO, Dict, Iterable, List, Optional, Pattern, Tuple
+
+LOG_PATTERNS_FILE = os.path.expanduser("~/.config/systemd-manager/log_patterns.json")
+
+DEFAULT_PATTERNS: List[Tuple[str, str]] = [
+    (r"segmentation fault", "Erreur de segmentation détectée"),
+    (r"permission denied", "Erreur de permission"),
+    (r"failed to start", "Échec du démarrage du service"),
+    (r"cannot allocate memory", "Erreur de mémoire"),
+    (r"timeout", "Timeout détecté"),
+    (r"core dumped", "Crash du programme détecté"),
+    (r"failed to bind to address", "Erreur de binding d'adresse"),
+    (r"file not found", "Fichier non trouvé"),
+    (r"configuration error", "Erreur de configuration"),
+]
+
+# Leading timestamp of a journalctl line: short / short-precise
+# ("Oct 19 12:00:00.123456") or short-iso / short-iso-precise.
+_TIMESTAMP_RE = re.compile(
+    r"\d{4}-\d\d-\d\dT[\d:.]+(?:[+-]\d{2}:?\d{2}|Z)?"
+    r"|[A-Z][a-z]{2} [ \d]\d \d\d:\d\d:\d\d(?:\.\d+)?"
+)
+
+# An uppercase letter that is not part of an escape such as \S or \W.
+_UPPERCASE_RE = re.compile(r"(?<!\\)[A-Z]")
+
+# A reference to a group: numbered or named backreference, conditional.
+_GROUP_REFERENCE_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=|\(\?\(")
+
+_CHUNK_SIZE = 1 << 20
+
+
+@dataclass
+class PatternStats:
+    """Occurrences of one error pattern in a log stream."""
+
+    pattern: str
+    message: str
+    count: int = 0
+    first_seen: Optional[str] = None
+    last_seen: Optional[str] = None
+
+
+class LogClassifier:
+    """
+    Compiled matcher applying the whole error pattern table in one pass.
+
+    Attributes:
+        patterns (List[Tuple[str, str]]): (regex, message) pairs, in table order
+        matcher (Pattern): Combined alternation of all patterns
+    """
+
+    def __init__(self, patterns: Optional[Iterable[Tuple[str, str]]] = None):
+        self.patterns: List[Tuple[str, str]] = []
+        for pattern, message in DEFAULT_PATTERNS if patterns is None else patterns:
+            try:
+                compiled = re.compile(pattern)
+            except re.error as e:
+                print(f"Motif de log invalide ignoré {pattern!r} : {e}")
+                continue
+            if compiled.groupindex:
+                # Named groups would clash once patterns are combined.
+                print(f"Motif de log ignoré (groupe nommé interdit) : {pattern!r}")
+                continue
+            if _GROUP_REFERENCE_RE.search(pattern):
+                print(
+                    f"Motif de log ignoré (référence de groupe interdite) : {pattern!r}"
+                )
+                continue
+            self.patterns.append((pattern, message))
+
+        # Text is lowercased before matching; only patterns that spell
+        # uppercase letters need the (much slower) IGNORECASE flag.
+        flags = re.MULTILINE
+        if any(_UPPERCASE_RE.search(pattern) for pattern, _ in self.patterns):
+            flags |= re.IGNORECASE
+        self._compiled = [re.compile(pattern, flags) for pattern, _ in self.patterns]
+        alternatives = "|".join(f"(?:{pattern})" for pattern, _ in self.patterns)
+        # An empty table must match nothing rather than every position.
+        self.matcher: Pattern[str] = re.compile(alternatives or r"(?!)", flags)
+
+    def patterns_in(self, text: str, start: int, end: int) -> List[int]:
+        """Return the indexes of the patterns found in ``text[start:end]``."""
+        return [
+            index
+            for index, compiled in enumerate(self._compiled)
+            if compiled.search(text, start, end)
+        ]
+
+    @classmethod
+    def from_config(cls, config_path: str = LOG_PATTERNS_FILE) -> "LogClassifier":
+        """Build a classifier from the built-in table and the user config file."""
+        patterns = list(DEFAULT_PATTERNS)
+        if not os.path.exists(config_path):
+            return cls(patterns)
+
+        try:
+            with open(config_path, "r") as f:
+                config = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Erreur lors de la lecture de {config_path} : {e}")
+            return cls(patterns)
+
+        if not isinstance(config, dict):
+            print(f"Configuration des motifs invalide dans {config_path}")
+            return cls(patterns)
+
+        if config.get("replace_defaults"):
+            patterns = []
+        for item in config.get("patterns", []):
+            if (
+                isinstance(item, dict)
+                and isinstance(item.get("pattern"), str)
+                and isinstance(item.get("message"), str)
+            ):
+                patterns.append((item["pattern"], item["message"]))
+        return cls(patterns)
+
+    def classify(self, logs: str) -> List[PatternStats]:
+        """Classify an in-memory log blob."""
+        state = _ClassificationState(self)
+        state.feed(logs)
+        return state.results()
+
+    def classify_lines(self, lines: Iterable[str]) -> List[PatternStats]:
+        """Classify an iterable of lines (with or without trailing newlines)."""
+        state = _ClassificationState(self)
+        buffer: List[str] = []
+        size = 0
+        for line in lines:
+            buffer.append(line if line.endswith("\n") else line + "\n")
+            size += len(line)
+            if size >= _CHUNK_SIZE:
+                state.feed("".join(buffer))
+                buffer, size = [], 0
+        if buffer:
+            state.feed("".join(buffer))
+        return state.results()
+
+    def classify_stream(self, stream: IO[str]) -> List[PatternStats]:
+        """Classify a text stream (file, pipe) in bounded memory."""
+        state = _ClassificationState(self)
+        while True:
+            # readlines(hint) always stops on a line boundary.
+            lines = stream.readlines(_CHUNK_SIZE)
+            if not lines:
+                break
+            state.feed("".join(lines))
+        return state.results()
+
+
+class _ClassificationState:
+    """Accumulates per-pattern statistics over line-aligned chunks."""
+
+    def __init__(self, classifier: LogClassifier):
+        self.classifier = classifier
+        self.stats: Dict[int, PatternStats] = {}
+
+    def feed(self, chunk: str) -> None:
+        lowered = chunk.lower()
+        if len(lowered) != len(chunk):
+            # A few characters change length when lowercased (e.g. "İ"); keep
+            # offsets aligned with the original text in that rare case.
+            lowered = "".join(
+                lower if len(lower) == 1 else char
+                for char, lower in ((c, c.lower()) for c in chunk)
+            )
+        matcher = self.classifier.matcher
+        pos = 0
+        while True:
+            match = matcher.search(lowered, pos)
+            if match is None:
+                break
+            # The combined matcher only finds candidate lines; each pattern is
+            # then searched on the line, so every matching pattern counts it.
+            line_start = lowered.rfind("\n", 0, match.start()) + 1
+            line_end = lowered.find("\n", match.start())
+            if line_end == -1:
+                line_end = len(lowered)
+            pos = line_end + 1
+
+            indexes = self.classifier.patterns_in(lowered, line_start, line_end)
+            if not indexes:
+                continue
+            stamp = _TIMESTAMP_RE.match(chunk, line_start)
+            for index in indexes:
+                stats = self.stats.get(index)
+                if stats is None:
+                    pattern, message = self.classifier.patterns[index]
+                    stats = self.stats[index] = PatternStats(pattern, message)
+                stats.count += 1
+                if stamp:
+                    if stats.first_seen is None:
+                        stats.first_seen = stamp.group()
+                    stats.last_seen = stamp.group()
+
+    def results(self) -> List[PatternStats]:
+        return [self.stats[index] for index in sorted(self.stats)]
+
+
+_default_classifier: Optional[LogClassifier] = None
+_default_mtime: Optional[float] = None
+
+
+def get_log_classifier() -> LogClassifier:
+    """Return the shared classifier, recompiled only when the config changes."""
+    global _default_classifier, _default_mtime
+
+    try:
+        mtime: Optional[float] = os.stat(LOG_PATTERNS_FILE).st_mtime
+    except OSError:
+        mtime = None
+
+    if _default_classifier is None or mtime != _default_mtime:
+        _default_classifier = LogClassifier.from_config(LOG_PATTERNS_FILE)
+        _default_mtime = mtime
+    return _default_classifier
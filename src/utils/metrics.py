@@ -0,0 +1,424 @@
+"""Prometheus metrics for the services managed by SystemdManager.
+
+Two kinds of metrics are exported, in the Prometheus text exposition format:
+
+* **per-service** state, ``NRestarts``, CPU time, memory and tasks. They are
+  gathered by a background ``MetricsCollector`` every ``interval`` seconds with
+  one batched ``systemctl show`` (``src/utils/systemctl``) and plain cgroup file
+  reads (``src/utils/cgroup``), then cached;
+* **manager operation latencies** (start, stop, restart, save...), recorded in
+  process by ``operation_metrics`` around each systemctl call.
+
+A scrape only renders the cache: it never spawns a process, whatever the
+number of services or the scrape frequency. The cache can be served over HTTP
+on localhost or written atomically to a node_exporter textfile collector
+directory.
+
+Usage::
+
+    python -m src.utils.metrics --listen 127.0.0.1:9559
+    python -m src.utils.metrics --textfile /var/lib/node_exporter/systemd_manager.prom
+
+or, to export the latencies of a running GUI/CLI session, set
+``SYSTEMD_MANAGER_METRICS`` to ``host:port`` or to a ``.prom`` file path.
+
+References:
+    * Prometheus, "Exposition formats" (text format 0.0.4).
+    * node_exporter, "Textfile Collector".
+"""
+
+import argparse
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.models.service_model import DEFAULT_SERVICES_DIR, list_service_names
+from src.utils.cgroup import CgroupSampler
+from src.utils.systemctl import show_units
+
+METRICS_ENV = "SYSTEMD_MANAGER_METRICS"
+DEFAULT_LISTEN = "127.0.0.1:9559"
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+UNIT_STATES = ("active", "activating", "deactivating", "inactive", "failed")
+
+# Histogram buckets, in seconds, for systemctl-bound operations.
+LATENCY_BUCKETS = (0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+@dataclass
+class OperationStats:
+    """Latency histogram of one manager operation."""
+
+    buckets: List[int] = field(default_factory=lambda: [0] * len(LATENCY_BUCKETS))
+    count: int = 0
+    total: float = 0.0
+    failures: int = 0
+
+
+class _Operation:
+    def __init__(self):
+        self.success = True
+
+
+class MetricsRegistry:
+    """
+    Thread-safe, in-process record of manager operation latencies.
+
+    Attributes:
+        operations (Dict[str, OperationStats]): Latency statistics by operation
+    """
+
+    def __init__(self):
+        self.operations: Dict[str, OperationStats] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, operation: str, seconds: float, success: bool = True):
+        with self._lock:
+            stats = self.operations.get(operation)
+            if stats is None:
+                stats = self.operations[operation] = OperationStats()
+            for i, bound in enumerate(LATENCY_BUCKETS):
+                if seconds <= bound:
+                    stats.buckets[i] += 1
+            stats.count += 1
+            stats.total += seconds
+            if not success:
+                stats.failures += 1
+
+    @contextmanager
+    def timed(self, operation: str) -> Iterator[_Operation]:
+        """Time the enclosed block; an exception or ``op.success = False``
+        counts as a failure."""
+        op = _Operation()
+        started = time.monotonic()
+        try:
+            yield op
+        except BaseException:
+            op.success = False
+            raise
+        finally:
+            self.observe(operation, time.monotonic() - started, op.success)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            snapshot = {
+                name: (list(s.buckets), s.count, s.total, s.failures)
+                for name, s in sorted(self.operations.items())
+            }
+
+        lines = [
+            "# HELP systemd_manager_operation_duration_seconds "
+            "Duration of manager operations.",
+            "# TYPE systemd_manager_operation_duration_seconds histogram",
+        ]
+        for name, (buckets, count, total, _failures) in snapshot.items():
+            label = f'operation="{_escape(name)}"'
+            for bound, value in zip(LATENCY_BUCKETS, buckets):
+                lines.append(
+                    "systemd_manager_operation_duration_seconds_bucket"
+                    f'{{{label},le="{bound}"}} {value}'
+                )
+            lines.append(
+                "systemd_manager_operation_duration_seconds_bucket"
+                f'{{{label},le="+Inf"}} {count}'
+            )
+            lines.append(
+                f"systemd_manager_operation_duration_seconds_sum{{{label}}} "
+                f"{_format_value(total)}"
+            )
+            lines.append(
+                f"systemd_manager_operation_duration_seconds_count{{{label}}} {count}"
+            )
+
+        lines += [
+            "# HELP systemd_manager_operation_failures_total "
+            "Failed manager operations.",
+            "# TYPE systemd_manager_operation_failures_total counter",
+        ]
+        for name, (_buckets, _count, _total, failures) in snapshot.items():
+            lines.append(
+                "systemd_manager_operation_failures_total"
+                f'{{operation="{_escape(name)}"}} {failures}'
+            )
+        return lines
+
+
+class MetricsCollector:
+    """
+    Periodically gathers per-service metrics into a cached exposition.
+
+    Attributes:
+        services_dir (str): Directory holding the managed service configurations
+        interval (float): Seconds between two refreshes
+        registry (MetricsRegistry): Source of the operation latencies
+    """
+
+    def __init__(
+        self,
+        services_dir: str = DEFAULT_SERVICES_DIR,
+        interval: float = 15.0,
+        registry: Optional[MetricsRegistry] = None,
+        sampler: Optional[CgroupSampler] = None,
+    ):
+        self.services_dir = services_dir
+        self.interval = interval
+        self.registry = registry if registry is not None else operation_metrics
+        self.sampler = sampler or CgroupSampler(history=1)
+        self._unit_lines: List[str] = []
+        self._refreshed_at: Optional[float] = None
+        self._collect_duration = 0.0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def refresh(self):
+        """Query systemd and the cgroups once and replace the cache."""
+        started = time.monotonic()
+        names = list_service_names(self.services_dir)
+        states = show_units(names)
+        usage = self.sampler.sample(names)
+
+        state_lines: List[str] = []
+        restart_lines: List[str] = []
+        cpu_lines: List[str] = []
+        memory_lines: List[str] = []
+        task_lines: List[str] = []
+        for name in names:
+            label = f'unit="{_escape(name)}"'
+            state = states.get(name, {})
+            active = state.get("ActiveState", "")
+            for value in UNIT_STATES:
+                state_lines.append(
+                    f'systemd_manager_unit_state{{{label},state="{value}"}} '
+                    f"{int(active == value)}"
+                )
+            restarts = state.get("NRestarts", "")
+            if restarts.isdigit():
+                restart_lines.append(
+                    f"systemd_manager_unit_restarts{{{label}}} {restarts}"
+                )
+
+            unit_usage = usage.get(name)
+            if unit_usage is None or unit_usage.last_reading is None:
+                continue
+            cpu_seconds = unit_usage.last_reading[1] / 1_000_000
+            cpu_lines.append(
+                f"systemd_manager_unit_cpu_seconds_total{{{label}}} "
+                f"{_format_value(cpu_seconds)}"
+            )
+            if unit_usage.memory_bytes is not None:
+                memory_lines.append(
+                    f"systemd_manager_unit_memory_bytes{{{label}}} "
+                    f"{unit_usage.memory_bytes}"
+                )
+            if unit_usage.pids is not None:
+                task_lines.append(
+                    f"systemd_manager_unit_tasks{{{label}}} {unit_usage.pids}"
+                )
+
+        lines = (
+            [
+                "# HELP systemd_manager_unit_state Current ActiveState of the unit.",
+                "# TYPE systemd_manager_unit_state gauge",
+            ]
+            + state_lines
+            + [
+                "# HELP systemd_manager_unit_restarts Automatic restarts (NRestarts).",
+                "# TYPE systemd_manager_unit_restarts gauge",
+            ]
+            + restart_lines
+            + [
+                "# HELP systemd_manager_unit_cpu_seconds_total CPU time of the unit cgroup.",
+                "# TYPE systemd_manager_unit_cpu_seconds_total counter",
+            ]
+            + cpu_lines
+            + [
+                "# HELP systemd_manager_unit_memory_bytes Memory charged to the unit cgroup.",
+                "# TYPE systemd_manager_unit_memory_bytes gauge",
+            ]
+            + memory_lines
+            + [
+                "# HELP systemd_manager_unit_tasks Tasks in the unit cgroup.",
+                "# TYPE systemd_manager_unit_tasks gauge",
+            ]
+            + task_lines
+        )
+
+        with self._lock:
+            self._unit_lines = lines
+            self._refreshed_at = time.monotonic()
+            self._collect_duration = self._refreshed_at - started
+
+    def exposition(self) -> str:
+        """Render the cached metrics; never spawns a process."""
+        with self._lock:
+            lines = list(self._unit_lines)
+            age = (
+                time.monotonic() - self._refreshed_at
+                if self._refreshed_at is not None
+                else -1.0
+            )
+            duration = self._collect_duration
+
+        lines += [
+            "# HELP systemd_manager_cache_age_seconds Age of the cached unit metrics.",
+            "# TYPE systemd_manager_cache_age_seconds gauge",
+            f"systemd_manager_cache_age_seconds {age:.3f}",
+            "# HELP systemd_manager_collect_duration_seconds Duration of the last refresh.",
+            "# TYPE systemd_manager_collect_duration_seconds gauge",
+            f"systemd_manager_collect_duration_seconds {duration:.6f}",
+        ]
+        lines += self.registry.render()
+        return "\n".join(lines) + "\n"
+
+    def start(self, textfile: Optional[str] = None):
+        """Refresh in a background thread, optionally rewriting ``textfile``."""
+        if self._thread is not None:
+            return
+
+        def run():
+            while not self._stop.is_set():
+                try:
+                    self.refresh()
+                    if textfile:
+                        write_textfile(textfile, self.exposition())
+                except Exception as e:
+                    print(f"Erreur lors de la collecte des métriques : {e}")
+                self._stop.wait(self.interval)
+
+        self._thread = threading.Thread(target=run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self.sampler.close()
+
+
+def write_textfile(path: str, text: str):
+    """Atomically replace ``path`` so node_exporter never reads a partial file."""
+    import tempfile
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".systemd_manager.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def parse_listen(listen: str) -> Tuple[str, int]:
+    host, _, port = listen.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def serve_metrics(collector: MetricsCollector, listen: str = DEFAULT_LISTEN):
+    """Create (without starting) an HTTP server exposing ``collector``."""
+    # Imported here: http.server pulls in http.client, email and ssl, which
+    # the CLI commands importing this module never need.
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] not in ("/metrics", "/"):
+                self.send_error(404)
+                return
+            body = collector.exposition().encode()
+            self.send_response(200)
+            self.send_header("Content-Type", CONTENT_TYPE)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return ThreadingHTTPServer(parse_listen(listen), MetricsHandler)
+
+
+def start_exporter_from_env() -> Optional[MetricsCollector]:
+    """Start an in-process exporter when ``SYSTEMD_MANAGER_METRICS`` is set.
+
+    The variable holds either ``host:port`` to serve over HTTP, or the path of
+    a ``.prom`` file for the node_exporter textfile collector.
+    """
+    target = os.environ.get(METRICS_ENV)
+    if not target:
+        return None
+
+    collector = MetricsCollector()
+    try:
+        if target.endswith(".prom"):
+            collector.start(textfile=target)
+        else:
+            server = serve_metrics(collector, target)
+            collector.start()
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+    except (OSError, ValueError) as e:
+        print(f"Erreur lors du démarrage de l'exportateur de métriques : {e}")
+        return None
+    return collector
+
+
+# Operation latencies recorded by the GUI and CLI controllers.
+operation_metrics = MetricsRegistry()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(
+        description="Export SystemdManager metrics in the Prometheus format."
+    )
+    parser.add_argument("--listen", default=None, help="host:port to serve /metrics")
+    parser.add_argument("--textfile", help="write metrics to this .prom file instead")
+    parser.add_argument("--interval", type=float, default=15.0)
+    parser.add_argument("--services-dir", default=DEFAULT_SERVICES_DIR)
+    args = parser.parse_args(argv)
+
+    collector = MetricsCollector(args.services_dir, interval=args.interval)
+    if args.textfile and not args.listen:
+        collector.start(textfile=args.textfile)
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            pass
+        finally:
+            collector.stop()
+        return
+
+    server = serve_metrics(collector, args.listen or DEFAULT_LISTEN)
+    collector.start(textfile=args.textfile)
+    print(f"Métriques disponibles sur http://{args.listen or DEFAULT_LISTEN}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        collector.stop()
+
+
+if __name__ == "__main__":
+    main()
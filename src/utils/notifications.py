@@ -0,0 +1,168 @@
+"""Queue of the toast notifications shown by the GUI.
+
+``NotificationManager.show_notification`` used to start one thread per toast,
+whose only job was to call ``parent.after(0, ...)``, and every toast was
+stacked on screen until it expired: a bulk action produced dozens of threads
+and a column of identical toasts. ``NotificationQueue`` holds the pending and
+visible toasts for the single Tk thread that displays them:
+
+* notifications pushed with the same ``group`` while one of that group is
+  still pending or visible are merged into it, and its text becomes the plural
+  form ("12 services restarted");
+* at most ``max_visible`` toasts are on screen at once, the others wait;
+* a new toast appears at most every ``min_interval`` seconds, and the pending
+  queue is bounded (the oldest pending toasts are dropped first).
+
+The queue has no Tk dependency: pushing is thread-safe, the GUI drains it from
+its main loop.
+"""
+
+import itertools
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Deque, List, Optional
+
+# Toasts on screen at once.
+MAX_VISIBLE = 3
+
+# Seconds between the appearance of two toasts.
+MIN_INTERVAL = 0.3
+
+# Toasts waiting to be shown (oldest dropped first).
+MAX_PENDING = 50
+
+
+@dataclass(eq=False)
+class Notification:
+    """
+    One toast, possibly standing for several merged notifications.
+
+    Attributes:
+        message (str): Text of a single notification
+        type (str): "info", "success" or "error"
+        duration (int): Display time in milliseconds (0 keeps it until closed)
+        group (Optional[str]): Notifications of the same group are merged
+        plural (Optional[str]): Text of merged notifications, with a ``%d`` count
+        count (int): Number of notifications merged into this toast
+        changed (bool): True when the count changed since the toast was shown
+    """
+
+    message: str
+    type: str = "info"
+    duration: int = 3000
+    group: Optional[str] = None
+    plural: Optional[str] = None
+    count: int = 1
+    changed: bool = False
+
+    @property
+    def text(self) -> str:
+        if self.count == 1:
+            return self.message
+        if self.plural:
+            return self.plural % self.count
+        return f"{self.message} (×{self.count})"
+
+
+class NotificationQueue:
+    """
+    Pending and visible toasts, with merging and rate limiting.
+
+    Attributes:
+        max_visible (int): Toasts on screen at once
+        min_interval (float): Seconds between the appearance of two toasts
+        max_pending (int): Toasts waiting to be shown
+        dropped (int): Pending toasts discarded because the queue was full
+    """
+
+    def __init__(
+        self,
+        max_visible: int = MAX_VISIBLE,
+        min_interval: float = MIN_INTERVAL,
+        max_pending: int = MAX_PENDING,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_visible = max_visible
+        self.min_interval = min_interval
+        self.max_pending = max_pending
+        self.dropped = 0
+        self._clock = clock
+        self._pending: Deque[Notification] = deque()
+        self._visible: List[Notification] = []
+        self._last_shown: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def push(
+        self,
+        message: str,
+        type: str = "info",
+        duration: int = 3000,
+        group: Optional[str] = None,
+        plural: Optional[str] = None,
+    ) -> Notification:
+        """Queue a notification, or merge it into one of the same group."""
+        with self._lock:
+            if group is not None:
+                for notification in itertools.chain(self._visible, self._pending):
+                    if notification.group == group and notification.type == type:
+                        notification.count += 1
+                        notification.changed = notification in self._visible
+                        return notification
+
+            notification = Notification(message, type, duration, group, plural)
+            self._pending.append(notification)
+            while len(self._pending) > self.max_pending:
+                self._pending.popleft()
+                self.dropped += 1
+            return notification
+
+    def due(self) -> List[Notification]:
+        """Return the toasts to show now; they are then counted as visible."""
+        with self._lock:
+            now = self._clock()
+            shown: List[Notification] = []
+            while self._pending and len(self._visible) < self.max_visible:
+                if (
+                    self._last_shown is not None
+                    and now - self._last_shown < self.min_interval
+                ):
+                    break
+                notification = self._pending.popleft()
+                self._visible.append(notification)
+                self._last_shown = now
+                shown.append(notification)
+            return shown
+
+    def changed(self) -> List[Notification]:
+        """Return the visible toasts whose count changed, and reset the flag."""
+        with self._lock:
+            changed = [n for n in self._visible if n.changed]
+            for notification in changed:
+                notification.changed = False
+            return changed
+
+    def dismiss(self, notification: Notification):
+        with self._lock:
+            if notification in self._visible:
+                self._visible.remove(notification)
+
+    def visible(self) -> List[Notification]:
+        """Return the visible toasts, oldest first."""
+        with self._lock:
+            return list(self._visible)
+
+    def pending(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def next_delay(self) -> Optional[float]:
+        """Return the seconds until a pending toast can appear (None if never)."""
+        with self._lock:
+            if not self._pending or len(self._visible) >= self.max_visible:
+                return None
+            if self._last_shown is None:
+                return 0.0
+            elapsed = self._clock() - self._last_shown
+            return max(0.0, self.min_interval - elapsed)
@@ -0,0 +1,200 @@
+"""Per-unit queue of start, stop and restart requests.
+
+Start/Stop/Restart used to run their ``systemctl`` call on every click: a
+double-clicked Restart queued two restart jobs in PID 1, and a click on a unit
+whose previous job had not finished raced with it. ``OperationQueue`` keeps,
+for each unit, at most one operation in flight and one pending:
+
+* the operations of a unit run one after the other (different units run
+  concurrently on the background runtime, see ``src.utils.runtime``);
+* a request replaces the pending one: the last request states what the user
+  wants, so start + stop + start leaves one start and any number of restarts
+  one restart. A start after a restart keeps the restart, which leaves the
+  unit running as well (``merge``);
+* a pending operation identical to the one in flight is dropped: the job
+  being run already does it.
+
+The callbacks of a dropped or merged request are attached to the operation
+that fulfils it and receive the verb that actually ran; those of a superseded
+request (a start replaced by a stop) are not called. ``state`` gives the
+operation in flight and the pending one of a unit; listeners are told when
+they change (the service list shows them in the status column).
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.daemon.client import refresh_daemon
+from src.utils.metrics import operation_metrics
+from src.utils.privileged import privileged_helper
+from src.utils.profiling import action_profiler
+from src.utils.runtime import BackgroundRuntime, runtime
+
+VERBS = ("start", "stop", "restart")
+
+Callbacks = Tuple[
+    Optional[Callable[[str], Any]], Optional[Callable[[str, BaseException], Any]]
+]
+
+
+def merge(previous: Optional[str], verb: str) -> str:
+    """Return the operation equivalent to ``previous`` followed by ``verb``."""
+    if previous == "restart" and verb == "start":
+        return "restart"
+    return verb
+
+
+def run_operation(verb: str, name: str):
+    """Run ``systemctl <verb>`` on unit ``name`` through the privileged helper."""
+    # Profiled here, on the worker thread: the Tk handler only queues it.
+    with action_profiler.action(verb), operation_metrics.timed(verb):
+        privileged_helper.call(verb, names=[name])
+    refresh_daemon([name])
+
+
+@dataclass
+class UnitOperation:
+    """
+    An operation of the queue and the requests it fulfils.
+
+    Attributes:
+        verb (str): "start", "stop" or "restart"
+        callbacks (List[Callbacks]): (on_done, on_error) of each request
+    """
+
+    verb: str
+    callbacks: List[Callbacks] = field(default_factory=list)
+
+
+class OperationQueue:
+    """
+    Serializes and collapses the operations requested on each unit.
+
+    Attributes:
+        collapsed (int): Requests that did not cost a systemctl job
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[str, str], Any] = run_operation,
+        background: BackgroundRuntime = runtime,
+    ):
+        self.collapsed = 0
+        self._execute = execute
+        self._runtime = background
+        self._running: Dict[str, UnitOperation] = {}
+        self._pending: Dict[str, UnitOperation] = {}
+        self._listeners: List[Callable[[str], Any]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Callable[[str], Any]):
+        """Call ``listener(name)`` whenever the state of a unit changes."""
+        self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str], Any]):
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def state(self, name: str) -> Tuple[Optional[str], Optional[str]]:
+        """Return the (in flight, pending) verbs of unit ``name``."""
+        with self._lock:
+            running = self._running.get(name)
+            pending = self._pending.get(name)
+        return (
+            running.verb if running else None,
+            pending.verb if pending else None,
+        )
+
+    def request(
+        self,
+        name: str,
+        verb: str,
+        on_done: Optional[Callable[[str], Any]] = None,
+        on_error: Optional[Callable[[str, BaseException], Any]] = None,
+    ) -> bool:
+        """Queue ``verb`` on unit ``name``.
+
+        Returns False when the request was merged into another operation.
+        ``on_done`` receives the verb that ran, ``on_error`` that verb and
+        its exception.
+        """
+        if verb not in VERBS:
+            raise ValueError(f"opération inconnue : {verb!r}")
+        callbacks = (on_done, on_error)
+        launch = None
+        with self._lock:
+            running = self._running.get(name)
+            pending = self._pending.get(name)
+            if running is None:
+                launch = self._running[name] = UnitOperation(verb, [callbacks])
+                queued = True
+            else:
+                previous = pending.verb if pending else running.verb
+                merged = merge(previous, verb)
+                if pending is not None and pending.verb == merged:
+                    pending.callbacks.append(callbacks)
+                    queued = False
+                elif merged == running.verb:
+                    # The pending operation, if any, is superseded.
+                    self._pending.pop(name, None)
+                    running.callbacks.append(callbacks)
+                    queued = False
+                else:
+                    self._pending[name] = UnitOperation(merged, [callbacks])
+                    queued = True
+                # Each request is counted once: when it is merged, or when
+                # the pending operation it was part of is superseded.
+                if not queued:
+                    self.collapsed += 1
+                if pending is not None and pending.verb != merged:
+                    self.collapsed += len(pending.callbacks)
+
+        if launch is not None:
+            self._launch(name, launch)
+        self._notify(name)
+        return queued
+
+    def _launch(self, name: str, operation: UnitOperation):
+        self._runtime.submit(
+            self._execute,
+            operation.verb,
+            name,
+            name=f"{operation.verb}_service",
+            on_done=lambda _: self._finished(name, operation, None),
+            on_error=lambda error: self._finished(name, operation, error),
+        )
+
+    def _finished(
+        self, name: str, operation: UnitOperation, error: Optional[BaseException]
+    ):
+        with self._lock:
+            self._running.pop(name, None)
+            following = self._pending.pop(name, None)
+            if following is not None:
+                self._running[name] = following
+        if following is not None:
+            self._launch(name, following)
+        self._notify(name)
+
+        for on_done, on_error in operation.callbacks:
+            try:
+                if error is None:
+                    if on_done is not None:
+                        on_done(operation.verb)
+                elif on_error is not None:
+                    on_error(operation.verb, error)
+                else:
+                    print(f"Erreur lors de {operation.verb} de {name} : {error}")
+            except Exception as e:
+                print(f"Erreur lors du retour de {operation.verb} de {name} : {e}")
+
+    def _notify(self, name: str):
+        for listener in list(self._listeners):
+            try:
+                listener(name)
+            except Exception as e:
+                print(f"Erreur lors de la mise à jour de l'état de {name} : {e}")
+
+
+operation_queue = OperationQueue()
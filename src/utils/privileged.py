@@ -0,0 +1,476 @@
+"""Persistent privileged helper for unit-file and systemctl operations.
+
+Saving a service used to cost ``sudo mv`` + ``sudo systemctl daemon-reload``
+(two ``sudo`` spawns, each re-checking credentials, plus a world-writable
+``/tmp`` staging file), and every permission check spawned ``sudo -n true``.
+
+``PrivilegedHelper`` starts **one** helper per session instead:
+
+* already root: operations run in-process, no helper is needed at all;
+* otherwise: ``sudo -n /usr/bin/python3 -I`` runs the helper once and keeps
+  it alive; requests go over its stdin/stdout pipes as one JSON line per
+  batch.
+
+The helper runs as root, so nothing about it is chosen by the caller: it is
+imported from a root-owned copy of the code in ``HELPER_ROOT`` (installed with
+``sudo python3 -m src.utils.privileged --install``; it is refused if any of
+its files is writable by another user), ``-I`` keeps the working directory
+and ``PYTHON*`` variables off ``sys.path``, and it always writes to
+``UNIT_DIR``.
+
+The installed copy does not follow upgrades of the application: ``ping``
+answers with ``PROTOCOL_VERSION`` and a digest of the helper's source files,
+and a helper whose answer differs from the caller's own is stopped as stale.
+
+When no helper can be used (not installed, stale, or ``sudo -n`` refused),
+operations fall back to the commands the manager ran before the helper
+existed, which ask for authentication when they need it: unit files are
+staged in a private temporary file and moved with ``sudo`` (``pkexec`` in a
+graphical session), and ``systemctl`` runs unprivileged so that polkit
+decides.
+
+The helper only understands a narrow, validated protocol: ``write_unit`` and
+``remove_unit`` (limited to ``<unit dir>/<valid name>.service``),
+``daemon_reload`` and ``start``/``stop``/``restart``/``enable``/``disable`` of
+valid service names. A batch is validated as a whole before anything runs;
+consecutive reloads are merged into one and consecutive operations with the
+same verb into a single ``systemctl`` call. A batch stops at its first
+failed operation: the following ones are reported as skipped.
+"""
+
+import argparse
+import atexit
+import functools
+import hashlib
+import json
+import os
+import shutil
+import stat
+import subprocess
+import sys
+import tempfile
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from src.models.service_model import is_valid_service_name
+from src.utils.proctrace import run_command
+from src.utils.systemctl import UNIT_DIR, unit_name
+
+SYSTEMCTL_VERBS = ("start", "stop", "restart", "enable", "disable")
+OPERATIONS = ("ping", "write_unit", "remove_unit", "daemon_reload") + SYSTEMCTL_VERBS
+
+# Upper bound on a generated unit file.
+UNIT_CONTENT_MAX = 64 * 1024
+
+# Upper bound on the operations of one batch.
+BATCH_MAX = 1000
+
+# Root-owned copy of the code the helper is imported from.
+HELPER_ROOT = "/usr/local/lib/systemd-manager"
+
+# Interpreter of the helper: never the caller's ``sys.executable``.
+HELPER_PYTHON = "/usr/bin/python3"
+
+SKIPPED = "skipped"
+
+# Bumped whenever the requests or the answers of the helper change.
+PROTOCOL_VERSION = 1
+
+# Source files the helper runs, relative to the directory holding ``src``.
+HELPER_SOURCES = (
+    "src/utils/privileged.py",
+    "src/utils/systemctl.py",
+    "src/utils/proctrace.py",
+    "src/models/service_model.py",
+    "src/models/screen.py",
+)
+
+
+class PrivilegedError(Exception):
+    """Raised when a privileged operation is rejected or fails."""
+
+
+def _check_name(name: Any):
+    if not isinstance(name, str) or not is_valid_service_name(name):
+        raise ValueError(f"Nom de service invalide : {name!r}")
+
+
+def validate(request: Any) -> dict:
+    """Return ``request`` if it is a well-formed operation, else raise ValueError."""
+    if not isinstance(request, dict):
+        raise ValueError("opération invalide")
+    op = request.get("op")
+    if op not in OPERATIONS:
+        raise ValueError(f"opération inconnue : {op!r}")
+
+    if op in ("write_unit", "remove_unit"):
+        _check_name(request.get("name"))
+    if op == "write_unit":
+        content = request.get("content")
+        if not isinstance(content, str) or "\0" in content:
+            raise ValueError("contenu de unité invalide")
+        if len(content.encode()) > UNIT_CONTENT_MAX:
+            raise ValueError("contenu de unité trop volumineux")
+    if op in SYSTEMCTL_VERBS:
+        names = request.get("names")
+        if not isinstance(names, list) or not names:
+            raise ValueError("liste de services attendue")
+        for name in names:
+            _check_name(name)
+    return request
+
+
+@functools.lru_cache(maxsize=None)
+def code_digest(root: Optional[str] = None) -> str:
+    """Return a digest of the ``HELPER_SOURCES`` found under ``root``."""
+    if root is None:
+        root = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    digest = hashlib.sha256()
+    for path in HELPER_SOURCES:
+        try:
+            with open(os.path.join(root, path), "rb") as f:
+                digest.update(f.read())
+        except OSError:
+            digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _check_result(result: subprocess.CompletedProcess):
+    if result.returncode != 0:
+        raise PrivilegedError(result.stderr.decode(errors="replace"))
+
+
+def _write_unit(unit_dir: str, name: str, content: str):
+    # Written next to the target and renamed: readers never see a partial
+    # file and no world-writable staging directory is involved.
+    fd, tmp_path = tempfile.mkstemp(dir=unit_dir, prefix=f".{name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, os.path.join(unit_dir, f"{name}.service"))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def _remove_unit(unit_dir: str, name: str):
+    try:
+        os.remove(os.path.join(unit_dir, f"{name}.service"))
+    except FileNotFoundError:
+        pass
+
+
+def _install_unit(
+    elevate: List[str], unit_dir: str, name: str, content: str, run: Callable
+):
+    fd, tmp_path = tempfile.mkstemp(prefix=f"{name}.", suffix=".service")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        target = os.path.join(unit_dir, f"{name}.service")
+        command = ["install", "-m", "644", "--", tmp_path, target]
+        _check_result(run(elevate + command, capture_output=True))
+    finally:
+        os.remove(tmp_path)
+
+
+def execute_batch(
+    requests: List[dict],
+    unit_dir: str = UNIT_DIR,
+    run: Callable[..., Any] = run_command,
+    elevate: Optional[List[str]] = None,
+) -> List[dict]:
+    """Validate then execute ``requests``; return one result per request.
+
+    Unit files are written in process unless ``elevate`` gives the command
+    prefix (``sudo``, ``pkexec``) that moves and removes them.
+    """
+    if not isinstance(requests, list) or len(requests) > BATCH_MAX:
+        raise ValueError("lot d'opérations invalide")
+    for request in requests:
+        validate(request)
+
+    results: List[dict] = [{"ok": True} for _ in requests]
+    i = 0
+    while i < len(requests):
+        op = requests[i]["op"]
+        # Group this operation with the following ones of the same kind.
+        j = i + 1
+        if op == "daemon_reload" or op in SYSTEMCTL_VERBS:
+            while j < len(requests) and requests[j]["op"] == op:
+                j += 1
+        group = range(i, j)
+
+        try:
+            if op == "ping":
+                results[i] = {
+                    "ok": True,
+                    "protocol": PROTOCOL_VERSION,
+                    "digest": code_digest(),
+                }
+            elif op == "write_unit":
+                name, content = requests[i]["name"], requests[i]["content"]
+                if elevate is None:
+                    _write_unit(unit_dir, name, content)
+                else:
+                    _install_unit(elevate, unit_dir, name, content, run)
+            elif op == "remove_unit":
+                if elevate is None:
+                    _remove_unit(unit_dir, requests[i]["name"])
+                else:
+                    path = os.path.join(unit_dir, f"{requests[i]['name']}.service")
+                    _check_result(
+                        run(elevate + ["rm", "-f", "--", path], capture_output=True)
+                    )
+            elif op == "daemon_reload":
+                _check_result(run(["systemctl", "daemon-reload"], capture_output=True))
+            elif op in SYSTEMCTL_VERBS:
+                units: List[str] = []
+                for k in group:
+                    units += [unit_name(name) for name in requests[k]["names"]]
+                result = run(
+                    ["systemctl", op, "--"] + list(dict.fromkeys(units)),
+                    capture_output=True,
+                )
+                _check_result(result)
+        except (OSError, PrivilegedError) as e:
+            for k in group:
+                results[k] = {"ok": False, "error": str(e).strip()}
+            # The following operations depend on this one (a unit file is
+            # only removed once the unit is stopped and disabled).
+            for k in range(j, len(requests)):
+                results[k] = {"ok": False, "error": SKIPPED}
+            break
+        i = j
+    return results
+
+
+def helper_installed(root: str = HELPER_ROOT) -> bool:
+    """True if ``root`` holds the helper and only root can modify it."""
+
+    def safe(path: str) -> bool:
+        info = os.lstat(path)
+        return info.st_uid == 0 and not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+    try:
+        if not os.path.isfile(os.path.join(root, "src", "utils", "privileged.py")):
+            return False
+        if not safe(root):
+            return False
+        for directory, _dirs, files in os.walk(root):
+            for name in [directory] + [os.path.join(directory, f) for f in files]:
+                if not safe(name):
+                    return False
+    except OSError:
+        return False
+    return True
+
+
+def install_helper(root: str = HELPER_ROOT):
+    """Copy the ``src`` package to ``root``, owned by root (run as root)."""
+    source = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    target = os.path.join(root, "src")
+    if os.path.exists(target):
+        shutil.rmtree(target)
+    os.makedirs(root, mode=0o755, exist_ok=True)
+    shutil.copytree(source, target, ignore=shutil.ignore_patterns("__pycache__"))
+    for directory, _dirs, files in os.walk(root):
+        os.chown(directory, 0, 0)
+        os.chmod(directory, 0o755)
+        for name in files:
+            path = os.path.join(directory, name)
+            os.chown(path, 0, 0)
+            os.chmod(path, 0o644)
+
+
+def fallback_elevation() -> List[str]:
+    """Return the command prefix of the fallback for unit-file changes."""
+    graphical = os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY")
+    if graphical and shutil.which("pkexec"):
+        return ["pkexec"]
+    return ["sudo"]
+
+
+def serve(stdin=None, stdout=None, unit_dir: str = UNIT_DIR):
+    """Helper side: answer one JSON batch per line until stdin is closed."""
+    stdin = stdin or sys.stdin
+    stdout = stdout or sys.stdout
+    for line in stdin:
+        try:
+            response: Dict[str, Any] = {
+                "results": execute_batch(json.loads(line), unit_dir)
+            }
+        except ValueError as e:
+            response = {"error": str(e)}
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+class PrivilegedHelper:
+    """
+    Session-wide access to privileged operations through a single helper.
+
+    Attributes:
+        unit_dir (str): Directory receiving the unit files in process (the
+            helper always writes to ``UNIT_DIR``)
+        command (Optional[List[str]]): Helper command line (``sudo -n`` on the
+            copy in ``HELPER_ROOT`` unless given)
+        in_process (bool): True when running as root, without a helper process
+        fallback (bool): Run the operations with ``sudo``/``pkexec`` and
+            unprivileged ``systemctl`` when no helper can be used
+    """
+
+    def __init__(
+        self,
+        unit_dir: str = UNIT_DIR,
+        command: Optional[List[str]] = None,
+        fallback: bool = True,
+    ):
+        self.unit_dir = unit_dir
+        self.command = command
+        self.in_process = False
+        self.fallback = fallback
+        self._warned = False
+        self._process: Optional[subprocess.Popen] = None
+        self._lock = threading.Lock()
+
+    def _helper_command(self) -> List[str]:
+        if self.command is not None:
+            return self.command
+        bootstrap = (
+            f"import sys; sys.path.insert(0, {HELPER_ROOT!r}); "
+            "from src.utils.privileged import main; main()"
+        )
+        return ["sudo", "-n", HELPER_PYTHON, "-I", "-c", bootstrap, "--serve"]
+
+    def start(self) -> bool:
+        """Make privileged operations available; False if they cannot be."""
+        with self._lock:
+            return self._ensure_started()
+
+    def _ensure_started(self) -> bool:
+        if self.in_process:
+            return True
+        if self._process is not None and self._process.poll() is None:
+            return True
+        if self.command is None and os.geteuid() == 0:
+            self.in_process = True
+            return True
+        if self.command is None and not helper_installed():
+            self._warn(f"Assistant privilégié absent ou modifiable dans {HELPER_ROOT}")
+            return False
+
+        try:
+            self._process = subprocess.Popen(
+                self._helper_command(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                cwd="/",
+            )
+            answer = self._exchange([{"op": "ping"}])[0]
+        except (OSError, PrivilegedError, IndexError):
+            self._stop_process()
+            return False
+        if (
+            answer.get("protocol") != PROTOCOL_VERSION
+            or answer.get("digest") != code_digest()
+        ):
+            self._stop_process()
+            self._warn(f"Assistant privilégié obsolète dans {HELPER_ROOT}")
+            return False
+        return True
+
+    def _warn(self, message: str):
+        if not self._warned:
+            self._warned = True
+            print(f"{message} : sudo python3 -m src.utils.privileged --install")
+
+    def _exchange(self, requests: List[dict]) -> List[dict]:
+        process = self._process
+        if process is None or process.stdin is None or process.stdout is None:
+            raise PrivilegedError("assistant privilégié indisponible")
+        try:
+            process.stdin.write(json.dumps(requests) + "\n")
+            process.stdin.flush()
+            line = process.stdout.readline()
+        except OSError as e:
+            raise PrivilegedError(str(e)) from e
+        if not line:
+            raise PrivilegedError("l'assistant privilégié s'est arrêté")
+        try:
+            response = json.loads(line)
+            if "error" in response:
+                raise PrivilegedError(response["error"])
+            results = response["results"]
+        except (ValueError, KeyError, TypeError) as e:
+            # The pipe is out of sync: the next answer could not be trusted.
+            self._stop_process()
+            raise PrivilegedError(f"réponse invalide de l'assistant : {e}") from e
+        return results
+
+    def batch(self, requests: List[dict]) -> List[dict]:
+        """Run several operations in one round trip; raise if any failed."""
+        with self._lock:
+            if self._ensure_started() and not self.in_process:
+                results = self._exchange(requests)
+            elif self.in_process or self.fallback:
+                elevate = None if self.in_process else fallback_elevation()
+                try:
+                    results = execute_batch(requests, self.unit_dir, elevate=elevate)
+                except ValueError as e:
+                    raise PrivilegedError(str(e)) from e
+            else:
+                raise PrivilegedError("droits administrateur indisponibles")
+
+        errors = [r["error"] for r in results if not r["ok"]]
+        if errors:
+            raise PrivilegedError("; ".join(errors))
+        return results
+
+    def call(self, op: str, **params) -> dict:
+        return self.batch([dict(params, op=op)])[0]
+
+    def _stop_process(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+
+    def close(self):
+        with self._lock:
+            self._stop_process()
+
+
+privileged_helper = PrivilegedHelper()
+atexit.register(privileged_helper.close)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="SystemdManager privileged helper")
+    action = parser.add_mutually_exclusive_group(required=True)
+    action.add_argument("--serve", action="store_true")
+    action.add_argument(
+        "--install", action="store_true", help=f"copy the helper to {HELPER_ROOT}"
+    )
+    args = parser.parse_args(argv)
+    if args.install:
+        if os.geteuid() != 0:
+            sys.exit("--install doit être lancé avec sudo")
+        install_helper()
+        return
+    # Always the system unit directory: the caller does not choose where
+    # root writes.
+    serve(unit_dir=UNIT_DIR)
+
+
+if __name__ == "__main__":
+    main()
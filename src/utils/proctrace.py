@@ -0,0 +1,247 @@
+"""Tracing of the external commands run by SystemdManager.
+
+The controllers, dialogs and validators call ``systemctl``, ``journalctl``,
+``id``... directly through ``subprocess.run``, so nothing tells which of these
+commands dominate the latency of an action. ``run_command`` is a drop-in
+replacement for ``subprocess.run`` that records, for every call:
+
+* the command class (``systemctl restart``, ``journalctl``...), the argv,
+* the duration, the exit code (``None`` when the command could not run),
+* the caller (module, function and line) and the thread.
+
+Records are kept in a bounded in-memory ring buffer, from which ``summary``
+computes p50/p95/p99 latencies per command class, and are appended as JSON
+lines to the file named by ``SYSTEMD_MANAGER_TRACE`` when it is set. A
+recorded file is summarized with ``systemd-manager trace FILE``; the GUI shows
+the live table in a debug window (F12).
+
+``run_command`` looks ``subprocess.run`` up at call time: code and tests that
+patch ``subprocess.run`` see exactly the call they used to. Commands whose
+output is read as a stream (the health scan's ``journalctl``, asyncio
+subprocesses) are recorded with ``record_command`` once they exit. Only the
+processes that live as long as the session (journal follower, privileged
+helper) are not traced.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import IO, Any, Deque, Dict, Iterable, List, Optional
+
+TRACE_ENV = "SYSTEMD_MANAGER_TRACE"
+
+# Records kept in memory (oldest dropped first).
+MAX_RECORDS = 5000
+
+# Programs whose first non-option argument is part of the command class.
+VERB_PROGRAMS = {"systemctl", "screen", "loginctl", "busctl"}
+
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass
+class CommandRecord:
+    """
+    One external command run through ``run_command``.
+
+    Attributes:
+        command (str): Command class, e.g. "systemctl restart"
+        argv (List[str]): Full command line
+        duration (float): Wall-clock duration in seconds
+        returncode (Optional[int]): Exit code, None when the command could not run
+        caller (str): "module.function:line" of the code that ran it
+        thread (str): Name of the calling thread
+        started (float): Start time (seconds since the epoch)
+    """
+
+    command: str
+    argv: List[str]
+    duration: float
+    returncode: Optional[int]
+    caller: str
+    thread: str
+    started: float
+
+
+def _as_list(argv: Any) -> List[str]:
+    if isinstance(argv, (str, bytes, os.PathLike)):
+        return [os.fsdecode(argv)]
+    return [os.fsdecode(arg) if isinstance(arg, bytes) else str(arg) for arg in argv]
+
+
+def command_class(argv: Any) -> str:
+    """Return the class of a command line: the program, and its verb if any."""
+    args = _as_list(argv)
+    if len(args) == 1:
+        # Shell string.
+        args = args[0].split()
+    while args and os.path.basename(args[0]) in ("sudo", "env", "nice", "timeout"):
+        # Wrappers: skip their options (and the duration of timeout).
+        wrapper = os.path.basename(args.pop(0))
+        while args and (args[0].startswith("-") or "=" in args[0]):
+            args.pop(0)
+        if wrapper == "timeout" and args:
+            args.pop(0)
+    if not args:
+        return "?"
+
+    program = os.path.basename(args[0])
+    if program in VERB_PROGRAMS:
+        for arg in args[1:]:
+            if not arg.startswith("-"):
+                return f"{program} {arg}"
+    return program
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Return the nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * percent // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(records: Iterable[CommandRecord]) -> List[dict]:
+    """Return per-class statistics, slowest total time first."""
+    durations: Dict[str, List[float]] = {}
+    failures: Dict[str, int] = {}
+    for record in records:
+        durations.setdefault(record.command, []).append(record.duration)
+        if record.returncode != 0:
+            failures[record.command] = failures.get(record.command, 0) + 1
+
+    rows: List[Dict[str, Any]] = []
+    for command, values in durations.items():
+        values.sort()
+        row: Dict[str, Any] = {
+            "command": command,
+            "count": len(values),
+            "failures": failures.get(command, 0),
+            "total": sum(values),
+            "max": values[-1],
+        }
+        for percent in PERCENTILES:
+            row[f"p{percent}"] = percentile(values, percent)
+        rows.append(row)
+    rows.sort(key=lambda row: row["total"], reverse=True)
+    return rows
+
+
+def load_records(path: str) -> List[CommandRecord]:
+    """Read the records of a JSONL trace file (invalid lines are skipped)."""
+    records = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                records.append(CommandRecord(**json.loads(line)))
+            except (ValueError, TypeError):
+                continue
+    return records
+
+
+class CommandTracer:
+    """
+    Thread-safe record of the external commands run by the process.
+
+    Attributes:
+        enabled (bool): When False, ``run_command`` only forwards the call
+        trace_path (Optional[str]): JSONL file the records are appended to
+    """
+
+    def __init__(
+        self, max_records: int = MAX_RECORDS, trace_path: Optional[str] = None
+    ):
+        self.enabled = True
+        self.trace_path = trace_path
+        self._records: Deque[CommandRecord] = deque(maxlen=max_records)
+        self._file: Optional[IO[str]] = None
+        self._lock = threading.Lock()
+
+    def record(self, record: CommandRecord):
+        with self._lock:
+            self._records.append(record)
+            if self.trace_path is None:
+                return
+            try:
+                if self._file is None:
+                    self._file = open(self.trace_path, "a", encoding="utf-8")
+                self._file.write(json.dumps(asdict(record)) + "\n")
+                self._file.flush()
+            except OSError as e:
+                print(f"Erreur lors de l'écriture de la trace des commandes : {e}")
+                self.trace_path = None
+
+    def records(self) -> List[CommandRecord]:
+        with self._lock:
+            return list(self._records)
+
+    def summary(self) -> List[dict]:
+        return summarize(self.records())
+
+    def clear(self):
+        with self._lock:
+            self._records.clear()
+
+    def dump(self, path: str):
+        """Write the records kept in memory to ``path`` as JSON lines."""
+        with open(path, "w", encoding="utf-8") as f:
+            for record in self.records():
+                f.write(json.dumps(asdict(record)) + "\n")
+
+
+def _caller(depth: int) -> str:
+    frame = sys._getframe(depth + 1)
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}.{frame.f_code.co_name}:{frame.f_lineno}"
+
+
+def run_command(*popenargs, **kwargs) -> subprocess.CompletedProcess:
+    """``subprocess.run`` with the call recorded by ``command_tracer``."""
+    if not command_tracer.enabled:
+        return subprocess.run(*popenargs, **kwargs)
+
+    argv = popenargs[0] if popenargs else kwargs.get("args", [])
+    started = time.time()
+    begin = time.perf_counter()
+    returncode: Optional[int] = None
+    try:
+        result = subprocess.run(*popenargs, **kwargs)
+        returncode = getattr(result, "returncode", None)
+        return result
+    except subprocess.CalledProcessError as e:
+        returncode = e.returncode
+        raise
+    finally:
+        record_command(argv, started, time.perf_counter() - begin, returncode, 2)
+
+
+def record_command(
+    argv: Any,
+    started: float,
+    duration: float,
+    returncode: Any,
+    depth: int = 1,
+):
+    """Record a command run outside ``run_command`` (streamed or asyncio)."""
+    if not command_tracer.enabled:
+        return
+    command_tracer.record(
+        CommandRecord(
+            command=command_class(argv),
+            argv=_as_list(argv),
+            duration=duration,
+            returncode=returncode if isinstance(returncode, int) else None,
+            caller=_caller(depth),
+            thread=threading.current_thread().name,
+            started=started,
+        )
+    )
+
+
+# Process-wide tracer; SYSTEMD_MANAGER_TRACE=FILE also appends to FILE.
+command_tracer = CommandTracer(trace_path=os.environ.get(TRACE_ENV) or None)
@@ -0,0 +1,206 @@
+"""Profiling of user actions, enabled at run time.
+
+``python3 src/main.py --profile`` (or ``SYSTEMD_MANAGER_PROFILE=1``) profiles
+the user actions of an otherwise unmodified session: each method decorated
+with ``@profiled("name")`` (refresh, save, start/stop/restart, open logs...)
+runs under ``cProfile``, and ``<time>-<name>.pstats`` (for ``snakeviz``,
+``python -m pstats``...) plus a ``<time>-<name>.txt`` summary sorted by
+cumulative time are written to ``PROFILE_DIR``.
+
+Actions declared with ``snapshot=True`` (the refreshes) also take a
+``tracemalloc`` snapshot when they end: ``<time>-<name>-memory.txt`` lists the
+top allocation sites and the growth since the previous snapshot, which is what
+a slowly growing refresh looks like.
+
+Disabled (the default), a decorated action costs one attribute check. Nested
+actions are profiled as part of the outermost one. Setting the variable to a
+directory path writes the reports there instead of ``PROFILE_DIR``.
+
+References:
+    * Python documentation, "The Python Profilers" and ``tracemalloc``.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import re
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Iterator, List, Optional, TypeVar
+
+PROFILE_ENV = "SYSTEMD_MANAGER_PROFILE"
+PROFILE_DIR = os.path.expanduser("~/.config/systemd-manager/profiles")
+
+# Functions listed in the text summary of a profile.
+TOP_FUNCTIONS = 40
+
+# Allocation sites listed in a memory report.
+TOP_ALLOCATIONS = 25
+
+# Frames kept by tracemalloc for each allocation.
+TRACEMALLOC_FRAMES = 10
+
+F = TypeVar("F", bound=Callable)
+
+
+class ActionProfiler:
+    """
+    cProfile/tracemalloc recorder of the user actions.
+
+    Attributes:
+        enabled (bool): True when actions are profiled
+        directory (str): Directory the reports are written to
+        reports (List[str]): Paths of the reports written so far
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.directory = PROFILE_DIR
+        self.reports: List[str] = []
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        # Nesting is per thread: an action running on a worker thread does
+        # not make a concurrent Tk action "nested".
+        self._local = threading.local()
+
+    def enable(self, directory: Optional[str] = None):
+        if directory:
+            self.directory = directory
+        os.makedirs(self.directory, exist_ok=True)
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(TRACEMALLOC_FRAMES)
+        self.enabled = True
+        print(f"Profilage activé, rapports écrits dans {self.directory}")
+
+    def disable(self):
+        self.enabled = False
+        self._previous = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def _path(self, name: str, suffix: str) -> str:
+        stamp = time.strftime("%Y%m%d-%H%M%S") + f"-{time.time_ns() % 10**9:09d}"
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", name) or "action"
+        return os.path.join(self.directory, f"{stamp}-{safe}{suffix}")
+
+    @contextmanager
+    def action(self, name: str, snapshot: bool = False) -> Iterator[None]:
+        """Profile the enclosed block as the user action ``name``."""
+        if not self.enabled:
+            yield
+            return
+        # cProfile only sees the thread that enabled it, and nested
+        # profilers conflict: the outermost action of the thread wins.
+        if getattr(self._local, "active", False):
+            yield
+            return
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+            enabled = True
+        except ValueError as e:
+            # Python 3.12+ allows one profiler per process: another thread's
+            # action is being profiled.
+            print(f"Action {name} non profilée : {e}")
+            enabled = False
+        if not enabled:
+            yield
+            return
+
+        self._local.active = True
+        started = time.perf_counter()
+        try:
+            try:
+                yield
+            finally:
+                profile.disable()
+        finally:
+            self._local.active = False
+            self._write_profile(name, profile, time.perf_counter() - started)
+            if snapshot:
+                self.snapshot(name)
+
+    def _write_profile(self, name: str, profile: cProfile.Profile, elapsed: float):
+        try:
+            path = self._path(name, ".pstats")
+            profile.dump_stats(path)
+            summary = io.StringIO()
+            summary.write(f"Action : {name}\nDurée : {elapsed * 1000:.1f} ms\n\n")
+            stats = pstats.Stats(profile, stream=summary)
+            stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+            text_path = path[: -len(".pstats")] + ".txt"
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(summary.getvalue())
+            self.reports += [path, text_path]
+        except OSError as e:
+            print(f"Erreur lors de l'écriture du profil : {e}")
+
+    def snapshot(self, name: str) -> Optional[str]:
+        """Write the top allocations and their growth since the last snapshot."""
+        if not self.enabled or not tracemalloc.is_tracing():
+            return None
+        current = tracemalloc.take_snapshot().filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            )
+        )
+        lines = [f"Action : {name}"]
+        size, peak = tracemalloc.get_traced_memory()
+        lines.append(
+            f"Mémoire suivie : {size / 1024:.1f} KiB (pic {peak / 1024:.1f} KiB)"
+        )
+
+        lines.append("")
+        lines.append(f"Top {TOP_ALLOCATIONS} des allocations :")
+        for stat in current.statistics("lineno")[:TOP_ALLOCATIONS]:
+            lines.append(f"  {stat}")
+
+        if self._previous is not None:
+            lines.append("")
+            lines.append("Évolution depuis l'instantané précédent :")
+            for diff in current.compare_to(self._previous, "lineno")[:TOP_ALLOCATIONS]:
+                lines.append(f"  {diff}")
+        self._previous = current
+
+        try:
+            path = self._path(name, "-memory.txt")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError as e:
+            print(f"Erreur lors de l'écriture de l'instantané mémoire : {e}")
+            return None
+        self.reports.append(path)
+        return path
+
+
+def profiled(name: str, snapshot: bool = False) -> Callable[[F], F]:
+    """Decorate a user action so that ``action_profiler`` can profile it."""
+
+    def decorator(function: F) -> F:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not action_profiler.enabled:
+                return function(*args, **kwargs)
+            with action_profiler.action(name, snapshot):
+                return function(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def enable_from_env() -> bool:
+    """Enable profiling when ``SYSTEMD_MANAGER_PROFILE`` is set."""
+    value = os.environ.get(PROFILE_ENV, "")
+    if value in ("", "0"):
+        return False
+    action_profiler.enable(None if value == "1" else value)
+    return True
+
+
+action_profiler = ActionProfiler()
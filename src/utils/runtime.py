@@ -0,0 +1,318 @@
+"""Background task runtime shared by the GUI frames and dialogs.
+
+Blocking work used to be handled case by case: each dialog started its own
+thread and polled a result dict with ``after()``, the log views ran
+``journalctl`` on the Tk thread, and start/stop/restart blocked the window
+until ``systemctl`` returned. ``BackgroundRuntime`` replaces these with one
+mechanism:
+
+* an asyncio event loop runs on a single worker thread; blocking functions
+  are run by its bounded thread pool, coroutine functions on the loop itself;
+* results, errors and progress are handed back to Tk through a
+  ``TkDispatcher``: a thread-safe queue drained on the Tk thread by a single
+  ``after()`` pump, so widgets are never touched from another thread;
+* every task may have an ``owner`` (a frame or dialog): ``cancel_owner`` is
+  called when the window is destroyed, and the callbacks of its cancelled
+  tasks are never run (coroutines also receive ``CancelledError``).
+
+Usage::
+
+    runtime.submit(
+        controller.get_services,
+        owner=self, on_done=self.show_services, on_error=self.show_failure,
+    )
+
+Cancelling a blocking function only drops its callbacks: the worker thread
+runs it to the end. External commands that may run long (``journalctl``
+over days of logs) are therefore submitted as ``run_process``, an asyncio
+subprocess that is killed when its task is cancelled and does not hold a
+worker meanwhile.
+
+A function submitted with ``on_progress`` receives a ``progress`` keyword
+argument it can call with any value; ``on_progress`` gets it on the Tk
+thread. Without an attached dispatcher (headless code, tests) callbacks run
+on the runtime thread.
+"""
+
+import asyncio
+import functools
+import inspect
+import queue
+import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from src.utils.proctrace import record_command
+
+# Threads running the blocking tasks.
+MAX_WORKERS = 8
+
+# Period of the Tk-side pump, in milliseconds.
+DISPATCH_INTERVAL_MS = 20
+
+
+async def run_process(argv: List[str]) -> subprocess.CompletedProcess:
+    """Run ``argv`` and capture its output as text; killed when cancelled."""
+    started = time.time()
+    begin = time.perf_counter()
+    returncode: Optional[int] = None
+    process = await asyncio.create_subprocess_exec(
+        *argv, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE
+    )
+    try:
+        stdout, stderr = await process.communicate()
+        code = returncode = await process.wait()
+    except asyncio.CancelledError:
+        process.kill()
+        await process.wait()
+        raise
+    finally:
+        record_command(argv, started, time.perf_counter() - begin, returncode)
+    return subprocess.CompletedProcess(
+        argv,
+        code,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+
+class Task:
+    """
+    Handle on a submitted function.
+
+    Attributes:
+        name (str): Name used in error messages
+        owner: Frame or dialog the task belongs to, if any
+    """
+
+    def __init__(
+        self,
+        runtime: "BackgroundRuntime",
+        name: str,
+        owner: Any = None,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+    ):
+        self.name = name
+        self.owner = owner
+        self.on_done = on_done
+        self.on_error = on_error
+        self.on_progress = on_progress
+        self._runtime = runtime
+        self._cancelled = threading.Event()
+        self._future: Optional[Future] = None
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self._future is not None and self._future.done()
+
+    def cancel(self):
+        """Drop the task's callbacks; interrupt it if it is a coroutine."""
+        self._cancelled.set()
+        if self._future is not None:
+            self._future.cancel()
+
+    def report(self, value: Any):
+        """Send ``value`` to ``on_progress`` (callable from any thread)."""
+        if self.on_progress is not None and not self.cancelled:
+            self._runtime.dispatch(self._deliver, self.on_progress, value)
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        """Wait for the task and return its result (raises its exception)."""
+        assert self._future is not None
+        return self._future.result(timeout)
+
+    def _deliver(self, callback: Callable[[Any], Any], value: Any):
+        if not self.cancelled:
+            callback(value)
+
+
+class TkDispatcher:
+    """
+    Runs callables on the Tk thread, whichever thread asks for it.
+
+    Attributes:
+        interval_ms (int): Period of the pump draining the queue
+    """
+
+    def __init__(self, interval_ms: int = DISPATCH_INTERVAL_MS):
+        self.interval_ms = interval_ms
+        self._calls: "queue.SimpleQueue[tuple]" = queue.SimpleQueue()
+        self._widget: Any = None
+
+    @property
+    def attached(self) -> bool:
+        return self._widget is not None
+
+    def attach(self, widget):
+        """Start draining the queue on ``widget``'s event loop."""
+        self._widget = widget
+        widget.after(self.interval_ms, self._pump)
+
+    def detach(self):
+        self._widget = None
+
+    def call_soon(self, function: Callable, *args):
+        self._calls.put((function, args))
+
+    def pump(self):
+        """Run the queued calls (on the Tk thread)."""
+        while True:
+            try:
+                function, args = self._calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                function(*args)
+            except Exception as e:
+                print(f"Erreur lors du retour d'une tâche de fond : {e}")
+
+    def _pump(self):
+        if self._widget is None:
+            return
+        self.pump()
+        try:
+            self._widget.after(self.interval_ms, self._pump)
+        except Exception:
+            # The root window was destroyed.
+            self._widget = None
+
+
+class BackgroundRuntime:
+    """
+    Asyncio loop on a worker thread, shared by the whole GUI.
+
+    Attributes:
+        dispatcher (TkDispatcher): Delivers the callbacks on the Tk thread
+    """
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self.dispatcher = TkDispatcher()
+        self._max_workers = max_workers
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread: Optional[threading.Thread] = None
+        self._tasks: Dict[int, List[Task]] = {}
+        self._lock = threading.Lock()
+
+    def attach(self, widget):
+        """Deliver the callbacks on the event loop of ``widget`` (the root)."""
+        self.dispatcher.attach(widget)
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._executor = ThreadPoolExecutor(
+                    self._max_workers, thread_name_prefix="runtime-worker"
+                )
+                loop.set_default_executor(self._executor)
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="runtime", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+            return self._loop
+
+    def submit(
+        self,
+        function: Callable,
+        *args,
+        owner: Any = None,
+        on_done: Optional[Callable[[Any], Any]] = None,
+        on_error: Optional[Callable[[BaseException], Any]] = None,
+        on_progress: Optional[Callable[[Any], Any]] = None,
+        name: Optional[str] = None,
+    ) -> Task:
+        """Run ``function(*args)`` in the background; see the module docstring."""
+        task = Task(
+            self,
+            name or str(getattr(function, "__qualname__", repr(function))),
+            owner,
+            on_done,
+            on_error,
+            on_progress,
+        )
+        kwargs = {"progress": task.report} if on_progress is not None else {}
+
+        async def run():
+            if inspect.iscoroutinefunction(function):
+                return await function(*args, **kwargs)
+            return await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(function, *args, **kwargs)
+            )
+
+        if owner is not None:
+            with self._lock:
+                self._tasks.setdefault(id(owner), []).append(task)
+        future = asyncio.run_coroutine_threadsafe(run(), self._ensure_loop())
+        task._future = future
+        future.add_done_callback(lambda _: self._finish(task))
+        return task
+
+    def _finish(self, task: Task):
+        if task.owner is not None:
+            with self._lock:
+                tasks = self._tasks.get(id(task.owner), [])
+                if task in tasks:
+                    tasks.remove(task)
+                if not tasks:
+                    self._tasks.pop(id(task.owner), None)
+
+        future = task._future
+        if task.cancelled or future is None or future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            self.dispatch(task._deliver, task.on_error or self._report(task), error)
+        elif task.on_done is not None:
+            self.dispatch(task._deliver, task.on_done, future.result())
+
+    @staticmethod
+    def _report(task: Task) -> Callable[[BaseException], None]:
+        def report(error: BaseException):
+            print(f"Erreur dans la tâche de fond {task.name} : {error}")
+
+        return report
+
+    def dispatch(self, function: Callable, *args):
+        """Run ``function(*args)`` on the Tk thread (immediately if detached)."""
+        if self.dispatcher.attached:
+            self.dispatcher.call_soon(function, *args)
+        else:
+            function(*args)
+
+    def tasks(self, owner: Any) -> List[Task]:
+        with self._lock:
+            return list(self._tasks.get(id(owner), []))
+
+    def cancel_owner(self, owner: Any):
+        """Cancel every pending task of ``owner`` (call it from ``destroy``)."""
+        with self._lock:
+            tasks = self._tasks.pop(id(owner), [])
+        for task in tasks:
+            task.cancel()
+
+    def shutdown(self):
+        with self._lock:
+            loop, self._loop = self._loop, None
+            executor, self._executor = self._executor, None
+            thread, self._thread = self._thread, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout=5)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if loop is not None:
+            loop.close()
+
+
+runtime = BackgroundRuntime()
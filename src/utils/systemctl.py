@@ -0,0 +1,120 @@
+"""Batched ``systemctl`` queries.
+
+Asking systemd about N units one ``systemctl status`` at a time costs N process
+spawns and N D-Bus round trips. ``systemctl show`` accepts any number of units
+and prints one ``Key=Value`` block per unit, in argument order, separated by a
+blank line, so the state of a whole fleet can be fetched with a handful of
+processes (units are sent in chunks to stay well below ``ARG_MAX``).
+
+References:
+    * systemctl(1): ``show``, ``--property``.
+    * org.freedesktop.systemd1(5): ``ActiveState``, ``SubState``, ``NRestarts``.
+"""
+
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from src.utils.proctrace import run_command
+
+STATUS_PROPERTIES = [
+    "Id",
+    "LoadState",
+    "ActiveState",
+    "SubState",
+    "Result",
+    "NRestarts",
+]
+
+# Properties of the detailed per-unit records (``unit_record``).
+DETAIL_PROPERTIES = STATUS_PROPERTIES + ["UnitFileState", "MainPID", "MemoryCurrent"]
+
+# Directory holding the unit files generated by SystemdManager.
+UNIT_DIR = "/etc/systemd/system"
+
+# Units per ``systemctl show`` invocation.
+SHOW_CHUNK_SIZE = 200
+
+
+def unit_name(name: str) -> str:
+    """Return ``name`` with a ``.service`` suffix unless it already has a type."""
+    return name if "." in name else f"{name}.service"
+
+
+def parse_show_output(output: str) -> List[Dict[str, str]]:
+    """Split ``systemctl show`` output into one property dict per unit."""
+    blocks: List[Dict[str, str]] = []
+    current: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line:
+            if current:
+                blocks.append(current)
+                current = {}
+            continue
+        key, sep, value = line.partition("=")
+        if sep:
+            current[key] = value
+    if current:
+        blocks.append(current)
+    return blocks
+
+
+def show_units(
+    names: Iterable[str], properties: Sequence[str] = STATUS_PROPERTIES
+) -> Dict[str, Dict[str, str]]:
+    """Return the requested properties for every unit, keyed by the given name.
+
+    Units systemd does not know about are still reported (``LoadState`` is
+    ``not-found``). A unit whose chunk could not be queried is missing from the
+    result.
+    """
+    names = list(names)
+    props = list(properties)
+    if "Id" not in props:
+        props.insert(0, "Id")
+
+    result: Dict[str, Dict[str, str]] = {}
+    for start in range(0, len(names), SHOW_CHUNK_SIZE):
+        chunk = names[start : start + SHOW_CHUNK_SIZE]
+        try:
+            output = run_command(
+                ["systemctl", "show", f"--property={','.join(props)}", "--"]
+                + [unit_name(name) for name in chunk],
+                capture_output=True,
+                text=True,
+            ).stdout
+        except OSError as e:
+            print(f"Erreur lors de l'interrogation de systemctl : {e}")
+            continue
+
+        blocks = parse_show_output(output)
+        if len(blocks) == len(chunk):
+            result.update(zip(chunk, blocks))
+        else:
+            # Unexpected layout: fall back to matching on the unit Id.
+            by_id = {block.get("Id"): block for block in blocks}
+            for name in chunk:
+                if unit_name(name) in by_id:
+                    result[name] = by_id[unit_name(name)]
+    return result
+
+
+def _int_or_none(value: str) -> Optional[int]:
+    # systemctl prints "[not set]" or 2^64-1 when a value is unavailable.
+    if value.isdigit() and int(value) < 2**63:
+        return int(value)
+    return None
+
+
+def unit_record(name: str, properties: Dict[str, str]) -> dict:
+    """Convert ``systemctl show`` properties into a JSON-friendly record."""
+    main_pid = _int_or_none(properties.get("MainPID", ""))
+    return {
+        "name": name,
+        "load": properties.get("LoadState", "unknown"),
+        "active": properties.get("ActiveState", "unknown"),
+        "sub": properties.get("SubState", "unknown"),
+        "result": properties.get("Result", ""),
+        "restarts": _int_or_none(properties.get("NRestarts", "")) or 0,
+        "enabled": properties.get("UnitFileState", ""),
+        "main_pid": main_pid or None,
+        "memory_bytes": _int_or_none(properties.get("MemoryCurrent", "")),
+    }
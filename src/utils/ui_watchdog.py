@@ -0,0 +1,235 @@
+"""Event-loop lag watchdog of the GUI thread.
+
+A GUI freeze is blocking work on the Tk thread (a ``systemctl`` call in a
+button handler, a refresh rebuilding thousands of widgets...), but it used to
+be noticed only as "the window hung". ``UIWatchdog`` measures it:
+
+* a heartbeat scheduled with ``after(interval)`` records how late it runs:
+  that lateness is the time the event loop could not answer the user;
+* every Tk callback (event handlers, ``after`` jobs) is timed by the GUI,
+  which wraps ``tkinter.CallWrapper`` (see ``src.gui.utils.lag_indicator``);
+* a watcher thread samples the stack of the Tk thread while a callback has
+  been running for longer than ``threshold``, so the report points at the
+  blocking line, not only at the callback.
+
+Callbacks slower than ``threshold`` are printed with their stack sample and
+kept in ``events``; the optional status-bar indicator shows the lag
+percentiles and opens the recent events.
+
+Disabled by default: ``python3 src/main.py --watchdog`` or
+``SYSTEMD_MANAGER_WATCHDOG=1`` enables it (a number instead of ``1`` sets the
+threshold in milliseconds).
+"""
+
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional
+
+from src.utils.proctrace import percentile
+
+WATCHDOG_ENV = "SYSTEMD_MANAGER_WATCHDOG"
+
+# Callbacks running longer than this are reported, in seconds.
+DEFAULT_THRESHOLD = 0.15
+
+# Period of the heartbeat, in seconds.
+HEARTBEAT_INTERVAL = 0.1
+
+# Lag samples kept for the percentiles (one minute of heartbeats).
+MAX_SAMPLES = 600
+
+# Slow callbacks kept in memory.
+MAX_EVENTS = 100
+
+# Innermost frames kept in a stack sample.
+STACK_DEPTH = 15
+
+
+@dataclass
+class SlowCallback:
+    """
+    A callback that blocked the Tk thread for longer than the threshold.
+
+    Attributes:
+        callback (str): Qualified name of the callback
+        duration (float): Time it ran, in seconds
+        started (float): Start time (seconds since the epoch)
+        stack (List[str]): Stack of the Tk thread sampled while it ran
+    """
+
+    callback: str
+    duration: float
+    started: float
+    stack: List[str] = field(default_factory=list)
+
+    def format(self) -> str:
+        lines = [f"{self.callback} : {self.duration * 1000:.0f} ms"]
+        lines += [line.rstrip() for line in self.stack]
+        return "\n".join(lines)
+
+
+def callback_name(function: Any) -> str:
+    """Return ``module.qualname`` of a callback."""
+    function = getattr(function, "__func__", function)
+    name = getattr(function, "__qualname__", None) or repr(function)
+    module = getattr(function, "__module__", None)
+    return f"{module}.{name}" if module else name
+
+
+class _Running:
+    __slots__ = ("name", "started", "stack")
+
+    def __init__(self, name: str, started: float):
+        self.name = name
+        self.started = started
+        self.stack: Optional[List[str]] = None
+
+
+class UIWatchdog:
+    """
+    Lag and slow-callback recorder of the Tk thread.
+
+    Attributes:
+        enabled (bool): True when the watchdog runs
+        threshold (float): Callback duration reported as a block, in seconds
+        interval (float): Heartbeat period, in seconds
+        events (Deque[SlowCallback]): Most recent slow callbacks
+        slow_count (int): Slow callbacks seen since the watchdog started
+    """
+
+    def __init__(
+        self,
+        threshold: float = DEFAULT_THRESHOLD,
+        interval: float = HEARTBEAT_INTERVAL,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.enabled = False
+        self.threshold = threshold
+        self.interval = interval
+        self.events: Deque[SlowCallback] = deque(maxlen=MAX_EVENTS)
+        self.slow_count = 0
+        self._clock = clock
+        self._lags: Deque[float] = deque(maxlen=MAX_SAMPLES)
+        self._expected: Optional[float] = None
+        self._running: List[_Running] = []
+        self._thread_id: Optional[int] = None
+        self._widget: Any = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def enable(self, threshold: Optional[float] = None):
+        if threshold is not None:
+            self.threshold = threshold
+        self.enabled = True
+
+    # --- Tk thread ----------------------------------------------------------
+
+    def attach(self, widget):
+        """Start the heartbeat on ``widget``'s event loop and the watcher."""
+        if not self.enabled:
+            return
+        self._widget = widget
+        self._thread_id = threading.get_ident()
+        self._expected = self._clock() + self.interval
+        widget.after(int(self.interval * 1000), self._tick)
+        self._stop.clear()
+        threading.Thread(target=self._watch, name="ui-watchdog", daemon=True).start()
+
+    def _tick(self):
+        if self._widget is None:
+            return
+        self.beat()
+        try:
+            self._widget.after(int(self.interval * 1000), self._tick)
+        except Exception:
+            # The window is being destroyed.
+            self._widget = None
+
+    def beat(self):
+        """Record the lateness of the heartbeat due now."""
+        now = self._clock()
+        if self._expected is not None:
+            self._lags.append(max(0.0, now - self._expected))
+        self._expected = now + self.interval
+
+    @contextmanager
+    def callback(self, name: str) -> Iterator[None]:
+        """Time the enclosed Tk callback ``name``."""
+        if not self.enabled:
+            yield
+            return
+        running = _Running(name, self._clock())
+        with self._lock:
+            self._running.append(running)
+        wall = time.time()
+        try:
+            yield
+        finally:
+            duration = self._clock() - running.started
+            with self._lock:
+                self._running.remove(running)
+            if duration >= self.threshold:
+                self._report(SlowCallback(name, duration, wall, running.stack or []))
+
+    def _report(self, event: SlowCallback):
+        self.events.append(event)
+        self.slow_count += 1
+        print(f"Interface bloquée par {event.format()}", file=sys.stderr)
+
+    def detach(self):
+        self._widget = None
+        self._stop.set()
+
+    # --- watcher thread -----------------------------------------------------
+
+    def check(self):
+        """Sample the Tk thread's stack if a callback runs beyond the threshold."""
+        with self._lock:
+            running = self._running[-1] if self._running else None
+        if running is None or running.stack is not None:
+            return
+        if self._clock() - running.started < self.threshold:
+            return
+        frame = sys._current_frames().get(self._thread_id or threading.get_ident())
+        if frame is not None:
+            running.stack = traceback.format_stack(frame)[-STACK_DEPTH:]
+
+    def _watch(self):
+        # Checking a few times per threshold samples a block early enough to
+        # catch its culprit, at a negligible cost.
+        while not self._stop.wait(self.threshold / 3):
+            self.check()
+
+    # --- statistics ---------------------------------------------------------
+
+    def stats(self) -> Dict[str, float]:
+        """Heartbeat lag percentiles (ms) and slow callbacks seen."""
+        lags = sorted(self._lags)
+        return {
+            "p50_ms": percentile(lags, 50) * 1000,
+            "p95_ms": percentile(lags, 95) * 1000,
+            "max_ms": (lags[-1] if lags else 0.0) * 1000,
+            "slow": self.slow_count,
+        }
+
+
+def enable_from_env() -> bool:
+    """Enable the watchdog when ``SYSTEMD_MANAGER_WATCHDOG`` is set."""
+    value = os.environ.get(WATCHDOG_ENV, "")
+    if value in ("", "0"):
+        return False
+    try:
+        threshold = None if value == "1" else float(value) / 1000
+    except ValueError:
+        threshold = None
+    ui_watchdog.enable(threshold)
+    return True
+
+
+ui_watchdog = UIWatchdog()
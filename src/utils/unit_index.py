@@ -0,0 +1,289 @@
+"""In-memory index of the unit files known to systemd.
+
+Checking whether a unit name is taken used to be an ``os.path.exists`` on
+``/etc/systemd/system/<name>.service``: vendor units in ``/usr/lib``, runtime
+units and generator output were missed, and the check hit the filesystem on
+every validation. ``UnitIndex`` scans the whole system unit search path once
+(``os.scandir``, no ``systemctl list-unit-files`` process) and then answers
+from memory:
+
+* every search-path directory that exists is watched with inotify (through
+  ``ctypes``, non-blocking): a lookup drains the pending events with one
+  ``read`` and rescans only the directories that changed;
+* directories that cannot be watched (missing yet, inotify unavailable or out
+  of watches) are re-checked by mtime at most every ``POLL_INTERVAL`` seconds.
+
+When the same unit exists in several directories, the first one of the search
+path wins, as for systemd itself.
+
+References:
+    * systemd.unit(5), "Unit File Load Path".
+    * systemd.generator(7).
+    * inotify(7).
+"""
+
+import ctypes
+import os
+import struct
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.systemctl import unit_name
+
+# System unit search path, highest priority first (systemd.unit(5)).
+UNIT_SEARCH_PATHS = [
+    "/etc/systemd/system.control",
+    "/run/systemd/system.control",
+    "/run/systemd/transient",
+    "/run/systemd/generator.early",
+    "/etc/systemd/system",
+    "/etc/systemd/system.attached",
+    "/run/systemd/system",
+    "/run/systemd/system.attached",
+    "/run/systemd/generator",
+    "/usr/local/lib/systemd/system",
+    "/usr/lib/systemd/system",
+    "/lib/systemd/system",
+    "/run/systemd/generator.late",
+]
+
+UNIT_SUFFIXES = (
+    ".service",
+    ".socket",
+    ".target",
+    ".timer",
+    ".path",
+    ".mount",
+    ".automount",
+    ".swap",
+    ".slice",
+    ".scope",
+    ".device",
+)
+
+# Seconds between two mtime checks of a directory that is not watched.
+POLL_INTERVAL = 2.0
+
+# inotify(7) constants.
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ONLYDIR = 0x01000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = os.O_CLOEXEC
+_WATCH_MASK = (
+    _IN_CREATE
+    | _IN_DELETE
+    | _IN_MOVED_FROM
+    | _IN_MOVED_TO
+    | _IN_DELETE_SELF
+    | _IN_MOVE_SELF
+    | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class _Inotify:
+    """Minimal non-blocking inotify instance."""
+
+    def __init__(self, libc: ctypes.CDLL):
+        self._libc = libc
+        self.fd = libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1")
+
+    def add_watch(self, path: str) -> int:
+        wd = self._libc.inotify_add_watch(self.fd, os.fsencode(path), _WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_add_watch", path)
+        return wd
+
+    def read_events(self) -> List[Tuple[int, int]]:
+        """Return the pending ``(wd, mask)`` events without blocking."""
+        events: List[Tuple[int, int]] = []
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                events.append((wd, mask))
+                offset += _EVENT_HEADER.size + length
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _open_inotify() -> Optional[_Inotify]:
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return _Inotify(libc)
+    except (OSError, AttributeError):
+        return None
+
+
+def _dir_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _scan(directory: str) -> Dict[str, str]:
+    units = {}
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # Drop-in (".d") and dependency (".wants") directories never
+                # end with a unit suffix, so no stat is needed to skip them.
+                if entry.name.endswith(UNIT_SUFFIXES):
+                    units[entry.name] = entry.path
+    except OSError:
+        pass
+    return units
+
+
+class UnitIndex:
+    """
+    Unit files of the system search path, kept current by inotify.
+
+    Attributes:
+        paths (List[str]): Search-path directories, highest priority first
+        scans (int): Number of directory scans done so far
+    """
+
+    def __init__(self, paths: Optional[List[str]] = None, use_inotify: bool = True):
+        self.paths = list(UNIT_SEARCH_PATHS if paths is None else paths)
+        self.use_inotify = use_inotify
+        self.scans = 0
+        self._by_dir: Dict[str, Dict[str, str]] = {}
+        self._units: Dict[str, str] = {}
+        self._mtimes: Dict[str, Optional[int]] = {}
+        self._watches: Dict[int, str] = {}
+        self._inotify: Optional[_Inotify] = None
+        self._next_poll = 0.0
+        self._loaded = False
+        self._lock = threading.Lock()
+
+    def _watch(self, directory: str) -> bool:
+        if self._inotify is None:
+            return False
+        try:
+            wd = self._inotify.add_watch(directory)
+        except OSError:
+            return False
+        self._watches[wd] = directory
+        return True
+
+    def _rescan(self, directory: str):
+        self._by_dir[directory] = _scan(directory)
+        self._mtimes[directory] = _dir_mtime(directory)
+        self.scans += 1
+
+    def _merge(self):
+        units: Dict[str, str] = {}
+        for directory in self.paths:
+            for name, path in self._by_dir.get(directory, {}).items():
+                units.setdefault(name, path)
+        self._units = units
+
+    def _load(self):
+        if self.use_inotify and self._inotify is None:
+            self._inotify = _open_inotify()
+        for directory in self.paths:
+            # Watch before scanning so that no change falls in between.
+            self._watch(directory)
+            self._rescan(directory)
+        self._merge()
+        self._next_poll = time.monotonic() + POLL_INTERVAL
+        self._loaded = True
+
+    def _update(self):
+        if not self._loaded:
+            self._load()
+            return
+
+        changed = set()
+        if self._inotify is not None:
+            for wd, mask in self._inotify.read_events():
+                if mask & _IN_Q_OVERFLOW:
+                    changed.update(self.paths)
+                    continue
+                directory = self._watches.get(wd)
+                if directory is None:
+                    continue
+                changed.add(directory)
+                if mask & _IN_IGNORED:
+                    # Directory removed (generators are rewritten on every
+                    # daemon-reload): poll it until it comes back.
+                    del self._watches[wd]
+
+        now = time.monotonic()
+        if now >= self._next_poll:
+            self._next_poll = now + POLL_INTERVAL
+            watched = set(self._watches.values())
+            for directory in self.paths:
+                if directory in watched:
+                    continue
+                if _dir_mtime(directory) != self._mtimes.get(directory):
+                    changed.add(directory)
+
+        if changed:
+            watched = set(self._watches.values())
+            for directory in changed:
+                if directory not in watched:
+                    self._watch(directory)
+                self._rescan(directory)
+            self._merge()
+
+    def refresh(self):
+        """Rescan every directory of the search path."""
+        with self._lock:
+            if not self._loaded:
+                self._load()
+                return
+            for directory in self.paths:
+                self._rescan(directory)
+            self._merge()
+
+    def path(self, name: str) -> Optional[str]:
+        """Return the file defining unit ``name`` (``.service`` by default)."""
+        unit = unit_name(name)
+        with self._lock:
+            self._update()
+            found = self._units.get(unit)
+            if found is None and "@" in unit:
+                # Template instance: foo@bar.service comes from foo@.service.
+                prefix, _, rest = unit.partition("@")
+                found = self._units.get(f"{prefix}@{rest[rest.rfind('.') :]}")
+            return found
+
+    def exists(self, name: str) -> bool:
+        return self.path(name) is not None
+
+    def names(self, suffix: str = ".service") -> List[str]:
+        """Return the sorted names of the known units ending with ``suffix``."""
+        with self._lock:
+            self._update()
+            return sorted(name for name in self._units if name.endswith(suffix))
+
+    def close(self):
+        with self._lock:
+            if self._inotify is not None:
+                self._inotify.close()
+                self._inotify = None
+            self._watches.clear()
+            self._loaded = False
+
+
+unit_index = UnitIndex()
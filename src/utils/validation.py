@@ -0,0 +1,341 @@
+"""Validation of service configurations.
+
+``ServiceValidator`` checks one configuration (name, command, working
+directory, restart settings, user and group) and is used both by the GUI forms
+and by the headless ``lint`` command. Filesystem checks go through a
+``StatCache`` so that a path is stat'ed once per validation, or once per lint
+run when many configurations share the same cache.
+"""
+
+import os
+import re
+import shutil
+import stat
+import subprocess
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from src.utils.identity import identity_cache
+from src.utils.log_classifier import get_log_classifier
+from src.utils.proctrace import run_command
+from src.utils.unit_index import unit_index
+
+
+@dataclass
+class ValidationResult:
+    """
+    Data class representing the result of a service validation.
+
+    Attributes:
+        is_valid (bool): Whether the service configuration is valid
+        errors (List[str]): List of validation errors
+        warnings (List[str]): List of validation warnings
+    """
+
+    is_valid: bool
+    errors: List[str]
+    warnings: List[str]
+
+
+class StatCache:
+    """
+    Memoized ``stat``/``access`` results, shared by concurrent validations.
+
+    Entries never expire: a cache lives for one validation or one lint run.
+
+    Attributes:
+        stats (Dict[str, Optional[os.stat_result]]): stat result by path
+            (None when the path does not exist)
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, Optional[os.stat_result]] = {}
+        self._access: Dict[Tuple[str, int], bool] = {}
+
+    def stat(self, path: str) -> Optional[os.stat_result]:
+        try:
+            return self.stats[path]
+        except KeyError:
+            pass
+        try:
+            result: Optional[os.stat_result] = os.stat(path)
+        except (OSError, ValueError):
+            result = None
+        self.stats[path] = result
+        return result
+
+    def exists(self, path: str) -> bool:
+        return self.stat(path) is not None
+
+    def isfile(self, path: str) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISREG(result.st_mode)
+
+    def isdir(self, path: str) -> bool:
+        result = self.stat(path)
+        return result is not None and stat.S_ISDIR(result.st_mode)
+
+    def access(self, path: str, mode: int) -> bool:
+        key = (path, mode)
+        try:
+            return self._access[key]
+        except KeyError:
+            pass
+        try:
+            allowed = os.access(path, mode)
+        except ValueError:
+            allowed = False
+        self._access[key] = allowed
+        return allowed
+
+
+class ServiceValidator:
+    """
+    Validator class for systemd service configurations.
+
+    This class provides methods to validate various aspects of a systemd service
+    configuration including service name, command, working directory, and user settings.
+
+    Attributes:
+        errors (List[str]): List of validation errors
+        warnings (List[str]): List of validation warnings
+        stat_cache (Optional[StatCache]): Cache shared across validations
+            (a fresh one is used for each validation when None)
+        new_service (bool): Warn when a unit with the same name is installed
+            (creation forms); False for already stored services
+    """
+
+    def __init__(
+        self, stat_cache: Optional[StatCache] = None, new_service: bool = True
+    ):
+        self.errors: List[str] = []
+        self.warnings: List[str] = []
+        self.stat_cache = stat_cache
+        self.new_service = new_service
+        self._stats = stat_cache or StatCache()
+
+    def validate_service_config(self, config: Dict) -> ValidationResult:
+
+        self.errors = []
+        self.warnings = []
+        self._stats = self.stat_cache or StatCache()
+
+        self._validate_service_name(config.get("name", ""))
+
+        self._validate_command(config.get("command", ""))
+
+        self._validate_working_directory(config.get("working_directory", ""))
+
+        self._validate_restart_config(
+            config.get("restart", "no"),
+            config.get("restart_sec", "0"),
+            config.get("max_restarts", "3"),
+        )
+
+        self._validate_user(config.get("user", ""))
+
+        self._validate_group(config.get("group", ""))
+
+        return ValidationResult(
+            is_valid=len(self.errors) == 0,
+            errors=self.errors.copy(),
+            warnings=self.warnings.copy(),
+        )
+
+    def _validate_service_name(self, name: str) -> None:
+
+        if not name:
+            self.errors.append("Le nom du service est requis")
+            return
+
+        if len(name) > 255:
+            self.errors.append(
+                "Le nom du service est trop long (maximum 255 caractères)"
+            )
+
+        if not re.match(r"^[a-zA-Z][a-zA-Z0-9-_]*$", name):
+            self.errors.append(
+                "Le nom du service doit commencer par une lettre et ne contenir que des lettres, chiffres, tirets et underscores"
+            )
+
+        if self.new_service:
+            existing = unit_index.path(name)
+            if existing is not None:
+                self.warnings.append(
+                    f"Un service nommé '{name}' existe déjà ({existing})"
+                )
+
+    def _validate_command(self, command: str) -> None:
+
+        if not command:
+            self.errors.append("La commande est requise")
+            return
+
+        if len(command) > 1024:
+            self.errors.append("La commande est trop longue (maximum 1024 caractères)")
+
+        cmd_parts = command.split()
+        if not cmd_parts:
+            self.errors.append("La commande ne peut pas être vide")
+            return
+
+        executable = cmd_parts[0]
+
+        if not os.path.isabs(executable):
+            self.errors.append("L'exécutable doit être spécifié avec un chemin absolu")
+            return
+
+        if not self._stats.exists(executable):
+            self.errors.append(f"L'exécutable '{executable}' n'existe pas")
+        elif not self._stats.isfile(executable):
+            self.errors.append(f"'{executable}' n'est pas un fichier")
+        elif not self._stats.access(executable, os.X_OK):
+            if not executable.endswith((".sh", ".py", ".bash", ".js")):
+                self.errors.append(
+                    f"'{executable}' n'a pas les permissions d'exécution"
+                )
+
+    def _validate_working_directory(self, directory: str) -> None:
+
+        if not directory:
+            return
+
+        if len(directory) > 4096:
+            self.errors.append(
+                "Le chemin du répertoire est trop long (maximum 4096 caractères)"
+            )
+            return
+
+        if not os.path.isabs(directory):
+            self.errors.append("Le répertoire de travail doit être un chemin absolu")
+            return
+
+        if not self._stats.exists(directory):
+            self.errors.append(f"Le répertoire '{directory}' n'existe pas")
+        elif not self._stats.isdir(directory):
+            self.errors.append(f"'{directory}' n'est pas un répertoire")
+        else:
+            if not self._stats.access(directory, os.R_OK):
+                self.warnings.append(f"Le répertoire '{directory}' n'est pas lisible")
+            if not self._stats.access(directory, os.W_OK):
+                self.warnings.append(
+                    f"Le répertoire '{directory}' n'est pas accessible en écriture"
+                )
+            if not self._stats.access(directory, os.X_OK):
+                self.warnings.append(
+                    f"Le répertoire '{directory}' n'est pas accessible en exécution"
+                )
+
+    def _validate_restart_config(
+        self, restart: str, restart_sec: str, max_restarts: str
+    ) -> None:
+
+        valid_restart_values = [
+            "no",
+            "always",
+            "on-failure",
+            "on-abnormal",
+            "on-abort",
+            "on-watchdog",
+        ]
+        if restart not in valid_restart_values:
+            self.errors.append(
+                f"Valeur de redémarrage invalide. Valeurs autorisées : {', '.join(valid_restart_values)}"
+            )
+
+        try:
+            restart_sec_val = int(restart_sec)
+            if restart_sec_val < 0:
+                self.errors.append("Le délai de redémarrage ne peut pas être négatif")
+            elif restart_sec_val > 300:
+                self.warnings.append(
+                    "Un délai de redémarrage supérieur à 5 minutes pourrait être problématique"
+                )
+        except ValueError:
+            self.errors.append("Le délai de redémarrage doit être un nombre entier")
+
+        try:
+            max_restarts_val = int(max_restarts)
+            if max_restarts_val < 0:
+                self.errors.append(
+                    "Le nombre maximum de redémarrages ne peut pas être négatif"
+                )
+            elif max_restarts_val == 0:
+                self.warnings.append(
+                    "Un nombre de redémarrages de 0 désactivera tout redémarrage automatique"
+                )
+            elif max_restarts_val > 100:
+                self.warnings.append(
+                    "Un nombre élevé de redémarrages pourrait indiquer un problème"
+                )
+        except ValueError:
+            self.errors.append(
+                "Le nombre maximum de redémarrages doit être un nombre entier"
+            )
+
+    def _validate_user(self, user: str) -> None:
+
+        if not user:
+            self.errors.append("L'utilisateur est requis")
+            return
+
+        if not identity_cache.user_exists(user):
+            self.errors.append(f"L'utilisateur '{user}' n'existe pas dans le système")
+
+    def _validate_group(self, group: str) -> None:
+
+        if group and not identity_cache.group_exists(group):
+            self.errors.append(f"Le groupe '{group}' n'existe pas dans le système")
+
+    def _command_exists_in_path(self, command: str) -> bool:
+
+        return shutil.which(command) is not None
+
+    def analyze_service_status(self, service_name: str) -> Tuple[str, List[str]]:
+
+        try:
+            status_output = run_command(
+                ["systemctl", "status", f"{service_name}.service"],
+                capture_output=True,
+                text=True,
+            )
+
+            journal_output = run_command(
+                [
+                    "journalctl",
+                    "-u",
+                    f"{service_name}.service",
+                    "-n",
+                    "50",
+                    "--no-pager",
+                ],
+                capture_output=True,
+                text=True,
+            )
+
+            status = self._parse_service_status(status_output.stdout)
+            errors = self._analyze_service_logs(journal_output.stdout)
+
+            return status, errors
+
+        except subprocess.CalledProcessError as e:
+            return "error", [f"Erreur lors de l'analyse du service: {str(e)}"]
+
+    def _parse_service_status(self, status_output: str) -> str:
+
+        if (
+            "Active: inactive" in status_output
+            or "Active: dead" in status_output
+            or "Stopped" in status_output
+        ):
+            return "inactive"
+        elif "Active: active (running)" in status_output:
+            return "active"
+        elif "Active: failed" in status_output:
+            return "failed"
+        else:
+            return "unknown"
+
+    def _analyze_service_logs(self, logs: str) -> List[str]:
+
+        return [stats.message for stats in get_log_classifier().classify(logs)]
@@ -0,0 +1,125 @@
+"""Tests for the cgroup v2 resource sampler.
+
+The cgroup hierarchy is faked in a temporary directory and the clock is patched.
+"""
+
+import os
+
+from src.utils import cgroup
+from src.utils.cgroup import (
+    CgroupSampler,
+    cgroup_path,
+    format_bytes,
+    sparkline,
+    unit_name_escape,
+)
+
+
+def _write_cgroup(root, unit, usage_usec, memory=1024, pids=1):
+    directory = root / unit
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / "cpu.stat").write_text(
+        f"usage_usec {usage_usec}\nuser_usec 0\nsystem_usec 0\n"
+    )
+    (directory / "memory.current").write_text(f"{memory}\n")
+    (directory / "pids.current").write_text(f"{pids}\n")
+
+
+def test_cgroup_path_handles_template_instances():
+    assert cgroup_path("web", "/cg") == "/cg/web.service"
+    assert cgroup_path("worker@2", "/cg") == "/cg/system-worker.slice/worker@2.service"
+    assert (
+        cgroup_path("my-worker@2", "/cg")
+        == "/cg/system-my\\x2dworker.slice/my-worker@2.service"
+    )
+
+
+def test_unit_name_escape_follows_systemd_escape():
+    assert unit_name_escape("systemd-fsck") == "systemd\\x2dfsck"
+    assert unit_name_escape("a/b") == "a-b"
+    assert unit_name_escape(".hidden.x") == "\\x2ehidden.x"
+    assert unit_name_escape("café") == "caf\\xc3\\xa9"
+
+
+def test_sample_computes_cpu_percent_from_deltas(tmp_path, monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(cgroup.time, "monotonic", lambda: now[0])
+    sampler = CgroupSampler(root=str(tmp_path), history=3)
+
+    _write_cgroup(tmp_path, "web.service", 1_000_000, memory=50 * 1024 * 1024, pids=4)
+    usage = sampler.sample(["web", "stopped"])
+    assert usage["web"].cpu_percent is None  # no previous sample yet
+    assert usage["web"].memory_bytes == 50 * 1024 * 1024
+    assert usage["web"].pids == 4
+    assert usage["stopped"].memory_bytes is None
+
+    for _ in range(4):
+        now[0] += 2.0
+        _write_cgroup(
+            tmp_path, "web.service", sampler.usage["web"].last_reading[1] + 500_000
+        )
+        sampler.sample(["web", "stopped"])
+
+    # 0.5 s of CPU over 2 s of wall-clock time.
+    assert sampler.usage["web"].cpu_percent == 25.0
+    assert list(sampler.usage["web"].cpu_history) == [25.0, 25.0, 25.0]
+
+
+def test_sample_resets_on_restart_and_forgets_removed(tmp_path, monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr(cgroup.time, "monotonic", lambda: now[0])
+    sampler = CgroupSampler(root=str(tmp_path))
+
+    _write_cgroup(tmp_path, "web.service", 5_000_000)
+    _write_cgroup(tmp_path, "db.service", 0)
+    sampler.sample(["web", "db"])
+    now[0] = 1.0
+    _write_cgroup(tmp_path, "web.service", 10)  # fresh cgroup after a restart
+    sampler.sample(["web"])
+
+    assert sampler.usage["web"].cpu_percent is None
+    assert "db" not in sampler.usage
+
+
+def test_format_bytes_and_sparkline():
+    assert format_bytes(None) == "—"
+    assert format_bytes(512) == "512 B"
+    assert format_bytes(3 * 1024 * 1024) == "3.0 MiB"
+    assert sparkline([0, 50, 100]) == "▁▅█"
+    assert sparkline([1, 2, 3, 4], width=2) == "▆█"
+    assert sparkline([]) == ""
+
+
+def test_sampling_reuses_directory_descriptors(tmp_path, monkeypatch):
+    # The timing of a tick is measured by ``benchmarks.micro`` (cgroup_sample).
+    names = [f"svc{i}" for i in range(500)]
+    for name in names:
+        _write_cgroup(tmp_path, f"{name}.service", 1000)
+    sampler = CgroupSampler(root=str(tmp_path))
+    sampler.sample(names)
+
+    opened = []
+    real_open = os.open
+
+    def counting_open(path, flags, *args, **kwargs):
+        opened.append((path, kwargs.get("dir_fd")))
+        return real_open(path, flags, *args, **kwargs)
+
+    monkeypatch.setattr(cgroup.os, "open", counting_open)
+    fds_before = len(os.listdir("/proc/self/fd"))
+    sampler.sample(names)
+    monkeypatch.undo()
+
+    # Three relative opens per service, no path walk from the root, and
+    # every file descriptor closed again.
+    assert len(opened) == 3 * len(names)
+    assert all(dir_fd is not None for _, dir_fd in opened)
+    assert {path for path, _ in opened} == {
+        "cpu.stat",
+        "memory.current",
+        "pids.current",
+    }
+    assert len(os.listdir("/proc/self/fd")) == fds_before
+
+    sampler.close()
+    assert sampler._dir_fds == {}
@@ -0,0 +1,161 @@
+"""Tests for the headless command-line interface.
+
+``subprocess`` and the batched ``systemctl show`` are mocked: no systemctl or
+journalctl process is spawned.
+"""
+
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cli.commands import EXIT_FAILURE, EXIT_NOT_ACTIVE, EXIT_OK, run
+from src.models.service_model import ServiceModel
+
+
+@pytest.fixture(autouse=True)
+def no_daemon(tmp_path, monkeypatch):
+    # Never talk to a daemon that may run on the machine.
+    monkeypatch.setenv("SYSTEMD_MANAGER_SOCKET", str(tmp_path / "absent.sock"))
+
+
+@pytest.fixture
+def services_dir(tmp_path):
+    directory = tmp_path / "services"
+    directory.mkdir()
+    for name in ["web", "db"]:
+        service = ServiceModel(name)
+        service.unit.description = f"{name} service"
+        service.service.exec_start = f"/usr/bin/{name}"
+        service.save_to_json(str(directory / f"{name}.json"))
+    return directory
+
+
+def _state(active, restarts="0"):
+    return {
+        "LoadState": "loaded",
+        "ActiveState": active,
+        "SubState": "running" if active == "active" else "dead",
+        "NRestarts": restarts,
+        "UnitFileState": "enabled",
+        "MainPID": "42" if active == "active" else "0",
+        "MemoryCurrent": "1048576" if active == "active" else "[not set]",
+    }
+
+
+@patch("src.cli.commands.show_units")
+def test_list_json_uses_one_batched_query(mock_show, services_dir, capsys):
+    mock_show.return_value = {"web": _state("active", "2"), "db": _state("failed")}
+
+    code = run(["--services-dir", str(services_dir), "list", "--json"])
+
+    assert code == EXIT_OK
+    mock_show.assert_called_once()
+    records = json.loads(capsys.readouterr().out)
+    assert [r["name"] for r in records] == ["db", "web"]
+    assert records[1]["restarts"] == 2
+    assert records[1]["memory_bytes"] == 1048576
+    assert records[0]["main_pid"] is None
+    assert records[0]["memory_bytes"] is None
+
+
+@patch("src.cli.commands.show_units")
+def test_status_exit_code_reflects_activity(mock_show, capsys):
+    mock_show.return_value = {"web": _state("active"), "db": _state("inactive")}
+    assert run(["status", "web", "db"]) == EXIT_NOT_ACTIVE
+    output = capsys.readouterr().out
+    assert output.splitlines()[0].split()[:3] == ["UNIT", "LOAD", "ACTIVE"]
+
+    mock_show.return_value = {"web": _state("active")}
+    assert run(["status", "web"]) == EXIT_OK
+
+
+def test_invalid_service_name_is_rejected(capsys):
+    assert run(["start", "../etc/passwd"]) == EXIT_FAILURE
+    assert "invalide" in capsys.readouterr().err
+
+
+@patch("subprocess.run")
+def test_start_many_services_in_one_call(mock_run, services_dir):
+    mock_run.return_value = MagicMock(returncode=0)
+
+    code = run(["--services-dir", str(services_dir), "start", "--all", "extra"])
+
+    assert code == EXIT_OK
+    mock_run.assert_called_once_with(
+        ["systemctl", "start", "--", "extra.service", "db.service", "web.service"]
+    )
+
+
+@patch("subprocess.run")
+def test_apply_writes_changed_units_and_reloads_once(
+    mock_run, services_dir, tmp_path, capsys
+):
+    mock_run.return_value = MagicMock(returncode=0)
+    unit_dir = tmp_path / "units"
+    unit_dir.mkdir()
+    web = ServiceModel.load_from_json(str(services_dir / "web.json"))
+    (unit_dir / "web.service").write_text(web.to_systemd_file())
+
+    args = ["--services-dir", str(services_dir), "apply", "--all", "--json"]
+    code = run(args + ["--unit-dir", str(unit_dir), "--restart"])
+
+    assert code == EXIT_OK
+    result = json.loads(capsys.readouterr().out)
+    assert result["changed"] == ["db"]
+    assert result["unchanged"] == ["web"]
+    assert (unit_dir / "db.service").read_text().startswith("[Unit]")
+    assert [c.args[0] for c in mock_run.call_args_list] == [
+        ["systemctl", "daemon-reload"],
+        ["systemctl", "try-restart", "--", "db.service"],
+    ]
+
+
+@patch("subprocess.run")
+def test_apply_without_systemctl_fails_cleanly(
+    mock_run, services_dir, tmp_path, capsys
+):
+    mock_run.side_effect = FileNotFoundError("systemctl")
+    # The file name, not the unit name inside it, is what the user asked for.
+    renamed = ServiceModel("web-v2")
+    renamed.service.exec_start = "/usr/bin/web"
+    renamed.save_to_json(str(services_dir / "web.json"))
+    unit_dir = tmp_path / "units"
+    unit_dir.mkdir()
+
+    args = ["--services-dir", str(services_dir), "apply", "--all", "--json"]
+    code = run(args + ["--unit-dir", str(unit_dir)])
+
+    assert code == EXIT_FAILURE
+    captured = capsys.readouterr()
+    assert "systemctl" in captured.err
+    result = json.loads(captured.out)
+    assert result["changed"] == ["db", "web"]
+    assert result["unchanged"] == []
+    assert (unit_dir / "web-v2.service").exists()
+
+
+@patch("subprocess.run")
+def test_logs_merges_units_in_one_journalctl(mock_run):
+    mock_run.return_value = MagicMock(returncode=0)
+
+    assert run(["logs", "web", "db", "-n", "10", "--json"]) == EXIT_OK
+
+    command = mock_run.call_args.args[0]
+    assert command[:4] == ["journalctl", "--no-pager", "-n", "10"]
+    assert command.count("-u") == 2
+    assert "--output=json" in command
+
+
+def test_commands_module_does_not_load_interactive_interfaces():
+    import subprocess
+
+    code = (
+        "import sys, src.cli.commands; "
+        "print(any(m in sys.modules for m in ('questionary', 'customtkinter')))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+    assert output.strip() == "False"
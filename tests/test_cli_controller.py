@@ -1,5 +1,6 @@
 import json
 import os
+import pwd
 import tempfile
 from unittest.mock import MagicMock, mock_open, patch
 
@@ -7,6 +8,7 @@ import pytest
 
 from src.cli.cli_controller import CLIController
 from src.models.service_model import ServiceModel
+from src.utils.identity import IdentityCache
 
 
 def test_setup_directories(cli_controller, temp_dir):
@@ -36,16 +38,23 @@ def test_get_system_users():
 
     controller = CLIController()
 
-    passwd_content = (
-        "root:x:0:0:root:/root:/bin/bash\n"
-        "user1:x:1000:1000:User One:/home/user1:/bin/bash\n"
-        "user2:x:1001:1001:User Two:/home/user2:/bin/bash\n"
-        "nobody:x:65534:65534:Nobody:/:/usr/sbin/nologin\n"
-    )
-
-    mock_file = mock_open(read_data=passwd_content)
+    passwd_entries = [
+        pwd.struct_passwd(("root", "x", 0, 0, "root", "/root", "/bin/bash")),
+        pwd.struct_passwd(
+            ("user1", "x", 1000, 1000, "User One", "/home/user1", "/bin/bash")
+        ),
+        pwd.struct_passwd(
+            ("user2", "x", 1001, 1001, "User Two", "/home/user2", "/bin/bash")
+        ),
+        pwd.struct_passwd(
+            ("nobody", "x", 65534, 65534, "Nobody", "/", "/usr/sbin/nologin")
+        ),
+    ]
 
-    with patch("builtins.open", mock_file):
+    with (
+        patch("pwd.getpwall", return_value=passwd_entries),
+        patch("src.cli.cli_controller.identity_cache", IdentityCache()),
+    ):
         users = controller.get_system_users()
         print(f"\nUtilisateurs trouvés : {users}")
         assert isinstance(users, list)
@@ -120,6 +129,25 @@ def test_service_operations(mock_run, cli_controller):
     mock_run.assert_any_call(["systemctl", "restart", "test-service"])
 
 
+@patch("subprocess.run")
+def test_save_service_changes_reloads_then_restarts_once(
+    mock_run, cli_controller, basic_service
+):
+
+    mock_run.return_value = MagicMock(returncode=0)
+    with patch("src.cli.cli_controller.open", mock_open(), create=True) as unit_file:
+        cli_controller.save_service_changes(basic_service)
+
+    unit_file.assert_called_once_with(
+        f"/etc/systemd/system/{basic_service.name}.service", "w"
+    )
+    # No separate stop: restart stops the unit itself.
+    assert [call.args[0] for call in mock_run.call_args_list] == [
+        ["systemctl", "daemon-reload"],
+        ["systemctl", "restart", basic_service.name],
+    ]
+
+
 @patch("subprocess.run")
 def test_get_service_status_uses_no_shell_list_args(mock_run, cli_controller):
     mock_run.return_value = MagicMock(stdout="active\n")
@@ -0,0 +1,182 @@
+"""Tests for the resident daemon and its clients.
+
+The daemon serves a socket in a temporary directory; ``systemctl show``,
+``journalctl`` and the journal follower are mocked.
+"""
+
+import json
+import queue
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cli.commands import run
+from src.daemon import DaemonClient, DaemonError, connect_daemon
+from src.daemon.server import IDLE_SECONDS, ManagerDaemon
+from src.models.service_model import ServiceModel
+from src.utils.cgroup import CgroupSampler
+from src.utils.journal import JournalEntry
+
+
+def _states(names, properties=None):
+    return {
+        name: {"Id": f"{name}.service", "LoadState": "loaded", "ActiveState": "active"}
+        for name in names
+    }
+
+
+@pytest.fixture
+def daemon(tmp_path):
+    services_dir = tmp_path / "services"
+    services_dir.mkdir()
+    for name in ["web", "db"]:
+        ServiceModel(name).save_to_json(str(services_dir / f"{name}.json"))
+
+    follower = MagicMock()
+    follower.subscribe.return_value = 7
+    with patch("src.daemon.server.show_units", side_effect=_states) as show:
+        manager = ManagerDaemon(
+            str(services_dir),
+            socket_path=str(tmp_path / "d.sock"),
+            refresh_interval=3600,
+            sampler=CgroupSampler(root=str(tmp_path / "cgroup")),
+            follower=follower,
+        )
+        manager.start()
+        manager.show_units = show
+        yield manager
+        manager.shutdown()
+
+
+def test_status_is_served_from_cache(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        assert client.call("ping")["services"] == 2
+        names = [record["name"] for record in client.call("list")]
+        for _ in range(10):
+            records = client.call("status", services=["web", "db"])
+
+    assert names == ["db", "web"]
+    assert [r["active"] for r in records] == ["active", "active"]
+    # Only the initial refresh queried systemd.
+    assert daemon.show_units.call_count == 1
+
+
+def test_unknown_unit_is_fetched_once_then_watched(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        client.call("status", services=["sshd"])
+        client.call("status", services=["sshd"])
+    assert daemon.show_units.call_count == 2
+
+    daemon.refresh()
+    assert "sshd" in daemon.show_units.call_args.args[0]
+
+
+def test_idle_unknown_unit_is_no_longer_watched(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        client.call("status", services=["sshd"])
+    daemon._extra_units["sshd"] -= IDLE_SECONDS + 1
+
+    daemon.refresh()
+    daemon.refresh()
+    assert "sshd" not in daemon.show_units.call_args.args[0]
+    assert "sshd" not in daemon.states
+
+
+def test_errors_are_reported_to_the_client(daemon):
+    with DaemonClient(daemon.socket_path) as client:
+        with pytest.raises(DaemonError):
+            client.call("status", services=["../evil"])
+        with pytest.raises(DaemonError):
+            client.call("nope")
+        # The connection stays usable after an error.
+        assert client.call("ping")["services"] == 2
+
+
+@patch("subprocess.run")
+def test_logs_are_seeded_once_then_followed(mock_run, daemon):
+    backlog = [
+        {"__CURSOR": f"c{i}", "__REALTIME_TIMESTAMP": str(i), "MESSAGE": f"old {i}"}
+        for i in range(3)
+    ]
+    mock_run.return_value = MagicMock(stdout="\n".join(json.dumps(e) for e in backlog))
+
+    with DaemonClient(daemon.socket_path) as client:
+        first = client.call("logs", services=["web"], lines=2)
+        entries: queue.Queue = daemon.follower.subscribe.call_args.args[1]
+        # A duplicate of the backlog and a new line arrive from the follower.
+        for cursor, message in [("c2", "old 2"), ("c3", "new")]:
+            entries.put(
+                JournalEntry(
+                    cursor=cursor, usec=9, unit="", identifier="web", message=message
+                )
+            )
+        second = client.call("logs", services=["web"], lines=10)
+
+    assert [e["message"] for e in first] == ["old 1", "old 2"]
+    assert [e["message"] for e in second] == ["old 0", "old 1", "old 2", "new"]
+    mock_run.assert_called_once()
+    daemon.follower.subscribe.assert_called_once()
+
+
+@patch("subprocess.run")
+def test_logs_backlog_is_read_without_the_lock(mock_run, daemon):
+    def read_backlog(*args, **kwargs):
+        # The request runs in a server thread: another thread must be able
+        # to take the lock while journalctl runs.
+        probe = threading.Thread(target=try_lock)
+        probe.start()
+        probe.join()
+        return MagicMock(stdout="")
+
+    def try_lock():
+        acquired = daemon._lock.acquire(blocking=False)
+        if acquired:
+            daemon._lock.release()
+        locked.append(not acquired)
+
+    locked: list = []
+    mock_run.side_effect = read_backlog
+    with DaemonClient(daemon.socket_path) as client:
+        client.call("logs", services=["web"])
+    assert locked == [False]
+
+
+def test_stale_socket_is_replaced(tmp_path):
+    stale = tmp_path / "stale.sock"
+    stale.write_text("")
+    assert connect_daemon(str(stale)) is None
+
+    with patch("src.daemon.server.show_units", side_effect=_states):
+        manager = ManagerDaemon(
+            str(tmp_path), socket_path=str(stale), follower=MagicMock()
+        )
+        manager.start()
+        try:
+            assert connect_daemon(str(stale)) is not None
+            second = ManagerDaemon(str(tmp_path), socket_path=str(stale))
+            with pytest.raises(RuntimeError):
+                second.start()
+        finally:
+            manager.shutdown()
+
+
+@patch("src.cli.commands.show_units")
+def test_cli_status_uses_running_daemon(mock_show, daemon, capsys):
+    code = run(["--socket", daemon.socket_path, "status", "web", "--json"])
+
+    assert code == 0
+    assert json.loads(capsys.readouterr().out)[0]["name"] == "web"
+    mock_show.assert_not_called()
+
+
+@patch("src.cli.commands.run_command", return_value=MagicMock(returncode=0))
+def test_cli_operation_refreshes_the_daemon_cache(mock_run, daemon):
+    calls = daemon.show_units.call_count
+    code = run(["--socket", daemon.socket_path, "stop", "web"])
+
+    assert code == 0
+    mock_run.assert_called_once()
+    # Only the unit just stopped is refetched, not the whole fleet.
+    assert daemon.show_units.call_count == calls + 1
+    assert daemon.show_units.call_args.args[0] == ["web"]
@@ -0,0 +1,88 @@
+"""Tests for the scandir-based directory listing and the paginated browser."""
+
+import os
+from unittest.mock import patch
+
+from src.cli.cli_controller import CLIController
+from src.cli.cli_translations import TranslationKeys, cli_translations
+from src.utils.dirlist import (
+    PAGE_SIZE,
+    DirectoryListing,
+    filter_names,
+    list_subdirectories,
+    paginate,
+)
+
+
+def _tree(tmp_path, count):
+    for i in range(count):
+        (tmp_path / f"dir{i:04d}").mkdir()
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / "file.txt").write_text("")
+    os.symlink(tmp_path / "dir0000", tmp_path / "link")
+    return tmp_path
+
+
+def test_list_subdirectories_skips_files_and_hidden(tmp_path):
+    _tree(tmp_path, 3)
+    assert list_subdirectories(str(tmp_path)) == [
+        "dir0000",
+        "dir0001",
+        "dir0002",
+        "link",
+    ]
+    assert ".hidden" in list_subdirectories(str(tmp_path), show_hidden=True)
+
+
+def test_filter_and_paginate():
+    names = [f"app{i}" for i in range(450)] + ["Backup"]
+    assert filter_names(names, " BACK") == ["Backup"]
+    page, index, pages = paginate(names, 7)
+    assert (len(page), index, pages) == (51, 2, 3)
+    assert paginate([], 0) == ([], 0, 1)
+
+
+def test_listing_runs_in_background_and_can_be_cancelled(tmp_path):
+    _tree(tmp_path, 1200)
+    listing = DirectoryListing(str(tmp_path)).start()
+    assert listing.wait(5)
+    assert listing.count() == 1201
+    assert listing.matching("dir000")[:2] == ["dir0000", "dir0001"]
+    assert listing.error is None
+
+    missing = DirectoryListing(str(tmp_path / "missing")).start()
+    assert missing.wait(5) and isinstance(missing.error, FileNotFoundError)
+
+    cancelled = DirectoryListing(str(tmp_path))
+    cancelled.cancel()
+    cancelled.start().wait(5)
+    assert cancelled.done and cancelled.count() == 0
+
+
+def test_cli_browser_pages_and_filters(tmp_path):
+    _tree(tmp_path, PAGE_SIZE + 50)
+    controller = CLIController()
+    text = cli_translations.get_text
+
+    with (
+        patch("questionary.select") as mock_select,
+        patch("questionary.text") as mock_text,
+    ):
+        mock_select.return_value.ask.side_effect = [
+            text(TranslationKeys.NEXT_PAGE),
+            text(TranslationKeys.FILTER_DIRECTORIES),
+            "📁 dir0242",
+            text(TranslationKeys.SELECT_THIS_DIRECTORY),
+        ]
+        mock_text.return_value.ask.return_value = "024"
+        selected = controller.browse_directory(str(tmp_path))
+
+    assert selected == str(tmp_path / "dir0242")
+    first, second, filtered, _ = [
+        c.kwargs["choices"] for c in mock_select.call_args_list
+    ]
+    assert len([c for c in first if c.startswith("📁")]) == PAGE_SIZE
+    assert "📁 dir0249" in second and "📁 dir0000" not in second
+    assert [c for c in filtered if c.startswith("📁")] == ["📁 dir0024"] + [
+        f"📁 dir{i:04d}" for i in range(240, 250)
+    ]
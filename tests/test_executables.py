@@ -0,0 +1,69 @@
+"""Tests for the cached executable discovery of the service forms."""
+
+import os
+
+from src.utils.executables import ExecutableFinder
+
+
+def _executable(path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text("#!/bin/sh\n")
+    path.chmod(0o755)
+
+
+def _tree(tmp_path):
+    _executable(tmp_path / "run")
+    (tmp_path / "start.sh").write_text("")  # script suffix, not executable
+    (tmp_path / "README.md").write_text("")
+    (tmp_path / "data").mkdir()
+    os.symlink(tmp_path / "run", tmp_path / "run-link")
+    _executable(tmp_path / "venv" / "bin" / "python")
+    _executable(tmp_path / "node_modules" / "x" / "bin" / "tool")
+    _executable(tmp_path / "a" / "b" / "c" / "bin" / "too-deep")
+    return tmp_path
+
+
+def test_finds_executables_and_scripts(tmp_path):
+    finder = ExecutableFinder()
+    search = finder.find(str(_tree(tmp_path)))
+
+    assert search.names == ["run", "run-link", "start.sh"]
+    assert not search.truncated
+
+
+def test_listing_is_cached_until_the_directory_changes(tmp_path):
+    finder = ExecutableFinder()
+    directory = str(_tree(tmp_path))
+    finder.find(directory)
+    assert finder.scans == 1
+
+    finder.find(directory, query="run")
+    assert finder.scans == 1
+
+    _executable(tmp_path / "new-tool")
+    assert "new-tool" in finder.find(directory).names
+    assert finder.scans == 2
+
+    finder.find(directory, force=True)
+    assert finder.scans == 3
+
+
+def test_search_is_capped_and_counts_every_match(tmp_path):
+    for i in range(300):
+        _executable(tmp_path / f"tool{i:03d}")
+    finder = ExecutableFinder()
+
+    search = finder.find(str(tmp_path), limit=50)
+    assert (len(search.names), search.total, search.truncated) == (50, 300, True)
+
+    search = finder.find(str(tmp_path), query="TOOL29", limit=50)
+    assert search.names == [f"tool29{i}" for i in range(10)]
+    assert finder.scans == 1
+
+
+def test_recursive_bin_search(tmp_path):
+    finder = ExecutableFinder()
+    search = finder.find(str(_tree(tmp_path)), recursive_bin=True)
+
+    assert "venv/bin/python" in search.names
+    assert not any("tool" in name or "too-deep" in name for name in search.names)
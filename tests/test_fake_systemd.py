@@ -0,0 +1,107 @@
+"""Tests for the simulated systemctl/journalctl used by the load benchmarks."""
+
+import os
+import queue
+import subprocess
+import time
+
+from benchmarks.fake_systemd import FakeSystemd, install, main
+from src.utils.journal import JournalEntry, JournalFollower
+from src.utils.runtime import BackgroundRuntime, run_process
+from src.utils.systemctl import show_units
+
+
+def test_batched_show_answers_the_real_parser():
+    fake = FakeSystemd(units=450, seed=1)
+    names = list(fake.units)[:450] + ["missing.service"]
+
+    with fake.patch():
+        states = show_units(names)
+
+    assert len(states) == 451
+    assert states["missing.service"]["LoadState"] == "not-found"
+    active = sum(1 for s in states.values() if s["ActiveState"] == "active")
+    assert active == sum(1 for u in fake.units.values() if u.active_state == "active")
+    # 451 units in chunks of 200: three processes, none spawned.
+    assert fake.calls == {"systemctl show": 3}
+
+
+def test_state_transitions_and_injected_failures():
+    fake = FakeSystemd(units=3, failure_rate=0.0)
+    fake.failing.add("svc00002.service")
+
+    with fake.patch():
+        assert subprocess.run(["systemctl", "stop", "svc00000"]).returncode == 0
+        result = subprocess.run(
+            ["systemctl", "is-active", "svc00000"], capture_output=True, text=True
+        )
+        assert (result.returncode, result.stdout) == (3, "inactive\n")
+
+        assert subprocess.run(["systemctl", "start", "svc00000"]).returncode == 0
+        assert fake.units["svc00000.service"].active_state == "active"
+
+        assert subprocess.run(["systemctl", "restart", "svc00002"]).returncode == 1
+        assert fake.units["svc00002.service"].active_state == "failed"
+        assert subprocess.run(["systemctl", "start", "nope"]).returncode == 5
+
+
+def test_daemon_reload_loads_the_unit_directory(tmp_path):
+    fake = FakeSystemd(unit_dir=str(tmp_path))
+    (tmp_path / "web.service").write_text("[Service]\n")
+
+    with fake.patch():
+        subprocess.run(["systemctl", "daemon-reload"])
+        assert "web.service" in fake.units
+        (tmp_path / "web.service").unlink()
+        subprocess.run(["systemctl", "daemon-reload"])
+    assert "web.service" not in fake.units
+
+
+def test_journal_backlog_and_follow_stream():
+    fake = FakeSystemd(units=2, journal_rate=2000)
+    with fake.patch():
+        out = subprocess.run(
+            ["journalctl", "-u", "svc00001.service", "-n", "5", "--output=json"],
+            capture_output=True,
+            text=True,
+        ).stdout
+        entries = [JournalEntry.from_json(line) for line in out.splitlines()]
+        assert [e.unit for e in entries if e] == ["svc00001.service"] * 5
+
+        follower = JournalFollower()
+        entries: queue.Queue = queue.Queue()
+        follower.subscribe(None, entries)
+        time.sleep(0.3)
+        follower.close()
+    assert entries.qsize() > 100
+
+
+def test_runtime_processes_are_simulated():
+    fake = FakeSystemd(units=2)
+    runtime = BackgroundRuntime(max_workers=1)
+    try:
+        with fake.patch():
+            result = runtime.submit(
+                run_process, ["journalctl", "-u", "svc00001.service", "-n", "3"]
+            ).result(5)
+    finally:
+        runtime.shutdown()
+    assert result.returncode == 0
+    assert len(result.stdout.splitlines()) == 3
+    assert fake.calls["journalctl"] == 1
+
+
+def test_executables_on_path(tmp_path):
+    state = str(tmp_path / "fleet.json")
+    assert main(["--state", state, "init", "--units", "20"]) == 0
+    install(str(tmp_path / "bin"), state)
+    env = dict(os.environ, PATH=f"{tmp_path / 'bin'}:{os.environ['PATH']}")
+
+    subprocess.run(["systemctl", "stop", "svc00003"], env=env, check=True)
+    result = subprocess.run(
+        ["systemctl", "show", "-p", "ActiveState", "--", "svc00003.service"],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    assert result.stdout == "ActiveState=inactive\n"
@@ -0,0 +1,70 @@
+"""Tests for the GUI rendering benchmark (the full run needs a display)."""
+
+import os
+import shutil
+
+import pytest
+
+from benchmarks import gui_render
+from benchmarks.gui_render import LagProbe, lag_stats, main, run_benchmark
+
+HAS_DISPLAY = bool(os.environ.get("DISPLAY")) or shutil.which("Xvfb") is not None
+
+
+class FakeWidget:
+    def __init__(self):
+        self.jobs = {}
+        self.next_job = 0
+
+    def after(self, ms, callback):
+        self.next_job += 1
+        self.jobs[self.next_job] = callback
+        return self.next_job
+
+    def after_cancel(self, job):
+        self.jobs.pop(job)
+
+    def run_pending(self):
+        for job in list(self.jobs):
+            self.jobs.pop(job)()
+
+
+def test_lag_probe_records_late_ticks(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(gui_render.time, "perf_counter", lambda: now[0])
+    widget = FakeWidget()
+    probe = LagProbe(widget, interval_ms=10)
+
+    probe.start()
+    now[0] += 0.010
+    widget.run_pending()
+    now[0] += 0.060
+    widget.run_pending()
+
+    assert probe.stop() == pytest.approx([0.0, 50.0])
+    assert widget.jobs == {}
+    assert lag_stats(probe.samples) == {"lag_p95_ms": 50.0, "lag_max_ms": 50.0}
+
+
+def test_skipped_without_display(monkeypatch, capsys):
+    monkeypatch.delenv("DISPLAY", raising=False)
+    monkeypatch.setattr(gui_render.shutil, "which", lambda name: None)
+
+    assert main(["--json"]) == 0
+    assert "skipped" in capsys.readouterr().out
+    assert main(["--strict"]) == 1
+
+
+@pytest.mark.skipif(not HAS_DISPLAY, reason="no display and no Xvfb")
+def test_every_metric_is_measured():
+    with gui_render.virtual_display():
+        results = run_benchmark([5], repeat=1, rate=100, duration=0.5)
+
+    assert set(results) == {
+        "refresh_ms",
+        "select_ms",
+        "logs_dialog_open_ms",
+        "ingest_us_per_line",
+        "lag_p95_ms",
+        "lag_max_ms",
+    }
@@ -0,0 +1,112 @@
+"""Tests for the batched systemctl query and the fleet health scan.
+
+``subprocess`` is mocked: no systemctl or journalctl process is spawned.
+"""
+
+import io
+from unittest.mock import MagicMock, patch
+
+from src.models.service_model import list_service_names
+from src.utils import systemctl
+from src.utils.health import ERRORING, FAILED, FLAPPING, HEALTHY, HealthScanner
+from src.utils.proctrace import command_tracer
+from src.utils.systemctl import parse_show_output, show_units
+
+
+def _show_block(unit, active="active", sub="running", restarts=0, load="loaded"):
+    return (
+        f"Id={unit}.service\nLoadState={load}\nActiveState={active}\n"
+        f"SubState={sub}\nResult=success\nNRestarts={restarts}\n"
+    )
+
+
+def test_parse_show_output_splits_blocks():
+    output = _show_block("a") + "\n" + _show_block("b", active="failed")
+    blocks = parse_show_output(output)
+    assert [b["Id"] for b in blocks] == ["a.service", "b.service"]
+    assert blocks[1]["ActiveState"] == "failed"
+
+
+@patch("subprocess.run")
+def test_show_units_batches_in_chunks(mock_run, monkeypatch):
+    monkeypatch.setattr(systemctl, "SHOW_CHUNK_SIZE", 2)
+
+    def fake_run(args, **kwargs):
+        units = args[args.index("--") + 1 :]
+        blocks = [_show_block(u.removesuffix(".service")) for u in units]
+        return MagicMock(stdout="\n".join(blocks))
+
+    mock_run.side_effect = fake_run
+    result = show_units(["a", "b", "c"])
+
+    # Three units, two per call: two processes instead of three.
+    assert mock_run.call_count == 2
+    assert set(result) == {"a", "b", "c"}
+    assert result["c"]["Id"] == "c.service"
+    first_call = mock_run.call_args_list[0].args[0]
+    assert first_call[:2] == ["systemctl", "show"]
+    assert first_call[-2:] == ["a.service", "b.service"]
+
+
+def test_list_service_names_skips_invalid_files(tmp_path):
+    for filename in ["web.json", "db.json", "notes.txt", "bad name.json"]:
+        (tmp_path / filename).write_text("{}")
+    assert list_service_names(str(tmp_path)) == ["db", "web"]
+    assert list_service_names(str(tmp_path / "missing")) == []
+
+
+@patch("subprocess.Popen")
+@patch("src.utils.health.show_units")
+def test_scan_categorises_and_sorts_worst_first(mock_show, mock_popen):
+    mock_show.return_value = {
+        "healthy": parse_show_output(_show_block("healthy"))[0],
+        "broken": parse_show_output(_show_block("broken", active="failed"))[0],
+        "flappy": parse_show_output(
+            _show_block("flappy", active="activating", sub="auto-restart", restarts=7)
+        )[0],
+        "noisy": parse_show_output(_show_block("noisy"))[0],
+    }
+
+    def fake_popen(args, **kwargs):
+        unit = args[args.index("-u") + 1]
+        logs = ""
+        if unit == "noisy.service":
+            logs = "2026-10-19T10:00:00+0200 host noisy[1]: permission denied\n" * 3
+        process = MagicMock()
+        process.stdout = io.StringIO(logs)
+        process.__enter__.return_value = process
+        return process
+
+    mock_popen.side_effect = fake_popen
+
+    report = HealthScanner(max_workers=2).scan(["noisy", "healthy", "flappy", "broken"])
+
+    assert [u.name for u in report.units] == ["broken", "flappy", "noisy", "healthy"]
+    assert [u.category for u in report.units] == [FAILED, FLAPPING, ERRORING, HEALTHY]
+    assert [u.name for u in report.problems] == ["broken", "flappy", "noisy"]
+    noisy = report.units[2]
+    assert noisy.errors[0].count == 3
+    assert noisy.to_json()["errors"][0]["first_seen"] == "2026-10-19T10:00:00+0200"
+    # A single batched status query for the whole fleet.
+    mock_show.assert_called_once()
+    assert mock_popen.call_count == 4
+
+
+@patch("subprocess.Popen")
+@patch("src.utils.health.show_units", return_value={})
+def test_scan_journal_reads_are_traced(_mock_show, mock_popen):
+    process = MagicMock(returncode=0)
+    process.stdout = io.StringIO("")
+    process.__enter__.return_value = process
+    mock_popen.return_value = process
+
+    command_tracer.clear()
+    try:
+        HealthScanner(max_workers=1).scan(["web", "db"])
+        records = command_tracer.records()
+    finally:
+        command_tracer.clear()
+
+    assert [r.command for r in records] == ["journalctl", "journalctl"]
+    assert [r.returncode for r in records] == [0, 0]
+    assert all("._journal_errors:" in r.caller for r in records)
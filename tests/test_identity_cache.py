@@ -0,0 +1,82 @@
+"""Tests for the cached user/group lookups."""
+
+import grp
+import os
+import pwd
+from unittest.mock import patch
+
+from src.utils.identity import IdentityCache
+from src.utils.validation import ServiceValidator
+
+
+def _user(name, uid, home="/home/x"):
+    return pwd.struct_passwd((name, "x", uid, uid, "", home, "/bin/sh"))
+
+
+def _group(name, gid):
+    return grp.struct_group((name, "x", gid, []))
+
+
+def _cache(tmp_path):
+    passwd_file = tmp_path / "passwd"
+    group_file = tmp_path / "group"
+    passwd_file.write_text("root:x:0:0::/root:/bin/sh\n")
+    group_file.write_text("root:x:0:\n")
+    return IdentityCache(str(passwd_file), str(group_file)), passwd_file
+
+
+def test_lookups_are_cached_until_passwd_changes(tmp_path):
+    users = [_user("root", 0, "/root"), _user("alice", 1000, "/home/alice")]
+    with (
+        patch("pwd.getpwall", return_value=users) as getpwall,
+        patch("pwd.getpwnam", side_effect=KeyError) as getpwnam,
+    ):
+        cache, passwd_file = _cache(tmp_path)
+        for _ in range(100):
+            assert cache.user_exists("alice")
+            assert not cache.user_exists("ghost")
+        assert cache.home_directory("alice") == "/home/alice"
+        assert getpwall.call_count == 1
+        assert getpwnam.call_count == 1  # "ghost" is negatively cached
+
+        users.append(_user("ghost", 1001))
+        passwd_file.write_text("changed, and longer than before\n")
+        os.utime(passwd_file, ns=(0, 10**18))
+        assert cache.user_exists("ghost")
+        assert cache.regular_users() == ["alice", "ghost"]
+        assert getpwall.call_count == 2
+
+
+def test_groups_and_non_enumerated_users(tmp_path):
+    with (
+        patch("grp.getgrall", return_value=[_group("web", 900)]),
+        patch("pwd.getpwall", return_value=[]),
+        patch("pwd.getpwnam", return_value=_user("ldapuser", 5000)),
+    ):
+        cache, _ = _cache(tmp_path)
+        assert cache.group_exists("web")
+        assert not cache.group_exists("ops")
+        assert cache.user_exists("ldapuser")
+        assert not cache.group_exists("")
+
+
+@patch("subprocess.run")
+def test_validating_many_configs_spawns_no_process(mock_run, tmp_path):
+    with (
+        patch("pwd.getpwall", return_value=[_user("root", 0, "/root")]),
+        patch("grp.getgrall", return_value=[_group("root", 0)]),
+        patch("src.utils.validation.identity_cache", _cache(tmp_path)[0]),
+    ):
+        validator = ServiceValidator()
+        for i in range(1000):
+            result = validator.validate_service_config(
+                {
+                    "name": f"svc{i}",
+                    "command": "/bin/sh -c true",
+                    "user": "root",
+                    "group": "root" if i % 2 else "nogroup-here",
+                }
+            )
+            assert result.is_valid == bool(i % 2)
+
+    mock_run.assert_not_called()
@@ -0,0 +1,34 @@
+"""Tests for the import-time benchmark and the lazy imports of the entry point.
+
+The benchmark spawns fresh interpreters; no timing assertion is made here (the
+budget is enforced by ``python -m benchmarks.import_time`` in CI).
+"""
+
+from benchmarks.import_time import load_budget, measure, parse_importtime
+
+SAMPLE = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       300 |        900 | src.cli.commands
+import time:       600 |        600 |   argparse
+"""
+
+
+def test_parse_importtime():
+    records = parse_importtime(SAMPLE)
+    assert [r.module for r in records] == ["_io", "src.cli.commands", "argparse"]
+    assert records[1].cumulative_us == 900
+    assert records[0].depth == 1
+    assert records[1].depth == 0
+
+
+def test_headless_entry_skips_interactive_interfaces():
+    budget = load_budget()
+    imported = {record.module for record in measure(budget["entry"])}
+
+    assert "src.cli.commands" in imported
+    for forbidden in budget["forbidden"]:
+        assert not any(
+            module == forbidden or module.startswith(forbidden + ".")
+            for module in imported
+        ), forbidden
@@ -0,0 +1,184 @@
+"""Tests for the shared journal follower (src/utils/journal.py).
+
+``subprocess.Popen`` is mocked: no journal is read and no process is spawned.
+"""
+
+import json
+import queue
+from unittest.mock import MagicMock, patch
+
+from src.utils.journal import (
+    PRIORITY_WARNING,
+    BacklogFence,
+    JournalEntry,
+    JournalFollower,
+    normalize_unit,
+    parse_entries,
+)
+
+
+def _entry_json(cursor, usec, unit, message="hello", priority=6, **extra):
+    data = {
+        "__CURSOR": cursor,
+        "__REALTIME_TIMESTAMP": str(usec),
+        "_SYSTEMD_UNIT": unit,
+        "SYSLOG_IDENTIFIER": unit.split(".")[0],
+        "MESSAGE": message,
+        "PRIORITY": str(priority),
+        "_HOSTNAME": "host",
+        "_PID": "42",
+    }
+    data.update(extra)
+    return json.dumps(data) + "\n"
+
+
+def _fake_process(lines=()):
+    process = MagicMock()
+    process.stdout = list(lines)
+    return process
+
+
+def test_normalize_unit_adds_service_suffix_only_when_missing():
+    assert normalize_unit("web") == "web.service"
+    assert normalize_unit("web.service") == "web.service"
+    assert normalize_unit("web.timer") == "web.timer"
+    assert normalize_unit("*web*") == "*web*"
+
+
+def test_entry_from_json_decodes_fields_and_byte_messages():
+    line = _entry_json("c1", 1_700_000_000_000_000, "web.service", message=[104, 105])
+    entry = JournalEntry.from_json(line)
+    assert entry is not None
+    assert entry.message == "hi"
+    assert entry.unit == "web.service"
+    assert entry.priority == 6
+    assert "host web[42]: hi" in entry.format()
+
+
+def test_entry_from_json_ignores_garbage():
+    assert JournalEntry.from_json("not json") is None
+    assert JournalEntry.from_json(json.dumps({"MESSAGE": "no cursor"})) is None
+
+
+def test_backlog_fence_drops_live_entries_already_shown():
+    output = "-- No entries --\n" + "".join(
+        _entry_json(f"c{i}", 100 + i, "web.service") for i in range(3)
+    )
+    backlog = parse_entries(output)
+    assert [entry.cursor for entry in backlog] == ["c0", "c1", "c2"]
+
+    fence = BacklogFence.after(backlog)
+    live = [
+        JournalEntry.from_json(_entry_json(cursor, usec, "web.service"))
+        for cursor, usec in [("c2", 102), ("late", 101), ("c3", 102), ("c4", 103)]
+    ]
+    # The duplicate and the entry older than the backlog's end are dropped.
+    assert [e.cursor for e in live if e is not None and fence.keeps(e)] == [
+        "c3",
+        "c4",
+    ]
+    assert BacklogFence().keeps(backlog[0])
+
+
+@patch("subprocess.Popen")
+def test_single_process_follows_union_of_units(mock_popen):
+    mock_popen.return_value = _fake_process()
+    follower = JournalFollower()
+
+    a = follower.subscribe(["web"], queue.Queue())
+    follower.subscribe(["db"], queue.Queue())
+    follower.subscribe(["web"], queue.Queue())
+
+    # Same match set for the third view: no restart.
+    assert mock_popen.call_count == 2
+    cmd = mock_popen.call_args.args[0]
+    assert cmd[:4] == ["journalctl", "-f", "--no-pager", "--output=json"]
+    assert follower.match_args == ["-u", "db.service", "-u", "web.service"]
+
+    # Closing one of two "web" views keeps the match set unchanged.
+    follower.unsubscribe(a)
+    assert mock_popen.call_count == 2
+
+
+@patch("subprocess.Popen")
+def test_follow_all_drops_unit_matches_and_last_unsubscribe_stops(mock_popen):
+    process = _fake_process()
+    mock_popen.return_value = process
+    follower = JournalFollower()
+
+    unit_token = follower.subscribe(["web"], queue.Queue())
+    all_token = follower.subscribe(None, queue.Queue())
+    assert follower.match_args == []
+
+    follower.unsubscribe(all_token)
+    assert follower.match_args == ["-u", "web.service"]
+
+    follower.unsubscribe(unit_token)
+    assert follower.match_args is None
+    assert process.terminate.called
+
+
+@patch("subprocess.Popen")
+def test_entries_fan_out_to_matching_views(mock_popen):
+    mock_popen.return_value = _fake_process()
+    follower = JournalFollower()
+
+    web, db, warnings, everything = (queue.Queue() for _ in range(4))
+    follower.subscribe(["web"], web)
+    follower.subscribe(["db"], db)
+    follower.subscribe(["*"], warnings, max_priority=PRIORITY_WARNING)
+    follower.subscribe(None, everything)
+
+    # Subscriptions ignore entries older than themselves; use a future stamp.
+    usec = 4_000_000_000_000_000
+    lines = [
+        _entry_json("c1", usec, "web.service"),
+        _entry_json("c2", usec + 1, "db.service", priority=3),
+        _entry_json(
+            "c3", usec + 2, "init.scope", message="Started web", UNIT="web.service"
+        ),
+    ]
+    follower._read_loop(_fake_process(lines), follower._generation)
+
+    assert [e.cursor for e in web.queue] == ["c1", "c3"]
+    assert [e.cursor for e in db.queue] == ["c2"]
+    assert [e.cursor for e in warnings.queue] == ["c2"]
+    assert [e.cursor for e in everything.queue] == ["c1", "c2", "c3"]
+
+
+@patch("subprocess.Popen")
+def test_restart_resumes_without_duplicates(mock_popen):
+    mock_popen.return_value = _fake_process()
+    follower = JournalFollower()
+    received = queue.Queue()
+    follower.subscribe(["web"], received)
+
+    usec = 4_000_000_000_000_000
+    first = _entry_json("c1", usec, "web.service")
+    follower._read_loop(_fake_process([first]), follower._generation)
+
+    # A new view changes the match set: the follower resumes from the last
+    # entry seen instead of "-n 0" and skips what was already delivered.
+    follower.subscribe(["db"], queue.Queue())
+    cmd = mock_popen.call_args.args[0]
+    assert any(arg.startswith("--since=@") for arg in cmd)
+    assert "-n" not in cmd
+
+    replay = [first, _entry_json("c2", usec + 5, "web.service")]
+    follower._read_loop(_fake_process(replay), follower._generation)
+    assert [e.cursor for e in received.queue] == ["c1", "c2"]
+
+
+@patch("subprocess.Popen")
+def test_stale_reader_stops_dispatching_after_restart(mock_popen):
+    mock_popen.return_value = _fake_process()
+    follower = JournalFollower()
+    received = queue.Queue()
+    follower.subscribe(["web"], received)
+    old_generation = follower._generation
+
+    follower.subscribe(["db"], queue.Queue())
+
+    line = _entry_json("c1", 4_000_000_000_000_000, "web.service")
+    follower._read_loop(_fake_process([line]), old_generation)
+    assert received.empty()
@@ -0,0 +1,66 @@
+"""Tests for the batch configuration linter (``systemd-manager lint``)."""
+
+import json
+from unittest.mock import patch
+
+from src.cli.commands import EXIT_FAILURE, EXIT_OK, run
+from src.models.service_model import ServiceModel
+from src.utils.lint import lint_services
+from src.utils.validation import StatCache
+
+
+def _save(directory, name, command="/bin/sh", user="root", workdir=None, **extra):
+    service = ServiceModel(name)
+    service.service.exec_start = command
+    service.service.user = user
+    service.service.working_directory = workdir or str(directory)
+    for key, value in extra.items():
+        setattr(service.service, key, value)
+    service.save_to_json(str(directory / f"{name}.json"))
+
+
+@patch("subprocess.run")
+def test_lint_reports_every_configuration(mock_run, tmp_path):
+    _save(tmp_path, "web")
+    _save(tmp_path, "api", command="/nonexistent/api", user="no-such-user-xyz")
+    _save(tmp_path, "slow", restart="always", restart_sec=600)
+    (tmp_path / "broken.json").write_text("{not json")
+    (tmp_path / "copy.json").write_text(json.dumps({"name": "web"}))
+
+    results = {r.path.rsplit("/", 1)[1]: r for r in lint_services(str(tmp_path))}
+
+    assert results["slow.json"].ok and results["slow.json"].warnings
+    assert not results["api.json"].ok and len(results["api.json"].errors) == 2
+    assert not results["broken.json"].ok
+    assert any("plusieurs fichiers" in e for e in results["web.json"].errors)
+    assert any("plusieurs fichiers" in e for e in results["copy.json"].errors)
+    mock_run.assert_not_called()
+
+
+def test_workers_share_one_stat_cache(tmp_path):
+    for i in range(600):
+        _save(tmp_path, f"svc{i}", command="/bin/sh -c true")
+    cache = StatCache()
+
+    results = lint_services(str(tmp_path), workers=4, stat_cache=cache, chunk_size=50)
+
+    assert [r.name for r in results] == sorted(f"svc{i}" for i in range(600))
+    assert all(r.ok for r in results)
+    # One executable and one working directory, whatever the service count.
+    assert set(cache.stats) == {"/bin/sh", str(tmp_path)}
+
+
+def test_lint_command_exit_codes(tmp_path, capsys):
+    _save(tmp_path, "web")
+    _save(tmp_path, "slow", restart="always", restart_sec=600)
+    services = ["--services-dir", str(tmp_path)]
+
+    assert run(services + ["lint"]) == EXIT_OK
+    assert run(services + ["lint", "--strict"]) == EXIT_FAILURE
+    capsys.readouterr()
+
+    _save(tmp_path, "api", command="relative/api")
+    assert run(services + ["lint", "--json", "--workers", "2"]) == EXIT_FAILURE
+    report = json.loads(capsys.readouterr().out)
+    assert (report["checked"], report["errors"], report["warnings"]) == (3, 1, 1)
+    assert [s["name"] for s in report["services"] if not s["ok"]] == ["api"]
@@ -0,0 +1,128 @@
+"""Tests for the single-pass journal error classifier.
+
+Dependency-free (no GUI/questionary imports) so they run in any environment.
+"""
+
+import io
+import json
+import re
+
+from src.utils.log_classifier import DEFAULT_PATTERNS, LogClassifier
+
+LOGS = (
+    "Oct 19 10:00:00 host app[1]: Permission denied while opening /srv/data\n"
+    "Oct 19 10:00:05 host app[1]: all good\n"
+    "Oct 19 10:01:00 host app[1]: TIMEOUT waiting for db, timeout again\n"
+    "Oct 19 10:02:30 host systemd[1]: Failed to start app.service\n"
+    "Oct 19 10:03:00 host app[1]: permission denied (retry)\n"
+)
+
+
+def test_classify_counts_lines_and_records_first_and_last_timestamp():
+    stats = {s.message: s for s in LogClassifier().classify(LOGS)}
+
+    permission = stats["Erreur de permission"]
+    assert permission.count == 2
+    assert permission.first_seen == "Oct 19 10:00:00"
+    assert permission.last_seen == "Oct 19 10:03:00"
+
+    # Two occurrences on the same line count once.
+    assert stats["Timeout détecté"].count == 1
+    assert stats["Échec du démarrage du service"].count == 1
+    assert "Erreur de segmentation détectée" not in stats
+
+
+def test_results_follow_table_order():
+    messages = [s.message for s in LogClassifier().classify(LOGS)]
+    table = [message for _, message in DEFAULT_PATTERNS]
+    assert messages == sorted(messages, key=table.index)
+
+
+def test_overlapping_patterns_are_each_counted():
+    classifier = LogClassifier(
+        [(r"configuration error", "config"), (r"error", "error"), (r"ion", "ion")]
+    )
+    logs = (
+        "Oct 19 10:00:00 host app[1]: Configuration error in line 3\n"
+        "Oct 19 10:00:01 host app[1]: error\n"
+        "Oct 19 10:00:02 host app[1]: ok\n"
+    )
+    counts = {s.message: s.count for s in classifier.classify(logs)}
+
+    # Same result as one independent search per pattern and line.
+    expected = {
+        message: sum(1 for line in logs.lower().splitlines() if re.search(p, line))
+        for p, message in classifier.patterns
+    }
+    assert counts == expected == {"config": 1, "error": 2, "ion": 1}
+
+
+def test_stream_and_lines_match_in_memory_result():
+    classifier = LogClassifier()
+    expected = [(s.message, s.count) for s in classifier.classify(LOGS)]
+
+    from_stream = classifier.classify_stream(io.StringIO(LOGS))
+    from_lines = classifier.classify_lines(LOGS.splitlines())
+
+    assert [(s.message, s.count) for s in from_stream] == expected
+    assert [(s.message, s.count) for s in from_lines] == expected
+
+
+def test_iso_timestamps_are_recognised():
+    logs = "2026-10-19T10:00:00.123456+0200 host app[1]: core dumped\n"
+    (stats,) = LogClassifier().classify(logs)
+    assert stats.first_seen == "2026-10-19T10:00:00.123456+0200"
+
+
+def test_invalid_and_group_patterns_are_skipped():
+    classifier = LogClassifier(
+        [
+            ("(unclosed", "bad"),
+            ("(?P<x>oops)", "named"),
+            (r"(a)\1", "backreference"),
+            (r"(?P<y>b)(?P=y)", "named reference"),
+            (r"(c)?(?(1)d|e)", "conditional"),
+            (r"\\1", "escaped backslash"),
+        ]
+    )
+    assert [message for _, message in classifier.patterns] == ["escaped backslash"]
+    assert classifier.classify("oops (unclosed aa bb\n") == []
+
+
+def test_anchors_match_at_line_boundaries():
+    classifier = LogClassifier(
+        [(r"^oct 19 10:00:01", "start"), (r"retry$", "end"), (r"^retry", "never")]
+    )
+    logs = (
+        "Oct 19 10:00:01 host app[1]: will retry\n"
+        "Oct 19 10:00:02 host app[1]: retry later\n"
+        "retry continued\n"
+    )
+    counts = {s.message: s.count for s in classifier.classify(logs)}
+    assert counts == {"start": 1, "end": 1, "never": 1}
+
+
+def test_user_config_extends_or_replaces_defaults(tmp_path):
+    config = tmp_path / "log_patterns.json"
+    config.write_text(
+        json.dumps({"patterns": [{"pattern": "out of memory", "message": "OOM"}]})
+    )
+    classifier = LogClassifier.from_config(str(config))
+    assert len(classifier.patterns) == len(DEFAULT_PATTERNS) + 1
+    assert [s.message for s in classifier.classify("Out Of Memory\n")] == ["OOM"]
+
+    config.write_text(
+        json.dumps(
+            {
+                "replace_defaults": True,
+                "patterns": [{"pattern": "oom", "message": "OOM"}],
+            }
+        )
+    )
+    assert LogClassifier.from_config(str(config)).patterns == [("oom", "OOM")]
+
+
+def test_broken_user_config_falls_back_to_defaults(tmp_path):
+    config = tmp_path / "log_patterns.json"
+    config.write_text("{not json")
+    assert len(LogClassifier.from_config(str(config)).patterns) == len(DEFAULT_PATTERNS)
@@ -0,0 +1,61 @@
+"""Tests for the batched log rendering of the log views."""
+
+from datetime import datetime
+
+from benchmarks.log_pipeline import main
+from src.utils.journal import JournalEntry
+from src.utils.log_render import render_lines, split_line
+
+
+def test_split_line_keeps_the_whole_line():
+    for line in (
+        "Oct 19 10:00:00.123456 host app[42]: ERROR: boom",
+        "2026-10-19T10:00:00+0200 host app[42]: started",
+        "Oct  9 10:00:00 host kernel: no source separator",
+        "-- No entries --",
+    ):
+        assert "".join(split_line(line)) == line
+
+    assert split_line("Oct 19 10:00:00 host app[1]: ready") == (
+        "Oct 19 10:00:00",
+        " host app[1]: ",
+        "ready",
+    )
+    assert split_line("-- No entries --") == ("", "", "-- No entries --")
+
+
+def test_render_lines_tags_levels_and_merges_runs():
+    chunks = render_lines(
+        [
+            "Oct 19 10:00:00 host app[1]: Warning: disk almost full",
+            "Oct 19 10:00:01 host app[1]: connection ERROR",
+            "-- Boot 1234 --",
+            "-- No entries --",
+        ]
+    )
+
+    assert list(zip(chunks[::2], chunks[1::2])) == [
+        ("Oct 19 10:00:00", "timestamp"),
+        (" host app[1]: ", "service"),
+        ("Warning: disk almost full\n", "warning"),
+        ("Oct 19 10:00:01", "timestamp"),
+        (" host app[1]: ", "service"),
+        ("connection ERROR\n", "error"),
+        ("-- Boot 1234 --\n-- No entries --\n", "info"),
+    ]
+    assert render_lines([]) == []
+
+
+def test_format_reuses_the_second_prefix():
+    stamps = [1_760_868_000_000_001, 1_760_868_000_999_999, 1_760_868_001_000_000]
+    for usec in stamps:
+        entry = JournalEntry(
+            "c", usec, "app.service", "app", "hello", hostname="host", pid="7"
+        )
+        prefix = datetime.fromtimestamp(usec // 1_000_000).strftime("%b %d %H:%M:%S")
+        assert entry.format() == f"{prefix}.{usec % 1_000_000:06d} host app[7]: hello"
+
+
+def test_pipeline_benchmark_runs_without_display(capsys):
+    assert main(["--lines", "200", "--target", "1", "--no-view"]) == 0
+    assert "ui_thread" in capsys.readouterr().out
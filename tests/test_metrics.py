@@ -0,0 +1,119 @@
+"""Tests for the Prometheus metrics exporter.
+
+``systemctl`` is mocked and cgroups are faked in a temporary directory: no
+process is spawned.
+"""
+
+import urllib.request
+from threading import Thread
+from unittest.mock import patch
+
+import pytest
+
+from src.utils.cgroup import CgroupSampler
+from src.utils.metrics import (
+    MetricsCollector,
+    MetricsRegistry,
+    serve_metrics,
+    write_textfile,
+)
+
+
+@pytest.fixture
+def collector(tmp_path):
+    services_dir = tmp_path / "services"
+    services_dir.mkdir()
+    for name in ["web", "db"]:
+        (services_dir / f"{name}.json").write_text("{}")
+
+    cgroup_root = tmp_path / "cgroup"
+    web = cgroup_root / "web.service"
+    web.mkdir(parents=True)
+    (web / "cpu.stat").write_text("usage_usec 2500000\n")
+    (web / "memory.current").write_text("4096\n")
+    (web / "pids.current").write_text("3\n")
+
+    return MetricsCollector(
+        str(services_dir),
+        registry=MetricsRegistry(),
+        sampler=CgroupSampler(root=str(cgroup_root)),
+    )
+
+
+def _states():
+    return {
+        "web": {"Id": "web.service", "ActiveState": "active", "NRestarts": "2"},
+        "db": {"Id": "db.service", "ActiveState": "failed", "NRestarts": "0"},
+    }
+
+
+def test_registry_renders_histogram():
+    registry = MetricsRegistry()
+    registry.observe("start", 0.2)
+    with pytest.raises(RuntimeError):
+        with registry.timed("start"):
+            raise RuntimeError("boom")
+    with registry.timed("stop") as operation:
+        operation.success = False
+
+    text = "\n".join(registry.render())
+    assert (
+        'systemd_manager_operation_duration_seconds_bucket{operation="start",le="0.25"} 2'
+        in text
+    )
+    assert (
+        'systemd_manager_operation_duration_seconds_count{operation="start"} 2' in text
+    )
+    assert 'systemd_manager_operation_failures_total{operation="start"} 1' in text
+    assert 'systemd_manager_operation_failures_total{operation="stop"} 1' in text
+
+
+@patch("src.utils.metrics.show_units")
+def test_refresh_exports_unit_metrics(mock_show, collector):
+    mock_show.return_value = _states()
+    collector.refresh()
+    text = collector.exposition()
+
+    assert 'systemd_manager_unit_state{unit="web",state="active"} 1' in text
+    assert 'systemd_manager_unit_state{unit="db",state="failed"} 1' in text
+    assert 'systemd_manager_unit_state{unit="db",state="active"} 0' in text
+    assert 'systemd_manager_unit_restarts{unit="web"} 2' in text
+    assert 'systemd_manager_unit_cpu_seconds_total{unit="web"} 2.5' in text
+    assert 'systemd_manager_unit_memory_bytes{unit="web"} 4096' in text
+    assert 'systemd_manager_unit_tasks{unit="web"} 3' in text
+    # db is not running: no cgroup, no resource series.
+    assert 'memory_bytes{unit="db"}' not in text
+    mock_show.assert_called_once_with(["db", "web"])
+
+
+@patch("subprocess.run")
+@patch("subprocess.Popen")
+@patch("src.utils.metrics.show_units")
+def test_scrapes_are_served_from_cache(mock_show, mock_popen, mock_run, collector):
+    mock_show.return_value = _states()
+    collector.refresh()
+
+    server = serve_metrics(collector, "127.0.0.1:0")
+    Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        for _ in range(5):
+            with urllib.request.urlopen(url) as response:
+                body = response.read().decode()
+                assert response.headers["Content-Type"].startswith("text/plain")
+        assert 'systemd_manager_unit_restarts{unit="web"} 2' in body
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert mock_show.call_count == 1
+    mock_popen.assert_not_called()
+    mock_run.assert_not_called()
+
+
+def test_write_textfile_replaces_atomically(tmp_path):
+    target = tmp_path / "systemd_manager.prom"
+    write_textfile(str(target), "a 1\n")
+    write_textfile(str(target), "a 2\n")
+    assert target.read_text() == "a 2\n"
+    assert [p.name for p in tmp_path.iterdir()] == ["systemd_manager.prom"]
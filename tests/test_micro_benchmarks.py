@@ -0,0 +1,30 @@
+"""Tests for the micro-benchmark suite (tiny sizes, no timing assertion)."""
+
+from benchmarks.micro import CASES, compare, main, run_benchmark
+
+
+def test_every_case_runs():
+    results = run_benchmark(list(CASES), [10], repeat=1)
+    assert set(results) == set(CASES)
+    assert all(points["10"] > 0 for points in results.values())
+
+
+def test_compare_flags_regressions_beyond_tolerance():
+    baseline = {"to_systemd_file": {"10": 10.0, "1000": 10.0}}
+    results = {"to_systemd_file": {"10": 14.0, "1000": 16.0, "10000": 5.0}}
+
+    rows = compare(results, baseline, tolerance=0.5)
+
+    assert [(row["size"], row["regression"]) for row in rows] == [
+        (10, False),
+        (1000, True),
+    ]
+
+
+def test_baseline_round_trip(tmp_path):
+    baseline = str(tmp_path / "baseline.json")
+    args = ["--cases", "screen_helpers", "--sizes", "10", "--repeat", "1"]
+
+    assert main(args + ["--baseline", baseline, "--save-baseline"]) == 0
+    assert main(args + ["--baseline", baseline, "--compare", "--tolerance", "100"]) == 0
+    assert main(args + ["--baseline", str(tmp_path / "absent"), "--compare"]) == 1
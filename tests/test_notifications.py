@@ -0,0 +1,58 @@
+"""Tests for the GUI notification queue (no Tk needed)."""
+
+from src.utils.notifications import NotificationQueue
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_same_group_is_merged_into_one_toast():
+    queue = NotificationQueue(clock=_Clock())
+    for _ in range(12):
+        queue.push(
+            "Service restarted", "success", group="restart", plural="%d restarted"
+        )
+    queue.push("Other", "success")
+
+    shown = queue.due()
+    assert [n.text for n in shown] == ["12 restarted"]
+    assert queue.pending() == 1
+
+    # A visible toast keeps absorbing its group and is flagged for update.
+    queue.push("Service restarted", "success", group="restart", plural="%d restarted")
+    assert [n.text for n in queue.changed()] == ["13 restarted"]
+    assert queue.changed() == []
+
+
+def test_visible_toasts_are_capped_and_rate_limited():
+    clock = _Clock()
+    queue = NotificationQueue(max_visible=2, min_interval=0.5, clock=clock)
+    for i in range(4):
+        queue.push(f"message {i}")
+
+    assert len(queue.due()) == 1
+    assert queue.due() == []
+    assert queue.next_delay() == 0.5
+
+    clock.now += 0.5
+    assert [n.text for n in queue.due()] == ["message 1"]
+    clock.now += 1
+    assert queue.due() == []
+    assert queue.next_delay() is None
+
+    queue.dismiss(queue.visible()[0])
+    assert [n.text for n in queue.due()] == ["message 2"]
+
+
+def test_pending_queue_is_bounded():
+    queue = NotificationQueue(max_pending=3, clock=_Clock())
+    for i in range(5):
+        queue.push(f"message {i}")
+
+    assert queue.dropped == 2
+    assert queue.due()[0].text == "message 2"
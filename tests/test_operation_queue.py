@@ -0,0 +1,156 @@
+"""Tests for the per-unit operation queue."""
+
+import threading
+
+import pytest
+
+from src.utils.operations import OperationQueue, merge
+from src.utils.runtime import BackgroundRuntime
+
+
+class BlockingSystemctl:
+    """Records the operations run; each one waits until ``release`` is set."""
+
+    def __init__(self):
+        self.calls = []
+        self.release = threading.Event()
+        self.started = threading.Event()
+        self.active = {}
+        self.overlaps = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, verb, name):
+        with self.lock:
+            self.calls.append((verb, name))
+            self.active[name] = self.active.get(name, 0) + 1
+            if self.active[name] > 1:
+                self.overlaps += 1
+        self.started.set()
+        self.release.wait(5)
+        with self.lock:
+            self.active[name] -= 1
+        if name == "broken":
+            raise RuntimeError("Job failed")
+
+
+@pytest.fixture
+def runtime():
+    runtime = BackgroundRuntime(max_workers=4)
+    yield runtime
+    runtime.shutdown()
+
+
+def wait_for(queue, names):
+    pause = threading.Event()
+    for _ in range(500):
+        if all(queue.state(name) == (None, None) for name in names):
+            return
+        pause.wait(0.01)
+    raise AssertionError("operations still queued")
+
+
+def test_merge():
+    assert merge(None, "start") == "start"
+    assert merge("start", "stop") == "stop"
+    assert merge("stop", "start") == "start"
+    assert merge("restart", "start") == "restart"
+    assert merge("restart", "stop") == "stop"
+    assert merge("start", "restart") == "restart"
+
+
+def test_repeated_restarts_collapse_into_one_job(runtime):
+    systemctl = BlockingSystemctl()
+    queue = OperationQueue(systemctl, runtime)
+    done = []
+
+    assert queue.request("web", "restart", on_done=done.append)
+    assert systemctl.started.wait(5)
+    for _ in range(5):
+        assert not queue.request("web", "restart", on_done=done.append)
+    assert queue.state("web") == ("restart", None)
+
+    systemctl.release.set()
+    wait_for(queue, ["web"])
+    assert systemctl.calls == [("restart", "web")]
+    assert done == ["restart"] * 6
+    assert queue.collapsed == 5
+
+
+def test_pending_requests_are_replaced_and_serialized(runtime):
+    systemctl = BlockingSystemctl()
+    queue = OperationQueue(systemctl, runtime)
+    changes = []
+    queue.subscribe(changes.append)
+    done = []
+
+    queue.request("web", "stop")
+    assert systemctl.started.wait(5)
+    queue.request("web", "start", on_done=done.append)
+    queue.request("web", "stop", on_done=done.append)
+    queue.request("web", "start", on_done=done.append)
+    assert queue.state("web") == ("stop", "start")
+
+    # Another unit does not wait for the first one.
+    queue.request("db", "restart")
+    assert queue.state("db") == ("restart", None)
+
+    systemctl.release.set()
+    wait_for(queue, ["web", "db"])
+    assert [call for call in systemctl.calls if call[1] == "web"] == [
+        ("stop", "web"),
+        ("start", "web"),
+    ]
+    assert systemctl.overlaps == 0
+    # The stop merged into the running one reports it; the superseded start
+    # is never reported.
+    assert sorted(done) == ["start", "stop"]
+    assert "web" in changes and "db" in changes
+    # The superseded start and the merged stop.
+    assert queue.collapsed == 2
+
+
+def test_request_joining_the_pending_operation_is_counted_once(runtime):
+    systemctl = BlockingSystemctl()
+    queue = OperationQueue(systemctl, runtime)
+
+    queue.request("web", "start")
+    assert systemctl.started.wait(5)
+    assert queue.request("web", "stop")
+    assert not queue.request("web", "stop")
+    assert queue.collapsed == 1
+
+    systemctl.release.set()
+    wait_for(queue, ["web"])
+    assert systemctl.calls == [("start", "web"), ("stop", "web")]
+
+
+def test_errors_reach_the_requests_and_the_queue_goes_on(runtime):
+    systemctl = BlockingSystemctl()
+    queue = OperationQueue(systemctl, runtime)
+    errors = []
+    done = []
+
+    def failed(verb, error):
+        errors.append((verb, str(error)))
+
+    queue.request("broken", "start", on_error=failed)
+    assert systemctl.started.wait(5)
+    queue.request("broken", "restart", on_error=failed)
+    queue.request("broken", "start", on_error=failed)
+    systemctl.release.set()
+    wait_for(queue, ["broken"])
+
+    # The start merged into the pending restart reports the restart.
+    assert errors == [
+        ("start", "Job failed"),
+        ("restart", "Job failed"),
+        ("restart", "Job failed"),
+    ]
+    assert systemctl.calls == [("start", "broken"), ("restart", "broken")]
+
+    queue.request("web", "start", on_done=done.append)
+    wait_for(queue, ["web"])
+    assert done == ["start"]
+
+    with pytest.raises(ValueError):
+        queue.request("web", "reload")
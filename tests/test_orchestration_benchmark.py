@@ -0,0 +1,35 @@
+"""Tests for the end-to-end orchestration benchmark (small fleet)."""
+
+import os
+
+from benchmarks.orchestration import PHASES, main, run_fleet
+from src.utils.privileged import privileged_helper
+
+
+def test_every_phase_runs_against_the_simulated_systemd(monkeypatch):
+    monkeypatch.setenv("SYSTEMD_MANAGER_SOCKET", "/run/user/0/original.sock")
+    saved = (privileged_helper.unit_dir, privileged_helper.in_process)
+
+    results = run_fleet(10)
+
+    assert list(results) == PHASES
+    commands = {phase: row["commands"] for phase, row in results.items()}
+    assert commands == {
+        "create": 0,
+        "install": 1,
+        "start": 10,
+        "list_gui": 1,
+        "list_cli": 1,
+        "restart": 1,
+        "save": 10,
+        "delete": 30,
+    }
+    assert all(row["seconds"] >= row["overhead_seconds"] for row in results.values())
+    # The environment is restored.
+    assert (privileged_helper.unit_dir, privileged_helper.in_process) == saved
+    assert os.environ["SYSTEMD_MANAGER_SOCKET"] == "/run/user/0/original.sock"
+
+
+def test_json_report(capsys):
+    assert main(["--sizes", "10", "--json"]) == 0
+    assert '"delete"' in capsys.readouterr().out
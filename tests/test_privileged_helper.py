@@ -0,0 +1,260 @@
+"""Tests for the persistent privileged helper.
+
+Unit files are written to a temporary directory and ``systemctl`` is mocked;
+the pipe protocol is exercised with a real helper process run without sudo.
+"""
+
+import json
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.utils.privileged import (
+    PROTOCOL_VERSION,
+    PrivilegedError,
+    PrivilegedHelper,
+    execute_batch,
+    helper_installed,
+    main,
+    validate,
+)
+
+
+def _ok(*args, **kwargs):
+    return MagicMock(returncode=0, stderr=b"")
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        {"op": "shell", "cmd": "id"},
+        {"op": "write_unit", "name": "../../etc/passwd", "content": ""},
+        {"op": "write_unit", "name": "web", "content": "x\0y"},
+        {"op": "write_unit", "name": "web", "content": "x" * 70000},
+        {"op": "start", "names": []},
+        {"op": "stop", "names": ["web; reboot"]},
+        "daemon_reload",
+    ],
+)
+def test_validate_rejects_malformed_requests(request_):
+    with pytest.raises(ValueError):
+        validate(request_)
+
+
+def test_invalid_batch_runs_nothing(tmp_path):
+    run = MagicMock(side_effect=_ok)
+    with pytest.raises(ValueError):
+        execute_batch(
+            [
+                {"op": "write_unit", "name": "web", "content": "[Unit]\n"},
+                {"op": "remove_unit", "name": "/etc/shadow"},
+            ],
+            str(tmp_path),
+            run,
+        )
+    assert list(tmp_path.iterdir()) == []
+    run.assert_not_called()
+
+
+def test_batch_coalesces_reloads_and_verbs(tmp_path):
+    run = MagicMock(side_effect=_ok)
+    (tmp_path / "old.service").write_text("[Unit]\n")
+
+    results = execute_batch(
+        [
+            {"op": "write_unit", "name": "web", "content": "[Unit]\nDescription=w\n"},
+            {"op": "write_unit", "name": "db", "content": "[Unit]\n"},
+            {"op": "remove_unit", "name": "old"},
+            {"op": "daemon_reload"},
+            {"op": "daemon_reload"},
+            {"op": "restart", "names": ["web"]},
+            {"op": "restart", "names": ["db", "web"]},
+        ],
+        str(tmp_path),
+        run,
+    )
+
+    assert all(result["ok"] for result in results)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["db.service", "web.service"]
+    assert (tmp_path / "web.service").read_text() == "[Unit]\nDescription=w\n"
+    assert [c.args[0] for c in run.call_args_list] == [
+        ["systemctl", "daemon-reload"],
+        ["systemctl", "restart", "--", "web.service", "db.service"],
+    ]
+
+
+def test_failed_group_is_reported_per_request(tmp_path):
+    run = MagicMock(return_value=MagicMock(returncode=5, stderr=b"Unit not found"))
+    results = execute_batch(
+        [{"op": "stop", "names": ["a"]}, {"op": "stop", "names": ["b"]}],
+        str(tmp_path),
+        run,
+    )
+    assert results == [{"ok": False, "error": "Unit not found"}] * 2
+
+
+def test_batch_stops_at_the_first_failure(tmp_path):
+    (tmp_path / "web.service").write_text("[Unit]\n")
+    run = MagicMock(return_value=MagicMock(returncode=1, stderr=b"Access denied"))
+    results = execute_batch(
+        [
+            {"op": "stop", "names": ["web"]},
+            {"op": "disable", "names": ["web"]},
+            {"op": "remove_unit", "name": "web"},
+            {"op": "daemon_reload"},
+        ],
+        str(tmp_path),
+        run,
+    )
+    assert results[0] == {"ok": False, "error": "Access denied"}
+    assert results[1:] == [{"ok": False, "error": "skipped"}] * 3
+    assert (tmp_path / "web.service").exists()
+    assert run.call_count == 1
+
+
+@patch("os.geteuid", return_value=0)
+@patch("subprocess.Popen")
+def test_root_runs_in_process_without_helper(mock_popen, _geteuid, tmp_path):
+    helper = PrivilegedHelper(unit_dir=str(tmp_path))
+    assert helper.start()
+    helper.call("write_unit", name="web", content="[Unit]\n")
+
+    assert helper.in_process
+    assert (tmp_path / "web.service").exists()
+    mock_popen.assert_not_called()
+
+
+@patch("os.geteuid", return_value=1000)
+def test_missing_sudo_rights_are_reported(_geteuid, tmp_path):
+    helper = PrivilegedHelper(unit_dir=str(tmp_path), command=["false"], fallback=False)
+    assert not helper.start()
+    with pytest.raises(PrivilegedError):
+        helper.call("daemon_reload")
+
+
+@patch("os.geteuid", return_value=1000)
+@patch("src.utils.privileged.fallback_elevation", return_value=["sudo"])
+@patch("subprocess.run")
+def test_without_helper_operations_fall_back_to_sudo_and_polkit(
+    mock_run, _elevation, _geteuid, tmp_path
+):
+    staged = []
+
+    def run(argv, **kwargs):
+        if argv[:2] == ["sudo", "install"]:
+            with open(argv[-2]) as f:
+                staged.append(f.read())
+        return _ok()
+
+    mock_run.side_effect = run
+    helper = PrivilegedHelper(unit_dir=str(tmp_path), command=["false"])
+    assert not helper.start()
+    helper.batch(
+        [
+            {"op": "write_unit", "name": "web", "content": "[Unit]\n"},
+            {"op": "daemon_reload"},
+            {"op": "start", "names": ["web"]},
+            {"op": "remove_unit", "name": "web"},
+        ]
+    )
+
+    commands = [call.args[0] for call in mock_run.call_args_list]
+    target = str(tmp_path / "web.service")
+    assert commands[0][:5] == ["sudo", "install", "-m", "644", "--"]
+    assert commands[0][-1] == target
+    assert not os.path.exists(commands[0][-2])  # staging file removed
+    assert staged == ["[Unit]\n"]
+    # systemctl runs unprivileged: polkit decides.
+    assert commands[1:] == [
+        ["systemctl", "daemon-reload"],
+        ["systemctl", "start", "--", "web.service"],
+        ["sudo", "rm", "-f", "--", target],
+    ]
+
+
+def helper_command(unit_dir):
+    # The helper's argv cannot choose the unit directory: the test process
+    # serves a temporary one through a bootstrap of its own.
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    bootstrap = (
+        f"import sys; sys.path.insert(0, {root!r}); "
+        "from src.utils.privileged import serve; "
+        f"serve(unit_dir={unit_dir!r})"
+    )
+    return [sys.executable, "-I", "-c", bootstrap]
+
+
+def test_helper_process_serves_many_batches(tmp_path):
+    command = helper_command(str(tmp_path))
+    helper = PrivilegedHelper(unit_dir=str(tmp_path), command=command)
+    try:
+        assert helper.start()
+        process = helper._process
+        for i in range(20):
+            helper.call("write_unit", name=f"svc{i}", content=f"# {i}\n")
+        helper.call("remove_unit", name="svc0")
+        with pytest.raises(PrivilegedError):
+            helper.call("write_unit", name="../x", content="")
+        # Still the same helper process after every request.
+        assert helper._process is process
+    finally:
+        helper.close()
+
+    assert len(list(tmp_path.glob("*.service"))) == 19
+    assert (tmp_path / "svc7.service").read_text() == "# 7\n"
+
+
+def test_helper_argv_cannot_choose_the_unit_dir(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["--serve", "--unit-dir", str(tmp_path)])
+
+
+@patch("os.geteuid", return_value=1000)
+def test_default_helper_is_isolated_and_root_owned(_geteuid, tmp_path):
+    command = PrivilegedHelper()._helper_command()
+    assert command[:4] == ["sudo", "-n", "/usr/bin/python3", "-I"]
+    assert sys.executable not in command[:3]
+
+    # A copy that another user could modify is never run as root.
+    (tmp_path / "src" / "utils").mkdir(parents=True)
+    helper_file = tmp_path / "src" / "utils" / "privileged.py"
+    helper_file.write_text("")
+    helper_file.chmod(0o666)
+    assert not helper_installed(str(tmp_path))
+    assert not helper_installed(str(tmp_path / "absent"))
+    with (
+        patch("src.utils.privileged.helper_installed", return_value=False),
+        patch("subprocess.Popen") as mock_popen,
+    ):
+        assert not PrivilegedHelper().start()
+    mock_popen.assert_not_called()
+
+
+def test_stale_helper_is_not_used(tmp_path):
+    answers = [
+        {"ok": True, "protocol": PROTOCOL_VERSION - 1},
+        {"ok": True, "protocol": PROTOCOL_VERSION, "digest": "0" * 64},
+    ]
+    for answer in answers:
+        reply = json.dumps({"results": [answer]})
+        command = [
+            sys.executable,
+            "-c",
+            f"import sys; sys.stdin.readline(); print({reply!r})",
+        ]
+        helper = PrivilegedHelper(unit_dir=str(tmp_path), command=command)
+        assert not helper.start()
+        assert helper._process is None
+
+
+def test_garbled_helper_answer_is_a_privileged_error(tmp_path):
+    command = [sys.executable, "-c", "import sys; sys.stdin.readline(); print('{')"]
+    helper = PrivilegedHelper(unit_dir=str(tmp_path), command=command)
+    assert not helper.start()
+
+    command = [sys.executable, "-c", "import sys; sys.stdin.readline(); print('{}')"]
+    helper = PrivilegedHelper(unit_dir=str(tmp_path), command=command)
+    assert not helper.start()
+    assert helper._process is None
@@ -0,0 +1,96 @@
+"""Tests for the tracing of external commands (no process is spawned)."""
+
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.cli.commands import EXIT_OK, run
+from src.utils.proctrace import (
+    CommandRecord,
+    command_class,
+    command_tracer,
+    percentile,
+    run_command,
+    summarize,
+)
+
+
+@pytest.fixture(autouse=True)
+def empty_tracer():
+    command_tracer.clear()
+    yield
+    command_tracer.clear()
+
+
+def test_command_class():
+    assert command_class(["systemctl", "--no-pager", "restart", "web"]) == (
+        "systemctl restart"
+    )
+    assert command_class(["sudo", "-n", "/usr/bin/systemctl", "stop", "x"]) == (
+        "systemctl stop"
+    )
+    assert command_class(["journalctl", "-u", "web.service"]) == "journalctl"
+    assert command_class("which screen") == "which"
+
+
+@patch("subprocess.run")
+def test_run_command_forwards_the_call_and_records_it(mock_run):
+    mock_run.return_value = MagicMock(returncode=3)
+
+    result = run_command(["systemctl", "is-active", "web"], capture_output=True)
+
+    assert result is mock_run.return_value
+    mock_run.assert_called_once_with(
+        ["systemctl", "is-active", "web"], capture_output=True
+    )
+    (record,) = command_tracer.records()
+    assert record.command == "systemctl is-active"
+    assert record.returncode == 3
+    assert ".test_run_command_forwards_the_call_and_records_it:" in record.caller
+
+
+@patch("subprocess.run")
+def test_failures_are_recorded_and_reraised(mock_run):
+    mock_run.side_effect = subprocess.CalledProcessError(1, ["systemctl"])
+    with pytest.raises(subprocess.CalledProcessError):
+        run_command(["systemctl", "start", "web"], check=True)
+
+    mock_run.side_effect = FileNotFoundError("systemctl")
+    with pytest.raises(FileNotFoundError):
+        run_command(["systemctl", "stop", "web"])
+
+    assert [r.returncode for r in command_tracer.records()] == [1, None]
+
+
+def test_percentiles_per_command_class():
+    records = [
+        CommandRecord("systemctl show", [], i / 1000, 0, "x", "t", 0.0)
+        for i in range(1, 101)
+    ] + [CommandRecord("journalctl", [], 1.0, 1, "x", "t", 0.0)]
+
+    rows = {row["command"]: row for row in summarize(records)}
+
+    show = rows["systemctl show"]
+    assert (show["count"], show["p50"], show["p95"], show["p99"]) == (
+        100,
+        0.05,
+        0.095,
+        0.099,
+    )
+    assert rows["journalctl"]["failures"] == 1
+    assert percentile([], 50) == 0.0
+
+
+@patch("subprocess.run")
+def test_trace_command_summarizes_a_jsonl_dump(mock_run, tmp_path, capsys):
+    mock_run.return_value = MagicMock(returncode=0)
+    for _ in range(3):
+        run_command(["systemctl", "restart", "web"])
+    trace = tmp_path / "trace.jsonl"
+    command_tracer.dump(str(trace))
+
+    assert run(["trace", str(trace)]) == EXIT_OK
+    out = capsys.readouterr().out
+    assert "COMMAND" in out
+    assert "systemctl restart" in out
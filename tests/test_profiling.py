@@ -0,0 +1,112 @@
+"""Tests for the run-time profiling of user actions."""
+
+import pstats
+import sys
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.main import main
+from src.utils.profiling import action_profiler, profiled
+
+
+@pytest.fixture
+def profiler(tmp_path):
+    action_profiler.enable(str(tmp_path))
+    action_profiler.reports.clear()
+    yield action_profiler
+    action_profiler.disable()
+    action_profiler.reports.clear()
+
+
+@profiled("refresh", snapshot=True)
+def _refresh(size):
+    return [str(i) * 10 for i in range(size)]
+
+
+@profiled("outer")
+def _outer():
+    return _refresh(10)
+
+
+def test_disabled_actions_write_nothing(tmp_path):
+    assert not action_profiler.enabled
+    assert len(_refresh(10)) == 10
+    assert action_profiler.reports == []
+
+
+def test_action_writes_pstats_summary_and_memory_reports(profiler, tmp_path):
+    kept = _refresh(100)
+    _refresh(200)
+
+    suffixes = sorted(p.rsplit("-refresh", 1)[1] for p in profiler.reports)
+    assert suffixes == ["-memory.txt"] * 2 + [".pstats"] * 2 + [".txt"] * 2
+    pstats_path = next(p for p in profiler.reports if p.endswith(".pstats"))
+    functions = {f[2] for f in pstats.Stats(pstats_path).stats}  # type: ignore[attr-defined]
+    assert "_refresh" in functions
+
+    second = sorted(p for p in profiler.reports if p.endswith("-memory.txt"))[-1]
+    assert "Évolution depuis l'instantané précédent" in open(second).read()
+    assert len(kept) == 100
+
+
+def test_nested_actions_are_profiled_once(profiler):
+    _outer()
+
+    profiles = [p for p in profiler.reports if p.endswith(".pstats")]
+    assert len(profiles) == 1
+    assert profiles[0].endswith("-outer.pstats")
+
+
+def test_action_on_another_thread_is_not_nesting(profiler, capsys):
+    started = threading.Event()
+    release = threading.Event()
+
+    def worker():
+        with profiler.action("worker"):
+            started.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=worker)
+    thread.start()
+    try:
+        assert started.wait(5)
+        with profiler.action("tk"):
+            _refresh(10)
+    finally:
+        release.set()
+        thread.join()
+
+    names = [p.rsplit("-", 1)[1] for p in profiler.reports if p.endswith(".pstats")]
+    if sys.version_info >= (3, 12):
+        # One profiler per process: the Tk action is reported, not dropped.
+        assert names == ["worker.pstats"]
+        assert "Action tk non profilée" in capsys.readouterr().out
+    else:
+        assert sorted(names) == ["tk.pstats", "worker.pstats"]
+
+
+@pytest.mark.parametrize(
+    "value, argv, enabled",
+    [
+        ("", ["list"], False),
+        ("0", ["list"], False),
+        ("0", ["--profile", "list"], True),
+        ("1", ["list"], True),
+    ],
+)
+def test_main_enables_profiling_from_flag_or_variable(
+    monkeypatch, tmp_path, value, argv, enabled
+):
+    monkeypatch.setenv("SYSTEMD_MANAGER_PROFILE", value)
+    monkeypatch.setattr(action_profiler, "directory", str(tmp_path))
+    with patch("src.cli.commands.run", return_value=0) as run:
+        with pytest.raises(SystemExit):
+            main(argv)
+    try:
+        assert action_profiler.enabled == enabled
+        run.assert_called_once_with(["list"])
+    finally:
+        action_profiler.disable()
+        action_profiler.reports.clear()
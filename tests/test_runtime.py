@@ -0,0 +1,141 @@
+"""Tests for the background task runtime and its Tk dispatcher."""
+
+import asyncio
+import os
+import threading
+import time
+
+import pytest
+
+from src.utils.runtime import BackgroundRuntime, run_process
+
+
+class FakeRoot:
+    """Stands for the Tk root: ``after`` jobs run when ``run_pending`` is called."""
+
+    def __init__(self):
+        self.jobs = []
+        self.thread = threading.get_ident()
+
+    def after(self, ms, callback):
+        self.jobs.append(callback)
+
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, []
+        for job in jobs:
+            job()
+
+
+@pytest.fixture
+def runtime():
+    runtime = BackgroundRuntime(max_workers=2)
+    yield runtime
+    runtime.shutdown()
+
+
+def test_results_and_errors_come_back_on_the_tk_thread(runtime):
+    root = FakeRoot()
+    runtime.attach(root)
+    delivered = []
+
+    def record(kind):
+        return lambda value: delivered.append((kind, value, threading.get_ident()))
+
+    ok = runtime.submit(lambda x: x * 2, 21, on_done=record("done"))
+    failing = runtime.submit(
+        lambda: 1 / 0, on_done=record("done"), on_error=record("error")
+    )
+
+    async def coroutine(value):
+        await asyncio.sleep(0)
+        return value
+
+    other = runtime.submit(coroutine, "async", on_done=record("done"))
+    ok.result(5), other.result(5)
+    with pytest.raises(ZeroDivisionError):
+        failing.result(5)
+    assert delivered == []
+
+    root.run_pending()
+
+    assert sorted((kind, str(value)) for kind, value, _ in delivered) == [
+        ("done", "42"),
+        ("done", "async"),
+        ("error", "division by zero"),
+    ]
+    assert {thread for _, _, thread in delivered} == {root.thread}
+
+
+def test_progress_is_reported(runtime):
+    root = FakeRoot()
+    runtime.attach(root)
+    seen = []
+
+    def work(count, progress):
+        for i in range(count):
+            progress(i)
+        return "done"
+
+    task = runtime.submit(work, 3, on_progress=seen.append, on_done=seen.append)
+    task.result(5)
+    root.run_pending()
+
+    assert seen == [0, 1, 2, "done"]
+
+
+def test_cancel_owner_drops_callbacks_and_cancels_coroutines(runtime):
+    root = FakeRoot()
+    runtime.attach(root)
+    window = object()
+    release = threading.Event()
+    seen = []
+
+    blocking = runtime.submit(release.wait, 5, owner=window, on_done=seen.append)
+
+    async def forever():
+        await asyncio.sleep(60)
+
+    sleeping = runtime.submit(forever, owner=window, on_done=seen.append)
+    assert runtime.tasks(window) == [blocking, sleeping]
+
+    runtime.cancel_owner(window)
+    release.set()
+    root.run_pending()
+
+    assert blocking.cancelled and sleeping.cancelled
+    assert runtime.tasks(window) == []
+    assert seen == []
+
+
+def test_without_dispatcher_callbacks_run_directly(runtime):
+    done = threading.Event()
+    task = runtime.submit(len, "abc", on_done=lambda value: done.set())
+
+    assert task.result(5) == 3
+    assert done.wait(5)
+
+
+def test_cancelled_process_is_killed(runtime, tmp_path):
+    done = runtime.submit(run_process, ["sh", "-c", "echo out; echo err >&2"])
+    result = done.result(5)
+    assert (result.returncode, result.stdout, result.stderr) == (0, "out\n", "err\n")
+
+    pid_file = tmp_path / "pid"
+    task = runtime.submit(
+        run_process, ["sh", "-c", f"echo $$ > {pid_file}; exec sleep 30"]
+    )
+    for _ in range(500):
+        if pid_file.exists() and pid_file.read_text().strip():
+            break
+        time.sleep(0.01)
+    pid = int(pid_file.read_text())
+
+    task.cancel()
+    for _ in range(500):
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            break
+        time.sleep(0.01)
+    else:
+        pytest.fail("the process outlived its task")
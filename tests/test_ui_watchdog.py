@@ -0,0 +1,115 @@
+"""Tests for the event-loop lag watchdog of the GUI thread."""
+
+from src.utils import ui_watchdog as watchdog_module
+from src.utils.ui_watchdog import UIWatchdog, callback_name, enable_from_env
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeWidget:
+    def __init__(self):
+        self.jobs = []
+
+    def after(self, ms, callback):
+        self.jobs.append((ms, callback))
+
+
+def test_heartbeat_lag_percentiles():
+    clock = FakeClock()
+    watchdog = UIWatchdog(interval=0.1, clock=clock)
+    watchdog.enable()
+    widget = FakeWidget()
+    watchdog.attach(widget)
+    try:
+        for late in (0.0, 0.0, 0.0, 0.5):
+            clock.now += 0.1 + late
+            ms, tick = widget.jobs.pop()
+            assert ms == 100
+            tick()
+    finally:
+        watchdog.detach()
+
+    stats = watchdog.stats()
+    assert stats["p50_ms"] == 0.0
+    assert round(stats["max_ms"]) == 500
+    assert stats["slow"] == 0
+
+
+def test_slow_callback_is_reported_with_its_stack(capsys):
+    clock = FakeClock()
+    watchdog = UIWatchdog(threshold=0.2, clock=clock)
+    watchdog.enable()
+
+    def blocking_handler():
+        clock.now += 0.3
+        # What the watcher thread does while the handler blocks.
+        watchdog.check()
+
+    with watchdog.callback("app.fast"):
+        clock.now += 0.01
+    with watchdog.callback("app.blocking_handler"):
+        blocking_handler()
+
+    assert [event.callback for event in watchdog.events] == ["app.blocking_handler"]
+    event = watchdog.events[0]
+    assert round(event.duration, 3) == 0.3
+    assert "blocking_handler" in "".join(event.stack)
+    assert "app.blocking_handler : 300 ms" in capsys.readouterr().err
+    assert watchdog.stats()["slow"] == 1
+
+
+def test_disabled_watchdog_records_nothing():
+    clock = FakeClock()
+    watchdog = UIWatchdog(threshold=0.1, clock=clock)
+    widget = FakeWidget()
+
+    watchdog.attach(widget)
+    with watchdog.callback("app.handler"):
+        clock.now += 1
+
+    assert widget.jobs == []
+    assert not watchdog.events
+
+
+def test_enable_from_env_and_callback_names(monkeypatch):
+    watchdog = UIWatchdog()
+    monkeypatch.setattr(watchdog_module, "ui_watchdog", watchdog)
+
+    monkeypatch.setenv("SYSTEMD_MANAGER_WATCHDOG", "0")
+    assert not enable_from_env()
+    monkeypatch.setenv("SYSTEMD_MANAGER_WATCHDOG", "250")
+    assert enable_from_env()
+    assert watchdog.enabled and watchdog.threshold == 0.25
+
+    assert callback_name(UIWatchdog.beat) == "src.utils.ui_watchdog.UIWatchdog.beat"
+    assert callback_name(watchdog.beat) == "src.utils.ui_watchdog.UIWatchdog.beat"
+
+
+def test_callbacks_registered_after_install_are_timed(monkeypatch):
+    import tkinter
+
+    from src.gui.utils import lag_indicator
+
+    # Undone after the test: the patch is global to tkinter.
+    monkeypatch.setattr(tkinter.CallWrapper, "__call__", tkinter.CallWrapper.__call__)
+    monkeypatch.setattr(lag_indicator, "_installed", False)
+    clock = FakeClock()
+    watchdog = UIWatchdog(threshold=0.1, clock=clock)
+    watchdog.enable()
+
+    def slow_button():
+        clock.now += 0.5
+
+    lag_indicator.install_callback_timer(watchdog)
+    # What tkinter's Misc._register does when a command is registered.
+    command = tkinter.CallWrapper(slow_button, None, None).__call__
+    command()
+
+    assert [event.callback for event in watchdog.events] == [callback_name(slow_button)]
+    assert round(watchdog.events[0].duration, 3) == 0.5
@@ -0,0 +1,84 @@
+"""Tests for the installed-unit index."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.utils import unit_index as unit_index_module
+from src.utils.unit_index import UnitIndex
+from src.utils.validation import ServiceValidator
+
+
+@pytest.fixture
+def search_path(tmp_path):
+    etc = tmp_path / "etc"
+    vendor = tmp_path / "lib"
+    generator = tmp_path / "generator"
+    etc.mkdir()
+    vendor.mkdir()
+    (etc / "web.service").write_text("[Service]\n")
+    (etc / "web.service.d").mkdir()
+    (etc / "multi-user.target.wants").mkdir()
+    (vendor / "web.service").write_text("[Service]\n")
+    (vendor / "ssh.service").write_text("[Service]\n")
+    (vendor / "getty@.service").write_text("[Service]\n")
+    (vendor / "README").write_text("")
+    return [str(etc), str(generator), str(vendor)]
+
+
+def test_lookups_follow_the_search_path_priority(search_path):
+    index = UnitIndex(search_path)
+    etc, _, vendor = search_path
+
+    assert index.path("web") == os.path.join(etc, "web.service")
+    assert index.path("ssh.service") == os.path.join(vendor, "ssh.service")
+    assert index.exists("getty@tty1")
+    assert not index.exists("db")
+    assert index.names() == ["getty@.service", "ssh.service", "web.service"]
+    assert index.scans == 3
+
+
+def test_inotify_events_rescan_only_changed_directories(search_path):
+    index = UnitIndex(search_path)
+    etc, generator, vendor = search_path
+    assert not index.exists("db")
+    scans = index.scans
+
+    for _ in range(100):
+        index.exists("web")
+    assert index.scans == scans  # nothing changed, nothing rescanned
+
+    with open(os.path.join(etc, "db.service"), "w") as f:
+        f.write("[Service]\n")
+    os.remove(os.path.join(vendor, "ssh.service"))
+
+    assert index.path("db") == os.path.join(etc, "db.service")
+    assert not index.exists("ssh")
+    assert index.scans == scans + 2
+    index.close()
+
+
+def test_missing_directories_are_polled(search_path):
+    with patch.object(unit_index_module, "POLL_INTERVAL", 0):
+        index = UnitIndex(search_path, use_inotify=False)
+        etc, generator, _ = search_path
+        assert not index.exists("mnt-data.mount")
+
+        os.mkdir(generator)
+        with open(os.path.join(generator, "mnt-data.mount"), "w") as f:
+            f.write("[Mount]\n")
+        assert index.exists("mnt-data.mount")
+
+
+def test_validator_warns_about_any_installed_unit(search_path):
+    index = UnitIndex(search_path)
+    with patch("src.utils.validation.unit_index", index):
+        result = ServiceValidator().validate_service_config(
+            {"name": "ssh", "command": "/bin/sh", "user": "root"}
+        )
+        stored = ServiceValidator(new_service=False).validate_service_config(
+            {"name": "ssh", "command": "/bin/sh", "user": "root"}
+        )
+    assert any("existe déjà" in w for w in result.warnings)
+    assert not any("existe déjà" in w for w in stored.warnings)